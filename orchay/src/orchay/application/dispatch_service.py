@@ -4,12 +4,14 @@ Task 분배 로직을 통합합니다:
 - 초기 분배 (_dispatch_to_worker)
 - 연속 실행 (_dispatch_next_step)
 - 공통 로직 통합
+- 백그라운드 명령 전송 (tick 비차단)
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
@@ -18,14 +20,60 @@ from orchay.domain.constants import DISPATCH_TIMINGS
 from orchay.domain.workflow import ExecutionMode, WorkflowEngine
 from orchay.models import Task, Worker, WorkerState
 from orchay.scheduler import dispatch_task, get_next_workflow_command, handle_approve
-from orchay.utils.wezterm import wezterm_send_text
-from orchay.worker import detect_worker_state
+from orchay.utils.wezterm import wezterm_get_text, wezterm_send_text
+from orchay.worker import PROMPT_PATTERNS, detect_worker_state
 
 if TYPE_CHECKING:
     from orchay.models import Config
+    from orchay.utils.pane_snapshot import PaneSnapshot
 
 logger = logging.getLogger(__name__)
 
+# 입력창 테두리/공백 (줄바꿈된 입력 에코 비교 시 제거)
+_ECHO_NOISE = re.compile(r"[\s│╭╮╰╯─]")
+
+
+def _is_echoed(text: str, command: str) -> bool:
+    """입력한 명령어가 pane에 표시되었는지 확인합니다.
+
+    Args:
+        text: pane 하단 출력
+        command: 입력한 명령어
+
+    Returns:
+        에코 여부
+    """
+    return _ECHO_NOISE.sub("", command) in _ECHO_NOISE.sub("", text)
+
+
+def _has_prompt(text: str) -> bool:
+    """pane 하단에 입력 프롬프트가 표시되었는지 확인합니다.
+
+    Args:
+        text: pane 하단 출력
+
+    Returns:
+        프롬프트 표시 여부
+    """
+    last_text = "\n".join(text.strip().split("\n")[-5:])
+    return any(pattern.search(last_text) for pattern in PROMPT_PATTERNS)
+
+
+def _is_cleared(text: str) -> bool:
+    """/clear 후 화면이 비고 입력 프롬프트만 남았는지 확인합니다.
+
+    상태 줄(bypass permissions 등)은 항상 보이므로 프롬프트 확인만으로는 부족하고,
+    이전 출력이 사라졌는지(비어 있지 않은 줄 수)도 함께 확인합니다.
+
+    Args:
+        text: pane 하단 출력
+
+    Returns:
+        화면 정리 여부
+    """
+    filled = [line for line in text.split("\n") if line.strip()]
+    return len(filled) <= DISPATCH_TIMINGS.CLEAR_SCREEN_MAX_LINES and _has_prompt(text)
+
 
 class DispatchResult:
     """Dispatch 결과."""
@@ -67,6 +115,10 @@ class DispatchService:
         # 연속 실행
         result = await service.dispatch_next_step(worker, task, last_action="start")
         ```
+
+    background=True이면 /clear·명령어 전송 시퀀스를 Worker별 백그라운드 태스크로
+    실행하고 즉시 반환합니다. 전송 중인 Worker는 DISPATCHING 상태가 되며,
+    전송이 끝나면 BUSY로, 실패하면 할당이 해제됩니다.
     """
 
     def __init__(
@@ -77,6 +129,7 @@ class DispatchService:
         mode: ExecutionMode,
         workflow_engine: WorkflowEngine | None = None,
         output_callback: Callable[[str], None] | None = None,
+        background: bool = False,
     ) -> None:
         """DispatchService를 초기화합니다.
 
@@ -87,6 +140,7 @@ class DispatchService:
             mode: 실행 모드
             workflow_engine: WorkflowEngine 인스턴스
             output_callback: 출력 콜백 함수 (console.print 대체)
+            background: 명령 전송을 백그라운드 태스크로 실행할지 여부
         """
         self._config = config
         self._project_name = project_name
@@ -94,6 +148,9 @@ class DispatchService:
         self._mode = mode
         self._engine = workflow_engine
         self._output = output_callback or (lambda x: None)
+        self._background = background
+        # Worker ID → 진행 중인 전송 태스크
+        self._pending: dict[int, asyncio.Task[DispatchResult]] = {}
 
     @property
     def mode(self) -> ExecutionMode:
@@ -105,11 +162,35 @@ class DispatchService:
         """실행 모드를 설정합니다."""
         self._mode = value
 
+    @property
+    def pending_workers(self) -> set[int]:
+        """명령 전송이 진행 중인 Worker ID 집합을 반환합니다."""
+        return {wid for wid, t in self._pending.items() if not t.done()}
+
+    async def wait_pending(self, timeout: float | None = None) -> None:
+        """진행 중인 명령 전송이 끝날 때까지 대기합니다.
+
+        제한 시간 내에 끝나지 않은 전송은 취소되고 할당이 해제됩니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        """
+        pending = [t for t in self._pending.values() if not t.done()]
+        if not pending:
+            return
+
+        _, not_done = await asyncio.wait(pending, timeout=timeout)
+        for t in not_done:
+            t.cancel()
+        if not_done:
+            await asyncio.gather(*not_done, return_exceptions=True)
+
     async def dispatch_task(
         self,
         worker: Worker,
         task: Task,
         check_state: bool = True,
+        snapshot: PaneSnapshot | None = None,
     ) -> DispatchResult:
         """Worker에 Task를 분배합니다 (초기 분배).
 
@@ -117,6 +198,7 @@ class DispatchService:
             worker: 대상 Worker
             task: 분배할 Task
             check_state: Worker 상태 확인 여부
+            snapshot: tick 단위 pane 스냅샷 (상태 확인 시 재사용, 전송 후 무효화)
 
         Returns:
             DispatchResult
@@ -124,7 +206,7 @@ class DispatchService:
         # Worker 상태 확인 (옵션)
         if check_state:
             actual_state, _ = await detect_worker_state(
-                worker.pane_id, has_active_task=False
+                worker.pane_id, has_active_task=False, snapshot=snapshot
             )
             if actual_state not in ("idle", "done"):
                 logger.warning(
@@ -140,7 +222,9 @@ class DispatchService:
             # pane에서 이 Task가 이미 실행 중인지 최종 확인
             from orchay.worker import extract_running_task_from_pane
 
-            pane_task = await extract_running_task_from_pane(worker.pane_id)
+            pane_task = await extract_running_task_from_pane(
+                worker.pane_id, snapshot=snapshot
+            )
             if pane_task == task.id:
                 logger.warning(
                     f"Worker {worker.id}: {task.id}가 이미 이 pane에서 실행 중 (dispatch 취소)"
@@ -155,13 +239,14 @@ class DispatchService:
         await dispatch_task(worker, task, self._mode)
 
         # 다음 명령 결정 (초기 분배이므로 last_action=None)
-        return await self._do_dispatch(worker, task, last_action=None)
+        return await self._do_dispatch(worker, task, last_action=None, snapshot=snapshot)
 
     async def dispatch_next_step(
         self,
         worker: Worker,
         task: Task,
         last_action: str | None = None,
+        snapshot: PaneSnapshot | None = None,
     ) -> DispatchResult:
         """같은 Worker에 다음 워크플로우 단계를 분배합니다 (연속 실행).
 
@@ -169,17 +254,19 @@ class DispatchService:
             worker: 대상 Worker
             task: 대상 Task
             last_action: 마지막으로 완료된 action
+            snapshot: tick 단위 pane 스냅샷 (전송 후 무효화)
 
         Returns:
             DispatchResult
         """
-        return await self._do_dispatch(worker, task, last_action)
+        return await self._do_dispatch(worker, task, last_action, snapshot=snapshot)
 
     async def _do_dispatch(
         self,
         worker: Worker,
         task: Task,
         last_action: str | None,
+        snapshot: PaneSnapshot | None = None,
     ) -> DispatchResult:
         """실제 분배 로직 (공통).
 
@@ -187,6 +274,7 @@ class DispatchService:
             worker: 대상 Worker
             task: 대상 Task
             last_action: 마지막 액션 (연속 실행 시)
+            snapshot: tick 단위 pane 스냅샷 (전송 후 무효화)
 
         Returns:
             DispatchResult
@@ -206,24 +294,26 @@ class DispatchService:
 
         # approve 단계 특별 처리
         if next_workflow == "approve":
-            return await self._handle_approve_step(worker, task)
+            return await self._handle_approve_step(worker, task, snapshot=snapshot)
 
         # Worker 상태 업데이트
         self._update_worker_state(worker, task, next_workflow)
 
         # 명령어 전송
-        return await self._send_command(worker, task, next_workflow)
+        return await self._send_command(worker, task, next_workflow, snapshot=snapshot)
 
     async def _handle_approve_step(
         self,
         worker: Worker,
         task: Task,
+        snapshot: PaneSnapshot | None = None,
     ) -> DispatchResult:
         """approve 단계를 처리합니다.
 
         Args:
             worker: 대상 Worker
             task: 대상 Task
+            snapshot: tick 단위 pane 스냅샷
 
         Returns:
             DispatchResult
@@ -233,7 +323,9 @@ class DispatchService:
         if success:
             # 승인 완료 → 다음 단계 진행 (재귀 호출)
             self._output(f"[green]자동 승인:[/] {task.id} → [ap]")
-            return await self.dispatch_next_step(worker, task, last_action="approve")
+            return await self.dispatch_next_step(
+                worker, task, last_action="approve", snapshot=snapshot
+            )
         else:
             # 수동 승인 대기
             self._output(f"[yellow]수동 승인 대기:[/] {task.id}")
@@ -269,6 +361,7 @@ class DispatchService:
         worker: Worker,
         task: Task,
         next_workflow: str,
+        snapshot: PaneSnapshot | None = None,
     ) -> DispatchResult:
         """명령어를 Worker에 전송합니다.
 
@@ -276,23 +369,55 @@ class DispatchService:
             worker: 대상 Worker
             task: 대상 Task
             next_workflow: 전송할 명령어
+            snapshot: tick 단위 pane 스냅샷 (전송 후 해당 pane 캐시 무효화)
 
         Returns:
             DispatchResult
         """
-        # /clear 전송 (설정에 따라, DONE 신호 감지 정확도 향상을 위해 권장)
-        if self._config.dispatch.clear_before_dispatch:
-            await self._send_clear(worker)
+        # pane 내용이 바뀌므로 같은 tick의 이후 조회는 다시 캡처
+        if snapshot:
+            snapshot.invalidate(worker.pane_id)
+
+        if self._background:
+            worker.state = WorkerState.DISPATCHING
+            self._pending[worker.id] = asyncio.create_task(
+                self._deliver(worker, task, next_workflow),
+                name=f"dispatch-worker-{worker.id}",
+            )
+            return DispatchResult(
+                success=True,
+                command=next_workflow,
+                message=f"Worker {worker.id}에 전송 시작",
+            )
+
+        return await self._deliver(worker, task, next_workflow)
+
+    async def _deliver(
+        self,
+        worker: Worker,
+        task: Task,
+        next_workflow: str,
+    ) -> DispatchResult:
+        """/clear와 명령어 전송 시퀀스를 실행합니다.
 
+        Args:
+            worker: 대상 Worker
+            task: 대상 Task
+            next_workflow: 전송할 명령어
+
+        Returns:
+            DispatchResult
+        """
         # 명령어 생성
         command = f"/wf:{next_workflow} {self._project_name}/{task.id}"
 
         try:
-            # 명령어 전송
-            await wezterm_send_text(worker.pane_id, command)
-            await asyncio.sleep(DISPATCH_TIMINGS.COMMAND_WAIT_SECONDS)
-            await wezterm_send_text(worker.pane_id, "\r")
-            await asyncio.sleep(DISPATCH_TIMINGS.ENTER_WAIT_SECONDS)
+            await self.deliver(worker.pane_id, command)
+
+            # 백그라운드 전송 완료: grace period는 실제 전송 시점부터 계산
+            if worker.state == WorkerState.DISPATCHING:
+                worker.state = WorkerState.BUSY
+                worker.dispatch_time = datetime.now()
 
             self._output(
                 f"[cyan]Dispatch:[/] {task.id} ({task.status.value}) → "
@@ -305,6 +430,11 @@ class DispatchService:
                 message=f"Worker {worker.id}에 분배됨",
             )
 
+        except asyncio.CancelledError:
+            logger.warning(f"Worker {worker.id} 명령 전송 취소")
+            self._reset_assignment(worker, task)
+            raise
+
         except Exception as e:
             logger.error(f"Worker {worker.id} 명령 전송 실패: {e}")
             self._reset_assignment(worker, task)
@@ -313,19 +443,121 @@ class DispatchService:
                 message=f"명령 전송 실패: {e}",
             )
 
-    async def _send_clear(self, worker: Worker) -> None:
-        """Worker에 clear 명령을 전송합니다.
+        finally:
+            if self._pending.get(worker.id) is asyncio.current_task():
+                del self._pending[worker.id]
+
+    async def deliver(self, pane_id: int, command: str) -> None:
+        """pane에 명령어를 입력하고 Enter를 전송합니다.
+
+        clear_before_dispatch 설정 시 /clear를 먼저 전송합니다.
+        delivery="adaptive"이면 고정 대기 대신 pane 하단을 지수 백오프로 확인하여
+        입력 에코/화면 정리가 확인되는 즉시 다음 단계로 진행하고,
+        확인되지 않으면 기존 고정 대기 시간만큼 기다린 뒤 진행합니다.
 
         Args:
-            worker: 대상 Worker
+            pane_id: 대상 pane ID
+            command: 전송할 명령어
+
+        Raises:
+            Exception: 명령어 전송 실패 시
         """
-        try:
-            await wezterm_send_text(worker.pane_id, "/clear")
-            await asyncio.sleep(DISPATCH_TIMINGS.CLEAR_WAIT_SECONDS)
-            await wezterm_send_text(worker.pane_id, "\r")
+        adaptive = self._config.dispatch.delivery == "adaptive"
+
+        # /clear 전송 (설정에 따라, DONE 신호 감지 정확도 향상을 위해 권장)
+        if self._config.dispatch.clear_before_dispatch:
+            await self._send_clear(pane_id, adaptive)
+
+        echoed: str | None = None
+        await wezterm_send_text(pane_id, command)
+        if adaptive:
+            echoed = await self._probe(
+                pane_id,
+                lambda text: _is_echoed(text, command),
+                DISPATCH_TIMINGS.COMMAND_WAIT_SECONDS,
+            )
+        else:
+            await asyncio.sleep(DISPATCH_TIMINGS.COMMAND_WAIT_SECONDS)
+
+        await wezterm_send_text(pane_id, "\r")
+        if echoed is not None:
+            # 입력 에코 화면에서 변화가 생기면 명령이 접수된 것으로 간주
+            await self._probe(
+                pane_id,
+                lambda text: text != echoed,
+                DISPATCH_TIMINGS.ENTER_WAIT_SECONDS,
+            )
+        else:
+            # fixed 모드이거나 에코 확인이 시간 초과됨: 고정 대기
             await asyncio.sleep(DISPATCH_TIMINGS.ENTER_WAIT_SECONDS)
+
+    async def _send_clear(self, pane_id: int, adaptive: bool = False) -> None:
+        """pane에 clear 명령을 전송합니다.
+
+        Args:
+            pane_id: 대상 pane ID
+            adaptive: pane 확인 기반 대기 사용 여부
+        """
+        echoed: str | None = None
+        try:
+            await wezterm_send_text(pane_id, "/clear")
+            if adaptive:
+                echoed = await self._probe(
+                    pane_id,
+                    lambda text: _is_echoed(text, "/clear"),
+                    DISPATCH_TIMINGS.CLEAR_WAIT_SECONDS,
+                )
+            else:
+                await asyncio.sleep(DISPATCH_TIMINGS.CLEAR_WAIT_SECONDS)
+
+            await wezterm_send_text(pane_id, "\r")
+            if echoed is not None:
+                # 화면이 비고 입력 프롬프트만 남으면 /clear 완료
+                await self._probe(
+                    pane_id,
+                    lambda text: text != echoed and _is_cleared(text),
+                    DISPATCH_TIMINGS.ENTER_WAIT_SECONDS,
+                )
+            else:
+                await asyncio.sleep(DISPATCH_TIMINGS.ENTER_WAIT_SECONDS)
         except Exception as e:
-            logger.warning(f"Worker {worker.id} /clear 실패: {e}")
+            logger.warning(f"pane {pane_id} /clear 실패: {e}")
+
+    async def _probe(
+        self,
+        pane_id: int,
+        ready: Callable[[str], bool],
+        timeout: float,
+    ) -> str | None:
+        """조건을 만족할 때까지 pane 하단을 지수 백오프로 확인합니다.
+
+        Args:
+            pane_id: 대상 pane ID
+            ready: pane 하단 출력을 받아 준비 여부를 반환하는 함수
+            timeout: 최대 대기 시간 (초) - 기존 고정 대기 시간
+
+        Returns:
+            조건을 만족한 시점의 pane 출력 (시간 초과 시 None)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval = DISPATCH_TIMINGS.PROBE_INITIAL_SECONDS
+
+        while True:
+            try:
+                text = await wezterm_get_text(pane_id, lines=DISPATCH_TIMINGS.PROBE_LINES)
+            except Exception as e:
+                logger.debug(f"pane {pane_id} 확인 실패: {e}")
+            else:
+                if ready(text):
+                    return text
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.debug(f"pane {pane_id} 확인 시간 초과 ({timeout}s), 고정 대기로 진행")
+                return None
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, DISPATCH_TIMINGS.PROBE_MAX_INTERVAL_SECONDS)
 
     def _reset_assignment(self, worker: Worker, task: Task) -> None:
         """할당을 리셋합니다.
@@ -10,12 +10,15 @@ Task 생명주기를 관리합니다:
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Container
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from orchay.domain.policies import TaskFilterPolicy
+from orchay.domain.policies import ReadySet, TaskFilterPolicy, TaskOrdering
 from orchay.domain.workflow import ExecutionMode, WorkflowConfig, WorkflowEngine
-from orchay.models import Task, TaskStatus
+from orchay.models import Task, TaskStatus, TaskStore
+from orchay.wbs_parser import WbsDelta
 
 if TYPE_CHECKING:
     from orchay.wbs_parser import WbsParser
@@ -62,6 +65,11 @@ MODE_VALID_STATES: dict[ExecutionMode, set[TaskStatus]] = {
     ExecutionMode.TEST: {TaskStatus.IMPLEMENT, TaskStatus.VERIFY, TaskStatus.DONE},
 }
 
+# 실행 가능 Task 필터링/분배 순서에 영향을 주는 WBS 필드 (그 외 필드 변경은 재평가하지 않음)
+FILTER_FIELDS: frozenset[str] = frozenset(
+    {"status", "category", "priority", "depends", "blocked_by", "schedule"}
+)
+
 
 class TaskService:
     """Task 생명주기 관리 서비스.
@@ -88,15 +96,31 @@ class TaskService:
         self,
         parser: WbsParser,
         workflow_engine: WorkflowEngine | None = None,
+        ordering: TaskOrdering | None = None,
     ) -> None:
         """TaskService를 초기화합니다.
 
         Args:
             parser: WbsParser 인스턴스
             workflow_engine: WorkflowEngine 인스턴스 (None이면 자동 생성)
+            ordering: 분배 순서 정책 (None이면 Task ID 순)
         """
         self._parser = parser
-        self._tasks: list[Task] = []
+        # ID/상태/할당 Worker/역방향 의존성 색인을 유지하는 Task 목록
+        self._tasks = TaskStore()
+        # 마지막 reload_tasks()에서 WBS 변경이 반영되었는지 여부
+        self._tasks_changed = True
+        # 다른 호출(refresh_task_status(), 초기 파싱 등)이 먼저 읽어 간 WBS 변경
+        # (다음 reload_tasks()에서 병합, 첫 reload는 항상 병합)
+        self._pending_change = True
+        # 마지막 reload_tasks()에서 병합한 변경 내역 (전체 병합이면 None)
+        self._last_delta: WbsDelta | None = None
+        # 파일 감시 모드: 변경 알림(mark_dirty)이 없으면 reload_tasks()에서 파싱 생략
+        self._watching = False
+        self._dirty = True
+        self._watch_fallback = 30.0
+        # 마지막으로 WBS를 확인한 시각 (time.monotonic)
+        self._last_checked = 0.0
 
         # WorkflowEngine 초기화
         if workflow_engine is None:
@@ -106,34 +130,151 @@ class TaskService:
             self._engine = workflow_engine
 
         self._filter_policy = TaskFilterPolicy(self._engine)
+        self._ordering = ordering if ordering is not None else TaskOrdering()
+        # 실행 가능 Task 집합 (Task 목록 변경 통지로 증분 갱신, 분배 순서로 정렬)
+        self._ready = ReadySet(self._tasks, self._filter_policy, self._ordering)
 
     @property
-    def tasks(self) -> list[Task]:
+    def tasks(self) -> TaskStore:
         """현재 Task 목록을 반환합니다."""
         return self._tasks
 
     @tasks.setter
     def tasks(self, value: list[Task]) -> None:
-        """Task 목록을 설정합니다."""
-        self._tasks = value
+        """Task 목록을 설정합니다 (TaskStore가 아니면 색인을 만들어 감쌉니다)."""
+        if value is self._tasks:
+            return
+        self._tasks = value if isinstance(value, TaskStore) else TaskStore(value)
+        self._ready.close()
+        self._ready = ReadySet(self._tasks, self._filter_policy, self._ordering)
+
+    @property
+    def tasks_changed(self) -> bool:
+        """마지막 reload_tasks() 이후 WBS 변경이 있었는지 여부.
+
+        reload_tasks()에서 병합한 변경과 그 뒤 refresh_task_status()가 읽은 변경을 포함합니다.
+        False이면 Task 목록이 이전 reload와 같으므로 UI 갱신 등을 건너뛸 수 있습니다.
+        """
+        return self._tasks_changed or self._pending_change
+
+    @property
+    def watching(self) -> bool:
+        """파일 감시 모드 여부."""
+        return self._watching
+
+    def set_watching(self, enabled: bool, fallback_interval: float = 30.0) -> None:
+        """파일 감시 모드를 설정합니다.
+
+        감시 모드에서는 `mark_dirty()` 호출 후, 또는 fallback_interval마다만
+        reload_tasks()가 WBS를 확인합니다.
+
+        Args:
+            enabled: 감시 모드 사용 여부
+            fallback_interval: 변경 알림이 없어도 WBS를 확인하는 간격 (초)
+        """
+        self._watching = enabled
+        self._watch_fallback = fallback_interval
+        self._dirty = True
+
+    def mark_dirty(self) -> None:
+        """WBS 파일 변경 알림 (다음 reload_tasks()에서 파싱)."""
+        self._dirty = True
+
+    @property
+    def last_delta(self) -> WbsDelta | None:
+        """마지막 reload_tasks()에서 병합한 Task 변경 내역.
+
+        None이면 전체 병합(첫 로드 등)이므로 모든 Task가 바뀌었다고 간주해야 합니다.
+        """
+        return self._last_delta
 
     @property
     def workflow_engine(self) -> WorkflowEngine:
         """WorkflowEngine 인스턴스를 반환합니다."""
         return self._engine
 
-    async def reload_tasks(self) -> list[Task]:
+    async def reload_tasks(self) -> TaskStore:
         """WBS를 다시 파싱하고 기존 Task에 병합합니다.
 
         런타임 상태(assigned_worker)는 보존됩니다.
 
+        파서가 변경 내역(`WbsParser.delta`)을 제공하면 바뀐 Task만 병합하고,
+        실행 가능 Task 집합에서는 필터링에 영향이 있는 필드가 바뀐 Task만 다시 평가합니다.
+        파일 감시 모드에서 변경 알림이 없으면 파싱하지 않습니다.
+
         Returns:
             병합된 Task 목록
         """
+        now = time.monotonic()
+        if (
+            self._watching
+            and not self._dirty
+            and not self._pending_change
+            and now - self._last_checked < self._watch_fallback
+        ):
+            self._tasks_changed = False
+            self._last_delta = WbsDelta()
+            return self._tasks
+        # 파싱 도중 들어온 변경 알림은 다음 호출에서 처리
+        self._dirty = False
+        self._last_checked = now
+
         new_tasks = await self._parser.parse()
-        self._merge_tasks(new_tasks)
+        changed = bool(self._parser.changed)
+        delta = getattr(self._parser, "delta", None)
+        if changed and not self._pending_change and isinstance(delta, WbsDelta):
+            self._last_delta = delta
+            self._tasks_changed = bool(delta)
+            if delta:
+                self._merge_delta(new_tasks, delta)
+                # 추가/삭제, 색인 필드 변경은 TaskStore 통지로 반영됨 (category 등은 직접 표시)
+                for task_id, fields in delta.changed.items():
+                    task = self._tasks.get(task_id)
+                    if task is not None and fields & FILTER_FIELDS:
+                        self._ready.invalidate(task)
+            return self._tasks
+
+        self._tasks_changed = changed or self._pending_change
+        if self._tasks_changed:
+            self._merge_tasks(new_tasks)
+            self._pending_change = False
+            self._ready.invalidate()
+            self._last_delta = None
+        else:
+            self._last_delta = WbsDelta()
         return self._tasks
 
+    def _merge_delta(self, new_tasks: list[Task], delta: WbsDelta) -> None:
+        """변경 내역에 해당하는 Task만 기존 Task 리스트에 병합합니다.
+
+        Args:
+            new_tasks: WBS 파싱으로 얻은 Task 리스트
+            delta: 이전 파싱 대비 변경 내역
+        """
+        if delta.removed:
+            self._tasks.discard_ids(set(delta.removed))
+
+        touched = set(delta.added) | delta.changed.keys()
+        new_map = {t.id: t for t in new_tasks if t.id in touched}
+        existing_map = {i: t for i in touched if (t := self._tasks.get(i)) is not None}
+        for task_id in delta.added:
+            if task_id not in existing_map and task_id in new_map:
+                self._tasks.append(new_map[task_id])
+        for task_id, fields in delta.changed.items():
+            existing = existing_map.get(task_id)
+            new_task = new_map.get(task_id)
+            if existing is None or new_task is None:
+                continue
+            # 파서와 같은 객체를 공유하면 이미 반영되어 있음
+            if existing is not new_task:
+                for name in fields:
+                    setattr(existing, name, getattr(new_task, name))
+
+        logger.debug(
+            f"Task 변경 병합: 추가 {len(delta.added)}, 삭제 {len(delta.removed)}, "
+            f"변경 {len(delta.changed)}"
+        )
+
     def _merge_tasks(self, new_tasks: list[Task]) -> None:
         """WBS 파싱 결과를 기존 Task 리스트에 병합합니다.
 
@@ -143,11 +284,11 @@ class TaskService:
             new_tasks: WBS 파싱으로 얻은 새 Task 리스트
         """
         # 기존 Task를 ID로 매핑
-        existing_map = {t.id: t for t in self._tasks}
+        existing_map = dict(self._tasks.by_id)
         new_ids = {t.id for t in new_tasks}
 
         # 1. 삭제된 Task 제거 (WBS에서 사라진 것)
-        self._tasks = [t for t in self._tasks if t.id in new_ids]
+        self._tasks.discard_ids({i for i in existing_map if i not in new_ids})
 
         # 2. 기존 Task 업데이트 또는 새 Task 추가
         for new_task in new_tasks:
@@ -168,15 +309,33 @@ class TaskService:
         logger.debug(f"Task 병합 완료: {len(self._tasks)}개")
 
     def get_executable_tasks(self, mode: ExecutionMode) -> list[Task]:
-        """실행 가능한 Task를 필터링하고 우선순위순으로 정렬합니다.
+        """실행 가능한 Task를 분배 순서(기본 Task ID 순)로 반환합니다.
+
+        Args:
+            mode: 현재 실행 모드
+
+        Returns:
+            분배 순서로 정렬된 실행 가능 Task 리스트
+
+        Note:
+            실행 가능 Task 집합(`ReadySet`)을 유지하므로, 모드가 같으면 마지막 조회 이후
+            바뀐 Task와 그 Task에 의존하는 Task만 다시 평가합니다.
+        """
+        return self._ready.tasks(mode)
+
+    def next_executable_task(
+        self, mode: ExecutionMode, exclude: Container[str] = ()
+    ) -> Task | None:
+        """다음으로 분배할 실행 가능 Task를 반환합니다 (전체 목록을 만들지 않음).
 
         Args:
             mode: 현재 실행 모드
+            exclude: 건너뛸 Task ID (예: 실행 중으로 감지된 Task)
 
         Returns:
-            우선순위순 정렬된 실행 가능 Task 리스트
+            분배 순서상 첫 실행 가능 Task 또는 None
         """
-        return self._filter_policy.filter_executable(self._tasks, mode)
+        return self._ready.first(mode, exclude)
 
     def cleanup_completed(self, mode: ExecutionMode) -> None:
         """stopAtState에 도달한 Task의 할당을 해제합니다.
@@ -193,8 +352,8 @@ class TaskService:
         stop_statuses = STOP_STATE_MAP.get(mode, {TaskStatus.DONE})
 
         # 완료된 Task의 할당 해제
-        for task in self._tasks:
-            if task.status in stop_statuses and task.assigned_worker is not None:
+        for task in self._tasks.assigned():
+            if task.status in stop_statuses:
                 logger.debug(f"Task {task.id} 할당 해제 (stopAtState 도달)")
                 task.assigned_worker = None
 
@@ -211,8 +370,8 @@ class TaskService:
         if valid_statuses is None:
             return
 
-        for task in self._tasks:
-            if task.assigned_worker is not None and task.status not in valid_statuses:
+        for task in self._tasks.assigned():
+            if task.status not in valid_statuses:
                 logger.debug(
                     f"Task {task.id} 할당 해제 (모드 범위 외: {task.status.value})"
                 )
@@ -232,6 +391,10 @@ class TaskService:
         """
         try:
             new_tasks = await self._parser.parse()
+            if self._parser.changed:
+                # 다른 Task 변경도 다음 reload_tasks()에서 병합되도록 기록
+                self._pending_change = True
+                self._ready.invalidate()
             for new_task in new_tasks:
                 if new_task.id == task.id:
                     # 상태 관련 필드만 업데이트
@@ -258,10 +421,7 @@ class TaskService:
         Returns:
             Task 또는 None
         """
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks.get(task_id)
 
     def get_tasks_by_status(self, status: TaskStatus) -> list[Task]:
         """상태로 Task를 조회합니다.
@@ -272,7 +432,7 @@ class TaskService:
         Returns:
             해당 상태의 Task 목록
         """
-        return [t for t in self._tasks if t.status == status]
+        return self._tasks.with_status(status)
 
     def get_assigned_tasks(self) -> list[Task]:
         """할당된 Task 목록을 반환합니다.
@@ -280,7 +440,7 @@ class TaskService:
         Returns:
             assigned_worker가 설정된 Task 목록
         """
-        return [t for t in self._tasks if t.assigned_worker is not None]
+        return self._tasks.assigned()
 
     async def update_task_status(
         self,
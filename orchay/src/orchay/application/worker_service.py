@@ -20,14 +20,18 @@ import zoneinfo
 from orchay.domain.constants import DISPATCH_TIMINGS
 from orchay.domain.workflow import ExecutionMode
 from orchay.models import PausedInfo, Worker, WorkerState
+from orchay.models.task_store import tasks_by_id
 from orchay.scheduler import get_manual_commands, get_next_workflow_command
 from orchay.utils.wezterm import get_active_pane_id, wezterm_list_panes, wezterm_send_text
 from orchay.worker import detect_worker_state
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from orchay.application.dispatch_service import DispatchService
     from orchay.application.task_service import TaskService
     from orchay.models import Config, Task
+    from orchay.utils.pane_snapshot import PaneSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -152,7 +156,7 @@ class WorkerService:
         Args:
             tasks: 현재 Task 목록 (Task 조회용)
         """
-        task_map = {t.id: t for t in tasks}
+        task_map = tasks_by_id(tasks)
 
         for worker in self._workers:
             await self._update_worker_state(worker, task_map)
@@ -160,7 +164,7 @@ class WorkerService:
     async def _update_worker_state(
         self,
         worker: Worker,
-        task_map: dict[str, Task],
+        task_map: Mapping[str, Task],
     ) -> None:
         """단일 Worker의 상태를 업데이트합니다.
 
@@ -214,10 +218,12 @@ class WorkerService:
     def get_busy_workers(self) -> list[Worker]:
         """작업 중인 Worker 목록을 반환합니다.
 
+        명령 전송 중(DISPATCHING)인 Worker도 Task를 맡고 있으므로 포함합니다.
+
         Returns:
             작업 중 Worker 목록
         """
-        return [w for w in self._workers if w.state == WorkerState.BUSY]
+        return [w for w in self._workers if w.state in (WorkerState.BUSY, WorkerState.DISPATCHING)]
 
     def get_worker_by_id(self, worker_id: int) -> Worker | None:
         """ID로 Worker를 조회합니다.
@@ -274,7 +280,7 @@ class WorkerService:
             get_next_command: 다음 명령어 결정 함수
             mode: 현재 실행 모드
         """
-        task_map = {t.id: t for t in tasks}
+        task_map = tasks_by_id(tasks)
 
         for worker in self._workers:
             if worker.current_task is None:
@@ -311,12 +317,17 @@ class WorkerService:
         """
         return {w.current_task for w in self._workers if w.current_task}
 
-    async def scan_running_tasks_from_panes(self) -> set[str]:
+    async def scan_running_tasks_from_panes(
+        self, snapshot: PaneSnapshot | None = None
+    ) -> set[str]:
         """모든 Worker pane에서 실행 중인 Task ID를 스캔합니다.
 
         pane 텍스트에서 /wf:xxx 명령어의 Task ID를 추출하여
         메모리 상태(current_task)와 비교하고 불일치 시 동기화합니다.
 
+        Args:
+            snapshot: tick 단위 pane 스냅샷 (있으면 CLI 재호출 없이 캐시 사용)
+
         Returns:
             pane에서 발견된 실행 중인 Task ID 집합
         """
@@ -326,10 +337,11 @@ class WorkerService:
 
         for worker in self._workers:
             # dead 상태 worker는 스킵 (pane이 없으므로 스캔 불가)
-            if worker.state == WorkerState.DEAD:
+            # dispatching 상태는 새 명령이 아직 화면에 없으므로 스킵
+            if worker.state in (WorkerState.DEAD, WorkerState.DISPATCHING):
                 continue
 
-            task_id = await extract_running_task_from_pane(worker.pane_id)
+            task_id = await extract_running_task_from_pane(worker.pane_id, snapshot=snapshot)
             if task_id:
                 running_tasks.add(task_id)
 
@@ -352,6 +364,7 @@ class WorkerService:
         task_service: TaskService,
         mode: ExecutionMode,
         paused: bool,
+        snapshot: PaneSnapshot | None = None,
     ) -> None:
         """Worker 상태를 업데이트하고 연속 실행을 처리합니다.
 
@@ -369,8 +382,14 @@ class WorkerService:
             task_service: TaskService 인스턴스
             mode: 현재 실행 모드
             paused: 스케줄러 일시정지 여부
+            snapshot: tick 단위 pane 스냅샷 (있으면 CLI 재호출 없이 캐시 사용)
         """
-        task_map = {t.id: t for t in tasks}
+        task_map = tasks_by_id(tasks)
+
+        # 백그라운드 명령 전송 중: 전송 완료 후 감지
+        if worker.state == WorkerState.DISPATCHING:
+            logger.debug(f"Worker {worker.id}: 명령 전송 중, 상태 감지 건너뜀")
+            return
 
         # Grace period: dispatch 직후에는 상태 체크 건너뛰기
         if worker.dispatch_time:
@@ -389,7 +408,7 @@ class WorkerService:
             f"task={worker.current_task}, has_active_task={has_active_task})"
         )
         state, done_or_paused_info = await detect_worker_state(
-            worker.pane_id, has_active_task
+            worker.pane_id, has_active_task, snapshot=snapshot
         )
         logger.debug(
             f"Worker {worker.id}: 감지 결과 state={state}, info={done_or_paused_info}"
@@ -411,6 +430,8 @@ class WorkerService:
         if new_state == WorkerState.PAUSED:
             if isinstance(done_or_paused_info, PausedInfo):
                 await self._handle_paused_worker(worker, done_or_paused_info)
+                if snapshot:
+                    snapshot.invalidate(worker.pane_id)
             else:
                 worker.state = new_state
         # done 상태 처리: 연속 실행 또는 할당 해제
@@ -423,6 +444,7 @@ class WorkerService:
                 task_service=task_service,
                 mode=mode,
                 paused=paused,
+                snapshot=snapshot,
             )
         elif new_state == WorkerState.IDLE:
             self._handle_idle_state(worker, task_map)
@@ -486,11 +508,12 @@ class WorkerService:
         self,
         worker: Worker,
         done_info: object | None,
-        task_map: dict[str, Task],
+        task_map: Mapping[str, Task],
         dispatch_service: DispatchService,
         task_service: TaskService,
         mode: ExecutionMode,
         paused: bool,
+        snapshot: PaneSnapshot | None = None,
     ) -> None:
         """DONE 상태를 처리합니다.
 
@@ -502,6 +525,7 @@ class WorkerService:
             task_service: TaskService 인스턴스
             mode: 현재 실행 모드
             paused: 스케줄러 일시정지 여부
+            snapshot: tick 단위 pane 스냅샷 (연속 실행 dispatch 시 전달)
         """
         # 이전 Task DONE 신호 무시
         # done_info.task_id는 "project/TSK-XX-XX" 형식일 수 있으므로 접두사 제거 후 비교
@@ -582,7 +606,7 @@ class WorkerService:
                                 f"연속 실행: {task.id} → /wf:{next_cmd} (Worker {worker.id})"
                             )
                             await dispatch_service.dispatch_next_step(
-                                worker, task, last_action
+                                worker, task, last_action, snapshot=snapshot
                             )
                             return  # 상태 유지, 다음으로
                     else:
@@ -598,7 +622,7 @@ class WorkerService:
     def _handle_idle_state(
         self,
         worker: Worker,
-        task_map: dict[str, Task],
+        task_map: Mapping[str, Task],
     ) -> None:
         """IDLE 상태를 처리합니다.
 
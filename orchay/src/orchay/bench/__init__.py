@@ -0,0 +1,8 @@
+"""orchay 벤치마크 패키지.
+
+실제 WezTerm/Claude pane 없이 시뮬레이션 Worker로 스케줄러 처리량을 측정합니다.
+"""
+
+from orchay.bench.runner import BenchConfig, BenchReport, run_bench
+
+__all__ = ["BenchConfig", "BenchReport", "run_bench"]
@@ -0,0 +1,177 @@
+"""Task/Worker 모델 벤치마크.
+
+같은 입력으로 pydantic 모델(`TaskModel`, `WorkerModel`)과 런타임 `__slots__` 표현
+(`Task`, `Worker`)을 만들어 객체당 생성 시간, 속성 변경 시간, 메모리를 비교합니다.
+
+측정 항목:
+    - construct: 키워드 인자로 객체 1개 생성
+    - assign: 상태 필드(Task.status, Worker.state) 1회 변경
+    - bytes: 객체 1개가 차지하는 tracemalloc 메모리 (입력과 공유하는 문자열 제외,
+      목록 필드는 모델이 새로 만드는 list/tuple 포함)
+
+Task 입력은 `orchay bench yaml`과 같은 합성 WBS를 파싱하여 만듭니다.
+
+Example:
+    ```python
+    for r in run_model_bench(count=1000):
+        print(r.model, r.impl, r.construct_seconds, r.bytes_per_object)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal, cast
+
+from orchay.bench.yaml_bench import generate_wbs
+from orchay.models import Task, TaskModel, TaskStatus, Worker, WorkerModel, WorkerState
+from orchay.wbs_parser import WbsParser
+
+ModelImpl = Literal["pydantic", "slots"]
+
+
+@dataclass
+class ModelBenchResult:
+    """모델/구현별 측정 결과 (객체당 값)."""
+
+    model: Literal["Task", "Worker"]
+    impl: ModelImpl
+    count: int
+    construct_seconds: float
+    assign_seconds: float
+    bytes_per_object: float
+
+
+def _task_kwargs(count: int) -> list[dict[str, Any]]:
+    """합성 WBS를 파싱하여 Task 생성 인자 목록을 만듭니다 (목록 필드는 list)."""
+    with tempfile.TemporaryDirectory(prefix="orchay-model-bench-") as tmp:
+        path = Path(tmp) / "wbs.yaml"
+        path.write_text(generate_wbs(count), encoding="utf-8")
+        tasks = asyncio.run(WbsParser(path).parse())
+    return [
+        {
+            name: list(cast(tuple[str, ...], value)) if isinstance(value, tuple) else value
+            for name, value in t.to_dict().items()
+        }
+        for t in tasks
+    ]
+
+
+def _worker_kwargs(count: int) -> list[dict[str, Any]]:
+    """실행 중 Worker와 같은 생성 인자 목록을 만듭니다."""
+    now = datetime.now()
+    return [
+        {
+            "id": i + 1,
+            "pane_id": i + 1,
+            "state": WorkerState.BUSY,
+            "current_task": f"TSK-{i:05d}",
+            "current_step": "build",
+            "dispatch_time": now,
+        }
+        for i in range(count)
+    ]
+
+
+def _best_time(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    """func 실행 시간의 최솟값 (누적 min_time 초를 넘으면 반복 중단)."""
+    best = float("inf")
+    total = 0.0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        if total >= min_time:
+            break
+    return best
+
+
+def _measure(
+    model: Literal["Task", "Worker"],
+    impl: ModelImpl,
+    factory: Callable[..., Any],
+    kwargs: list[dict[str, Any]],
+    field: str,
+    value: object,
+    repeat: int,
+    min_time: float,
+) -> ModelBenchResult:
+    """한 모델/구현의 생성/속성 변경 시간과 메모리를 측정합니다."""
+    count = len(kwargs)
+
+    def construct() -> list[Any]:
+        return [factory(**kw) for kw in kwargs]
+
+    objects = construct()
+
+    def assign() -> None:
+        for obj in objects:
+            setattr(obj, field, value)
+
+    construct_seconds = _best_time(construct, repeat, min_time)
+    assign_seconds = _best_time(assign, repeat, min_time)
+
+    del objects
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = construct()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return ModelBenchResult(
+        model=model,
+        impl=impl,
+        count=count,
+        construct_seconds=construct_seconds / count,
+        assign_seconds=assign_seconds / count,
+        bytes_per_object=(after - before) / count,
+    )
+
+
+def run_model_bench(
+    count: int = 10_000,
+    repeat: int = 5,
+    min_time: float = 1.0,
+) -> list[ModelBenchResult]:
+    """pydantic 모델과 런타임 표현의 생성 시간/메모리를 측정합니다.
+
+    Args:
+        count: 모델별 객체 수
+        repeat: 최대 반복 횟수 (최솟값 보고)
+        min_time: 누적 측정 시간이 이 값(초)을 넘으면 반복 중단
+
+    Returns:
+        측정 결과 목록 (Task pydantic, Task slots, Worker pydantic, Worker slots 순)
+    """
+    task_kwargs = _task_kwargs(count)
+    worker_kwargs = _worker_kwargs(count)
+    return [
+        _measure(
+            "Task", "pydantic", TaskModel, task_kwargs, "status", TaskStatus.DONE, repeat, min_time
+        ),
+        _measure("Task", "slots", Task, task_kwargs, "status", TaskStatus.DONE, repeat, min_time),
+        _measure(
+            "Worker",
+            "pydantic",
+            WorkerModel,
+            worker_kwargs,
+            "state",
+            WorkerState.IDLE,
+            repeat,
+            min_time,
+        ),
+        _measure(
+            "Worker", "slots", Worker, worker_kwargs, "state", WorkerState.IDLE, repeat, min_time
+        ),
+    ]
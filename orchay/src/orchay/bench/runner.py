@@ -0,0 +1,385 @@
+"""orchay 처리량 벤치마크.
+
+실제 `Orchestrator`/`WorkerService`/`DispatchService`를 시뮬레이션 터미널
+(`SimulatedTerminal`)과 합성 WBS 위에서 실행하고 처리량을 측정합니다.
+
+측정 항목:
+    - tasks/hour, steps/hour (워크플로우 명령 수 기준)
+    - dispatch 지연 (pane이 입력 대기가 된 시점 → 다음 /wf 명령 접수)
+    - tick 소요 시간 (`Orchestrator.run_tick` 1회)
+    - 터미널 호출 수 (실제 환경에서 호출 하나가 wezterm 서브프로세스 하나)
+    - 파일 열기 수 (WBS 읽기/쓰기)
+
+Example:
+    ```python
+    report = await run_bench(BenchConfig(workers=50, tasks=500, duration=(1.0, 3.0)))
+    print(report.tasks_per_hour)
+    ```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+from orchay.domain.workflow import WorkflowConfig, WorkflowEngine
+from orchay.infrastructure.wezterm.simulated import SimulatedTerminal, SimulationProfile
+from orchay.main import Orchestrator
+from orchay.models import Config
+from orchay.models.config import DispatchConfig, ExecutionConfig, HistoryConfig
+from orchay.scheduler import set_workflow_engine
+from orchay.utils.wezterm import set_terminal_backend
+from orchay.wbs_parser import update_task_status
+
+# 합성 프로젝트 이름 (.orchay/projects/{name}/wbs.yaml)
+BENCH_PROJECT = "bench"
+
+# 작업 패키지당 Task 수
+TASKS_PER_WP = 50
+
+# 벤치마크 워크플로우: 실제 development 워크플로우의 transitions (사람 승인 단계 없음)
+BENCH_TRANSITIONS: list[dict[str, str]] = [
+    {"from": "[ ]", "to": "[dd]", "command": "start"},
+    {"from": "[dd]", "to": "[ap]", "command": "approve"},
+    {"from": "[ap]", "to": "[im]", "command": "build"},
+    {"from": "[im]", "to": "[vf]", "command": "verify"},
+    {"from": "[vf]", "to": "[xx]", "command": "done"},
+]
+
+# 종료 시 백그라운드 명령 전송 완료 대기 시간 (초)
+_DRAIN_SECONDS = 5.0
+
+
+@dataclass
+class BenchConfig:
+    """벤치마크 설정.
+
+    Attributes:
+        workers: 시뮬레이션 Worker pane 수
+        tasks: 합성 WBS Task 수
+        duration: 워크플로우 명령 1회 실행 시간 범위 (초)
+        failure_rate: 명령 실패 확률
+        rate_limit_rate: 명령 중 rate limit 발생 확률
+        rate_limit_seconds: rate limit 지속 시간 (초)
+        tick_interval: tick 사이 대기 시간 (초)
+        timeout: 최대 실행 시간 (초)
+        delivery: 명령 전송 방식 (DispatchConfig.delivery)
+        seed: 난수 시드 (재현용)
+    """
+
+    workers: int = 10
+    tasks: int = 100
+    duration: tuple[float, float] = (1.0, 3.0)
+    failure_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    rate_limit_seconds: float = 5.0
+    tick_interval: float = 0.5
+    timeout: float = 600.0
+    delivery: Literal["fixed", "adaptive"] = "adaptive"
+    seed: int | None = 0
+
+
+@dataclass
+class Percentiles:
+    """측정값 분포 요약 (초)."""
+
+    count: int = 0
+    p50: float = 0.0
+    p95: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> Percentiles:
+        """측정값 목록에서 분포를 계산합니다 (nearest-rank).
+
+        Args:
+            samples: 측정값 목록
+
+        Returns:
+            Percentiles
+        """
+        if not samples:
+            return cls()
+        ordered = sorted(samples)
+
+        def rank(pct: float) -> float:
+            index = max(0, -(-len(ordered) * pct // 100) - 1)
+            return ordered[int(index)]
+
+        return cls(count=len(ordered), p50=rank(50), p95=rank(95), max=ordered[-1])
+
+
+@dataclass
+class BenchReport:
+    """벤치마크 결과."""
+
+    workers: int
+    tasks: int
+    completed: int
+    steps: int
+    elapsed: float
+    ticks: int
+    failures: int = 0
+    rate_limits: int = 0
+    timed_out: bool = False
+    dispatch_latency: Percentiles = field(default_factory=Percentiles)
+    tick_duration: Percentiles = field(default_factory=Percentiles)
+    terminal_calls: dict[str, int] = field(default_factory=dict[str, int])
+    file_reads: int = 0
+    file_writes: int = 0
+
+    @property
+    def tasks_per_hour(self) -> float:
+        """완료 Task 처리량 (시간당)."""
+        return self.completed * 3600 / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def steps_per_hour(self) -> float:
+        """워크플로우 명령 처리량 (시간당)."""
+        return self.steps * 3600 / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def calls_per_tick(self) -> float:
+        """tick당 평균 터미널 호출 수."""
+        return sum(self.terminal_calls.values()) / self.ticks if self.ticks else 0.0
+
+
+def write_bench_project(root: Path, tasks: int) -> Path:
+    """합성 프로젝트(wbs.yaml, workflows.json)를 생성합니다.
+
+    workflows.json은 force 모드에서 수동 명령 없이 [xx]까지 진행하도록 구성합니다.
+
+    Args:
+        root: 프로젝트 루트 디렉토리
+        tasks: 생성할 Task 수
+
+    Returns:
+        wbs.yaml 경로
+    """
+    settings_dir = root / ".orchay" / "settings"
+    settings_dir.mkdir(parents=True, exist_ok=True)
+    workflows: dict[str, Any] = {
+        "version": "2.0",
+        "defaultCategory": "development",
+        "executionModes": {
+            "force": {
+                "workflowScope": "transitions-only",
+                "stopAtState": "[xx]",
+                "dependencyCheck": "ignore",
+                "manualCommands": [],
+            },
+        },
+        "workflows": {
+            "development": {
+                "name": "Bench Workflow",
+                "states": ["[ ]", "[dd]", "[ap]", "[im]", "[vf]", "[xx]"],
+                "transitions": BENCH_TRANSITIONS,
+                "actions": {},
+            },
+        },
+    }
+    (settings_dir / "workflows.json").write_text(
+        json.dumps(workflows, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+    lines = [
+        "project:",
+        f"  id: {BENCH_PROJECT}",
+        "  name: Bench Project",
+        '  version: "1.0"',
+        "",
+        "workPackages:",
+    ]
+    wp_count = max(1, -(-tasks // TASKS_PER_WP))
+    for wp in range(1, wp_count + 1):
+        lines += [
+            f"  - id: WP-{wp:02d}",
+            f"    title: Work Package {wp}",
+            "    status: planned",
+            "    priority: medium",
+            "    tasks:",
+        ]
+        first = (wp - 1) * TASKS_PER_WP
+        for n in range(first + 1, min(first + TASKS_PER_WP, tasks) + 1):
+            lines += [
+                f"      - id: TSK-{wp:02d}-{n - first:02d}",
+                f"        title: Bench Task {n}",
+                "        category: development",
+                '        status: "[ ]"',
+                "        priority: medium",
+                "        depends: []",
+                "",
+            ]
+
+    wbs_path = root / ".orchay" / "projects" / BENCH_PROJECT / "wbs.yaml"
+    wbs_path.parent.mkdir(parents=True, exist_ok=True)
+    wbs_path.write_text("\n".join(lines), encoding="utf-8")
+    return wbs_path
+
+
+# 파일 열기 집계 (audit hook은 해제할 수 없으므로 한 번만 등록하고 이 값으로 켜고 끔)
+_io_counts: Counter[str] | None = None
+_io_root = ""
+_audit_installed = False
+
+
+def _audit_open(event: str, args: tuple[Any, ...]) -> None:
+    """open 감사 이벤트를 집계합니다 (벤치 루트 아래 파일만)."""
+    if event != "open" or _io_counts is None:
+        return
+    path, mode, flags = args
+    if not isinstance(path, str | os.PathLike):
+        return
+    fspath: str | bytes = os.fspath(path)
+    if not isinstance(fspath, str) or not fspath.startswith(_io_root):
+        return
+    if isinstance(mode, str):
+        writing = any(c in mode for c in "wax+")
+    else:
+        writing = bool(flags & (os.O_WRONLY | os.O_RDWR))
+    _io_counts["write" if writing else "read"] += 1
+
+
+@contextlib.contextmanager
+def _count_file_opens(root: Path) -> Generator[Counter[str]]:
+    """root 아래 파일 열기 횟수를 집계합니다."""
+    global _io_counts, _io_root, _audit_installed
+
+    if not _audit_installed:
+        sys.addaudithook(_audit_open)
+        _audit_installed = True
+    counts: Counter[str] = Counter()
+    _io_counts, _io_root = counts, str(root)
+    try:
+        yield counts
+    finally:
+        _io_counts, _io_root = None, ""
+
+
+def _orchestrator_config(bench: BenchConfig) -> Config:
+    """벤치마크용 orchay 설정 (dispatch 유예/최소 실행 시간 없음)."""
+    return Config(
+        workers=bench.workers,
+        history=HistoryConfig(enabled=False),
+        execution=ExecutionConfig(mode="force"),
+        dispatch=DispatchConfig(
+            grace_period=0,
+            min_task_duration=0,
+            delivery=bench.delivery,
+        ),
+    )
+
+
+async def run_bench(config: BenchConfig) -> BenchReport:
+    """임시 디렉토리에 합성 프로젝트를 만들고 벤치마크를 실행합니다.
+
+    Args:
+        config: 벤치마크 설정
+
+    Returns:
+        BenchReport
+
+    Raises:
+        RuntimeError: 오케스트레이터 초기화 실패 시
+    """
+    with tempfile.TemporaryDirectory(prefix="orchay-bench-") as tmp:
+        root = Path(tmp).resolve()
+        wbs_path = write_bench_project(root, config.tasks)
+        return await _run(config, root, wbs_path)
+
+
+async def _run(config: BenchConfig, root: Path, wbs_path: Path) -> BenchReport:
+    """시뮬레이션 터미널을 연결하고 모든 Task가 완료될 때까지 tick을 실행합니다."""
+    next_status = {t["command"]: t["to"] for t in BENCH_TRANSITIONS}
+    completed = steps = 0
+
+    async def on_complete(task_id: str, action: str, success: bool) -> None:
+        # 실제 /wf 스킬처럼 명령 성공 시 WBS 상태를 갱신
+        nonlocal completed, steps
+        if not success or action not in next_status:
+            return
+        steps += 1
+        updated = await update_task_status(wbs_path, task_id, next_status[action])
+        if updated and next_status[action] == "[xx]":
+            completed += 1
+
+    terminal = SimulatedTerminal(
+        config.workers,
+        SimulationProfile(
+            duration=config.duration,
+            failure_rate=config.failure_rate,
+            rate_limit_rate=config.rate_limit_rate,
+            rate_limit_seconds=config.rate_limit_seconds,
+            seed=config.seed,
+        ),
+        on_complete=on_complete,
+    )
+
+    previous_backend = set_terminal_backend(terminal)
+    previous_engine = set_workflow_engine(WorkflowEngine(WorkflowConfig.from_project_root(root)))
+    previous_pane = os.environ.get("WEZTERM_PANE")
+    os.environ["WEZTERM_PANE"] = str(SimulatedTerminal.SCHEDULER_PANE_ID)
+
+    tick_durations: list[float] = []
+    try:
+        # 상태 테이블 출력(rich console) 억제
+        with contextlib.redirect_stdout(io.StringIO()), _count_file_opens(root) as io_counts:
+            orchestrator = Orchestrator(_orchestrator_config(config), wbs_path, root, BENCH_PROJECT)
+            if not await orchestrator.initialize():
+                raise RuntimeError("벤치마크 오케스트레이터 초기화 실패")
+            terminal.calls.clear()
+            io_counts.clear()
+
+            started = time.perf_counter()
+            deadline = started + config.timeout
+            timed_out = False
+            while completed < config.tasks:
+                if time.perf_counter() >= deadline:
+                    timed_out = True
+                    break
+                tick_started = time.perf_counter()
+                await orchestrator.run_tick()
+                tick_durations.append(time.perf_counter() - tick_started)
+                await orchestrator.wait_for_signal(config.tick_interval)
+            elapsed = time.perf_counter() - started
+
+            await orchestrator.wait_pending(timeout=_DRAIN_SECONDS)
+            reads, writes = io_counts["read"], io_counts["write"]
+    finally:
+        set_terminal_backend(previous_backend)
+        set_workflow_engine(previous_engine)
+        if previous_pane is None:
+            os.environ.pop("WEZTERM_PANE", None)
+        else:
+            os.environ["WEZTERM_PANE"] = previous_pane
+        await terminal.close()
+
+    stats = [pane.stats for pane in terminal.panes.values()]
+    return BenchReport(
+        workers=config.workers,
+        tasks=config.tasks,
+        completed=completed,
+        steps=steps,
+        elapsed=elapsed,
+        ticks=len(tick_durations),
+        failures=sum(s.failures for s in stats),
+        rate_limits=sum(s.rate_limits for s in stats),
+        timed_out=timed_out,
+        dispatch_latency=Percentiles.from_samples(
+            [latency for s in stats for latency in s.dispatch_latencies]
+        ),
+        tick_duration=Percentiles.from_samples(tick_durations),
+        terminal_calls=dict(terminal.calls),
+        file_reads=reads,
+        file_writes=writes,
+    )
@@ -0,0 +1,197 @@
+"""WBS YAML 로딩 벤치마크.
+
+합성 wbs.yaml(Task 100 ~ 50,000개)을 백엔드별(`orchay.utils.yaml_loader`)로 파싱하여
+로딩 시간, `WbsParser.parse()` 전체 시간, 최대 메모리를 측정합니다.
+
+측정 항목:
+    - load: YAML 문자열 → dict (`load_yaml`)
+    - parse: 파일 읽기 + 해시 + YAML 로딩 + Task 모델 생성 (`WbsParser.parse`)
+    - peak: `WbsParser.parse()` 1회 동안 tracemalloc 최대 메모리.
+      tracemalloc은 Python 할당만 추적하므로 libyaml 내부(C) 버퍼는 포함되지 않습니다.
+
+Example:
+    ```python
+    results = run_yaml_bench(sizes=(100, 1000), backends=("fast", "libyaml"))
+    for r in results:
+        print(r.size, r.backend, r.load_seconds)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from orchay.utils.yaml_loader import YamlBackend, load_yaml
+from orchay.wbs_parser import WbsParser
+
+# 기본 측정 크기 (Task 수)
+DEFAULT_SIZES: tuple[int, ...] = (100, 1_000, 10_000, 50_000)
+
+# 기본 측정 백엔드 (auto는 fast가 성공하면 fast와 같음)
+DEFAULT_BACKENDS: tuple[YamlBackend, ...] = ("fast", "libyaml", "python")
+
+# 작업 패키지당 Task 수
+TASKS_PER_WP = 100
+
+_STATUSES = ("[ ]", "[dd]", "[ap]", "[im]", "[vf]", "[xx]")
+_CATEGORIES = ("development", "defect", "infrastructure", "simple-dev")
+_PRIORITIES = ("critical", "high", "medium", "low")
+
+
+@dataclass
+class YamlBenchResult:
+    """크기/백엔드별 측정 결과."""
+
+    size: int
+    backend: YamlBackend
+    file_bytes: int
+    load_seconds: float
+    parse_seconds: float
+    peak_bytes: int
+    # 결과가 libyaml(safe_load와 같은 규칙) 결과와 같은지
+    matches_reference: bool
+
+
+def generate_wbs(tasks: int) -> str:
+    """실제 wbs.yaml과 같은 형식의 합성 WBS 문자열을 생성합니다.
+
+    Args:
+        tasks: Task 수
+
+    Returns:
+        YAML 문자열
+    """
+    lines = [
+        "project:",
+        "  id: bench",
+        "  name: YAML 벤치마크 프로젝트",
+        '  createdAt: "2025-12-28"',
+        "wbs:",
+        '  version: "1.0"',
+        "  depth: 3",
+        "  projectRoot: bench",
+        "workPackages:",
+    ]
+    for wp in range((tasks + TASKS_PER_WP - 1) // TASKS_PER_WP):
+        wp_id = wp + 1
+        lines += [
+            f"  - id: WP-{wp_id:03d}",
+            f"    title: 작업 패키지 {wp_id}",
+            "    status: planned",
+            f"    priority: {_PRIORITIES[wp % len(_PRIORITIES)]}",
+            "    schedule: 2025-12-28 ~ 2026-01-03",
+            "    tasks:",
+        ]
+        for n in range(min(TASKS_PER_WP, tasks - wp * TASKS_PER_WP)):
+            index = wp * TASKS_PER_WP + n
+            task_id = f"TSK-{wp_id:03d}-{n + 1:03d}"
+            depends = f"[TSK-{wp_id:03d}-{n:03d}]" if n else "[]"
+            lines += [
+                f"      - id: {task_id}",
+                f"        title: 합성 Task {index} 구현 및 검증",
+                f"        category: {_CATEGORIES[index % len(_CATEGORIES)]}",
+                "        domain: backend",
+                f'        status: "{_STATUSES[index % len(_STATUSES)]}"',
+                f"        priority: {_PRIORITIES[index % len(_PRIORITIES)]}",
+                '        assignee: "-"',
+                "        schedule: 2025-12-28 ~ 2025-12-29",
+                "        tags:",
+                "          - bench",
+                f"          - wp{wp_id}",
+                f"        depends: {depends}",
+                "        requirements:",
+                "          items:",
+                f"            - 요구사항 {index}-1: 입력 검증",
+                f'            - "\\"따옴표\\" 포함 항목 {index}"',
+                "          acceptance:",
+                f"            - 테스트 {index} 통과",
+                "        note: 벤치마크용 # 주석",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def _best_time(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    """func 실행 시간의 최솟값 (누적 min_time 초를 넘으면 반복 중단)."""
+    best = float("inf")
+    total = 0.0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        if total >= min_time:
+            break
+    return best
+
+
+def _parse_file(path: Path, backend: YamlBackend) -> None:
+    """새 WbsParser로 파일을 1회 파싱합니다."""
+    tasks = asyncio.run(WbsParser(path, yaml_backend=backend).parse())
+    if not tasks:
+        raise RuntimeError(f"WBS 파싱 실패 ({backend}): {path}")
+
+
+def run_yaml_bench(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    backends: Iterable[YamlBackend] = DEFAULT_BACKENDS,
+    repeat: int = 5,
+    min_time: float = 1.0,
+    workdir: Path | None = None,
+) -> list[YamlBenchResult]:
+    """크기/백엔드별 YAML 로딩 성능을 측정합니다.
+
+    Args:
+        sizes: 측정할 Task 수 목록
+        backends: 측정할 백엔드 목록
+        repeat: 최대 반복 횟수 (최솟값 보고)
+        min_time: 누적 측정 시간이 이 값(초)을 넘으면 반복 중단
+        workdir: 합성 WBS 파일을 쓸 디렉토리 (기본: 임시 디렉토리)
+
+    Returns:
+        측정 결과 목록 (크기 → 백엔드 순)
+    """
+    backends = list(backends)
+    results: list[YamlBenchResult] = []
+    with tempfile.TemporaryDirectory(prefix="orchay-yaml-bench-") as tmp:
+        root = workdir or Path(tmp)
+        for size in sizes:
+            content = generate_wbs(size)
+            path = root / f"wbs-{size}.yaml"
+            path.write_text(content, encoding="utf-8")
+            reference = load_yaml(content, "libyaml")
+
+            for backend in backends:
+                matches = load_yaml(content, backend) == reference
+                load_seconds = _best_time(
+                    lambda c=content, b=backend: load_yaml(c, b), repeat, min_time
+                )
+                parse_seconds = _best_time(
+                    lambda p=path, b=backend: _parse_file(p, b), repeat, min_time
+                )
+
+                tracemalloc.start()
+                try:
+                    _parse_file(path, backend)
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+
+                results.append(
+                    YamlBenchResult(
+                        size=size,
+                        backend=backend,
+                        file_bytes=len(content.encode("utf-8")),
+                        load_seconds=load_seconds,
+                        parse_seconds=parse_seconds,
+                        peak_bytes=peak,
+                        matches_reference=matches,
+                    )
+                )
+    return results
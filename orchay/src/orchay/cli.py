@@ -5,13 +5,19 @@
 사용법:
     orchay                      # 스케줄러 실행 (기본)
     orchay run [options]        # 스케줄러 실행
-    orchay history [task_id]    # 작업 히스토리 조회
+    orchay history [task_id]    # 작업 히스토리 조회 (--show: 캡처된 출력 표시)
+    orchay signal <signal>      # Worker 신호 전송 (Worker pane에서 실행)
+    orchay bench [options]      # 시뮬레이션 Worker로 처리량 측정
+    orchay bench yaml [options] # WBS YAML 백엔드별 파싱 성능 측정
+    orchay bench models         # Task/Worker 모델 생성 시간/메모리 비교
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+from pathlib import Path
 from typing import Any
 
 from rich.console import Console
@@ -98,10 +104,328 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="히스토리 삭제",
     )
+    history_parser.add_argument(
+        "--show",
+        action="store_true",
+        help="캡처된 pane 출력 표시 (Task ID 생략 시 가장 최근 항목)",
+    )
+
+    # signal 서브커맨드 (Worker 신호 전송)
+    signal_parser = subparsers.add_parser(
+        "signal",
+        help="Worker 신호 전송 (실행 중인 스케줄러에 완료/일시정지/에러 알림)",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    signal_parser.add_argument(
+        "signal",
+        help="""전송할 신호
+  ORCHAY_DONE:{task-id}:{action}:{status}[:{message}]
+  ORCHAY_PAUSED[:{message}]
+  ORCHAY_ERROR[:{message}]""",
+    )
+    signal_parser.add_argument(
+        "--pane",
+        type=int,
+        default=None,
+        help="신호를 보내는 pane ID (기본: WEZTERM_PANE 환경변수)",
+    )
+
+    # bench 서브커맨드 (시뮬레이션 Worker 처리량 측정)
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="시뮬레이션 Worker로 스케줄러 처리량 측정",
+    )
+    bench_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=10,
+        help="시뮬레이션 Worker 수 (기본: 10)",
+    )
+    bench_parser.add_argument(
+        "-t",
+        "--tasks",
+        type=int,
+        default=100,
+        help="합성 WBS Task 수 (기본: 100)",
+    )
+    bench_parser.add_argument(
+        "--duration",
+        type=float,
+        nargs=2,
+        default=[1.0, 3.0],
+        metavar=("MIN", "MAX"),
+        help="명령 1회 실행 시간 범위 초 (기본: 1.0 3.0)",
+    )
+    bench_parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="명령 실패 확률 (기본: 0.0)",
+    )
+    bench_parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=0.0,
+        help="명령 중 rate limit 발생 확률 (기본: 0.0)",
+    )
+    bench_parser.add_argument(
+        "--tick-interval",
+        type=float,
+        default=0.5,
+        help="tick 간격 초 (기본: 0.5)",
+    )
+    bench_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600.0,
+        help="최대 실행 시간 초 (기본: 600)",
+    )
+    bench_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="난수 시드 (기본: 0)",
+    )
+    bench_parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="스케줄러 로그 출력",
+    )
+
+    # bench yaml (WBS YAML 백엔드별 파싱 성능 측정)
+    bench_subparsers = bench_parser.add_subparsers(dest="bench_command")
+    bench_yaml_parser = bench_subparsers.add_parser(
+        "yaml",
+        help="합성 WBS로 YAML 백엔드별 파싱 시간/메모리 측정",
+    )
+    bench_yaml_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000, 50000],
+        help="합성 WBS Task 수 (기본: 100 1000 10000 50000)",
+    )
+    bench_yaml_parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["auto", "fast", "libyaml", "python"],
+        default=["fast", "libyaml", "python"],
+        help="측정할 백엔드 (기본: fast libyaml python)",
+    )
+    bench_yaml_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="최대 반복 횟수, 최솟값 보고 (기본: 5)",
+    )
+
+    # bench models (pydantic 모델과 런타임 __slots__ 표현 비교)
+    bench_models_parser = bench_subparsers.add_parser(
+        "models",
+        help="Task/Worker pydantic 모델과 런타임 표현의 생성 시간/메모리 비교",
+    )
+    bench_models_parser.add_argument(
+        "--count",
+        type=int,
+        default=10000,
+        help="모델별 객체 수 (기본: 10000)",
+    )
+    bench_models_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="최대 반복 횟수, 최솟값 보고 (기본: 5)",
+    )
 
     return parser
 
 
+def handle_bench(args: argparse.Namespace) -> int:
+    """bench 서브커맨드 처리."""
+    import asyncio
+    import logging
+
+    from orchay.bench import BenchConfig, run_bench
+
+    if getattr(args, "bench_command", None) == "yaml":
+        return handle_bench_yaml(args)
+    if getattr(args, "bench_command", None) == "models":
+        return handle_bench_models(args)
+
+    if args.workers < 1 or args.tasks < 1:
+        console.print("[red]오류:[/] --workers와 --tasks는 1 이상이어야 합니다.")
+        return 1
+
+    if not args.verbose:
+        logging.getLogger("orchay").setLevel(logging.ERROR)
+
+    config = BenchConfig(
+        workers=args.workers,
+        tasks=args.tasks,
+        duration=(args.duration[0], args.duration[1]),
+        failure_rate=args.failure_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        tick_interval=args.tick_interval,
+        timeout=args.timeout,
+        seed=args.seed,
+    )
+    console.print(
+        f"[bold cyan]orchay bench[/] - Worker {config.workers}개, Task {config.tasks}개 "
+        f"(명령 {config.duration[0]}~{config.duration[1]}s)"
+    )
+    report = asyncio.run(run_bench(config))
+
+    table = Table(title="Bench Result")
+    table.add_column("항목", style="cyan")
+    table.add_column("값", justify="right")
+    table.add_row("완료 Task", f"{report.completed}/{report.tasks}")
+    table.add_row("경과 시간", f"{report.elapsed:.1f}s")
+    table.add_row("tasks/hour", f"{report.tasks_per_hour:,.0f}")
+    table.add_row("steps/hour", f"{report.steps_per_hour:,.0f}")
+    latency = report.dispatch_latency
+    table.add_row(
+        "dispatch 지연 p50/p95/max",
+        f"{latency.p50:.3f}s / {latency.p95:.3f}s / {latency.max:.3f}s",
+    )
+    tick = report.tick_duration
+    table.add_row(
+        "tick 시간 p50/p95/max",
+        f"{tick.p50 * 1000:.1f}ms / {tick.p95 * 1000:.1f}ms / {tick.max * 1000:.1f}ms",
+    )
+    table.add_row("tick 수", str(report.ticks))
+    for name, count in sorted(report.terminal_calls.items()):
+        table.add_row(f"wezterm {name} 호출", str(count))
+    table.add_row("tick당 wezterm 호출", f"{report.calls_per_tick:.1f}")
+    table.add_row("파일 읽기/쓰기", f"{report.file_reads} / {report.file_writes}")
+    table.add_row("실패 / rate limit", f"{report.failures} / {report.rate_limits}")
+    console.print(table)
+
+    if report.timed_out:
+        console.print(
+            f"[yellow]시간 초과:[/] {config.timeout:.0f}s 안에 모든 Task를 마치지 못했습니다."
+        )
+        return 1
+    return 0
+
+
+def handle_bench_yaml(args: argparse.Namespace) -> int:
+    """bench yaml 서브커맨드 처리."""
+    from orchay.bench.yaml_bench import run_yaml_bench
+    from orchay.utils.yaml_loader import HAS_LIBYAML
+
+    if any(size < 1 for size in args.sizes):
+        console.print("[red]오류:[/] --sizes는 1 이상이어야 합니다.")
+        return 1
+
+    console.print(
+        f"[bold cyan]orchay bench yaml[/] - Task {', '.join(map(str, args.sizes))}개 "
+        f"(libyaml {'사용 가능' if HAS_LIBYAML else '없음: python으로 대체'})"
+    )
+    results = run_yaml_bench(sizes=args.sizes, backends=args.backends, repeat=args.repeat)
+
+    table = Table(title="YAML Bench Result")
+    table.add_column("Task 수", justify="right")
+    table.add_column("파일 크기", justify="right")
+    table.add_column("백엔드", style="cyan")
+    table.add_column("load", justify="right")
+    table.add_column("parse", justify="right")
+    table.add_column("최대 메모리", justify="right")
+    table.add_column("결과 일치", justify="center")
+    for r in results:
+        table.add_row(
+            f"{r.size:,}",
+            f"{r.file_bytes / 1024:,.0f}KB",
+            r.backend,
+            f"{r.load_seconds * 1000:,.1f}ms",
+            f"{r.parse_seconds * 1000:,.1f}ms",
+            f"{r.peak_bytes / 1024 / 1024:,.1f}MB",
+            "[green]✓[/]" if r.matches_reference else "[red]✗[/]",
+        )
+    console.print(table)
+    console.print("[dim]최대 메모리는 tracemalloc 기준 (libyaml C 버퍼 제외)[/]")
+
+    if not all(r.matches_reference for r in results):
+        console.print("[red]오류:[/] 백엔드 결과가 safe_load 결과와 다릅니다.")
+        return 1
+    return 0
+
+
+def handle_bench_models(args: argparse.Namespace) -> int:
+    """bench models 서브커맨드 처리."""
+    from orchay.bench.model_bench import run_model_bench
+
+    if args.count < 1:
+        console.print("[red]오류:[/] --count는 1 이상이어야 합니다.")
+        return 1
+
+    console.print(f"[bold cyan]orchay bench models[/] - 모델별 객체 {args.count:,}개")
+    results = run_model_bench(count=args.count, repeat=args.repeat)
+
+    table = Table(title="Model Bench Result")
+    table.add_column("모델", style="cyan")
+    table.add_column("구현")
+    table.add_column("생성", justify="right")
+    table.add_column("속성 변경", justify="right")
+    table.add_column("메모리/객체", justify="right")
+    baseline: dict[str, float] = {}
+    for r in results:
+        if r.impl == "pydantic":
+            baseline[r.model] = r.bytes_per_object
+        ratio = r.bytes_per_object / baseline[r.model] if baseline.get(r.model) else 1.0
+        table.add_row(
+            r.model,
+            r.impl,
+            f"{r.construct_seconds * 1e6:,.2f}µs",
+            f"{r.assign_seconds * 1e6:,.3f}µs",
+            f"{r.bytes_per_object:,.0f}B ({ratio:.0%})",
+        )
+    console.print(table)
+    console.print("[dim]메모리는 tracemalloc 기준 (입력과 공유하는 문자열 제외)[/]")
+    return 0
+
+
+def handle_signal(args: argparse.Namespace) -> int:
+    """signal 서브커맨드 처리."""
+    from orchay.utils.config import find_orchay_root, load_config
+    from orchay.utils.signal_listener import parse_signal_text, send_signal
+
+    if parse_signal_text(args.signal) is None:
+        console.print(f"[red]오류:[/] 알 수 없는 신호입니다: {args.signal}")
+        return 1
+
+    pane_id = args.pane
+    if pane_id is None:
+        env_pane = os.environ.get("WEZTERM_PANE")
+        if env_pane is None or not env_pane.isdigit():
+            console.print("[red]오류:[/] --pane을 지정하거나 WezTerm pane에서 실행하세요.")
+            return 1
+        pane_id = int(env_pane)
+
+    try:
+        config = load_config()
+    except Exception:
+        socket_path = Path(".orchay/logs/orchay.sock")
+    else:
+        socket_path = Path(config.signal.socket_path)
+
+    orchay_root = find_orchay_root()
+    if not socket_path.is_absolute() and orchay_root is not None:
+        socket_path = orchay_root.parent / socket_path
+
+    try:
+        response = send_signal(socket_path, pane_id, args.signal)
+    except OSError as e:
+        console.print(f"[red]오류:[/] 스케줄러에 연결할 수 없습니다 ({socket_path}): {e}")
+        return 1
+
+    if response != "ok":
+        console.print(f"[red]오류:[/] {response}")
+        return 1
+    return 0
+
+
 def handle_history(args: argparse.Namespace) -> int:
     """history 서브커맨드 처리."""
     from orchay.utils.config import load_config
@@ -125,9 +449,14 @@ def handle_history(args: argparse.Namespace) -> int:
         console.print("[green]✓[/] 히스토리가 삭제되었습니다.")
         return 0
 
-    # 특정 Task ID 조회
-    if args.task_id:
-        entry: dict[str, Any] | None = manager.get(args.task_id)
+    # 특정 Task ID 조회 (--show만 지정하면 가장 최근 항목)
+    show: bool = getattr(args, "show", False)
+    if args.task_id or show:
+        entry: dict[str, Any] | None
+        if args.task_id:
+            entry = manager.get(args.task_id, with_output=False)
+        else:
+            entry = next(iter(manager.list(1)), None)
         if entry:
             console.print(f"\n[bold]Task:[/] {entry['task_id']}")
             console.print(f"[bold]Command:[/] {entry['command']}")
@@ -135,11 +464,20 @@ def handle_history(args: argparse.Namespace) -> int:
             console.print(f"[bold]Result:[/] [{result_color}]{entry['result']}[/{result_color}]")
             console.print(f"[bold]Worker:[/] {entry['worker_id']}")
             console.print(f"[bold]Timestamp:[/] {entry['timestamp']}")
-            if entry.get("output"):
-                console.print("\n[dim]--- Captured Output ---[/]\n")
-                console.print(entry["output"])
-        else:
+            if show:
+                # 압축 블롭은 출력을 표시할 때만 복원
+                output = manager.output(entry)
+                if output:
+                    console.print("\n[dim]--- Captured Output ---[/]\n")
+                    console.print(output)
+            elif entry.get("output_ref") or entry.get("output"):
+                console.print(
+                    f"\n[dim]ℹ️  'orchay history {entry['task_id']} --show'로 캡처된 출력 확인[/]"
+                )
+        elif args.task_id:
             console.print(f"[yellow]Task {args.task_id}의 히스토리를 찾을 수 없습니다.[/]")
+        else:
+            console.print("[yellow]히스토리가 없습니다.[/]")
         return 0
 
     # 목록 출력
@@ -166,7 +504,7 @@ def handle_history(args: argparse.Namespace) -> int:
         )
 
     console.print(table)
-    console.print("\n[dim]ℹ️  'orchay history <TASK-ID>'로 상세 출력 확인[/]")
+    console.print("\n[dim]ℹ️  'orchay history <TASK-ID> --show'로 상세 출력 확인[/]")
     return 0
 
 
@@ -185,6 +523,10 @@ def cli_main() -> int:
 
     if args.command == "history":
         return handle_history(args)
+    elif args.command == "signal":
+        return handle_signal(args)
+    elif args.command == "bench":
+        return handle_bench(args)
     elif args.command == "run":
         # 스케줄러 실행 (기존 main.py 방식)
         # sys.argv에서 'run' 서브커맨드를 제거하여 main.py에 전달
@@ -9,7 +9,8 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol
 
-from orchay.models import Task, TaskStatus, WorkerState
+from orchay.models import Task, TaskStatus, TaskStore, WorkerState
+from orchay.models.task_store import find_task
 from orchay.scheduler import ExecutionMode
 
 if TYPE_CHECKING:
@@ -206,7 +207,10 @@ class CommandHandler:
         Returns:
             완료되지 않은 Task 리스트
         """
-        return [t for t in self.orchestrator.tasks if t.status != TaskStatus.DONE]
+        tasks = self.orchestrator.tasks
+        if isinstance(tasks, TaskStore):
+            return tasks.without_status(TaskStatus.DONE)
+        return [t for t in tasks if t.status != TaskStatus.DONE]
 
     def get_prev_task_index(self, current: int, total: int) -> int:
         """이전 Task 인덱스를 반환합니다.
@@ -263,7 +267,7 @@ class CommandHandler:
         if task_id in self.orchestrator.running_tasks:
             return CommandResult.error(f"실행 중인 Task는 스킵할 수 없습니다: {task_id}")
 
-        task = next((t for t in self.orchestrator.tasks if t.id == task_id), None)
+        task = find_task(self.orchestrator.tasks, task_id)
 
         if task is None:
             return CommandResult.error(f"Task '{task_id}'를 찾을 수 없습니다")
@@ -289,7 +293,7 @@ class CommandHandler:
 
         from orchay.wbs_parser import update_task_blocked_by
 
-        task = next((t for t in self.orchestrator.tasks if t.id == task_id), None)
+        task = find_task(self.orchestrator.tasks, task_id)
 
         if task is None:
             return CommandResult.error(f"Task '{task_id}'를 찾을 수 없습니다")
@@ -327,7 +331,7 @@ class CommandHandler:
         if self.orchestrator.mode == ExecutionMode.FORCE:
             return CommandResult.error("force 모드에서는 자동 승인됩니다")
 
-        task = next((t for t in self.orchestrator.tasks if t.id == task_id), None)
+        task = find_task(self.orchestrator.tasks, task_id)
         if task is None:
             return CommandResult.error(f"Task '{task_id}'를 찾을 수 없습니다")
 
@@ -361,8 +365,10 @@ class CommandHandler:
         if wbs_path is None:
             return CommandResult.error("WBS 파일 경로를 찾을 수 없습니다")
 
-        # WBS 파일 직접 업데이트
-        success = await update_task_status(wbs_path, task_id, new_status)
+        # WBS 파일 업데이트 (그 사이 파일의 상태가 바뀌었으면 덮어쓰지 않음)
+        success = await update_task_status(
+            wbs_path, task_id, new_status, expected_status=raw_status
+        )
         if success:
             task.status = new_enum  # 메모리 동기화
             return CommandResult.ok(f"{task_id} → {action} {new_status}")
@@ -438,7 +444,8 @@ class CommandHandler:
         """Worker 정보 표시."""
         workers = self.orchestrator.workers
         idle = sum(1 for w in workers if w.state == WorkerState.IDLE)
-        busy = sum(1 for w in workers if w.state == WorkerState.BUSY)
+        # 명령 전송 중(DISPATCHING)인 Worker도 Task를 맡고 있으므로 busy로 집계
+        busy = sum(1 for w in workers if w.state in (WorkerState.BUSY, WorkerState.DISPATCHING))
         return CommandResult.ok(f"Workers: {len(workers)} total, {idle} idle, {busy} busy")
 
     async def _cmd_worker(self, arg: str | None) -> CommandResult:
@@ -17,6 +17,12 @@ class DispatchTimings:
         ENTER_WAIT_SECONDS: Enter 키 처리 대기 시간
         GRACE_PERIOD_SECONDS: 분배 후 상태 체크 유예 기간
         MIN_TASK_DURATION_SECONDS: 최소 Task 실행 시간 (너무 빠른 완료 경고)
+        PENDING_DRAIN_SECONDS: 종료 시 백그라운드 명령 전송 완료 대기 시간
+        PROBE_INITIAL_SECONDS: adaptive 전송 시 첫 pane 확인 간격
+        PROBE_MAX_INTERVAL_SECONDS: adaptive 전송 시 pane 확인 간격 상한 (지수 백오프)
+        PROBE_LINES: adaptive 전송 시 확인할 pane 하단 라인 수
+        CLEAR_SCREEN_MAX_LINES: /clear 완료로 볼 pane 하단의 최대 비어 있지 않은 줄 수
+            (입력창 테두리와 상태 줄만 남은 화면)
     """
 
     CLEAR_WAIT_SECONDS: float = 5.0
@@ -24,6 +30,11 @@ class DispatchTimings:
     ENTER_WAIT_SECONDS: float = 1.0
     GRACE_PERIOD_SECONDS: float = 20.0
     MIN_TASK_DURATION_SECONDS: float = 30.0
+    PENDING_DRAIN_SECONDS: float = 10.0
+    PROBE_INITIAL_SECONDS: float = 0.05
+    PROBE_MAX_INTERVAL_SECONDS: float = 0.4
+    PROBE_LINES: int = 15
+    CLEAR_SCREEN_MAX_LINES: int = 8
 
 
 @dataclass(frozen=True)
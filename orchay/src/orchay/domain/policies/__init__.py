@@ -1,8 +1,10 @@
 """비즈니스 정책 모듈.
 
-Task 필터링, 의존성 검사 등 비즈니스 규칙을 제공합니다.
+Task 필터링, 의존성 검사, 실행 가능 Task 집합, 분배 순서 등 비즈니스 규칙을 제공합니다.
 """
 
+from orchay.domain.policies.ready_set import ReadySet
 from orchay.domain.policies.task_filter import TaskFilterPolicy
+from orchay.domain.policies.task_order import DependencyGraph, TaskOrdering
 
-__all__ = ["TaskFilterPolicy"]
+__all__ = ["DependencyGraph", "ReadySet", "TaskFilterPolicy", "TaskOrdering"]
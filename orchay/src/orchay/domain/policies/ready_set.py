@@ -0,0 +1,261 @@
+"""실행 가능 Task 집합 (증분 갱신).
+
+`TaskFilterPolicy.filter_executable()`은 호출마다 모든 Task에 BR-01~BR-09와 의존성
+검사를 적용합니다. `ReadySet`은 그 결과를 분배 순서(`TaskOrdering`, 기본 Task ID 순)로
+유지하고, `TaskStore` 변경 통지를 받아 다음 Task만 다시 평가합니다.
+
+- 추가/삭제되었거나 색인 필드(status, depends, blocked_by, assigned_worker)가 바뀐 Task
+- 상태가 바뀌었거나 추가/삭제된 Task에 의존하는 Task (역방향 의존성 색인)
+- `invalidate(task)`로 알린 Task (예: WBS에서 category가 바뀐 Task)
+
+WBS 변경이 없는 tick에서는 필터링 없이 유지 중인 목록을 반환합니다. 모드가 바뀌거나
+`invalidate()`로 전체 무효화하면 전체를 다시 필터링합니다. 의존성 그래프를 쓰는 순서
+정책은 Task 추가/삭제, depends 변경, 완료 여부 변경이 있을 때만 그래프를 다시 계산하고
+정렬 키를 갱신합니다.
+
+Example:
+    ```python
+    ready = ReadySet(store, TaskFilterPolicy(engine))
+    ready.tasks(ExecutionMode.QUICK)  # 첫 호출: 전체 필터링
+    store[0].assigned_worker = 1      # 통지 → 해당 Task만 재평가
+    ready.first(ExecutionMode.QUICK)
+    ```
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from collections.abc import Container
+from typing import TYPE_CHECKING
+
+from orchay.domain.policies.task_order import TaskOrdering
+from orchay.models import TaskStatus
+
+if TYPE_CHECKING:
+    from orchay.domain.policies.task_filter import TaskFilterPolicy
+    from orchay.domain.workflow import ExecutionMode
+    from orchay.models import Task, TaskStore
+
+logger = logging.getLogger(__name__)
+
+# 정렬 키: (*분배 순서 키, Task ID, 추가 순번) - 같은 ID의 Task도 구분
+_Key = tuple[float | str | int, ...]
+
+
+class ReadySet:
+    """분배 순서대로 유지하는 실행 가능 Task 집합.
+
+    `TaskStore`의 구독자로 등록되어 변경된 Task만 표시해 두고, 조회 시 표시된 Task만
+    `TaskFilterPolicy.is_executable()`로 다시 평가합니다.
+    """
+
+    def __init__(
+        self,
+        store: TaskStore,
+        policy: TaskFilterPolicy,
+        ordering: TaskOrdering | None = None,
+    ) -> None:
+        """ReadySet을 초기화합니다.
+
+        Args:
+            store: 전체 Task 목록
+            policy: 실행 가능 여부 판단 정책
+            ordering: 분배 순서 정책 (None이면 Task ID 순)
+        """
+        self._store = store
+        self._policy = policy
+        self._ordering = ordering if ordering is not None else TaskOrdering()
+        # 의존성 그래프를 다시 계산해야 하는지 여부
+        self._graph_dirty = True
+        # 마지막 전체 필터링 모드 (None이면 다음 조회에서 전체 필터링)
+        self._mode: ExecutionMode | None = None
+        self._manual_cmds: set[str] = set()
+        # 분배 순서 정렬 키 목록과 키 → Task
+        self._keys: list[_Key] = []
+        self._tasks: dict[_Key, Task] = {}
+        # id(Task) → 정렬 키
+        self._entries: dict[int, _Key] = {}
+        self._counter = 0
+        # 다시 평가할 Task, 의존하는 Task를 다시 평가할 Task ID
+        self._dirty: dict[int, Task] = {}
+        self._dirty_deps: set[str] = set()
+        store.add_listener(self)
+
+    def close(self) -> None:
+        """TaskStore 구독을 해제합니다."""
+        self._store.remove_listener(self)
+
+    # ========================================================================
+    # 조회
+    # ========================================================================
+
+    @property
+    def ordering(self) -> TaskOrdering:
+        """분배 순서 정책."""
+        return self._ordering
+
+    def tasks(self, mode: ExecutionMode) -> list[Task]:
+        """실행 가능 Task 목록 (분배 순서).
+
+        Args:
+            mode: 현재 실행 모드
+
+        Returns:
+            실행 가능 Task 리스트 (호출자가 변경해도 집합에 영향 없음)
+        """
+        self._sync(mode)
+        return [self._tasks[key] for key in self._keys]
+
+    def first(self, mode: ExecutionMode, exclude: Container[str] = ()) -> Task | None:
+        """다음으로 분배할 Task (분배 순서상 첫 실행 가능 Task).
+
+        Args:
+            mode: 현재 실행 모드
+            exclude: 건너뛸 Task ID (예: pane에서 실행 중으로 감지된 Task)
+
+        Returns:
+            Task 또는 None
+        """
+        self._sync(mode)
+        for key in self._keys:
+            task = self._tasks[key]
+            if task.id not in exclude:
+                return task
+        return None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # ========================================================================
+    # 무효화 (TaskStoreListener)
+    # ========================================================================
+
+    def invalidate(self, task: Task | None = None) -> None:
+        """Task 하나(또는 전체)를 다음 조회에서 다시 평가하도록 표시합니다.
+
+        Args:
+            task: 다시 평가할 Task (None이면 전체 필터링)
+        """
+        if task is None:
+            self._mode = None
+        else:
+            self._dirty[id(task)] = task
+        # priority/schedule 등 정렬 키에 쓰이는 필드가 바뀌었을 수 있음
+        self._graph_dirty = True
+
+    def task_added(self, task: Task) -> None:
+        self._dirty[id(task)] = task
+        self._dirty_deps.add(task.id)
+        self._graph_dirty = True
+
+    def task_removed(self, task: Task) -> None:
+        self._dirty[id(task)] = task
+        self._dirty_deps.add(task.id)
+        self._graph_dirty = True
+
+    def task_changed(self, task: Task, field: str, old: object) -> None:
+        self._dirty[id(task)] = task
+        if field == "status":
+            self._dirty_deps.add(task.id)
+            if TaskStatus.DONE in (old, task.status):
+                self._graph_dirty = True
+        elif field == "depends":
+            self._graph_dirty = True
+
+    def store_reset(self) -> None:
+        self._mode = None
+        self._graph_dirty = True
+
+    # ========================================================================
+    # 갱신
+    # ========================================================================
+
+    def _sync(self, mode: ExecutionMode) -> None:
+        """표시된 변경을 반영합니다 (모드가 바뀌었으면 전체 필터링)."""
+        rekey = False
+        if self._graph_dirty:
+            self._graph_dirty = False
+            if self._ordering.uses_graph:
+                self._ordering.refresh(self._store)
+                rekey = True
+        if self._mode != mode:
+            self._rebuild(mode)
+            return
+        if self._dirty or self._dirty_deps:
+            self._apply(mode)
+        if rekey:
+            self._rekey()
+
+    def _rebuild(self, mode: ExecutionMode) -> None:
+        """전체 Task를 필터링하여 집합을 다시 만듭니다."""
+        self._dirty.clear()
+        self._dirty_deps.clear()
+        self._manual_cmds = self._policy.manual_commands(mode)
+        ready = self._policy.filter_executable(self._store, mode)
+        self._keys = []
+        self._tasks = {}
+        self._entries = {}
+        for task in ready:
+            key = self._next_key(task)
+            self._keys.append(key)
+            self._tasks[key] = task
+            self._entries[id(task)] = key
+        self._keys.sort()
+        self._mode = mode
+
+    def _rekey(self) -> None:
+        """의존성 그래프가 바뀌었을 때 모든 Task의 정렬 키를 다시 계산합니다."""
+        tasks = [self._tasks[key] for key in self._keys]
+        self._keys = []
+        self._tasks = {}
+        self._entries = {}
+        for task in tasks:
+            key = self._next_key(task)
+            self._keys.append(key)
+            self._tasks[key] = task
+            self._entries[id(task)] = key
+        self._keys.sort()
+
+    def _apply(self, mode: ExecutionMode) -> None:
+        """표시된 Task와 그 Task에 의존하는 Task만 다시 평가합니다."""
+        dirty = self._dirty
+        for task_id in self._dirty_deps:
+            for dependent in self._store.dependents(task_id):
+                dirty[id(dependent)] = dependent
+        self._dirty = {}
+        self._dirty_deps = set()
+
+        all_tasks = self._store.by_id
+        for task in dirty.values():
+            executable = task.store is self._store and self._policy.is_executable(
+                task, mode, all_tasks, self._manual_cmds
+            )
+            if executable:
+                self._add(task)
+            else:
+                self._discard(task)
+        logger.debug(f"ReadySet: {len(dirty)}개 Task 재평가, 실행 가능 {len(self._keys)}개")
+
+    def _next_key(self, task: Task) -> _Key:
+        self._counter += 1
+        return (*self._ordering.key(task), task.id, self._counter)
+
+    def _add(self, task: Task) -> None:
+        current = self._entries.get(id(task))
+        if current is not None:
+            if current[:-1] == (*self._ordering.key(task), task.id):
+                return
+            # 정렬 키가 바뀜 (예: priority 변경)
+            self._discard(task)
+        key = self._next_key(task)
+        bisect.insort(self._keys, key)
+        self._tasks[key] = task
+        self._entries[id(task)] = key
+
+    def _discard(self, task: Task) -> None:
+        key = self._entries.pop(id(task), None)
+        if key is None:
+            return
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        del self._tasks[key]
@@ -7,11 +7,12 @@
 from __future__ import annotations
 
 import logging
-from collections import deque
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from orchay.domain.workflow import ExecutionMode, WorkflowEngine
 from orchay.models import Task, TaskPriority, TaskStatus
+from orchay.models.task_store import tasks_by_id
 
 if TYPE_CHECKING:
     pass
@@ -47,91 +48,6 @@ def sort_tasks_by_id(tasks: list[Task]) -> list[Task]:
     return sorted(tasks, key=lambda t: t.id)
 
 
-# =============================================================================
-# [RESERVED] Dependency 기반 위상정렬 - 나중에 정렬 옵션으로 선택 가능
-# =============================================================================
-# def topological_sort_tasks(
-#     tasks: list[Task],
-#     all_tasks_dict: dict[str, Task],
-# ) -> list[Task]:
-#     """Dependency 기반 위상정렬 후 Priority, Task ID 순으로 정렬합니다.
-#
-#     Kahn's Algorithm (BFS 기반)을 사용하여 의존성 레벨을 계산하고,
-#     동일 레벨 내에서는 Priority → Task ID 순으로 정렬합니다.
-#
-#     Args:
-#         tasks: 정렬할 Task 목록 (필터링 완료된 상태)
-#         all_tasks_dict: 전체 Task 딕셔너리 (의존성 조회용)
-#
-#     Returns:
-#         정렬된 Task 리스트
-#
-#     정렬 순서:
-#         1차: Dependency 레벨 (낮을수록 먼저, 의존이 없는 Task가 먼저)
-#         2차: Priority (CRITICAL > HIGH > MEDIUM > LOW)
-#         3차: Task ID (알파벳/숫자 순)
-#
-#     Note:
-#         순환 의존성 Task는 경고 로그 후 마지막 레벨에 배치됩니다.
-#     """
-#     if not tasks:
-#         return []
-#
-#     task_ids = {t.id for t in tasks}
-#     task_map = {t.id: t for t in tasks}
-#
-#     # 1. in-degree 계산 (tasks 내에서만)
-#     in_degree: dict[str, int] = {t.id: 0 for t in tasks}
-#     adjacency: dict[str, list[str]] = {t.id: [] for t in tasks}
-#
-#     for task in tasks:
-#         for dep_id in task.depends:
-#             if dep_id in task_ids:
-#                 # dep_id → task.id 의존 관계 (dep_id가 먼저 실행되어야 함)
-#                 adjacency[dep_id].append(task.id)
-#                 in_degree[task.id] += 1
-#
-#     # 2. Kahn's Algorithm (BFS)
-#     level_map: dict[str, int] = {}
-#     queue: deque[str] = deque()
-#
-#     for task_id, degree in in_degree.items():
-#         if degree == 0:
-#             queue.append(task_id)
-#             level_map[task_id] = 0
-#
-#     while queue:
-#         current_id = queue.popleft()
-#         current_level = level_map[current_id]
-#
-#         for neighbor_id in adjacency[current_id]:
-#             in_degree[neighbor_id] -= 1
-#             # 레벨은 의존 Task 중 최대 레벨 + 1
-#             new_level = max(level_map.get(neighbor_id, 0), current_level + 1)
-#             level_map[neighbor_id] = new_level
-#
-#             if in_degree[neighbor_id] == 0:
-#                 queue.append(neighbor_id)
-#
-#     # 3. 순환 의존성 처리
-#     max_level = max(level_map.values()) if level_map else 0
-#     unprocessed = [t_id for t_id in task_ids if t_id not in level_map]
-#
-#     if unprocessed:
-#         logger.warning(f"순환 의존성 감지: {unprocessed}")
-#         for task_id in unprocessed:
-#             level_map[task_id] = max_level + 1
-#
-#     # 4. 복합 정렬 키: (level, priority, task_id)
-#     def sort_key(task: Task) -> tuple[int, int, str]:
-#         level = level_map.get(task.id, max_level + 1)
-#         priority = PRIORITY_ORDER.get(task.priority, 99)
-#         return (level, priority, task.id)
-#
-#     return sorted(tasks, key=sort_key)
-# =============================================================================
-
-
 class TaskFilterPolicy:
     """Task 필터링 정책.
 
@@ -179,8 +95,8 @@ class TaskFilterPolicy:
         Returns:
             우선순위순 정렬된 실행 가능 Task 리스트
         """
-        # 전체 Task를 딕셔너리로 변환 (의존성 검사용)
-        all_tasks_dict = {t.id: t for t in tasks}
+        # 전체 Task ID 매핑 (의존성 검사용, TaskStore면 유지 중인 색인 사용)
+        all_tasks_dict = tasks_by_id(tasks)
 
         result: list[Task] = []
         manual_cmds = self._engine.get_manual_commands(mode)
@@ -196,11 +112,36 @@ class TaskFilterPolicy:
 
         return result
 
+    def manual_commands(self, mode: ExecutionMode) -> set[str]:
+        """모드별 수동 실행 명령어 집합 (BR-09)."""
+        return self._engine.get_manual_commands(mode)
+
+    def is_executable(
+        self,
+        task: Task,
+        mode: ExecutionMode,
+        all_tasks: Mapping[str, Task],
+        manual_cmds: set[str],
+    ) -> bool:
+        """Task 하나가 실행 가능한지 확인합니다 (BR-01~BR-09, 증분 갱신용).
+
+        Args:
+            task: 검사 대상 Task
+            mode: 현재 실행 모드
+            all_tasks: 전체 Task ID 매핑 (의존성 검사용)
+            manual_cmds: `manual_commands(mode)` 결과
+
+        Returns:
+            True: 실행 가능
+            False: 제외
+        """
+        return self._should_include(task, mode, all_tasks, manual_cmds)
+
     def _should_include(
         self,
         task: Task,
         mode: ExecutionMode,
-        all_tasks: dict[str, Task],
+        all_tasks: Mapping[str, Task],
         manual_cmds: set[str],
     ) -> bool:
         """Task가 실행 가능한지 확인합니다.
@@ -253,7 +194,7 @@ class TaskFilterPolicy:
         self,
         task: Task,
         mode: ExecutionMode,
-        all_tasks: dict[str, Task],
+        all_tasks: Mapping[str, Task],
     ) -> bool:
         """모드별 추가 필터링 규칙을 적용합니다.
 
@@ -304,7 +245,7 @@ class TaskFilterPolicy:
     def check_dependencies_implemented(
         self,
         task: Task,
-        all_tasks: dict[str, Task],
+        all_tasks: Mapping[str, Task],
     ) -> bool:
         """Task의 선행 의존성이 모두 구현 완료([im] 이상)인지 확인합니다.
 
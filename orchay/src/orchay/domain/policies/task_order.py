@@ -0,0 +1,195 @@
+"""Task 분배 순서 정책.
+
+실행 가능 Task 중 어떤 Task를 먼저 분배할지 정합니다.
+
+- id: Task ID 순 (기본값)
+- priority: 우선순위(critical > high > medium > low), 같으면 Task ID 순
+- topological: 의존성 위상 레벨 순 (선행 Task가 적은 Task 먼저), 같으면 우선순위, Task ID 순
+- critical-path: 이 Task 뒤에 이어지는 가장 긴 미완료 작업 경로(예상 기간 가중) 순
+  (하위 작업을 가장 많이 풀어 주는 Task 먼저), 같으면 우선순위, Task ID 순
+
+topological/critical-path는 `DependencyGraph`를 미리 계산해 두고, 의존성/Task 구성/
+완료 여부가 바뀔 때만 다시 계산합니다 (`ReadySet`이 변경 통지를 받아 `refresh()` 호출).
+
+예상 기간은 Task `schedule`("2026-01-05 ~ 2026-01-07", 양 끝 포함 3일)에서 계산하며,
+없거나 읽을 수 없으면 `default_days`를 사용합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Iterable
+from datetime import date
+from typing import Literal
+
+from orchay.domain.policies.task_filter import PRIORITY_ORDER
+from orchay.models import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+TaskOrder = Literal["id", "priority", "topological", "critical-path"]
+
+# 정렬 키 접두사 (Task ID 앞에 붙는 값)
+OrderKey = tuple[float, ...]
+
+
+def expected_days(task: Task, default: float = 1.0) -> float:
+    """Task 예상 기간 (일).
+
+    Args:
+        task: 대상 Task
+        default: schedule이 없거나 읽을 수 없을 때 사용할 기간
+
+    Returns:
+        schedule 시작~종료 일수 (양 끝 포함) 또는 default
+    """
+    start, sep, end = task.schedule.partition("~")
+    if not sep:
+        return default
+    try:
+        days = (date.fromisoformat(end.strip()) - date.fromisoformat(start.strip())).days + 1
+    except ValueError:
+        return default
+    return float(days) if days > 0 else default
+
+
+class DependencyGraph:
+    """Task 의존성 DAG의 위상 레벨과 임계 경로 길이.
+
+    - level: 선행 Task 체인 길이 (선행 Task가 없으면 0)
+    - path: 자신과 후속 Task를 잇는 가장 긴 경로의 미완료 예상 기간 합
+
+    WBS에 없는 의존 ID는 무시하고, 순환 의존성에 걸린 Task는 최대 레벨 + 1, 경로 길이는
+    자신의 기간으로 둡니다.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = (), default_days: float = 1.0) -> None:
+        """그래프를 계산합니다.
+
+        Args:
+            tasks: 전체 Task 목록
+            default_days: schedule이 없는 Task의 예상 기간
+        """
+        self.levels: dict[str, int] = {}
+        self.paths: dict[str, float] = {}
+        self._build(list(tasks), default_days)
+
+    def _build(self, tasks: list[Task], default_days: float) -> None:
+        # 같은 ID가 여러 개면 먼저 나온 Task 사용 (TaskStore ID 색인과 같음)
+        by_id: dict[str, Task] = {}
+        for task in tasks:
+            by_id.setdefault(task.id, task)
+
+        in_degree = dict.fromkeys(by_id, 0)
+        successors: dict[str, list[str]] = {task_id: [] for task_id in by_id}
+        for task_id, task in by_id.items():
+            for dep_id in dict.fromkeys(task.depends):
+                if dep_id in by_id and dep_id != task_id:
+                    successors[dep_id].append(task_id)
+                    in_degree[task_id] += 1
+
+        # Kahn 알고리즘 (BFS) - 레벨은 선행 Task 중 최대 레벨 + 1
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        levels = dict.fromkeys(queue, 0)
+        order: list[str] = []
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for successor in successors[current]:
+                levels[successor] = max(levels.get(successor, 0), levels[current] + 1)
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+
+        weights = {
+            task_id: 0.0 if task.status == TaskStatus.DONE else expected_days(task, default_days)
+            for task_id, task in by_id.items()
+        }
+
+        # 순환 의존성: 처리되지 않은 Task (순환에 걸린 Task와 그 후속 Task)
+        cyclic = [task_id for task_id in by_id if in_degree[task_id]]
+        if cyclic:
+            logger.warning(f"순환 의존성 감지: {cyclic}")
+            max_level = max((levels[task_id] for task_id in order), default=0)
+            for task_id in cyclic:
+                levels[task_id] = max_level + 1
+
+        # 임계 경로: 위상 역순으로 후속 Task 경로 중 최댓값 + 자신의 기간
+        paths = {task_id: weights[task_id] for task_id in cyclic}
+        for task_id in reversed(order):
+            downstream = (paths.get(s, 0.0) for s in successors[task_id])
+            paths[task_id] = weights[task_id] + max(downstream, default=0.0)
+
+        self.levels = levels
+        self.paths = paths
+
+
+class TaskOrdering:
+    """분배 순서 정책.
+
+    `key(task)`는 Task ID 앞에 붙일 정렬 키 접두사를 반환합니다 (작을수록 먼저).
+
+    Example:
+        ```python
+        ordering = TaskOrdering("critical-path")
+        ordering.refresh(tasks)  # 의존성이 바뀌었을 때만
+        tasks.sort(key=lambda t: (*ordering.key(t), t.id))
+        ```
+    """
+
+    def __init__(self, order: TaskOrder = "id", default_days: float = 1.0) -> None:
+        """TaskOrdering을 초기화합니다.
+
+        Args:
+            order: 순서 정책
+            default_days: schedule이 없는 Task의 예상 기간 (critical-path)
+        """
+        self._order: TaskOrder = order
+        self._default_days = default_days
+        self._graph: DependencyGraph | None = None
+
+    @property
+    def order(self) -> TaskOrder:
+        """순서 정책 이름."""
+        return self._order
+
+    @property
+    def uses_graph(self) -> bool:
+        """의존성 그래프가 필요한 정책인지 여부."""
+        return self._order in ("topological", "critical-path")
+
+    @property
+    def graph(self) -> DependencyGraph | None:
+        """마지막으로 계산한 의존성 그래프 (그래프를 쓰지 않으면 None)."""
+        return self._graph
+
+    def refresh(self, tasks: Iterable[Task]) -> None:
+        """의존성 그래프를 다시 계산합니다 (그래프를 쓰지 않는 정책이면 무시).
+
+        Args:
+            tasks: 전체 Task 목록
+        """
+        if self.uses_graph:
+            self._graph = DependencyGraph(tasks, self._default_days)
+
+    def key(self, task: Task) -> OrderKey:
+        """Task ID 앞에 붙일 정렬 키 접두사.
+
+        Args:
+            task: 대상 Task
+
+        Returns:
+            정렬 키 (id 정책이면 빈 튜플)
+        """
+        if self._order == "id":
+            return ()
+        priority = float(PRIORITY_ORDER.get(task.priority, 99))
+        if self._order == "priority":
+            return (priority,)
+        graph = self._graph
+        if graph is None:
+            return (0.0, priority)
+        if self._order == "topological":
+            return (float(graph.levels.get(task.id, 0)), priority)
+        return (-graph.paths.get(task.id, 0.0), priority)
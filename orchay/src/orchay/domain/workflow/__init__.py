@@ -3,6 +3,11 @@
 워크플로우 설정 관리 및 명령어 결정 로직을 제공합니다.
 """
 
-from orchay.domain.workflow.engine import ExecutionMode, WorkflowConfig, WorkflowEngine
+from orchay.domain.workflow.engine import (
+    CompiledWorkflows,
+    ExecutionMode,
+    WorkflowConfig,
+    WorkflowEngine,
+)
 
-__all__ = ["ExecutionMode", "WorkflowConfig", "WorkflowEngine"]
+__all__ = ["CompiledWorkflows", "ExecutionMode", "WorkflowConfig", "WorkflowEngine"]
@@ -2,6 +2,9 @@
 
 workflows.json 기반 워크플로우 로직을 인스턴스 기반으로 관리합니다.
 전역 상태를 제거하고 의존성 주입을 통해 테스트 가능성을 높입니다.
+
+workflows.json은 로드할 때 `CompiledWorkflows` 조회 테이블로 컴파일되므로,
+`get_next_command()`는 설정 딕셔너리를 순회하지 않고 상수 시간에 명령어를 찾습니다.
 """
 
 from __future__ import annotations
@@ -29,6 +32,131 @@ class ExecutionMode(str, Enum):
     TEST = "test"
 
 
+# actions를 실행하는 workflowScope
+ACTION_SCOPES: frozenset[str] = frozenset({"design-only", "full"})
+
+# 조회 키: (워크플로우 이름, 상태 코드)
+_StateKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class CompiledMode:
+    """실행 모드 설정 (컴파일됨).
+
+    Attributes:
+        scope: workflowScope (transitions-only, design-only, full, test-only)
+        manual_commands: 수동 실행이 필요한 명령어 집합
+    """
+
+    scope: str = "transitions-only"
+    manual_commands: frozenset[str] = frozenset()
+
+    @property
+    def runs_actions(self) -> bool:
+        """actions를 실행하는 모드인지 여부."""
+        return self.scope in ACTION_SCOPES
+
+
+# 설정에 없는 모드 (또는 mode=None)
+_DEFAULT_MODE = CompiledMode()
+
+
+@dataclass(frozen=True)
+class CompiledWorkflows:
+    """workflows.json을 컴파일한 조회 테이블.
+
+    `get_next_command()`가 매 호출 transitions 목록을 순회하고 transition 명령어 집합을
+    만드는 대신, 워크플로우/상태/모드/마지막 action 키로 바로 조회합니다.
+
+    Attributes:
+        modes: 모드 이름 → 모드 설정
+        transitions: (워크플로우, 상태) → transition 명령어 (같은 상태면 처음 정의된 것)
+        first_actions: (워크플로우, 상태) → 상태 진입 시 첫 action
+        next_actions: (워크플로우, 상태, 완료한 action) → 다음 action (None: 모든 action 완료)
+    """
+
+    modes: dict[str, CompiledMode] = field(default_factory=dict[str, CompiledMode])
+    transitions: dict[_StateKey, str | None] = field(default_factory=dict[_StateKey, str | None])
+    first_actions: dict[_StateKey, str] = field(default_factory=dict[_StateKey, str])
+    next_actions: dict[tuple[str, str, str], str | None] = field(
+        default_factory=dict[tuple[str, str, str], str | None]
+    )
+
+    @classmethod
+    def compile(cls, data: dict[str, Any]) -> CompiledWorkflows:
+        """workflows.json 데이터를 조회 테이블로 컴파일합니다.
+
+        Args:
+            data: workflows.json 내용
+
+        Returns:
+            CompiledWorkflows 인스턴스
+        """
+        modes = {
+            name: CompiledMode(
+                scope=mode_config.get("workflowScope", "transitions-only"),
+                manual_commands=frozenset(mode_config.get("manualCommands", [])),
+            )
+            for name, mode_config in data.get("executionModes", {}).items()
+        }
+
+        transitions: dict[_StateKey, str | None] = {}
+        first_actions: dict[_StateKey, str] = {}
+        next_actions: dict[tuple[str, str, str], str | None] = {}
+        for workflow_name, workflow in data.get("workflows", {}).items():
+            workflow_transitions = workflow.get("transitions", [])
+            # transition commands 집합 (action과 구분용)
+            transition_commands = {t.get("command") for t in workflow_transitions}
+            for transition in workflow_transitions:
+                transitions.setdefault(
+                    (workflow_name, transition.get("from")), transition.get("command")
+                )
+
+            for status, state_actions in workflow.get("actions", {}).items():
+                if not state_actions:
+                    continue
+                first_actions[(workflow_name, status)] = state_actions[0]
+                for idx, action in enumerate(state_actions):
+                    # transition 명령어는 새 상태 진입으로 처리 (첫 action)
+                    if action in transition_commands:
+                        continue
+                    following = state_actions[idx + 1] if idx + 1 < len(state_actions) else None
+                    next_actions.setdefault((workflow_name, status, action), following)
+
+        return cls(
+            modes=modes,
+            transitions=transitions,
+            first_actions=first_actions,
+            next_actions=next_actions,
+        )
+
+    def mode(self, mode: ExecutionMode | None) -> CompiledMode:
+        """모드 설정을 반환합니다 (설정에 없거나 None이면 transitions-only)."""
+        if mode is None:
+            return _DEFAULT_MODE
+        return self.modes.get(mode.value, _DEFAULT_MODE)
+
+    def next_action(self, workflow: str, status: str, last_action: str | None) -> str | None:
+        """현재 상태에서 다음 action을 반환합니다.
+
+        - last_action이 None 또는 transition이면 → 새 상태 진입, 첫 번째 action
+        - last_action이 이 상태의 action이면 → 다음 action (모두 완료했으면 None)
+        - 그 외 → 첫 번째 action
+
+        Args:
+            workflow: 워크플로우 이름
+            status: 현재 상태 코드
+            last_action: 마지막으로 완료된 action
+
+        Returns:
+            다음 action 또는 None
+        """
+        first = self.first_actions.get((workflow, status))
+        if first is None or last_action is None:
+            return first
+        return self.next_actions.get((workflow, status, last_action), first)
+
+
 @dataclass
 class WorkflowConfig:
     """워크플로우 설정 관리 (인스턴스 기반, 전역 상태 제거).
@@ -40,11 +168,13 @@ class WorkflowConfig:
         config_path: workflows.json 파일 경로
         _data: 캐싱된 설정 데이터
         _mtime: 마지막 수정 시간
+        _compiled: 컴파일된 조회 테이블 (로드할 때만 다시 만듦)
     """
 
     config_path: Path | None = None
     _data: dict[str, Any] = field(default_factory=dict)
     _mtime: float = 0.0
+    _compiled: CompiledWorkflows | None = None
 
     @classmethod
     def from_project_root(cls, project_root: Path) -> WorkflowConfig:
@@ -81,6 +211,8 @@ class WorkflowConfig:
 
     def _load(self) -> None:
         """설정 파일을 로드합니다."""
+        # 다음 compiled 조회에서 다시 컴파일
+        self._compiled = None
         if self.config_path is None or not self.config_path.exists():
             self._data = {}
             self._mtime = 0.0
@@ -143,6 +275,13 @@ class WorkflowConfig:
         """실행 모드 설정을 반환합니다."""
         return self._data.get("executionModes", {})
 
+    @property
+    def compiled(self) -> CompiledWorkflows:
+        """컴파일된 조회 테이블을 반환합니다 (로드 후 첫 조회에서 컴파일)."""
+        if self._compiled is None:
+            self._compiled = CompiledWorkflows.compile(self._data)
+        return self._compiled
+
 
 class WorkflowEngine:
     """워크플로우 엔진 (순수 로직).
@@ -188,10 +327,9 @@ class WorkflowEngine:
             mode: 현재 실행 모드
 
         Returns:
-            수동 실행이 필요한 명령어 집합 (예: {"approve", "done"})
+            수동 실행이 필요한 명령어 집합 (예: {"approve", "done"}, 컴파일된 집합의 복사본)
         """
-        mode_config = self._config.execution_modes.get(mode.value, {})
-        return set(mode_config.get("manualCommands", []))
+        return set(self._config.compiled.mode(mode).manual_commands)
 
     def _get_workflow_name(self, category: str) -> str:
         """Task 카테고리에 해당하는 workflow 이름을 반환합니다.
@@ -223,53 +361,29 @@ class WorkflowEngine:
         Note:
             - design/develop 모드: transitions + actions 실행
             - quick/force 모드: transitions만 실행
+            - 컴파일된 조회 테이블을 사용하므로 상수 시간에 결정합니다.
         """
-        workflows = self._config.workflows
-        execution_modes = self._config.execution_modes
-
-        # 현재 모드의 workflowScope 확인
-        mode_config = execution_modes.get(mode.value, {}) if mode else {}
-        workflow_scope = mode_config.get("workflowScope", "transitions-only")
-        stop_after_cmd = mode_config.get("stopAfterCommand")
+        compiled = self._config.compiled
+        mode_table = compiled.mode(mode)
 
         # test-only scope: 항상 "test" 명령 반환 (상태 변경 없음)
-        if workflow_scope == "test-only":
+        if mode_table.scope == "test-only":
             return "test"
 
         # Task 카테고리에 해당하는 workflow 찾기
         workflow_name = self._get_workflow_name(task.category.value)
-        workflow = workflows.get(workflow_name, {})
-        transitions = workflow.get("transitions", [])
-        actions = workflow.get("actions", {})
-
         current_status = task.status.value
 
-        # transition commands 집합 (action과 구분용)
-        transition_commands = {t.get("command") for t in transitions}
-
         # actions 처리 (design-only 또는 full scope)
-        if workflow_scope in ("design-only", "full"):
-            state_actions = actions.get(current_status, [])
-
-            if state_actions:
-                next_action = self._get_next_action(
-                    state_actions, last_action, transition_commands
-                )
-
-                if next_action:
-                    # stopAfterCommand 체크 (design 모드에서 apply 후 멈춤 등)
-                    if stop_after_cmd == next_action:
-                        return next_action  # 이게 마지막 명령
-                    return next_action
+        if mode_table.runs_actions:
+            next_action = compiled.next_action(workflow_name, current_status, last_action)
+            if next_action:
+                return next_action
 
         # transition 반환
-        for transition in transitions:
-            if transition.get("from") == current_status:
-                cmd = transition.get("command")
-                # stopAfterCommand 체크
-                if stop_after_cmd == cmd:
-                    return cmd
-                return cmd
+        key = (workflow_name, current_status)
+        if key in compiled.transitions:
+            return compiled.transitions[key]
 
         # transition 없으면 None 반환
         logger.debug(
@@ -278,41 +392,6 @@ class WorkflowEngine:
         )
         return None
 
-    def _get_next_action(
-        self,
-        state_actions: list[str],
-        last_action: str | None,
-        transition_commands: set[str | None],
-    ) -> str | None:
-        """현재 상태에서 다음 action을 결정합니다.
-
-        Args:
-            state_actions: 현재 상태의 action 목록
-            last_action: 마지막으로 완료된 action
-            transition_commands: transition 명령어 집합
-
-        Returns:
-            다음 action 또는 None
-        """
-        # last_action이 transition이면 → 새 상태 진입, 첫 번째 action 반환
-        # last_action이 action이면 → 같은 상태, 다음 action 반환
-        # last_action이 None이면 → 첫 번째 action 반환
-
-        if last_action is None or last_action in transition_commands:
-            # 새 상태 진입: 첫 번째 action
-            return state_actions[0]
-
-        # 같은 상태에서 action 완료: 다음 action 찾기
-        try:
-            idx = state_actions.index(last_action)
-            if idx + 1 < len(state_actions):
-                return state_actions[idx + 1]
-            # 모든 actions 완료 → transition으로
-            return None
-        except ValueError:
-            # last_action이 이 상태의 action이 아님 → 첫 번째 action
-            return state_actions[0]
-
     def get_workflow_steps(self, mode: ExecutionMode) -> list[str]:
         """모드에 따른 기본 워크플로우 단계를 반환합니다.
 
@@ -370,4 +449,4 @@ class WorkflowEngine:
             True: 수동 실행 필요
             False: 자동 실행 가능
         """
-        return command in self.get_manual_commands(mode)
+        return command in self._config.compiled.mode(mode).manual_commands
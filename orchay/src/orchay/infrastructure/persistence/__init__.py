@@ -3,6 +3,7 @@
 스케줄러 상태와 히스토리 관리를 담당합니다.
 """
 
+from orchay.infrastructure.persistence.sqlite_store import SqliteStateStore
 from orchay.infrastructure.persistence.state_store import (
     ActiveStateData,
     HistoryEntry,
@@ -12,5 +13,6 @@ from orchay.infrastructure.persistence.state_store import (
 __all__ = [
     "ActiveStateData",
     "HistoryEntry",
+    "SqliteStateStore",
     "StateStore",
 ]
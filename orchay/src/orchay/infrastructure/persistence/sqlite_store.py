@@ -0,0 +1,364 @@
+"""SQLite 상태 저장소 모듈.
+
+`StateStore`(JSON/JSONL 파일)와 같은 인터페이스를 표준 라이브러리 `sqlite3`(WAL 모드)로
+제공합니다. 파일 전체를 다시 쓰지 않고, 여러 프로세스(스케줄러, CLI, TUI)가 동시에 읽고
+쓰더라도 트랜잭션으로 보호됩니다.
+
+테이블:
+- paused_workers: 수동 일시정지된 Worker ID
+- scheduler_state: 스케줄러 상태 (한 행)
+- history: 히스토리 항목 (task_id/worker_id/result/timestamp 색인)
+- meta: 스키마 버전, JSON 파일 가져오기 여부
+
+처음 열 때 같은 경로의 `orchay-active.json`/`orchay-history.jsonl`을 한 번 가져옵니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from orchay.infrastructure.persistence.state_store import (
+    ActiveStateData,
+    HistoryEntry,
+    StateStore,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paused_workers (
+    worker_id INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS scheduler_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    command TEXT NOT NULL,
+    result TEXT NOT NULL,
+    worker_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    output TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_task ON history (task_id, id);
+CREATE INDEX IF NOT EXISTS idx_history_worker ON history (worker_id, id);
+CREATE INDEX IF NOT EXISTS idx_history_result ON history (result, id);
+CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history (timestamp);
+"""
+
+_HISTORY_COLUMNS = "task_id, command, result, worker_id, timestamp, output"
+
+
+class SqliteStateStore:
+    """SQLite 상태 저장소.
+
+    `StateStore`와 같은 메서드를 제공하며, 조건별 히스토리 조회(`query_history`)를
+    추가로 지원합니다.
+
+    Example:
+        ```python
+        store = SqliteStateStore(base_path=Path(".orchay/logs"))
+        store.pause_worker(1)
+        store.append_history(entry)
+        store.query_history(worker_id=1, result="error", since="2026-01-01")
+        store.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        max_history_entries: int = 1000,
+        import_legacy: bool = True,
+    ) -> None:
+        """SqliteStateStore를 초기화합니다 (DB 파일과 스키마 생성).
+
+        Args:
+            base_path: 저장 경로 (기본: .orchay/logs)
+            max_history_entries: 최대 히스토리 항목 수
+            import_legacy: 같은 경로의 JSON/JSONL 파일을 한 번 가져올지 여부
+        """
+        if base_path is None:
+            base_path = Path.cwd() / ".orchay" / "logs"
+        self._base_path = base_path
+        self._max_history = max_history_entries
+        base_path.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        with self._transaction():
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+        if import_legacy:
+            self.import_json()
+
+    @property
+    def db_path(self) -> Path:
+        """DB 파일 경로."""
+        return self._base_path / "orchay-state.db"
+
+    def close(self) -> None:
+        """DB 연결을 닫습니다."""
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Generator[None]:
+        """쓰기 트랜잭션 (시작 시 쓰기 잠금 획득, 예외가 나면 롤백)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    # === Active State 관리 ===
+
+    def load_active_state(self) -> ActiveStateData:
+        """활성 상태를 로드합니다."""
+        return {
+            "pausedWorkers": self.get_paused_workers(),
+            "schedulerState": self.get_scheduler_state(),
+        }
+
+    def save_active_state(self, data: ActiveStateData) -> None:
+        """활성 상태를 저장합니다 (한 트랜잭션)."""
+        with self._transaction():
+            self._conn.execute("DELETE FROM paused_workers")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO paused_workers (worker_id) VALUES (?)",
+                [(worker_id,) for worker_id in data.get("pausedWorkers", [])],
+            )
+            self._set_scheduler_state(data.get("schedulerState", "running"))
+
+    # Worker Pause/Resume 헬퍼
+
+    def pause_worker(self, worker_id: int) -> None:
+        """Worker 수동 일시정지.
+
+        Args:
+            worker_id: Worker ID (1, 2, 3...)
+        """
+        with self._transaction():
+            self._conn.execute(
+                "INSERT OR IGNORE INTO paused_workers (worker_id) VALUES (?)", (worker_id,)
+            )
+
+    def resume_worker(self, worker_id: int) -> None:
+        """Worker 수동 일시정지 해제.
+
+        Args:
+            worker_id: Worker ID (1, 2, 3...)
+        """
+        with self._transaction():
+            self._conn.execute("DELETE FROM paused_workers WHERE worker_id = ?", (worker_id,))
+
+    def is_worker_paused(self, worker_id: int) -> bool:
+        """Worker가 수동 일시정지 상태인지 확인.
+
+        Args:
+            worker_id: Worker ID
+
+        Returns:
+            일시정지 상태 여부
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM paused_workers WHERE worker_id = ?", (worker_id,)
+        ).fetchone()
+        return row is not None
+
+    def get_paused_workers(self) -> list[int]:
+        """수동 일시정지된 Worker ID 목록 반환."""
+        rows = self._conn.execute("SELECT worker_id FROM paused_workers ORDER BY worker_id")
+        return [int(row["worker_id"]) for row in rows]
+
+    # Scheduler State 헬퍼
+
+    def set_scheduler_state(self, state: str) -> None:
+        """스케줄러 상태 설정.
+
+        Args:
+            state: running, paused, stopped 중 하나
+        """
+        with self._transaction():
+            self._set_scheduler_state(state)
+
+    def get_scheduler_state(self) -> str:
+        """스케줄러 상태 반환.
+
+        Returns:
+            running, paused, stopped 중 하나
+        """
+        row = self._conn.execute("SELECT state FROM scheduler_state WHERE id = 1").fetchone()
+        return str(row["state"]) if row is not None else "running"
+
+    def _set_scheduler_state(self, state: str) -> None:
+        self._conn.execute(
+            "INSERT INTO scheduler_state (id, state) VALUES (1, ?) "
+            "ON CONFLICT (id) DO UPDATE SET state = excluded.state",
+            (state,),
+        )
+
+    # === History 관리 ===
+
+    def append_history(self, entry: HistoryEntry) -> None:
+        """히스토리 항목을 추가하고 보존 한도를 넘은 오래된 항목을 삭제합니다."""
+        with self._transaction():
+            cursor = self._conn.execute(
+                f"INSERT INTO history ({_HISTORY_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    entry.task_id,
+                    entry.command,
+                    entry.result,
+                    entry.worker_id,
+                    entry.timestamp,
+                    entry.output,
+                ),
+            )
+            last_id = cursor.lastrowid or 0
+            self._conn.execute("DELETE FROM history WHERE id <= ?", (last_id - self._max_history,))
+
+    def list_history(self, limit: int = 10) -> list[dict[str, Any]]:
+        """최근 히스토리를 조회합니다.
+
+        Args:
+            limit: 반환할 최대 항목 수
+
+        Returns:
+            히스토리 항목 리스트 (최신순)
+        """
+        return self.query_history(limit=limit)
+
+    def get_task_history(self, task_id: str) -> dict[str, Any] | None:
+        """특정 Task의 가장 최근 히스토리를 조회합니다.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            히스토리 항목 또는 None
+        """
+        entries = self.query_history(task_id=task_id, limit=1)
+        return entries[0] if entries else None
+
+    def query_history(
+        self,
+        task_id: str | None = None,
+        worker_id: int | None = None,
+        result: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """조건에 맞는 히스토리를 조회합니다 (조건은 AND, None이면 무시).
+
+        Args:
+            task_id: Task ID
+            worker_id: Worker ID
+            result: 결과 (success, error)
+            since: 이 시각 이후 (포함, ISO 8601 문자열 비교)
+            until: 이 시각 이전 (미포함)
+            limit: 반환할 최대 항목 수
+
+        Returns:
+            히스토리 항목 리스트 (최신순)
+        """
+        where, params = _conditions(
+            ("task_id = ?", task_id),
+            ("worker_id = ?", worker_id),
+            ("result = ?", result),
+            ("timestamp >= ?", since),
+            ("timestamp < ?", until),
+        )
+        rows = self._conn.execute(
+            f"SELECT {_HISTORY_COLUMNS} FROM history{where} ORDER BY id DESC LIMIT ?",
+            (*params, limit),
+        )
+        return [dict(row) for row in rows]
+
+    def clear_history(self) -> None:
+        """히스토리를 삭제합니다."""
+        with self._transaction():
+            self._conn.execute("DELETE FROM history")
+
+    # === JSON 파일 가져오기 ===
+
+    def import_json(self, source: Path | None = None) -> bool:
+        """JSON/JSONL 상태 파일을 한 번 가져옵니다.
+
+        `orchay-active.json`의 일시정지 Worker/스케줄러 상태와 `orchay-history.jsonl`의
+        보존 한도 안 항목을 한 트랜잭션으로 넣습니다. 원본 파일은 그대로 둡니다.
+
+        Args:
+            source: JSON 파일 경로 (기본: DB와 같은 경로)
+
+        Returns:
+            True: 가져옴
+            False: 이미 가져왔거나 가져올 파일이 없음
+        """
+        if self._conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone():
+            return False
+        legacy = StateStore(source or self._base_path, self._max_history)
+        has_files = legacy.active_state_path.exists() or legacy.history_path.exists()
+        # 최신순 → 오래된 순, 블롭에 저장된 출력은 복원
+        history = legacy.list_history(self._max_history)[::-1]
+
+        with self._transaction():
+            # 다른 프로세스가 먼저 가져왔을 수 있으므로 쓰기 잠금 안에서 표시를 선점
+            claimed = self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('json_imported', ?)",
+                (datetime.now().isoformat(timespec="seconds"),),
+            )
+            if claimed.rowcount == 0:
+                return False
+            if legacy.active_state_path.exists():
+                state = legacy.load_active_state()
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO paused_workers (worker_id) VALUES (?)",
+                    [(worker_id,) for worker_id in state["pausedWorkers"]],
+                )
+                self._set_scheduler_state(state["schedulerState"])
+            self._conn.executemany(
+                f"INSERT INTO history ({_HISTORY_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                [_history_row(record, legacy.history_output(record)) for record in history],
+            )
+        if has_files:
+            logger.info(f"JSON 상태 파일 가져옴: 히스토리 {len(history)}개 → {self.db_path}")
+        return has_files
+
+
+def _conditions(*pairs: tuple[str, object]) -> tuple[str, list[object]]:
+    """None이 아닌 조건만 모아 WHERE 절과 파라미터를 만듭니다."""
+    clauses = [clause for clause, value in pairs if value is not None]
+    params = [value for _, value in pairs if value is not None]
+    return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+def _history_row(record: dict[str, Any], output: str) -> tuple[str, str, str, int, str, str]:
+    """JSONL 히스토리 항목을 history 테이블 행으로 변환합니다 (빠진 필드는 기본값)."""
+    return (
+        str(record.get("task_id", "")),
+        str(record.get("command", "")),
+        str(record.get("result", "")),
+        int(record.get("worker_id") or 0),
+        str(record.get("timestamp", "")),
+        output,
+    )
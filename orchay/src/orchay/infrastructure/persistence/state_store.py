@@ -5,11 +5,14 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, TypedDict
 
+from orchay.utils.active_tasks import ActiveStateFile
+from orchay.utils.history_log import HistoryLog
+from orchay.utils.output_store import OutputStore
+
 
 class ActiveStateData(TypedDict):
     """활성 상태 데이터 구조."""
@@ -53,17 +56,24 @@ class StateStore:
         self,
         base_path: Path | None = None,
         max_history_entries: int = 1000,
+        write_coalesce: float = 0.0,
     ) -> None:
         """StateStore를 초기화합니다.
 
         Args:
             base_path: 저장 경로 (기본: .orchay/logs)
             max_history_entries: 최대 히스토리 항목 수
+            write_coalesce: 활성 상태 저장 병합 간격 (초, 0이면 매번 즉시 기록)
         """
         if base_path is None:
             base_path = Path.cwd() / ".orchay" / "logs"
         self._base_path = base_path
         self._max_history = max_history_entries
+        # 활성 상태는 메모리에 유지 (파일이 바뀌었을 때만 다시 읽음)
+        self._active = ActiveStateFile(self.active_state_path, write_coalesce)
+        self._history = HistoryLog(
+            self.history_path, max_history_entries, outputs=OutputStore(self.history_blob_path)
+        )
 
     @property
     def active_state_path(self) -> Path:
@@ -75,38 +85,24 @@ class StateStore:
         """히스토리 파일 경로."""
         return self._base_path / "orchay-history.jsonl"
 
-    # === Active State 관리 ===
+    @property
+    def history_blob_path(self) -> Path:
+        """히스토리 pane 출력 블롭 디렉토리."""
+        return self._base_path / "orchay-history-blobs"
 
-    def _get_default_state(self) -> ActiveStateData:
-        """기본 상태 반환."""
-        return {
-            "pausedWorkers": [],
-            "schedulerState": "running",
-        }
+    # === Active State 관리 ===
 
     def load_active_state(self) -> ActiveStateData:
-        """활성 상태를 로드합니다."""
-        if not self.active_state_path.exists():
-            return self._get_default_state()
-
-        try:
-            with open(self.active_state_path, encoding="utf-8") as f:
-                data = json.load(f)
-                # 기본값 보장
-                if "pausedWorkers" not in data:
-                    data["pausedWorkers"] = []
-                if "schedulerState" not in data:
-                    data["schedulerState"] = "running"
-                return data
-        except (json.JSONDecodeError, OSError):
-            return self._get_default_state()
+        """활성 상태를 로드합니다 (파일이 바뀌었을 때만 다시 읽음)."""
+        return self._active.load()
 
     def save_active_state(self, data: ActiveStateData) -> None:
-        """활성 상태를 저장합니다."""
-        self._base_path.mkdir(parents=True, exist_ok=True)
+        """활성 상태를 저장합니다 (원자적 교체, 병합 간격 안이면 잠시 뒤 기록)."""
+        self._active.save(data)
 
-        with open(self.active_state_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def flush_active_state(self) -> None:
+        """대기 중인 활성 상태 저장을 즉시 기록합니다."""
+        self._active.flush()
 
     # Worker Pause/Resume 헬퍼
 
@@ -116,12 +112,7 @@ class StateStore:
         Args:
             worker_id: Worker ID (1, 2, 3...)
         """
-        data = self.load_active_state()
-        paused = data.get("pausedWorkers", [])
-        if worker_id not in paused:
-            paused.append(worker_id)
-            data["pausedWorkers"] = paused
-            self.save_active_state(data)
+        self._active.pause_worker(worker_id)
 
     def resume_worker(self, worker_id: int) -> None:
         """Worker 수동 일시정지 해제.
@@ -129,12 +120,7 @@ class StateStore:
         Args:
             worker_id: Worker ID (1, 2, 3...)
         """
-        data = self.load_active_state()
-        paused = data.get("pausedWorkers", [])
-        if worker_id in paused:
-            paused.remove(worker_id)
-            data["pausedWorkers"] = paused
-            self.save_active_state(data)
+        self._active.resume_worker(worker_id)
 
     def is_worker_paused(self, worker_id: int) -> bool:
         """Worker가 수동 일시정지 상태인지 확인.
@@ -145,13 +131,11 @@ class StateStore:
         Returns:
             일시정지 상태 여부
         """
-        data = self.load_active_state()
-        return worker_id in data.get("pausedWorkers", [])
+        return self._active.is_worker_paused(worker_id)
 
     def get_paused_workers(self) -> list[int]:
         """수동 일시정지된 Worker ID 목록 반환."""
-        data = self.load_active_state()
-        return data.get("pausedWorkers", [])
+        return self._active.get_paused_workers()
 
     # Scheduler State 헬퍼
 
@@ -161,9 +145,7 @@ class StateStore:
         Args:
             state: running, paused, stopped 중 하나
         """
-        data = self.load_active_state()
-        data["schedulerState"] = state
-        self.save_active_state(data)
+        self._active.set_scheduler_state(state)
 
     def get_scheduler_state(self) -> str:
         """스케줄러 상태 반환.
@@ -171,27 +153,16 @@ class StateStore:
         Returns:
             running, paused, stopped 중 하나
         """
-        data = self.load_active_state()
-        return data.get("schedulerState", "running")
+        return self._active.get_scheduler_state()
 
     # === History 관리 ===
 
     def append_history(self, entry: HistoryEntry) -> None:
-        """히스토리 항목을 추가합니다."""
-        self._base_path.mkdir(parents=True, exist_ok=True)
+        """히스토리 항목을 추가합니다 (파일 끝에 한 줄 추가, 보존 한도는 가끔 압축).
 
-        # 기존 항목 읽기
-        entries = self._read_all_history()
-        entries.append(asdict(entry))
-
-        # 최대 항목 수 초과 시 오래된 것 삭제
-        if len(entries) > self._max_history:
-            entries = entries[-self._max_history :]
-
-        # JSON Lines 형식으로 저장
-        with open(self.history_path, "w", encoding="utf-8") as f:
-            for e in entries:
-                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+        pane 출력은 압축 블롭으로 저장하고 항목에는 참조(`output_ref`)만 남깁니다.
+        """
+        self._history.append(asdict(entry))
 
     def list_history(self, limit: int = 10) -> list[dict[str, Any]]:
         """최근 히스토리를 조회합니다.
@@ -200,43 +171,36 @@ class StateStore:
             limit: 반환할 최대 항목 수
 
         Returns:
-            히스토리 항목 리스트 (최신순)
+            히스토리 항목 리스트 (최신순, 출력은 참조만 포함)
         """
-        entries = self._read_all_history()
-        return entries[-limit:][::-1]
+        return self._history.tail(limit)
 
-    def get_task_history(self, task_id: str) -> dict[str, Any] | None:
+    def get_task_history(self, task_id: str, with_output: bool = True) -> dict[str, Any] | None:
         """특정 Task의 가장 최근 히스토리를 조회합니다.
 
         Args:
             task_id: Task ID
+            with_output: pane 출력을 복원하여 `output`에 넣을지 여부
 
         Returns:
             히스토리 항목 또는 None
         """
-        entries = self._read_all_history()
-        for entry in reversed(entries):
-            if entry["task_id"] == task_id:
-                return entry
-        return None
+        entry = self._history.latest(task_id)
+        if entry is not None and with_output:
+            entry["output"] = self._history.output(entry)
+        return entry
+
+    def history_output(self, entry: dict[str, Any]) -> str:
+        """히스토리 항목의 pane 출력을 복원합니다.
+
+        Args:
+            entry: `list_history()`/`get_task_history()`가 반환한 항목
+
+        Returns:
+            pane 출력 (없으면 빈 문자열)
+        """
+        return self._history.output(entry)
 
     def clear_history(self) -> None:
         """히스토리를 삭제합니다."""
-        if self.history_path.exists():
-            self.history_path.unlink()
-
-    def _read_all_history(self) -> list[dict[str, Any]]:
-        """모든 히스토리 항목을 읽습니다."""
-        if not self.history_path.exists():
-            return []
-
-        entries: list[dict[str, Any]] = []
-        with open(self.history_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        return entries
+        self._history.clear()
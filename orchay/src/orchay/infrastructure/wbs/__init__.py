@@ -1,6 +1,6 @@
 """WBS 인프라스트럭처.
 
-WBS 파일 파싱 및 업데이트를 담당합니다.
+WBS 파일 파싱 및 업데이트(단일 writer)를 담당합니다.
 """
 
 # 기존 wbs_parser에서 re-export
@@ -12,6 +12,7 @@ from orchay.wbs_parser import (
     update_task_status,
     watch_wbs,
 )
+from orchay.wbs_writer import WbsLockTimeout, WbsWriter, get_wbs_writer
 
 __all__ = [
     "WbsParser",
@@ -20,4 +21,7 @@ __all__ = [
     "watch_wbs",
     "update_task_status",
     "update_task_blocked_by",
+    "WbsWriter",
+    "WbsLockTimeout",
+    "get_wbs_writer",
 ]
@@ -9,10 +9,13 @@ from orchay.infrastructure.wezterm.adapter import (
     WezTermAdapter,
     WezTermNotFoundError,
 )
+from orchay.infrastructure.wezterm.simulated import SimulatedTerminal, SimulationProfile
 
 __all__ = [
     "ITerminalAdapter",
     "PaneInfo",
+    "SimulatedTerminal",
+    "SimulationProfile",
     "WezTermAdapter",
     "WezTermNotFoundError",
 ]
@@ -25,6 +25,7 @@ class PaneInfo:
     workspace: str
     cwd: str
     title: str
+    rows: int = 0  # 화면(viewport) 줄 수, 0이면 알 수 없음
 
 
 class ITerminalAdapter(Protocol):
@@ -37,7 +38,13 @@ class ITerminalAdapter(Protocol):
         """pane 목록을 조회합니다."""
         ...
 
-    async def get_text(self, pane_id: int, lines: int = 50) -> str:
+    async def get_text(
+        self,
+        pane_id: int,
+        lines: int = 50,
+        start_line: int | None = None,
+        end_line: int | None = None,
+    ) -> str:
         """특정 pane의 출력 텍스트를 조회합니다."""
         ...
 
@@ -116,27 +123,38 @@ class WezTermAdapter:
                     workspace=item.get("workspace", ""),
                     cwd=item.get("cwd", ""),
                     title=item.get("title", ""),
+                    rows=item.get("size", {}).get("rows", 0),
                 )
             )
         return result
 
-    async def get_text(self, pane_id: int, lines: int = 50) -> str:
+    async def get_text(
+        self,
+        pane_id: int,
+        lines: int = 50,
+        start_line: int | None = None,
+        end_line: int | None = None,
+    ) -> str:
         """특정 pane의 출력 텍스트를 조회합니다.
 
         Args:
             pane_id: WezTerm pane ID
             lines: 읽을 줄 수 (기본값: 50)
+            start_line: 조회 시작 줄 (None이면 화면 첫 줄, 음수는 scrollback)
+            end_line: 조회 끝 줄 (None이면 화면 마지막 줄)
 
         Returns:
             pane 출력 텍스트. pane이 없으면 빈 문자열.
         """
+        args = ["wezterm", "cli", "get-text", "--pane-id", str(pane_id)]
+        if start_line is not None:
+            args += ["--start-line", str(start_line)]
+        if end_line is not None:
+            args += ["--end-line", str(end_line)]
+
         try:
             process = await asyncio.create_subprocess_exec(
-                "wezterm",
-                "cli",
-                "get-text",
-                "--pane-id",
-                str(pane_id),
+                *args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
@@ -0,0 +1,319 @@
+"""시뮬레이션 터미널 어댑터.
+
+실제 Claude pane 없이 orchay를 부하 상태로 측정하기 위한 in-process 터미널입니다.
+각 pane은 Claude Code와 비슷한 출력을 재현합니다.
+
+- 입력 프롬프트(`>`), 입력 에코, `/clear` 처리
+- `/wf:{action} {project}/{task}` 실행: 작업 중 표시 후 설정된 시간 뒤
+  `ORCHAY_DONE:{project}/{task}:{action}:{status}` 출력
+- 설정 확률로 실패(ORCHAY_DONE ... error)와 rate limit(일시 중단 후 자동 재개) 발생
+
+줄 번호 규칙과 `get_text` 범위는 `wezterm cli get-text`와 같습니다
+(화면 첫 줄 0, 음수는 scrollback). 호출 수는 `calls`에 기록되며,
+실제 환경에서는 호출 하나가 wezterm 서브프로세스 하나에 해당합니다.
+
+Example:
+    ```python
+    terminal = SimulatedTerminal(workers=10, profile=SimulationProfile(duration=(1.0, 3.0)))
+    previous = set_terminal_backend(terminal)
+    try:
+        ...  # Orchestrator 실행
+    finally:
+        set_terminal_backend(previous)
+        await terminal.close()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from orchay.infrastructure.wezterm.adapter import PaneInfo
+
+logger = logging.getLogger(__name__)
+
+# /wf:{action} {project}/{task-id}
+_WF_COMMAND = re.compile(r"^/wf:(\w+)\s+(\S+)$")
+
+# 작업 완료 콜백: (task_id, action, success)
+CompletionCallback = Callable[[str, str, bool], Awaitable[None]]
+
+
+@dataclass
+class SimulationProfile:
+    """시뮬레이션 Worker 동작 설정.
+
+    Attributes:
+        duration: 명령 실행 시간 범위 (초)
+        failure_rate: 명령 실패 확률 (ORCHAY_DONE ... error)
+        rate_limit_rate: 명령 중 rate limit 발생 확률
+        rate_limit_seconds: rate limit 지속 시간 (초)
+        output_lines: 명령당 출력 줄 수
+        rows: pane 화면 줄 수
+        scrollback: 보관할 최대 줄 수
+        seed: 난수 시드 (재현용)
+    """
+
+    duration: tuple[float, float] = (1.0, 3.0)
+    failure_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    rate_limit_seconds: float = 5.0
+    output_lines: int = 20
+    rows: int = 40
+    scrollback: int = 2000
+    seed: int | None = None
+
+
+@dataclass
+class PaneStats:
+    """pane별 측정값."""
+
+    commands: int = 0
+    failures: int = 0
+    rate_limits: int = 0
+    # 이전 명령 완료 → 다음 /wf 명령 접수까지 걸린 시간 (초)
+    dispatch_latencies: list[float] = field(default_factory=list[float])
+
+
+class SimulatedPane:
+    """Claude Code를 흉내 내는 단일 pane."""
+
+    def __init__(
+        self,
+        pane_id: int,
+        profile: SimulationProfile,
+        rng: random.Random,
+        on_complete: CompletionCallback | None = None,
+    ) -> None:
+        """SimulatedPane을 초기화합니다.
+
+        Args:
+            pane_id: pane ID
+            profile: 동작 설정
+            rng: 난수 생성기
+            on_complete: 명령 완료 시 호출할 콜백 (WBS 상태 반영 등)
+        """
+        self.pane_id = pane_id
+        self._profile = profile
+        self._rng = rng
+        self._on_complete = on_complete
+        self._lines: list[str] = []
+        self._input = ""
+        self._busy_label: str | None = None
+        # rate limit 안내 (화면 하단에 다시 그려지는 영역, 재개 시 사라짐)
+        self._notice: str | None = None
+        self._job: asyncio.Task[None] | None = None
+        # 마지막으로 입력 대기 상태가 된 시각 (dispatch 지연 측정용)
+        self._ready_at = time.monotonic()
+        self.stats = PaneStats()
+
+    @property
+    def busy(self) -> bool:
+        """명령 실행 중 여부 (rate limit 대기 포함)."""
+        return self._job is not None
+
+    def screen_lines(self) -> list[str]:
+        """scrollback + 화면 전체 줄 (화면 하단 입력 영역 포함)."""
+        if self._notice is not None:
+            footer = ["", self._notice]
+        elif self._busy_label is not None:
+            footer = ["", f"* {self._busy_label} (esc to interrupt)"]
+        else:
+            footer = ["", f"> {self._input}".rstrip()]
+        lines = self._lines + footer
+        # 출력이 화면보다 짧으면 위쪽을 빈 줄로 채움 (실제 터미널과 동일)
+        if len(lines) < self._profile.rows:
+            lines = [""] * (self._profile.rows - len(lines)) + lines
+        return lines
+
+    def type_text(self, text: str) -> None:
+        """입력을 처리합니다 (\\r 또는 \\n이면 입력 제출).
+
+        Args:
+            text: 전송된 텍스트
+        """
+        submit = text.endswith(("\r", "\n"))
+        self._input += text.rstrip("\r\n")
+        if submit:
+            command, self._input = self._input.strip(), ""
+            self._submit(command)
+
+    def cancel(self) -> asyncio.Task[None] | None:
+        """실행 중인 명령을 취소합니다.
+
+        Returns:
+            취소한 명령 태스크 (없으면 None)
+        """
+        job, self._job = self._job, None
+        if job is not None:
+            job.cancel()
+            self._busy_label = self._notice = None
+        return job
+
+    def _submit(self, command: str) -> None:
+        """입력된 명령을 실행합니다."""
+        if self.busy:
+            # 실행 중 입력은 무시 (Claude Code 대기열 미지원 가정)
+            return
+        if not command:
+            return
+        if command == "/clear":
+            self._lines = []
+            return
+
+        self._append(f"> {command}")
+        match = _WF_COMMAND.match(command)
+        if match is None:
+            return
+
+        self.stats.commands += 1
+        self.stats.dispatch_latencies.append(time.monotonic() - self._ready_at)
+        action, target = match.group(1), match.group(2)
+        self._busy_label = "작업 중..."
+        self._job = asyncio.create_task(self._run(action, target), name=f"sim-pane-{self.pane_id}")
+
+    async def _run(self, action: str, target: str) -> None:
+        """명령 실행: 출력, rate limit, 완료 신호."""
+        profile = self._profile
+        duration = self._rng.uniform(*profile.duration)
+        steps = max(1, profile.output_lines)
+        rate_limit_at = (
+            self._rng.randrange(steps) if self._rng.random() < profile.rate_limit_rate else -1
+        )
+        success = self._rng.random() >= profile.failure_rate
+
+        try:
+            for i in range(steps):
+                await asyncio.sleep(duration / steps)
+                self._append(f"⏺ {action} {target}: step {i + 1}/{steps}")
+                if i == rate_limit_at:
+                    await self._rate_limit()
+
+            task_id = target.split("/")[-1]
+            if self._on_complete is not None:
+                # WBS 상태 반영이 완료 신호보다 먼저 일어나야 함 (실제 스킬과 동일)
+                await self._on_complete(task_id, action, success)
+
+            if success:
+                self._append(f"Task {target} {action} 단계를 마쳤습니다.")
+            else:
+                self.stats.failures += 1
+                self._append(f"❌ {action} 실패: simulated failure")
+            status = "success" if success else "error"
+            self._append(f"ORCHAY_DONE:{target}:{action}:{status}")
+        finally:
+            self._busy_label = None
+            self._job = None
+            self._ready_at = time.monotonic()
+
+    async def _rate_limit(self) -> None:
+        """rate limit 메시지를 표시하고 일정 시간 뒤 재개합니다."""
+        self.stats.rate_limits += 1
+        self._notice = "⚠ rate limit reached, please wait"
+        try:
+            await asyncio.sleep(self._profile.rate_limit_seconds)
+        finally:
+            self._notice = None
+        self._append("⏺ 재개합니다")
+
+    def _append(self, line: str) -> None:
+        """출력 줄을 추가합니다 (scrollback 한도 유지)."""
+        self._lines.append(line)
+        overflow = len(self._lines) - self._profile.scrollback
+        if overflow > 0:
+            del self._lines[:overflow]
+
+
+class SimulatedTerminal:
+    """시뮬레이션 Worker pane 집합을 제공하는 ITerminalAdapter 구현.
+
+    pane 0은 스케줄러 pane(활성 pane)이며, Worker pane은 1부터 시작합니다.
+    """
+
+    SCHEDULER_PANE_ID = 0
+
+    def __init__(
+        self,
+        workers: int,
+        profile: SimulationProfile | None = None,
+        on_complete: CompletionCallback | None = None,
+    ) -> None:
+        """SimulatedTerminal을 초기화합니다.
+
+        Args:
+            workers: Worker pane 수
+            profile: Worker 동작 설정
+            on_complete: 명령 완료 시 호출할 콜백
+        """
+        self.profile = profile or SimulationProfile()
+        rng = random.Random(self.profile.seed)
+        self.panes: dict[int, SimulatedPane] = {
+            pid: SimulatedPane(pid, self.profile, random.Random(rng.random()), on_complete)
+            for pid in range(1, workers + 1)
+        }
+        self.calls: Counter[str] = Counter()
+
+    async def list_panes(self) -> list[PaneInfo]:
+        """pane 목록을 조회합니다."""
+        self.calls["list"] += 1
+        ids = [self.SCHEDULER_PANE_ID, *self.panes]
+        return [
+            PaneInfo(pane_id=pid, workspace="bench", cwd="/", title="sim", rows=self.profile.rows)
+            for pid in ids
+        ]
+
+    async def get_text(
+        self,
+        pane_id: int,
+        lines: int = 50,
+        start_line: int | None = None,
+        end_line: int | None = None,
+    ) -> str:
+        """pane 출력 텍스트를 조회합니다 (wezterm get-text와 같은 범위 규칙)."""
+        self.calls["get-text"] += 1
+        pane = self.panes.get(pane_id)
+        if pane is None:
+            return ""
+
+        all_lines = pane.screen_lines()
+        top = len(all_lines) - self.profile.rows
+        start = top + (start_line if start_line is not None else 0)
+        end = top + (end_line if end_line is not None else self.profile.rows - 1)
+        selected = all_lines[max(start, 0) : end + 1]
+        if len(selected) > lines:
+            selected = selected[-lines:]
+        return "\n".join(selected)
+
+    async def send_text(self, pane_id: int, text: str) -> None:
+        """pane에 텍스트를 입력합니다.
+
+        Raises:
+            RuntimeError: pane이 없을 때
+        """
+        self.calls["send-text"] += 1
+        pane = self.panes.get(pane_id)
+        if pane is None:
+            raise RuntimeError(f"WezTerm send-text 실패: pane {pane_id} 없음")
+        pane.type_text(text)
+
+    async def pane_exists(self, pane_id: int) -> bool:
+        """pane 존재 여부를 반환합니다."""
+        self.calls["list"] += 1
+        return pane_id == self.SCHEDULER_PANE_ID or pane_id in self.panes
+
+    async def get_active_pane_id(self) -> int | None:
+        """활성 pane(스케줄러 pane) ID를 반환합니다."""
+        self.calls["list"] += 1
+        return self.SCHEDULER_PANE_ID
+
+    async def close(self) -> None:
+        """실행 중인 모든 시뮬레이션 명령을 취소합니다."""
+        jobs = [job for pane in self.panes.values() if (job := pane.cancel()) is not None]
+        await asyncio.gather(*jobs, return_exceptions=True)
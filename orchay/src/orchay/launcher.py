@@ -371,8 +371,8 @@ def main() -> int:
     log.info(f"Log file: {LOG_FILE}")
     log.info("=" * 60)
 
-    # 서브커맨드 감지: run, exec, history는 cli.py로 위임
-    cli_subcommands = {"run", "exec", "history"}
+    # 서브커맨드 감지: run, exec, history, signal, bench는 cli.py로 위임
+    cli_subcommands = {"run", "exec", "history", "signal", "bench"}
     if len(sys.argv) > 1 and sys.argv[1] in cli_subcommands:
         log.info(f"Delegating to cli.py: {sys.argv[1]}")
         try:
@@ -19,15 +19,21 @@ from rich.console import Console
 from rich.table import Table
 
 from orchay.application import DispatchService, TaskService, WorkerService
+from orchay.domain.constants import DISPATCH_TIMINGS
+from orchay.domain.policies import TaskOrdering
 from orchay.domain.workflow import WorkflowConfig, WorkflowEngine
 from orchay.models import Config, Task, TaskStatus, Worker, WorkerState
 from orchay.scheduler import ExecutionMode, get_next_workflow_command
+from orchay.utils.pane_snapshot import PaneSnapshot
+from orchay.utils.signal_listener import SignalListener
+from orchay.utils.tick_profiler import TickProfiler, set_profiler
 from orchay.utils.wezterm import (
     WezTermNotFoundError,
     get_active_pane_id,
     wezterm_list_panes,
 )
-from orchay.wbs_parser import WbsParser
+from orchay.wbs_parser import WbsParser, WbsWatcher
+from orchay.wbs_writer import get_wbs_writer
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -44,17 +50,50 @@ class Orchestrator:
         self.wbs_path = wbs_path
         self.base_dir = base_dir  # 프로젝트 루트 디렉토리
         self.project_name = project_name  # 프로젝트명 (예: orchay)
-        self.parser = WbsParser(wbs_path)
+        # WBS 시작 스냅샷 (내용이 같으면 다음 시작 시 YAML 파싱 생략)
+        snapshot_dir: Path | None = None
+        if config.cache.enabled:
+            snapshot_dir = Path(config.cache.path)
+            if not snapshot_dir.is_absolute():
+                snapshot_dir = base_dir / snapshot_dir
+        self.parser = WbsParser(wbs_path, snapshot_dir=snapshot_dir)
+        # WBS 쓰기 묶음 시간 (동시에 끝난 Worker들의 상태 변경을 한 번에 씀)
+        get_wbs_writer(wbs_path, window=config.dispatch.wbs_write_window)
         self.workers: list[Worker] = []
         self.tasks: list[Task] = []
         self._mode = ExecutionMode(config.execution.mode)
         self._running = False
         self._paused = config.execution.start_paused
+        # Worker ID → 연속 폴링 시간 초과 횟수 (느린/응답 없는 pane 보고용)
+        self._poll_timeouts: dict[int, int] = {}
+        # Worker 신호 수신기 (활성화 시 신호 도착 즉시 tick, 폴링은 fallback)
+        self._signal_listener: SignalListener | None = None
+        if config.signal.enabled:
+            socket_path = Path(config.signal.socket_path)
+            if not socket_path.is_absolute():
+                socket_path = base_dir / socket_path
+            self._signal_listener = SignalListener(socket_path)
+        # WBS 파일 감시자 (활성화 시 변경이 없는 tick은 WBS 파싱 생략, 변경 즉시 tick)
+        self._wbs_watcher: WbsWatcher | None = None
+        self._wbs_wake = asyncio.Event()
+        # tick 단계별 프로파일러 (활성화 시 WezTerm/WBS 호출도 측정, 메트릭 파일 저장)
+        self._profiler = TickProfiler(config.metrics.window, config.metrics.write_interval)
+        self._metrics_path: Path | None = None
+        if config.metrics.enabled:
+            metrics_path = Path(config.metrics.path)
+            if not metrics_path.is_absolute():
+                metrics_path = base_dir / metrics_path
+            self._metrics_path = metrics_path
+            set_profiler(self._profiler)
 
         # Phase 2.4: 서비스 레이어 초기화
         workflow_config = WorkflowConfig.from_project_root(base_dir)
         self._workflow_engine = WorkflowEngine(workflow_config)
-        self._task_service = TaskService(self.parser, self._workflow_engine)
+        self._task_service = TaskService(
+            self.parser,
+            self._workflow_engine,
+            TaskOrdering(config.dispatch.order, config.dispatch.default_task_days),
+        )
         self._worker_service = WorkerService(config)
         self._dispatch_service = DispatchService(
             config=config,
@@ -63,6 +102,7 @@ class Orchestrator:
             mode=self._mode,
             workflow_engine=self._workflow_engine,
             output_callback=lambda msg: console.print(msg),
+            background=config.dispatch.background,
         )
 
     @property
@@ -83,6 +123,123 @@ class Orchestrator:
         """현재 실행 중인 Task ID 집합."""
         return {w.current_task for w in self.workers if w.current_task}
 
+    @property
+    def tasks_changed(self) -> bool:
+        """마지막 tick에서 WBS Task 내용이 바뀌었는지 여부 (False면 Task 목록 갱신 생략 가능)."""
+        return self._task_service.tasks_changed
+
+    @property
+    def profiler(self) -> TickProfiler:
+        """tick 단계별 프로파일러."""
+        return self._profiler
+
+    @property
+    def slow_workers(self) -> dict[int, int]:
+        """상태 폴링이 시간 초과된 Worker (Worker ID → 연속 시간 초과 횟수)."""
+        return dict(self._poll_timeouts)
+
+    @property
+    def signals_active(self) -> bool:
+        """Worker 신호 수신 중 여부."""
+        return self._signal_listener is not None and self._signal_listener.active
+
+    @property
+    def wbs_watch_active(self) -> bool:
+        """WBS 파일 감시 중 여부."""
+        return self._wbs_watcher is not None and self._wbs_watcher.active
+
+    @property
+    def poll_interval(self) -> int:
+        """pane 폴링 간격 (초). 신호 수신 중이면 느린 fallback 간격을 사용합니다."""
+        if self.signals_active:
+            return max(self.config.interval, self.config.signal.fallback_interval)
+        return self.config.interval
+
+    async def start_signal_listener(self) -> bool:
+        """Worker 신호 수신을 시작합니다.
+
+        Returns:
+            신호 수신 시작 여부 (비활성화 또는 실패 시 False, 폴링만 사용)
+        """
+        if self._signal_listener is None:
+            return False
+        if await self._signal_listener.start():
+            return True
+        self._signal_listener = None
+        return False
+
+    async def stop_signal_listener(self) -> None:
+        """Worker 신호 수신을 중단합니다."""
+        if self._signal_listener is not None:
+            await self._signal_listener.stop()
+
+    async def start_wbs_watcher(self) -> bool:
+        """WBS 파일 감시를 시작합니다.
+
+        감시 중에는 파일 변경 알림이 있을 때(또는 fallback 간격마다)만 WBS를 파싱합니다.
+
+        Returns:
+            감시 시작 여부 (비활성화 또는 실패 시 False, 매 tick 파싱)
+        """
+        if self.wbs_watch_active:
+            return True
+        watch = self.config.watch
+        if not watch.enabled:
+            return False
+
+        watcher = WbsWatcher(self.wbs_path, debounce=watch.debounce, on_change=self._on_wbs_change)
+        try:
+            watcher.start()
+        except Exception as e:
+            logger.warning(f"WBS 파일 감시 시작 실패 (매 tick 파싱): {e}")
+            return False
+        self._wbs_watcher = watcher
+        self._task_service.set_watching(True, watch.fallback_interval)
+        return True
+
+    async def stop_wbs_watcher(self) -> None:
+        """WBS 파일 감시를 중단합니다 (이후 매 tick 파싱)."""
+        if self._wbs_watcher is not None:
+            await self._wbs_watcher.stop()
+            self._wbs_watcher = None
+        self._task_service.set_watching(False)
+
+    async def _on_wbs_change(self) -> None:
+        """WBS 파일 변경 알림: Task 목록을 dirty로 표시하고 다음 tick을 앞당깁니다."""
+        self._task_service.mark_dirty()
+        self._wbs_wake.set()
+
+    async def wait_for_signal(self, timeout: float) -> bool:
+        """Worker 신호나 WBS 변경이 도착하거나 시간이 지날 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            신호/변경 도착 여부 (신호 수신과 파일 감시가 모두 비활성화면 항상 시간 초과)
+        """
+        events: list[asyncio.Event] = []
+        listener = self._signal_listener
+        if listener is not None and listener.active:
+            events.append(listener.wake)
+        if self.wbs_watch_active:
+            events.append(self._wbs_wake)
+        if not events:
+            await asyncio.sleep(timeout)
+            return False
+
+        waiters = [asyncio.ensure_future(event.wait()) for event in events]
+        try:
+            done, _ = await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        # Worker 신호 이벤트는 tick에서 drain()으로 해제, WBS 변경은 dirty 표시로 전달됨
+        self._wbs_wake.clear()
+        return bool(done)
+
     async def initialize(self) -> bool:
         """오케스트레이터 초기화.
 
@@ -161,71 +318,170 @@ class Orchestrator:
         """메인 스케줄링 루프 실행."""
         self._running = True
         console.print("[bold green]스케줄러 시작[/] (Ctrl+C로 종료)\n")
+        await self.start_signal_listener()
+        await self.start_wbs_watcher()
 
         while self._running:
             try:
                 await self._tick()
-                await asyncio.sleep(self.config.interval)
+                await self.wait_for_signal(self.poll_interval)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.exception(f"스케줄링 오류: {e}")
                 await asyncio.sleep(self.config.interval)
 
+        await self.stop_signal_listener()
+        await self.stop_wbs_watcher()
+
+        # 진행 중인 백그라운드 명령 전송 마무리
+        await self.wait_pending(timeout=DISPATCH_TIMINGS.PENDING_DRAIN_SECONDS)
+
         console.print("\n[yellow]스케줄러 종료[/]")
 
+    async def run_tick(self) -> None:
+        """스케줄링 사이클을 한 번 실행합니다 (벤치마크 등 외부 루프용)."""
+        await self._tick()
+
+    async def wait_pending(self, timeout: float | None = None) -> None:
+        """진행 중인 백그라운드 명령 전송이 끝날 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        """
+        await self._dispatch_service.wait_pending(timeout=timeout)
+
     async def _tick(self) -> None:
         """단일 스케줄링 사이클.
 
         Phase 2.4: 서비스 레이어로 리팩토링됨.
         """
         logger.debug("_tick 시작")
+        profiler = self._profiler
+
+        with profiler.tick():
+            # 1. Task 재로드 및 정리 (TaskService 사용)
+            with profiler.phase("reload"):
+                self.tasks = await self._task_service.reload_tasks()
+                self._task_service.tasks = self.tasks  # 서비스와 동기화
+                self._task_service.cleanup_completed(self.mode)
+
+            with profiler.phase("detect"):
+                # 2. pane 스냅샷 캡처 (tick 내 모든 감지 로직이 공유, 받은 Worker 신호 포함)
+                snapshot = PaneSnapshot(
+                    signals=self._signal_listener.drain() if self._signal_listener else None,
+                )
+                with profiler.phase("detect.prefetch"):
+                    await snapshot.prefetch(w.pane_id for w in self.workers)
+
+                # 3. Worker 상태 업데이트 (WorkerService 사용, 연속 실행 포함)
+                await self._update_worker_states(snapshot)
+
+                # 명령 전송 중/grace period라 처리하지 못한 신호는 다음 tick으로 넘김
+                if self._signal_listener is not None:
+                    live = {w.pane_id for w in self.workers if w.state != WorkerState.DEAD}
+                    held = {
+                        pane_id: signal
+                        for pane_id, signal in snapshot.untaken_signals().items()
+                        if pane_id in live
+                    }
+                    self._signal_listener.restore(held, delay=self.config.interval)
+
+            # 4. Worker의 current_step 동기화 (WorkerService 사용)
+            with profiler.phase("sync"):
+                self._worker_service.sync_worker_steps(
+                    tasks=self.tasks,
+                    get_next_command=lambda t, m: get_next_workflow_command(t, m),
+                    mode=self.mode.value,
+                )
 
-        # 1. Task 재로드 및 정리 (TaskService 사용)
-        self.tasks = await self._task_service.reload_tasks()
-        self._task_service.tasks = self.tasks  # 서비스와 동기화
-        self._task_service.cleanup_completed(self.mode)
+            # 5. 유휴 Worker에 Task 분배 (DispatchService 사용)
+            if not self._paused:
+                with profiler.phase("dispatch"):
+                    await self._dispatch_idle_workers(snapshot)
 
-        # 2. Worker 상태 업데이트 (WorkerService 사용, 연속 실행 포함)
-        for worker in self.workers:
-            await self._worker_service.update_worker_state_with_continuation(
-                worker=worker,
-                tasks=self.tasks,
-                dispatch_service=self._dispatch_service,
-                task_service=self._task_service,
-                mode=self.mode,
-                paused=self._paused,
-            )
+            # 6. 상태 출력
+            with profiler.phase("status"):
+                self.print_status()
 
-        # 3. Worker의 current_step 동기화 (WorkerService 사용)
-        self._worker_service.sync_worker_steps(
-            tasks=self.tasks,
-            get_next_command=lambda t, m: get_next_workflow_command(t, m),
-            mode=self.mode.value,
-        )
+            # 7. 자동 재시동 체크 (WorkerService에서 이미 처리됨)
+            # WorkerService.update_worker_state_with_continuation에서
+            # paused 상태인 Worker의 resume_at을 체크하고 자동 재시동 수행
+
+        # 8. 메트릭 파일 저장 (write_interval 간격)
+        if self._metrics_path is not None:
+            profiler.maybe_write(self._metrics_path)
+
+    async def _update_worker_states(self, snapshot: PaneSnapshot | None = None) -> None:
+        """모든 Worker의 상태를 업데이트합니다.
+
+        동시 폴링 모드(기본)에서는 Worker별 폴링을 동시에 실행하므로
+        tick 소요 시간이 Worker 수의 합이 아니라 가장 느린 pane 하나로 제한됩니다.
+
+        Args:
+            snapshot: tick 단위 pane 스냅샷
+        """
+        if self.config.detection.concurrent_polling:
+            await asyncio.gather(*(self._poll_worker(w, snapshot) for w in self.workers))
+        else:
+            for worker in self.workers:
+                await self._poll_worker(worker, snapshot)
+
+    async def _poll_worker(self, worker: Worker, snapshot: PaneSnapshot | None) -> None:
+        """단일 Worker 상태를 제한 시간 내에 업데이트합니다.
 
-        # 4. 유휴 Worker에 Task 분배 (DispatchService 사용)
-        if not self._paused:
-            await self._dispatch_idle_workers()
+        시간 초과나 예외는 해당 Worker에만 격리하고 로그로 보고합니다.
 
-        # 5. 상태 출력
-        self.print_status()
+        Args:
+            worker: 대상 Worker
+            snapshot: tick 단위 pane 스냅샷
+        """
+        timeout = self.config.detection.poll_timeout
+        try:
+            with self._profiler.phase(f"detect.worker.{worker.id}"):
+                await asyncio.wait_for(
+                    self._worker_service.update_worker_state_with_continuation(
+                        worker=worker,
+                        tasks=self.tasks,
+                        dispatch_service=self._dispatch_service,
+                        task_service=self._task_service,
+                        mode=self.mode,
+                        paused=self._paused,
+                        snapshot=snapshot,
+                    ),
+                    timeout=timeout,
+                )
+        except asyncio.TimeoutError:
+            count = self._poll_timeouts.get(worker.id, 0) + 1
+            self._poll_timeouts[worker.id] = count
+            logger.warning(
+                f"Worker {worker.id} (pane {worker.pane_id}): 상태 폴링 시간 초과 "
+                f"({timeout}s, 연속 {count}회)"
+            )
+            return
+        except Exception as e:
+            logger.exception(f"Worker {worker.id} (pane {worker.pane_id}): 상태 폴링 오류: {e}")
+            return
 
-        # 6. 자동 재시동 체크 (WorkerService에서 이미 처리됨)
-        # WorkerService.update_worker_state_with_continuation에서
-        # paused 상태인 Worker의 resume_at을 체크하고 자동 재시동 수행
+        if self._poll_timeouts.pop(worker.id, None):
+            logger.info(f"Worker {worker.id}: 상태 폴링 응답 회복")
 
-    async def _dispatch_idle_workers(self) -> None:
+    async def _dispatch_idle_workers(self, snapshot: PaneSnapshot | None = None) -> None:
         """유휴 Worker에 실행 가능 Task를 분배합니다.
 
         Phase 2.4: 새로 추가된 헬퍼 메서드.
         중복 방지: 메모리 기반 체크 + pane 텍스트 스캔 이중 검증.
+
+        Args:
+            snapshot: tick 단위 pane 스냅샷 (없으면 pane을 개별 조회)
         """
         # 실행 가능 Task 조회
         executable = self._task_service.get_executable_tasks(self.mode)
 
         # pane 기반 스캔 (메모리/pane 불일치 시 동기화 포함)
-        pane_running_tasks = await self._worker_service.scan_running_tasks_from_panes()
+        pane_running_tasks = await self._worker_service.scan_running_tasks_from_panes(
+            snapshot=snapshot
+        )
 
         # 메모리 기반 + pane 기반 이중 체크
         running_task_ids = self._worker_service.running_task_ids() | pane_running_tasks
@@ -262,7 +518,7 @@ class Orchestrator:
 
             # DispatchService 사용
             result = await self._dispatch_service.dispatch_task(
-                worker, task, check_state=True
+                worker, task, check_state=True, snapshot=snapshot
             )
             if not result.success:
                 logger.warning(f"Dispatch 실패: {result.message}")
@@ -278,6 +534,7 @@ class Orchestrator:
 
         state_colors = {
             WorkerState.IDLE: "green",
+            WorkerState.DISPATCHING: "cyan",
             WorkerState.BUSY: "yellow",
             WorkerState.PAUSED: "magenta",
             WorkerState.ERROR: "red",
@@ -297,6 +554,13 @@ class Orchestrator:
 
         console.print(table)
 
+        # 느린 pane 보고
+        if self._poll_timeouts:
+            slow = ", ".join(
+                f"Worker {wid} (x{count})" for wid, count in sorted(self._poll_timeouts.items())
+            )
+            console.print(f"[red]Slow panes:[/] {slow}")
+
         # 큐 상태
         pending = sum(1 for t in self.tasks if t.status.value == "[ ]")
         running = sum(1 for t in self.tasks if t.assigned_worker is not None)
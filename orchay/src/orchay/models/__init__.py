@@ -7,8 +7,16 @@ from orchay.models.config import (
     LauncherConfig,
     WorkerCommandConfig,
 )
-from orchay.models.task import ExecutionInfo, Task, TaskCategory, TaskPriority, TaskStatus
-from orchay.models.worker import PausedInfo, SchedulerState, Worker, WorkerState
+from orchay.models.task import (
+    ExecutionInfo,
+    Task,
+    TaskCategory,
+    TaskModel,
+    TaskPriority,
+    TaskStatus,
+)
+from orchay.models.task_store import TaskStore
+from orchay.models.worker import PausedInfo, SchedulerState, Worker, WorkerModel, WorkerState
 
 __all__ = [
     "Config",
@@ -20,9 +28,12 @@ __all__ = [
     "SchedulerState",
     "Task",
     "TaskCategory",
+    "TaskModel",
     "TaskPriority",
     "TaskStatus",
+    "TaskStore",
     "Worker",
     "WorkerCommandConfig",
+    "WorkerModel",
     "WorkerState",
 ]
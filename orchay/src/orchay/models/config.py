@@ -36,6 +36,14 @@ class DetectionConfig(BaseModel):
         description="질문 대기 감지 패턴",
     )
     read_lines: int = Field(default=50, description="pane 출력 읽기 줄 수")
+    concurrent_polling: bool = Field(
+        default=True, description="Worker 상태 동시 폴링 (False면 순차 폴링)"
+    )
+    poll_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Worker별 상태 폴링 제한 시간 (초) - dispatch 전송 시간보다 길어야 함",
+    )
 
 
 class RecoveryConfig(BaseModel):
@@ -54,10 +62,40 @@ class DispatchConfig(BaseModel):
     clear_before_dispatch: bool = Field(default=True, description="분배 전 /clear 전송")
     clear_wait_time: int = Field(default=2, description="/clear 후 대기 시간 (초)")
     grace_period: int = Field(default=20, description="dispatch 후 상태 체크 무시 시간 (초)")
+    background: bool = Field(
+        default=True, description="명령 전송을 백그라운드로 실행 (스케줄러 tick 비차단)"
+    )
+    delivery: Literal["fixed", "adaptive"] = Field(
+        default="adaptive",
+        description=(
+            "명령 전송 방식 - fixed: 고정 대기, "
+            "adaptive: pane 확인 후 진행 (시간 초과 시 고정 대기와 동일)"
+        ),
+    )
     min_task_duration: int = Field(
         default=30,
         description="Task 최소 실행 시간 (초) - 이보다 빨리 끝나면 잘못된 idle 판정 의심",
     )
+    order: Literal["id", "priority", "topological", "critical-path"] = Field(
+        default="id",
+        description=(
+            "분배 순서 - id: Task ID 순, priority: 우선순위 순, "
+            "topological: 의존성 레벨 순, critical-path: 후속 작업 경로가 긴 Task 먼저"
+        ),
+    )
+    default_task_days: float = Field(
+        default=1.0,
+        gt=0,
+        description="schedule이 없는 Task의 예상 기간 (일, critical-path 가중치)",
+    )
+    wbs_write_window: float = Field(
+        default=0.05,
+        ge=0.0,
+        description=(
+            "WBS 변경을 모아 한 번에 쓰는 대기 시간 (초) - "
+            "여러 Worker의 상태 변경이 이 시간 안에 들어오면 파일 쓰기 1회"
+        ),
+    )
 
 
 class HistoryConfig(BaseModel):
@@ -72,6 +110,64 @@ class HistoryConfig(BaseModel):
     capture_lines: int = Field(default=500, description="pane 출력 캡처 줄 수")
 
 
+class SignalConfig(BaseModel):
+    """Worker 신호 수신 설정 (Unix 소켓, push 방식 상태 보고)."""
+
+    enabled: bool = Field(default=False, description="Worker 신호 수신 활성화")
+    socket_path: str = Field(
+        default=".orchay/logs/orchay.sock",
+        description="신호 수신 Unix 소켓 경로 (프로젝트 루트 기준)",
+    )
+    fallback_interval: int = Field(
+        default=30,
+        ge=1,
+        le=300,
+        description="신호 수신 중 pane 폴링 간격 (초) - 신호를 놓친 경우 대비",
+    )
+
+
+class WatchConfig(BaseModel):
+    """WBS 파일 감시 설정 (watchdog, 변경 시에만 재파싱)."""
+
+    enabled: bool = Field(default=True, description="WBS 파일 감시 활성화 (변경 즉시 tick)")
+    debounce: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=5.0,
+        description="연속 변경을 하나로 묶는 대기 시간 (초)",
+    )
+    fallback_interval: int = Field(
+        default=30,
+        ge=1,
+        le=300,
+        description="감시 중 WBS 지문 확인 간격 (초) - 이벤트를 놓친 경우 대비",
+    )
+
+
+class CacheConfig(BaseModel):
+    """WBS 시작 스냅샷 설정 (내용 해시가 같으면 YAML 파싱 생략)."""
+
+    enabled: bool = Field(default=True, description="WBS 스냅샷 사용")
+    path: str = Field(
+        default=".orchay/cache",
+        description="스냅샷 디렉토리 (프로젝트 루트 기준)",
+    )
+
+
+class MetricsConfig(BaseModel):
+    """tick 프로파일링 설정 (단계별 소요 시간 백분위수)."""
+
+    enabled: bool = Field(
+        default=True, description="WezTerm/WBS 호출 측정 및 메트릭 파일 저장 활성화"
+    )
+    path: str = Field(
+        default=".orchay/logs/orchay-metrics.json",
+        description="메트릭 파일 경로 (프로젝트 루트 기준)",
+    )
+    window: int = Field(default=200, ge=10, le=10000, description="백분위수 계산 샘플 수")
+    write_interval: int = Field(default=30, ge=1, le=3600, description="메트릭 파일 저장 간격 (초)")
+
+
 class ExecutionConfig(BaseModel):
     """실행 모드 설정."""
 
@@ -174,6 +270,10 @@ class Config(BaseModel):
     recovery: RecoveryConfig = Field(default_factory=RecoveryConfig)
     dispatch: DispatchConfig = Field(default_factory=DispatchConfig)
     history: HistoryConfig = Field(default_factory=HistoryConfig)
+    signal: SignalConfig = Field(default_factory=SignalConfig)
+    watch: WatchConfig = Field(default_factory=WatchConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
     execution: ExecutionConfig = Field(default_factory=ExecutionConfig)
     worker_command: WorkerCommandConfig = Field(default_factory=WorkerCommandConfig)
     launcher: LauncherConfig = Field(default_factory=LauncherConfig)
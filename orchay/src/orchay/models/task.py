@@ -1,9 +1,22 @@
-"""Task 모델 정의."""
+"""Task 모델 정의.
 
+- `Task`: 스케줄러 루프/필터/TUI에서 쓰는 런타임 표현 (`__slots__`, 검증 없음)
+- `TaskModel`: 파일/외부 입력 경계에서 쓰는 pydantic 모델 (검증, 직렬화)
+
+`Task.from_model()` / `Task.to_model()`로 서로 변환합니다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
 from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from orchay.models.task_store import TaskStore
+
 
 class TaskCategory(str, Enum):
     """Task 카테고리."""
@@ -47,8 +60,11 @@ class ExecutionInfo(BaseModel):
     worker: int | None = Field(default=None, description="할당된 Worker 번호")
 
 
-class Task(BaseModel):
-    """WBS Task 모델."""
+class TaskModel(BaseModel):
+    """WBS Task pydantic 모델 (경계 검증/직렬화용).
+
+    런타임에는 `Task`를 사용합니다.
+    """
 
     id: str = Field(description="Task ID (예: TSK-01-01)")
     title: str = Field(description="Task 제목")
@@ -72,6 +88,202 @@ class Task(BaseModel):
     raw_content: str = Field(default="", description="WBS 원본 텍스트 (제목 제외)")
     execution: ExecutionInfo | None = Field(default=None, description="실행 중인 워크플로우 정보")
 
+
+# Task 필드 (TaskModel 필드와 같은 순서)
+TASK_FIELDS: tuple[str, ...] = (
+    "id",
+    "title",
+    "category",
+    "domain",
+    "status",
+    "priority",
+    "assignee",
+    "schedule",
+    "tags",
+    "depends",
+    "blocked_by",
+    "assigned_worker",
+    "prd_ref",
+    "requirements",
+    "acceptance",
+    "tech_spec",
+    "api_spec",
+    "ui_spec",
+    "raw_content",
+    "execution",
+)
+
+# TaskStore가 색인/구독자 알림에 쓰는 필드 (값이 바뀌면 Task가 속한 저장소에 알림)
+INDEXED_FIELDS: tuple[str, ...] = ("status", "depends", "blocked_by", "assigned_worker")
+
+
+class Task:
+    """WBS Task 런타임 표현.
+
+    필드는 `TaskModel`과 같지만 `__slots__` 객체라 생성/속성 변경에 검증 비용이 없고
+    인스턴스 `__dict__`가 없습니다. 목록 필드(tags, depends, requirements 등)는 읽기 전용
+    튜플로 저장하므로 빈 목록은 메모리를 차지하지 않습니다.
+
+    생성 시 enum 필드에 문자열 값을 주면 enum으로 변환하는 것 외에는 값을 검증하지
+    않습니다. 외부 입력은 `TaskModel`로 검증한 뒤 `Task.from_model()`로 변환하세요.
+
+    색인 필드(`INDEXED_FIELDS`)는 프로퍼티이며, Task가 `TaskStore`에 들어 있으면
+    값이 바뀔 때 저장소 색인과 구독자(`TaskStoreListener`)에 알립니다.
+    """
+
+    __slots__ = (
+        *(name for name in TASK_FIELDS if name not in INDEXED_FIELDS),
+        *(f"_{name}" for name in INDEXED_FIELDS),
+        "_store",
+    )
+
+    id: str
+    title: str
+    category: TaskCategory
+    domain: str
+    priority: TaskPriority
+    assignee: str
+    schedule: str
+    tags: tuple[str, ...]
+    prd_ref: str
+    requirements: tuple[str, ...]
+    acceptance: tuple[str, ...]
+    tech_spec: tuple[str, ...]
+    api_spec: tuple[str, ...]
+    ui_spec: tuple[str, ...]
+    raw_content: str
+    execution: ExecutionInfo | None
+    _status: TaskStatus
+    _depends: tuple[str, ...]
+    _blocked_by: str | None
+    _assigned_worker: int | None
+    _store: TaskStore | None
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        title: str,
+        category: TaskCategory | str,
+        domain: str = "",
+        status: TaskStatus | str = TaskStatus.TODO,
+        priority: TaskPriority | str = TaskPriority.MEDIUM,
+        assignee: str = "-",
+        schedule: str = "",
+        tags: Iterable[str] = (),
+        depends: Iterable[str] = (),
+        blocked_by: str | None = None,
+        assigned_worker: int | None = None,
+        prd_ref: str = "",
+        requirements: Iterable[str] = (),
+        acceptance: Iterable[str] = (),
+        tech_spec: Iterable[str] = (),
+        api_spec: Iterable[str] = (),
+        ui_spec: Iterable[str] = (),
+        raw_content: str = "",
+        execution: ExecutionInfo | None = None,
+    ) -> None:
+        self._store = None
+        self.id = id
+        self.title = title
+        self.category = category if type(category) is TaskCategory else TaskCategory(category)
+        self.domain = domain
+        self._status = status if type(status) is TaskStatus else TaskStatus(status)
+        self.priority = priority if type(priority) is TaskPriority else TaskPriority(priority)
+        self.assignee = assignee
+        self.schedule = schedule
+        self.tags = tuple(tags)
+        self._depends = tuple(depends)
+        self._blocked_by = blocked_by
+        self._assigned_worker = assigned_worker
+        self.prd_ref = prd_ref
+        self.requirements = tuple(requirements)
+        self.acceptance = tuple(acceptance)
+        self.tech_spec = tuple(tech_spec)
+        self.api_spec = tuple(api_spec)
+        self.ui_spec = tuple(ui_spec)
+        self.raw_content = raw_content
+        self.execution = execution
+
+    @property
+    def status(self) -> TaskStatus:
+        """현재 상태 (색인 필드)."""
+        return self._status
+
+    @status.setter
+    def status(self, value: TaskStatus) -> None:
+        old = self._status
+        self._status = value
+        if self._store is not None and value is not old:
+            self._store.notify(self, "status", old)
+
+    @property
+    def depends(self) -> tuple[str, ...]:
+        """의존 Task ID 목록 (색인 필드)."""
+        return self._depends
+
+    @depends.setter
+    def depends(self, value: tuple[str, ...]) -> None:
+        old = self._depends
+        self._depends = value
+        if self._store is not None and value != old:
+            self._store.notify(self, "depends", old)
+
+    @property
+    def blocked_by(self) -> str | None:
+        """블로킹 사유 (색인 필드)."""
+        return self._blocked_by
+
+    @blocked_by.setter
+    def blocked_by(self, value: str | None) -> None:
+        old = self._blocked_by
+        self._blocked_by = value
+        if self._store is not None and value != old:
+            self._store.notify(self, "blocked_by", old)
+
+    @property
+    def assigned_worker(self) -> int | None:
+        """할당된 Worker ID (색인 필드)."""
+        return self._assigned_worker
+
+    @assigned_worker.setter
+    def assigned_worker(self, value: int | None) -> None:
+        old = self._assigned_worker
+        self._assigned_worker = value
+        if self._store is not None and value != old:
+            self._store.notify(self, "assigned_worker", old)
+
+    @property
+    def store(self) -> TaskStore | None:
+        """색인 필드 변경을 알릴 TaskStore (없으면 None)."""
+        return self._store
+
+    def bind_store(self, store: TaskStore | None) -> None:
+        """색인 필드 변경을 알릴 TaskStore를 설정합니다 (TaskStore에서 호출)."""
+        self._store = store
+
+    @classmethod
+    def from_model(cls, model: TaskModel) -> Task:
+        """pydantic 모델 → 런타임 Task."""
+        return cls(**{name: getattr(model, name) for name in TASK_FIELDS})
+
+    def to_model(self) -> TaskModel:
+        """런타임 Task → pydantic 모델 (검증 포함)."""
+        return TaskModel.model_validate(self.to_dict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """필드 이름 → 값 (목록 필드는 튜플 그대로)."""
+        return {name: getattr(self, name) for name in TASK_FIELDS}
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Task:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in TASK_FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in TASK_FIELDS)
+        return f"Task({fields})"
+
     def is_executable(self) -> bool:
         """실행 가능 여부 확인."""
         return (
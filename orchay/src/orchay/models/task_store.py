@@ -0,0 +1,369 @@
+"""색인을 유지하는 Task 목록.
+
+`TaskStore`는 `list[Task]`를 상속하여 기존 리스트 사용 코드와 호환되면서,
+다음 색인을 Task 추가/삭제와 색인 필드 변경 시 갱신합니다.
+
+- ID → Task
+- 상태 → Task
+- 할당 Worker → Task
+- 의존 Task ID → 그 Task에 의존하는 Task (역방향 의존성)
+
+색인 필드(`status`, `depends`, `blocked_by`, `assigned_worker`)는 `Task` 프로퍼티가
+저장소에 변경을 알리므로, 조회 결과는 직접 속성을 바꿔도 항상 최신입니다. 조회 결과는
+리스트 순서를 따릅니다.
+
+`add_listener()`로 등록한 `TaskStoreListener`는 Task 추가/삭제, 색인 필드 변경,
+전체 재색인을 통지받습니다 (예: 실행 가능 Task 집합의 증분 갱신).
+
+Task 하나는 마지막으로 추가된 저장소 하나에만 변경을 알립니다.
+
+Example:
+    ```python
+    store = TaskStore(await parser.parse())
+    store.get("TSK-01-01")
+    store.with_status(TaskStatus.TODO)
+    store.dependents("TSK-01-01")
+    ```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable, Mapping
+from typing import Any, Protocol, SupportsIndex, cast, overload
+
+from orchay.models.task import Task, TaskStatus
+
+# 색인 버킷: 리스트 내 순번 → Task (조회 시 순번으로 정렬)
+_Bucket = dict[int, Task]
+
+
+def _ordered(*buckets: _Bucket) -> list[Task]:
+    """버킷들의 Task를 리스트 순서대로 반환합니다."""
+    if len(buckets) == 1:
+        bucket = buckets[0]
+        return [bucket[seq] for seq in sorted(bucket)]
+    merged: _Bucket = {}
+    for bucket in buckets:
+        merged.update(bucket)
+    return [merged[seq] for seq in sorted(merged)]
+
+
+class TaskStoreListener(Protocol):
+    """TaskStore 변경 구독자."""
+
+    def task_added(self, task: Task) -> None:
+        """Task가 추가됨."""
+        ...
+
+    def task_removed(self, task: Task) -> None:
+        """Task가 제거됨."""
+        ...
+
+    def task_changed(self, task: Task, field: str, old: object) -> None:
+        """Task 색인 필드가 바뀜 (old: 이전 값)."""
+        ...
+
+    def store_reset(self) -> None:
+        """리스트 순서/구성이 바뀌어 전체를 다시 색인함."""
+        ...
+
+
+class TaskStore(list[Task]):
+    """ID/상태/할당 Worker/역방향 의존성 색인을 유지하는 Task 리스트.
+
+    리스트 변경 메서드(append, extend, remove, pop 등)는 모두 색인을 갱신합니다.
+    순서를 바꾸는 변경(insert, sort, 슬라이스 대입 등)은 색인을 다시 만듭니다.
+
+    같은 ID의 Task가 여러 개면 ID 색인은 리스트에서 먼저 나오는 Task를 가리킵니다.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        """TaskStore를 초기화합니다.
+
+        Args:
+            tasks: 초기 Task 목록
+        """
+        super().__init__(tasks)
+        self._listeners: list[TaskStoreListener] = []
+        self._by_id: dict[str, Task] = {}
+        # id(Task) → 리스트 내 순번 (추가 순서, 재색인 시 리스트 위치)
+        self._seq: dict[int, int] = {}
+        self._next_seq = 0
+        self._by_status: dict[TaskStatus, _Bucket] = {}
+        self._by_worker: dict[int, _Bucket] = {}
+        self._dependents: dict[str, _Bucket] = {}
+        self._rebuild()
+
+    # ========================================================================
+    # 조회
+    # ========================================================================
+
+    @property
+    def by_id(self) -> Mapping[str, Task]:
+        """Task ID → Task 색인 (읽기 전용으로 사용)."""
+        return self._by_id
+
+    def get(self, task_id: str) -> Task | None:
+        """ID로 Task를 조회합니다.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task 또는 None
+        """
+        return self._by_id.get(task_id)
+
+    def with_status(self, *statuses: TaskStatus) -> list[Task]:
+        """주어진 상태 중 하나인 Task 목록 (리스트 순서)."""
+        return _ordered(*(self._by_status.get(s, {}) for s in statuses))
+
+    def without_status(self, *statuses: TaskStatus) -> list[Task]:
+        """주어진 상태가 아닌 Task 목록 (리스트 순서)."""
+        return _ordered(
+            *(bucket for status, bucket in self._by_status.items() if status not in statuses)
+        )
+
+    def assigned(self, worker_id: int | None = None) -> list[Task]:
+        """할당된 Task 목록 (리스트 순서).
+
+        Args:
+            worker_id: Worker ID (None이면 모든 Worker)
+
+        Returns:
+            할당된 Task 리스트
+        """
+        if worker_id is not None:
+            return _ordered(self._by_worker.get(worker_id, {}))
+        return _ordered(*self._by_worker.values())
+
+    def dependents(self, task_id: str) -> list[Task]:
+        """task_id에 의존하는 Task 목록 (리스트 순서).
+
+        Args:
+            task_id: 의존 대상 Task ID
+
+        Returns:
+            depends에 task_id가 있는 Task 리스트
+        """
+        return _ordered(self._dependents.get(task_id, {}))
+
+    # ========================================================================
+    # 변경
+    # ========================================================================
+
+    def add_listener(self, listener: TaskStoreListener) -> None:
+        """변경 구독자를 등록합니다."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: TaskStoreListener) -> None:
+        """변경 구독자를 해제합니다 (등록되지 않았으면 무시)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def discard_ids(self, task_ids: Collection[str]) -> None:
+        """주어진 ID의 Task를 모두 제거합니다.
+
+        Args:
+            task_ids: 제거할 Task ID
+        """
+        removed = [t for t in self if t.id in task_ids]
+        if not removed:
+            return
+        super().__setitem__(slice(None), [t for t in self if t.id not in task_ids])
+        for task in removed:
+            self._unindex(task)
+        for task_id in task_ids:
+            self._by_id.pop(task_id, None)
+        for task in removed:
+            for listener in self._listeners:
+                listener.task_removed(task)
+
+    def notify(self, task: Task, field: str, old: object) -> None:
+        """Task 색인 필드 변경 알림 (Task 프로퍼티에서 호출).
+
+        Args:
+            task: 변경된 Task
+            field: 필드 이름 (`INDEXED_FIELDS` 중 하나)
+            old: 이전 값
+        """
+        seq = self._seq.get(id(task))
+        if seq is None:
+            return
+        if field == "status":
+            self._drop(self._by_status, old, seq)
+            self._by_status.setdefault(task.status, {})[seq] = task
+        elif field == "assigned_worker":
+            if old is not None:
+                self._drop(self._by_worker, old, seq)
+            if task.assigned_worker is not None:
+                self._by_worker.setdefault(task.assigned_worker, {})[seq] = task
+        elif field == "depends":
+            for dep_id in cast(tuple[str, ...], old):
+                self._drop(self._dependents, dep_id, seq)
+            for dep_id in task.depends:
+                self._dependents.setdefault(dep_id, {})[seq] = task
+        for listener in self._listeners:
+            listener.task_changed(task, field, old)
+
+    def append(self, task: Task, /) -> None:
+        super().append(task)
+        self._index(task, self._next_seq)
+        for listener in self._listeners:
+            listener.task_added(task)
+
+    def extend(self, tasks: Iterable[Task], /) -> None:
+        for task in tasks:
+            self.append(task)
+
+    def __iadd__(self, tasks: Iterable[Task], /) -> TaskStore:
+        self.extend(tasks)
+        return self
+
+    def pop(self, index: SupportsIndex = -1, /) -> Task:
+        task = super().pop(index)
+        self._forget(task)
+        return task
+
+    def remove(self, task: Task, /) -> None:
+        self.pop(self.index(task))
+
+    def clear(self) -> None:
+        super().clear()
+        self._rebuild()
+
+    def insert(self, index: SupportsIndex, task: Task, /) -> None:
+        super().insert(index, task)
+        self._rebuild()
+
+    def sort(self, *, key: Callable[[Task], Any], reverse: bool = False) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._rebuild()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._rebuild()
+
+    def __imul__(self, count: SupportsIndex, /) -> TaskStore:
+        super().__imul__(count)
+        self._rebuild()
+        return self
+
+    @overload
+    def __setitem__(self, index: SupportsIndex, value: Task, /) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Task], /) -> None: ...
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Any, /) -> None:
+        super().__setitem__(index, value)
+        self._rebuild()
+
+    def __delitem__(self, index: SupportsIndex | slice, /) -> None:
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._rebuild()
+        else:
+            self.pop(index)
+
+    # ========================================================================
+    # 색인 관리
+    # ========================================================================
+
+    def _index(self, task: Task, seq: int) -> None:
+        """Task를 색인에 추가합니다 (이미 색인된 객체면 무시)."""
+        if id(task) in self._seq:
+            return
+        self._seq[id(task)] = seq
+        self._next_seq = seq + 1
+        self._by_id.setdefault(task.id, task)
+        self._by_status.setdefault(task.status, {})[seq] = task
+        if task.assigned_worker is not None:
+            self._by_worker.setdefault(task.assigned_worker, {})[seq] = task
+        for dep_id in task.depends:
+            self._dependents.setdefault(dep_id, {})[seq] = task
+        task.bind_store(self)
+
+    def _unindex(self, task: Task) -> None:
+        """Task를 ID 색인을 제외한 색인에서 제거합니다."""
+        seq = self._seq.pop(id(task), None)
+        if seq is None:
+            return
+        self._drop(self._by_status, task.status, seq)
+        if task.assigned_worker is not None:
+            self._drop(self._by_worker, task.assigned_worker, seq)
+        for dep_id in task.depends:
+            self._drop(self._dependents, dep_id, seq)
+        if task.store is self:
+            task.bind_store(None)
+
+    def _forget(self, task: Task) -> None:
+        """리스트에서 빠진 Task를 색인에서 제거합니다."""
+        if any(t is task for t in self):
+            # 같은 객체가 리스트에 남아 있음
+            return
+        self._unindex(task)
+        if self._by_id.get(task.id) is task:
+            del self._by_id[task.id]
+            replacement = next((t for t in self if t.id == task.id), None)
+            if replacement is not None:
+                self._by_id[task.id] = replacement
+        for listener in self._listeners:
+            listener.task_removed(task)
+
+    def _rebuild(self) -> None:
+        """리스트 순서대로 모든 색인을 다시 만듭니다."""
+        previous = [t for bucket in self._by_status.values() for t in bucket.values()]
+        self._by_id = {}
+        self._seq = {}
+        self._next_seq = 0
+        self._by_status = {}
+        self._by_worker = {}
+        self._dependents = {}
+        for seq, task in enumerate(self):
+            self._index(task, seq)
+        for task in previous:
+            if id(task) not in self._seq and task.store is self:
+                task.bind_store(None)
+        for listener in self._listeners:
+            listener.store_reset()
+
+    @staticmethod
+    def _drop(index: dict[Any, _Bucket], key: object, seq: int) -> None:
+        """색인 버킷에서 순번을 제거합니다 (빈 버킷은 삭제)."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(seq, None)
+            if not bucket:
+                del index[key]
+
+
+def tasks_by_id(tasks: Iterable[Task]) -> Mapping[str, Task]:
+    """Task ID → Task 매핑.
+
+    TaskStore면 유지 중인 색인을 그대로 반환하고, 아니면 새로 만듭니다.
+
+    Args:
+        tasks: Task 목록
+
+    Returns:
+        Task ID → Task 매핑
+    """
+    if isinstance(tasks, TaskStore):
+        return tasks.by_id
+    return {t.id: t for t in tasks}
+
+
+def find_task(tasks: Iterable[Task], task_id: str) -> Task | None:
+    """ID로 Task를 찾습니다 (TaskStore면 색인 조회, 아니면 순차 검색).
+
+    Args:
+        tasks: Task 목록
+        task_id: Task ID
+
+    Returns:
+        Task 또는 None
+    """
+    if isinstance(tasks, TaskStore):
+        return tasks.get(task_id)
+    return next((t for t in tasks if t.id == task_id), None)
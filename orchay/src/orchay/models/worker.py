@@ -1,7 +1,16 @@
-"""Worker 모델 정의."""
+"""Worker 모델 정의.
+
+- `Worker`: 스케줄러 루프/TUI에서 쓰는 런타임 표현 (`__slots__`, 검증 없음)
+- `WorkerModel`: 외부 입력 경계에서 쓰는 pydantic 모델 (검증, 직렬화)
+
+`Worker.from_model()` / `Worker.to_model()`로 서로 변환합니다.
+"""
+
+from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +27,7 @@ class WorkerState(str, Enum):
     """Worker 상태."""
 
     IDLE = "idle"
+    DISPATCHING = "dispatching"  # 명령 전송 중 (백그라운드 dispatch)
     BUSY = "busy"
     PAUSED = "paused"
     ERROR = "error"
@@ -35,8 +45,11 @@ class PausedInfo(BaseModel):
     message: str = Field(default="", description="원본 메시지")
 
 
-class Worker(BaseModel):
-    """Claude Code Worker 모델."""
+class WorkerModel(BaseModel):
+    """Claude Code Worker pydantic 모델 (경계 검증/직렬화용).
+
+    런타임에는 `Worker`를 사용합니다.
+    """
 
     id: int = Field(description="Worker 번호 (1, 2, 3...)")
     pane_id: int = Field(description="WezTerm pane ID")
@@ -49,6 +62,90 @@ class Worker(BaseModel):
     resume_at: datetime | None = Field(default=None, description="자동 재개 시간 (토큰 한도 등)")
     paused_info: PausedInfo | None = Field(default=None, description="일시정지 상세 정보")
 
+
+# Worker 필드 (WorkerModel 필드와 같은 순서)
+WORKER_FIELDS: tuple[str, ...] = (
+    "id",
+    "pane_id",
+    "state",
+    "current_task",
+    "current_step",
+    "dispatch_time",
+    "retry_count",
+    "is_manually_paused",
+    "resume_at",
+    "paused_info",
+)
+
+
+class Worker:
+    """Claude Code Worker 런타임 표현.
+
+    필드는 `WorkerModel`과 같지만 `__slots__` 객체라 tick마다 반복되는 상태 변경에
+    검증 비용이 없습니다. state에 문자열 값을 주면 enum으로 변환하는 것 외에는 값을
+    검증하지 않습니다.
+    """
+
+    __slots__ = WORKER_FIELDS
+
+    id: int
+    pane_id: int
+    state: WorkerState
+    current_task: str | None
+    current_step: str | None
+    dispatch_time: datetime | None
+    retry_count: int
+    is_manually_paused: bool
+    resume_at: datetime | None
+    paused_info: PausedInfo | None
+
+    def __init__(
+        self,
+        *,
+        id: int,
+        pane_id: int,
+        state: WorkerState | str = WorkerState.IDLE,
+        current_task: str | None = None,
+        current_step: str | None = None,
+        dispatch_time: datetime | None = None,
+        retry_count: int = 0,
+        is_manually_paused: bool = False,
+        resume_at: datetime | None = None,
+        paused_info: PausedInfo | None = None,
+    ) -> None:
+        self.id = id
+        self.pane_id = pane_id
+        self.state = state if type(state) is WorkerState else WorkerState(state)
+        self.current_task = current_task
+        self.current_step = current_step
+        self.dispatch_time = dispatch_time
+        self.retry_count = retry_count
+        self.is_manually_paused = is_manually_paused
+        self.resume_at = resume_at
+        self.paused_info = paused_info
+
+    @classmethod
+    def from_model(cls, model: WorkerModel) -> Worker:
+        """pydantic 모델 → 런타임 Worker."""
+        return cls(**{name: getattr(model, name) for name in WORKER_FIELDS})
+
+    def to_model(self) -> WorkerModel:
+        """런타임 Worker → pydantic 모델 (검증 포함)."""
+        return WorkerModel.model_validate(self.to_dict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """필드 이름 → 값."""
+        return {name: getattr(self, name) for name in WORKER_FIELDS}
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Worker:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in WORKER_FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in WORKER_FIELDS)
+        return f"Worker({fields})"
+
     def is_available(self) -> bool:
         """작업 할당 가능 여부.
 
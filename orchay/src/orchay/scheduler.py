@@ -28,6 +28,7 @@ __all__ = [
     "get_manual_commands",
     "get_next_workflow_command",
     "reload_workflows",
+    "set_workflow_engine",
     "handle_approve",
     "dispatch_task",
 ]
@@ -169,6 +170,21 @@ def _get_workflow_engine() -> WorkflowEngine:
     return _workflow_engine
 
 
+def set_workflow_engine(engine: WorkflowEngine | None) -> WorkflowEngine | None:
+    """WorkflowEngine 싱글톤을 교체합니다 (벤치마크/시뮬레이션용).
+
+    Args:
+        engine: 사용할 WorkflowEngine (None이면 다음 호출 시 현재 디렉토리 기준으로 다시 생성)
+
+    Returns:
+        이전 WorkflowEngine (복원용)
+    """
+    global _workflow_engine
+
+    previous, _workflow_engine = _workflow_engine, engine
+    return previous
+
+
 def reload_workflows() -> None:
     """workflows.json 캐시를 강제로 갱신합니다."""
     global _workflow_engine
@@ -249,8 +265,8 @@ async def handle_approve(
     # force 모드: 자동 승인
     logger.info(f"[{task.id}] 자동 승인 처리 (force 모드)")
 
-    # WBS 상태 업데이트: [dd] → [ap]
-    success = await update_task_status(wbs_path, task.id, "[ap]")
+    # WBS 상태 업데이트: [dd] → [ap] (파일 상태가 이미 바뀌었으면 덮어쓰지 않음)
+    success = await update_task_status(wbs_path, task.id, "[ap]", expected_status="[dd]")
 
     if success:
         logger.info(f"[{task.id}] 승인 완료: [dd] → [ap]")
@@ -7,21 +7,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from rich.text import Text
 
 if TYPE_CHECKING:
     from orchay.main import Orchestrator
+    from orchay.utils.tick_profiler import TickProfiler
 from textual.app import App, ComposeResult
 from textual.binding import Binding, BindingType
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.widgets import DataTable, Footer, Header, RichLog, Static
 
 from orchay.command import CommandHandler
-from orchay.domain.constants import DISPATCH_TIMINGS
 from orchay.scheduler import ExecutionMode
 from orchay.models import Config, Task, TaskStatus, Worker, WorkerState
+from orchay.models.task_store import find_task
 from orchay.ui.widgets import HelpModal, TaskDetailModal, TestSelectionPanel
 from orchay.utils.active_tasks import (
     pause_worker,
@@ -213,12 +215,32 @@ class HeaderInfo(Static):
         )
 
 
+class TickStatsLine(Static):
+    """tick 프로파일 상태 줄 (tick/단계별 소요 시간 백분위수)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._text = "tick: -"
+        self.id = "tick-stats"
+
+    def update_stats(self, text: str) -> None:
+        """상태 줄 업데이트."""
+        if text != self._text:
+            self._text = text
+            self.refresh()
+
+    def render(self) -> Text:
+        """상태 줄 렌더링."""
+        return Text(f"⏱ {self._text}", style="dim")
+
+
 class WorkerPanel(Static):
     """Worker 상태 패널 (선택 및 제어 기능 포함)."""
 
     # 상태별 색상
     STATE_COLORS: ClassVar[dict[WorkerState, str]] = {
         WorkerState.IDLE: "#22c55e",
+        WorkerState.DISPATCHING: "#06b6d4",
         WorkerState.BUSY: "#3b82f6",
         WorkerState.PAUSED: "#f59e0b",
         WorkerState.ERROR: "#ef4444",
@@ -230,6 +252,7 @@ class WorkerPanel(Static):
     # 상태별 아이콘
     STATE_ICONS: ClassVar[dict[WorkerState, str]] = {
         WorkerState.IDLE: "●",
+        WorkerState.DISPATCHING: "➤",
         WorkerState.BUSY: "◐",
         WorkerState.PAUSED: "⏸",
         WorkerState.ERROR: "✗",
@@ -340,6 +363,8 @@ class WorkerPanel(Static):
             return "Manually paused (P to resume)"
         if worker.state == WorkerState.IDLE:
             return "Ready for next task"
+        elif worker.state == WorkerState.DISPATCHING:
+            return "Sending command..."
         elif worker.state == WorkerState.PAUSED:
             return "Rate limit - waiting..."
         elif worker.state == WorkerState.ERROR:
@@ -417,6 +442,9 @@ class OrchayApp(App[None]):
         self._logs_fullscreen = False
         self._help_visible = False
         self._tick_running = False  # tick 중복 실행 방지
+        self._tick_idle = asyncio.Event()  # 실행 중인 tick이 없으면 설정됨
+        self._tick_idle.set()
+        self._rendered_running: set[str] = set()  # 큐 테이블에 표시된 실행 중 Task
 
         # 실제 Orchestrator 또는 Mock
         self._real_orchestrator: Orchestrator | None = orchestrator  # type: ignore[assignment]
@@ -559,6 +587,9 @@ class OrchayApp(App[None]):
                 yield Static("Logs  (F6:Expand)", id="log-title")
                 yield RichLog(id="log-panel", highlight=True, markup=True)
 
+            # tick 프로파일 상태 줄
+            yield TickStatsLine()
+
         # 모달 위젯들 (기본 숨김)
         yield HelpModal()
         yield TaskDetailModal()
@@ -603,7 +634,13 @@ class OrchayApp(App[None]):
         logging.getLogger().addHandler(self._log_handler)
 
         # 자동 갱신 타이머 시작
-        self.set_interval(self._interval, self._on_auto_refresh)
+        self._refresh_timer = self.set_interval(self._interval, self._on_auto_refresh)
+
+        # Worker 신호 수신 / WBS 파일 감시 (신호·변경 도착 즉시 tick)
+        if self._real_orchestrator is not None and (
+            self.config.signal.enabled or self.config.watch.enabled
+        ):
+            self.run_worker(self._watch_signals(), group="signals")
 
         # F9 바인딩 초기 레이블 설정
         self._update_f9_binding()
@@ -633,6 +670,7 @@ class OrchayApp(App[None]):
         # Orchestrator._tick() 내부에서 pause일 때 Task 분배만 건너뜀
         if self._real_orchestrator is not None and not self._tick_running:
             self._tick_running = True
+            self._tick_idle.clear()
             logger.debug(f"_on_auto_refresh: _tick 시작 (paused={self._paused})")
             self.run_worker(self._run_orchestrator_tick(selected_task_id))
             # UI 업데이트는 _run_orchestrator_tick() 완료 후 수행됨
@@ -646,6 +684,44 @@ class OrchayApp(App[None]):
             self._update_worker_panel()
             self._update_header_info()
 
+    async def _watch_signals(self) -> None:
+        """Worker 신호나 WBS 변경을 기다렸다가 도착하면 즉시 tick을 실행합니다.
+
+        신호 수신 중에는 자동 갱신을 느린 fallback 간격으로 전환합니다.
+        WBS 파일 감시 중에는 변경이 없는 tick에서 WBS 파싱을 생략합니다.
+        """
+        orchestrator = self._real_orchestrator
+        if orchestrator is None:
+            return
+        signals = self.config.signal.enabled and await orchestrator.start_signal_listener()
+        if self.config.signal.enabled and not signals:
+            self.write_log("Worker 신호 수신을 시작할 수 없어 폴링만 사용합니다", "warning")
+        watching = await orchestrator.start_wbs_watcher()
+        if watching:
+            self.write_log("WBS 파일 감시 시작 (변경 시에만 재파싱)", "info")
+        if not signals and not watching:
+            return
+
+        interval = orchestrator.poll_interval
+        if signals:
+            self._refresh_timer.stop()
+            self._refresh_timer = self.set_interval(interval, self._on_auto_refresh)
+            self.write_log(f"Worker 신호 수신 시작 (폴링 간격 {interval}초)", "info")
+
+        try:
+            while True:
+                if not await orchestrator.wait_for_signal(interval):
+                    continue
+                # 진행 중인 tick이 끝난 뒤 실행 (받은 신호/변경은 다음 tick에서 처리)
+                await self._tick_idle.wait()
+                self._on_auto_refresh()
+                # 예약한 tick이 신호를 drain()하여 wake를 해제할 때까지 대기
+                # (끝난 뒤에도 wake가 설정되어 있으면 tick 중에 새로 도착한 신호)
+                await self._tick_idle.wait()
+        finally:
+            await orchestrator.stop_signal_listener()
+            await orchestrator.stop_wbs_watcher()
+
     def write_log(self, message: str, level: str = "info") -> None:
         """로그 패널에 메시지 작성.
 
@@ -684,14 +760,23 @@ class OrchayApp(App[None]):
                     logging.getLogger(__name__).exception(f"_tick 실행 중 오류: {e}")
 
             # tick 성공/실패와 무관하게 UI는 항상 업데이트
-            self._sync_from_orchestrator()
-            self._update_queue_table(preserve_cursor_task_id=preserve_cursor_task_id)
-            self._update_worker_panel()
-            self._update_header_info()
+            # (WBS와 실행 중 Task가 그대로면 큐 테이블 재구성 생략)
+            profiler: TickProfiler | None = getattr(self._real_orchestrator, "profiler", None)
+            with profiler.phase("ui") if profiler is not None else nullcontext():
+                self._sync_from_orchestrator()
+                running = {w.current_task for w in self._worker_list if w.current_task}
+                tasks_changed = getattr(self._real_orchestrator, "tasks_changed", True)
+                if tasks_changed is not False or running != self._rendered_running:
+                    self._update_queue_table(preserve_cursor_task_id=preserve_cursor_task_id)
+                self._update_worker_panel()
+                self._update_header_info()
+            if profiler is not None:
+                self._update_tick_stats(profiler)
         except Exception as e:
             logging.getLogger(__name__).exception(f"UI 업데이트 중 오류: {e}")
         finally:
             self._tick_running = False
+            self._tick_idle.set()
 
     def _sync_from_orchestrator(self) -> None:
         """Orchestrator 상태를 TUI에 동기화."""
@@ -724,6 +809,11 @@ class OrchayApp(App[None]):
                         f"(task: {curr_task})",
                         "info",
                     )
+                elif curr_state == WorkerState.DISPATCHING:
+                    self.write_log(
+                        f"Worker {worker.id}: Dispatch → {curr_task} (전송 중)",
+                        "info",
+                    )
                 elif curr_state == WorkerState.DONE:
                     if prev_task is not None:
                         self.write_log(
@@ -797,6 +887,7 @@ class OrchayApp(App[None]):
         active_row: int | None = None
         preserved_row: int | None = None
         running_task_ids = {w.current_task for w in self._worker_list if w.current_task}
+        self._rendered_running = running_task_ids
 
         # 짧은 표시명 매핑
         category_short = {
@@ -870,6 +961,14 @@ class OrchayApp(App[None]):
         except Exception:
             pass
 
+    def _update_tick_stats(self, profiler: TickProfiler) -> None:
+        """tick 프로파일 상태 줄 업데이트."""
+        try:
+            line = self.query_one("#tick-stats", TickStatsLine)
+            line.update_stats(profiler.status_line())
+        except Exception:
+            pass
+
     def _update_layout(self) -> None:
         """레이아웃 상태 업데이트 (전체화면 토글)."""
         try:
@@ -1378,9 +1477,7 @@ class OrchayApp(App[None]):
 
             # Task의 할당 해제
             if current_task and self._real_orchestrator is not None:
-                task = next(
-                    (t for t in self._real_orchestrator.tasks if t.id == current_task), None
-                )
+                task = find_task(self._real_orchestrator.tasks, current_task)
                 if task:
                     task.assigned_worker = None
 
@@ -1480,29 +1577,15 @@ class OrchayApp(App[None]):
             if dispatched >= len(idle_workers):
                 break
 
-            task = next((t for t in self._tasks if t.id == task_id), None)
+            task = find_task(self._tasks, task_id)
             if task is None:
                 continue
 
             worker = idle_workers[dispatched]
 
-            # dispatch 실행
-            from orchay.utils.wezterm import wezterm_send_text
-
-            # /clear 전송 (config 설정 확인)
-            dispatch_config = self._orchestrator._dispatch_service._config.dispatch
-            if dispatch_config.clear_before_dispatch:
-                await wezterm_send_text(worker.pane_id, "/clear")
-                await asyncio.sleep(DISPATCH_TIMINGS.CLEAR_WAIT_SECONDS)
-                await wezterm_send_text(worker.pane_id, "\r")
-                await asyncio.sleep(DISPATCH_TIMINGS.ENTER_WAIT_SECONDS)
-
-            # 명령어 전송
+            # 명령어 전송 (/clear 및 대기 방식은 dispatch 설정을 따름)
             command = f"/wf:test {self._project}/{task_id}"
-            await wezterm_send_text(worker.pane_id, command)
-            await asyncio.sleep(DISPATCH_TIMINGS.COMMAND_WAIT_SECONDS)
-            await wezterm_send_text(worker.pane_id, "\r")
-            await asyncio.sleep(DISPATCH_TIMINGS.ENTER_WAIT_SECONDS)
+            await self._orchestrator._dispatch_service.deliver(worker.pane_id, command)
 
             # 상태 업데이트
             worker.state = WorkerState.BUSY
@@ -2,6 +2,7 @@
 
 from orchay.utils.config import ConfigLoadError, load_config
 from orchay.utils.history import HistoryEntry, HistoryManager
+from orchay.utils.pane_snapshot import PaneSnapshot
 from orchay.utils.wezterm import (
     PaneInfo,
     WezTermNotFoundError,
@@ -15,6 +16,7 @@ __all__ = [
     "ConfigLoadError",
     "HistoryEntry",
     "HistoryManager",
+    "PaneSnapshot",
     "PaneInfo",
     "WezTermNotFoundError",
     "load_config",
@@ -1,13 +1,27 @@
 """작업 중 상태 파일 관리 모듈.
 
 `.orchay/logs/orchay-active.json` 파일로 Worker 일시정지 및 스케줄러 상태를 관리합니다.
+
+상태는 `ActiveStateFile`이 메모리에 유지하고, 파일의 (inode, 크기, mtime)이 바뀐 경우
+(다른 프로세스나 사용자가 수정한 경우)에만 다시 읽습니다. 따라서 tick마다 호출되는
+일시정지/상태 조회는 파일을 열지 않습니다. 저장은 임시 파일 + `os.replace`로 원자적으로
+교체하며, `coalesce`를 지정하면 짧은 간격의 연속 저장을 한 번으로 합칩니다.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
+import os
+import threading
+import time
 from pathlib import Path
-from typing import TypedDict
+from typing import TypedDict, cast
+
+from orchay.utils.wbs_index import write_atomic
+
+logger = logging.getLogger(__name__)
 
 
 class ActiveTasksData(TypedDict):
@@ -17,6 +31,10 @@ class ActiveTasksData(TypedDict):
     schedulerState: str  # running, paused, stopped
 
 
+# 파일 변경 감지 키: (inode, 크기, mtime_ns)
+_FileStamp = tuple[int, int, int]
+
+
 def get_active_tasks_path() -> Path:
     """상태 파일 경로 반환."""
     return Path.cwd() / ".orchay" / "logs" / "orchay-active.json"
@@ -30,32 +48,191 @@ def _get_default_data() -> ActiveTasksData:
     }
 
 
-def load_active_tasks() -> ActiveTasksData:
-    """상태 파일 로드."""
-    path = get_active_tasks_path()
-    if not path.exists():
-        return _get_default_data()
-
-    try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-            # 기본값 보장
-            if "pausedWorkers" not in data:
-                data["pausedWorkers"] = []
-            if "schedulerState" not in data:
-                data["schedulerState"] = "running"
-            return data
-    except (json.JSONDecodeError, OSError):
-        return _get_default_data()
+class ActiveStateFile:
+    """메모리 캐시를 둔 상태 파일.
 
+    조회는 `os.stat()`으로 파일 변경 여부만 확인하고, 바뀌었을 때만 JSON을 다시 읽습니다.
+    같은 크기로 제자리 수정된 파일은 파일 시스템 mtime 해상도 안에서는 감지하지 못할 수
+    있습니다 (orchay 자신의 저장은 항상 새 inode).
 
-def save_active_tasks(data: ActiveTasksData) -> None:
-    """상태 파일 저장."""
+    Example:
+        ```python
+        state = ActiveStateFile(Path(".orchay/logs/orchay-active.json"), coalesce=0.5)
+        state.pause_worker(1)       # 0.5초 안의 연속 저장은 한 번만 기록
+        state.is_worker_paused(1)   # 파일 I/O 없음
+        state.flush()               # 대기 중인 저장 즉시 기록
+        ```
+    """
+
+    def __init__(self, path: Path, coalesce: float = 0.0) -> None:
+        """ActiveStateFile을 초기화합니다.
+
+        Args:
+            path: 상태 파일 경로
+            coalesce: 저장 병합 간격 (초, 0이면 매번 즉시 기록)
+        """
+        self.path = path
+        self.coalesce = coalesce
+        self._lock = threading.RLock()
+        self._data: ActiveTasksData | None = None
+        # 캐시한 시점의 파일 변경 감지 키 (None이면 파일 없음)
+        self._stamp: _FileStamp | None = None
+        # 아직 기록하지 않은 변경 여부
+        self._dirty = False
+        self._last_write: float | None = None
+        self._timer: threading.Timer | None = None
+        if coalesce > 0:
+            atexit.register(self.flush)
+
+    # === 조회 ===
+
+    def load(self) -> ActiveTasksData:
+        """상태 사본을 반환합니다 (호출자가 변경해도 캐시에 영향 없음)."""
+        with self._lock:
+            data = self._current()
+            copied = cast(ActiveTasksData, dict(data))
+            copied["pausedWorkers"] = list(data["pausedWorkers"])
+            return copied
+
+    def is_worker_paused(self, worker_id: int) -> bool:
+        """Worker가 수동 일시정지 상태인지 확인."""
+        with self._lock:
+            return worker_id in self._current()["pausedWorkers"]
+
+    def get_paused_workers(self) -> list[int]:
+        """수동 일시정지된 Worker ID 목록 반환."""
+        with self._lock:
+            return list(self._current()["pausedWorkers"])
+
+    def get_scheduler_state(self) -> str:
+        """스케줄러 상태 반환."""
+        with self._lock:
+            return self._current()["schedulerState"]
+
+    # === 변경 ===
+
+    def save(self, data: ActiveTasksData) -> None:
+        """상태를 저장합니다 (병합 간격 안이면 잠시 뒤 기록).
+
+        Args:
+            data: 저장할 상태
+        """
+        with self._lock:
+            copied = cast(ActiveTasksData, dict(data))
+            copied["pausedWorkers"] = list(data.get("pausedWorkers", []))
+            self._data = copied
+            self._dirty = True
+            last = self._last_write
+            if self.coalesce <= 0 or last is None:
+                self._write()
+                return
+            remaining = self.coalesce - (time.monotonic() - last)
+            if remaining <= 0:
+                self._write()
+            elif self._timer is None:
+                self._timer = threading.Timer(remaining, self._flush_quietly)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def pause_worker(self, worker_id: int) -> None:
+        """Worker 수동 일시정지."""
+        with self._lock:
+            data = self._current()
+            if worker_id not in data["pausedWorkers"]:
+                self.save({**data, "pausedWorkers": [*data["pausedWorkers"], worker_id]})
+
+    def resume_worker(self, worker_id: int) -> None:
+        """Worker 수동 일시정지 해제."""
+        with self._lock:
+            data = self._current()
+            if worker_id in data["pausedWorkers"]:
+                paused = [w for w in data["pausedWorkers"] if w != worker_id]
+                self.save({**data, "pausedWorkers": paused})
+
+    def set_scheduler_state(self, state: str) -> None:
+        """스케줄러 상태 설정."""
+        with self._lock:
+            self.save({**self._current(), "schedulerState": state})
+
+    def flush(self) -> None:
+        """대기 중인 저장을 즉시 기록합니다."""
+        with self._lock:
+            if self._dirty:
+                self._write()
+
+    # === 내부 ===
+
+    def _current(self) -> ActiveTasksData:
+        """캐시된 상태 (파일이 바뀌었으면 다시 읽음, 기록 대기 중이면 캐시 우선)."""
+        if self._dirty and self._data is not None:
+            return self._data
+        stamp = self._stat()
+        if self._data is None or stamp != self._stamp:
+            self._data = self._read() if stamp is not None else _get_default_data()
+            self._stamp = stamp
+        return self._data
+
+    def _stat(self) -> _FileStamp | None:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _read(self) -> ActiveTasksData:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+                # 기본값 보장
+                if "pausedWorkers" not in data:
+                    data["pausedWorkers"] = []
+                if "schedulerState" not in data:
+                    data["schedulerState"] = "running"
+                return data
+        except (json.JSONDecodeError, OSError):
+            return _get_default_data()
+
+    def _write(self) -> None:
+        """캐시를 파일에 원자적으로 기록합니다 (잠금 안에서 호출)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        data = self._data if self._data is not None else _get_default_data()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+        self._stamp = self._stat()
+        self._dirty = False
+        self._last_write = time.monotonic()
+
+    def _flush_quietly(self) -> None:
+        with self._lock:
+            self._timer = None
+            try:
+                self.flush()
+            except OSError as e:
+                logger.warning(f"상태 파일 저장 실패: {e}")
+
+
+# 경로별 상태 파일 캐시 (작업 디렉토리가 바뀌면 다른 항목 사용)
+_state_files: dict[Path, ActiveStateFile] = {}
+
+
+def _state_file() -> ActiveStateFile:
     path = get_active_tasks_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
+    state = _state_files.get(path)
+    if state is None:
+        state = _state_files[path] = ActiveStateFile(path)
+    return state
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def load_active_tasks() -> ActiveTasksData:
+    """상태 로드 (파일이 바뀌었을 때만 다시 읽음)."""
+    return _state_file().load()
+
+
+def save_active_tasks(data: ActiveTasksData) -> None:
+    """상태 파일 저장 (원자적 교체)."""
+    _state_file().save(data)
 
 
 # === Worker Pause/Resume 관리 ===
@@ -67,12 +244,7 @@ def pause_worker(worker_id: int) -> None:
     Args:
         worker_id: Worker ID (1, 2, 3...)
     """
-    data = load_active_tasks()
-    paused = data.get("pausedWorkers", [])
-    if worker_id not in paused:
-        paused.append(worker_id)
-        data["pausedWorkers"] = paused
-        save_active_tasks(data)
+    _state_file().pause_worker(worker_id)
 
 
 def resume_worker(worker_id: int) -> None:
@@ -81,12 +253,7 @@ def resume_worker(worker_id: int) -> None:
     Args:
         worker_id: Worker ID (1, 2, 3...)
     """
-    data = load_active_tasks()
-    paused = data.get("pausedWorkers", [])
-    if worker_id in paused:
-        paused.remove(worker_id)
-        data["pausedWorkers"] = paused
-        save_active_tasks(data)
+    _state_file().resume_worker(worker_id)
 
 
 def is_worker_paused(worker_id: int) -> bool:
@@ -98,14 +265,12 @@ def is_worker_paused(worker_id: int) -> bool:
     Returns:
         일시정지 상태 여부
     """
-    data = load_active_tasks()
-    return worker_id in data.get("pausedWorkers", [])
+    return _state_file().is_worker_paused(worker_id)
 
 
 def get_paused_workers() -> list[int]:
     """수동 일시정지된 Worker ID 목록 반환."""
-    data = load_active_tasks()
-    return data.get("pausedWorkers", [])
+    return _state_file().get_paused_workers()
 
 
 # === Scheduler State 관리 ===
@@ -117,9 +282,7 @@ def set_scheduler_state(state: str) -> None:
     Args:
         state: running, paused, stopped 중 하나
     """
-    data = load_active_tasks()
-    data["schedulerState"] = state
-    save_active_tasks(data)
+    _state_file().set_scheduler_state(state)
 
 
 def get_scheduler_state() -> str:
@@ -128,5 +291,4 @@ def get_scheduler_state() -> str:
     Returns:
         running, paused, stopped 중 하나
     """
-    data = load_active_tasks()
-    return data.get("schedulerState", "running")
+    return _state_file().get_scheduler_state()
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+from orchay.utils.history_log import HistoryLog
+from orchay.utils.output_store import OutputStore
+
 # 타입 별칭
 HistoryDict = dict[str, Any]
 
@@ -26,7 +28,12 @@ class HistoryEntry:
 class HistoryManager:
     """히스토리 관리자.
 
-    JSON Lines 형식으로 히스토리를 저장하고 조회합니다.
+    JSON Lines 형식으로 히스토리를 저장하고 조회합니다. 저장은 파일 끝에 한 줄을
+    추가하고, 보존 한도는 `HistoryLog`가 가끔 압축하여 유지합니다. 목록은 파일 끝에서
+    거꾸로 읽고, Task별 조회는 사이드카 색인을 사용합니다.
+
+    pane 출력은 `<파일명>-blobs/` 디렉토리에 압축 블롭으로 저장하고, 항목에는 참조
+    (`output_ref`)만 남깁니다. 목록 조회는 출력을 복원하지 않습니다.
     """
 
     def __init__(self, storage_path: str, max_entries: int = 1000) -> None:
@@ -38,6 +45,8 @@ class HistoryManager:
         """
         self.storage_path = Path(storage_path)
         self.max_entries = max_entries
+        blob_path = self.storage_path.with_name(f"{self.storage_path.stem}-blobs")
+        self._log = HistoryLog(self.storage_path, max_entries, outputs=OutputStore(blob_path))
 
     def save(self, entry: HistoryEntry) -> None:
         """히스토리 항목을 저장한다.
@@ -45,21 +54,7 @@ class HistoryManager:
         Args:
             entry: 저장할 히스토리 항목
         """
-        # 디렉토리 생성
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # 기존 항목 읽기
-        entries = self._read_all()
-        entries.append(asdict(entry))
-
-        # 최대 항목 수 초과 시 오래된 것 삭제
-        if len(entries) > self.max_entries:
-            entries = entries[-self.max_entries :]
-
-        # JSON Lines 형식으로 저장
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            for e in entries:
-                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+        self._log.append(asdict(entry))
 
     def list(self, limit: int = 10) -> list[HistoryDict]:
         """최근 히스토리 목록을 반환한다.
@@ -68,49 +63,36 @@ class HistoryManager:
             limit: 반환할 최대 항목 수
 
         Returns:
-            히스토리 항목 리스트 (최신순)
+            히스토리 항목 리스트 (최신순, 출력은 참조만 포함)
         """
-        entries = self._read_all()
-        # 최신순으로 정렬하여 반환
-        return entries[-limit:][::-1]
+        return self._log.tail(limit)
 
-    def get(self, task_id: str) -> HistoryDict | None:
+    def get(self, task_id: str, with_output: bool = True) -> HistoryDict | None:
         """특정 Task의 가장 최근 히스토리를 반환한다.
 
         Args:
             task_id: 조회할 Task ID
+            with_output: pane 출력을 복원하여 `output`에 넣을지 여부
 
         Returns:
             히스토리 항목 또는 None
         """
-        entries = self._read_all()
-        for entry in reversed(entries):
-            if entry["task_id"] == task_id:
-                return entry
-        return None
+        entry = self._log.latest(task_id)
+        if entry is not None and with_output:
+            entry["output"] = self._log.output(entry)
+        return entry
 
-    def clear(self) -> None:
-        """히스토리를 삭제한다."""
-        if self.storage_path.exists():
-            self.storage_path.unlink()
+    def output(self, entry: HistoryDict) -> str:
+        """히스토리 항목의 pane 출력을 복원한다.
 
-    def _read_all(self) -> list[HistoryDict]:
-        """모든 히스토리 항목을 읽는다.
+        Args:
+            entry: `list()`/`get()`이 반환한 항목
 
         Returns:
-            히스토리 항목 리스트
+            pane 출력 (없으면 빈 문자열)
         """
-        if not self.storage_path.exists():
-            return []
-
-        entries: list[HistoryDict] = []
-        with open(self.storage_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        # 손상된 라인은 무시
-                        continue
-        return entries
+        return self._log.output(entry)
+
+    def clear(self) -> None:
+        """히스토리를 삭제한다."""
+        self._log.clear()
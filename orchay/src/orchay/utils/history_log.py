@@ -0,0 +1,398 @@
+"""추가 전용(append-only) 히스토리 로그.
+
+히스토리 항목마다 pane 출력(최대 `capture_lines`줄)이 들어 있어, 저장할 때마다 파일 전체를
+읽고 다시 쓰면 Task 완료 한 번에 히스토리 크기만큼 I/O가 발생합니다. `HistoryLog`는
+
+- 저장: JSON 한 줄을 파일 끝에 추가 (O(1))
+- 보존 한도: 줄 수가 `max_entries + slack`을 넘으면 최근 `max_entries`개만 남기도록 압축
+  (임시 파일 + rename, `background=True`면 별도 스레드에서 실행)
+- 조회: 압축 전 초과분은 건너뛰고 최근 `max_entries`개만 반환
+
+하므로 압축 비용이 `slack`번의 저장에 나뉘어 저장당 평균 O(1)입니다.
+
+조회도 히스토리 크기와 무관하게 동작합니다.
+
+- `tail(limit)`: 파일 끝에서부터 블록 단위로 거꾸로 읽어 최근 `limit`개만 파싱
+- `latest(task_id)`: 사이드카 색인(`<파일명>.idx`, 항목마다 task_id/timestamp/바이트
+  오프셋/길이를 한 줄씩 추가)을 끝에서부터 찾아 해당 오프셋의 한 줄만 읽음
+
+색인은 저장 때 함께 추가하고 압축 때 다시 만듭니다. 색인의 마지막 항목이 가리키는 끝
+위치가 히스토리 파일 크기와 다르면(이전 버전이 쓴 파일, 쓰기 도중 중단 등) 한 번 전체를
+읽어 다시 만듭니다.
+
+`outputs`(`OutputStore`)를 지정하면 항목의 `output`은 압축 블롭으로 저장하고 항목에는
+참조(`output_ref`)만 남깁니다. 같은 Worker의 직전 출력을 델타 기준으로 쓰며, 출력은
+`output(record)`로 필요할 때만 복원합니다. 압축 때 보존 항목이 참조하지 않는 블롭은
+삭제합니다.
+
+Example:
+    ```python
+    log = HistoryLog(Path(".orchay/logs/orchay-history.jsonl"), max_entries=1000)
+    log.append({"task_id": "TSK-01-01", ...})
+    log.tail(10)                # 최신순
+    log.latest("TSK-01-01")     # 색인으로 조회
+    log.output(record)          # 출력 복원 (outputs 지정 시)
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, cast
+
+from orchay.utils.output_store import OutputStore
+from orchay.utils.wbs_index import write_atomic
+
+logger = logging.getLogger(__name__)
+
+HistoryRecord = dict[str, Any]
+
+# 파일 줄 수를 세거나 거꾸로 읽을 때의 블록 크기
+_BLOCK_SIZE = 1 << 16
+
+
+class HistoryLog:
+    """JSON Lines 형식의 추가 전용 히스토리 파일.
+
+    같은 프로세스 안에서는 저장과 압축이 잠금으로 직렬화됩니다. 다른 프로세스가 같은
+    파일에 추가한 줄은 줄 수 추정에만 늦게 반영되며, 다음 압축에서 함께 정리됩니다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = 1000,
+        slack: int | None = None,
+        background: bool = False,
+        outputs: OutputStore | None = None,
+    ) -> None:
+        """HistoryLog를 초기화합니다.
+
+        Args:
+            path: 히스토리 파일 경로
+            max_entries: 보존할 최대 항목 수
+            slack: 압축 전까지 허용할 초과 항목 수 (None이면 max_entries)
+            background: 압축을 별도 스레드에서 실행할지 여부
+            outputs: pane 출력 블롭 저장소 (None이면 출력을 항목에 그대로 저장)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.slack = max(1, max_entries if slack is None else slack)
+        self.background = background
+        self._lock = threading.Lock()
+        # 파일 줄 수 (None이면 다음 저장 시 파일에서 셈)
+        self._lines: int | None = None
+        self._compactor: threading.Thread | None = None
+        self.outputs = outputs
+        # Worker ID → 직전 출력 참조 (델타 기준)
+        self._last_refs: dict[object, str] = {}
+
+    @property
+    def index_path(self) -> Path:
+        """사이드카 색인 파일 경로."""
+        return self.path.with_name(f"{self.path.name}.idx")
+
+    def append(self, record: HistoryRecord) -> None:
+        """항목을 파일 끝에 한 줄로 추가합니다.
+
+        Args:
+            record: 저장할 항목 (`outputs`가 있으면 `output`은 참조로 바꿔 저장)
+        """
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.outputs is not None and "output" in record:
+                record = self._store_output(record, self.outputs)
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            if self._lines is None:
+                self._lines = self._count_lines()
+                self._ensure_index()
+            with open(self.path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(line)
+            with open(self.index_path, "ab") as f:
+                f.write(_index_line(record, offset, len(line)))
+            self._lines += 1
+            needs_compaction = self._lines > self.max_entries + self.slack
+        if needs_compaction:
+            self._schedule_compaction()
+
+    def output(self, record: HistoryRecord) -> str:
+        """항목의 pane 출력을 반환합니다 (참조면 이때 압축 해제).
+
+        Args:
+            record: 히스토리 항목
+
+        Returns:
+            pane 출력 (없거나 블롭을 읽을 수 없으면 빈 문자열)
+        """
+        if "output" in record:
+            return str(record["output"])
+        ref = record.get("output_ref")
+        if not ref or self.outputs is None:
+            return ""
+        try:
+            return self.outputs.get(str(ref))
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"출력 블롭을 읽을 수 없음 ({ref}): {e}")
+            return ""
+
+    def read(self) -> list[HistoryRecord]:
+        """보존 한도 안의 항목을 읽습니다.
+
+        Returns:
+            최근 max_entries개 항목 (오래된 순, 손상된 줄 제외)
+        """
+        entries = self._read_all()
+        if len(entries) > self.max_entries:
+            entries = entries[-self.max_entries :]
+        return entries
+
+    def tail(self, limit: int = 10) -> list[HistoryRecord]:
+        """최근 항목을 파일 끝에서부터 거꾸로 읽습니다.
+
+        Args:
+            limit: 반환할 최대 항목 수 (max_entries를 넘지 않음)
+
+        Returns:
+            히스토리 항목 리스트 (최신순, 손상된 줄 제외)
+        """
+        limit = min(limit, self.max_entries)
+        entries: list[HistoryRecord] = []
+        if limit <= 0 or not self.path.exists():
+            return entries
+        with open(self.path, "rb") as f:
+            for _, line in _reverse_lines(f):
+                record = _decode(line)
+                if record is None:
+                    continue
+                entries.append(record)
+                if len(entries) >= limit:
+                    break
+        return entries
+
+    def latest(self, task_id: str) -> HistoryRecord | None:
+        """Task의 가장 최근 항목을 색인으로 찾습니다.
+
+        압축 전 초과분에 있는 항목도 찾을 수 있습니다.
+
+        Args:
+            task_id: 조회할 Task ID
+
+        Returns:
+            히스토리 항목 또는 None
+        """
+        with self._lock:
+            if not self.path.exists():
+                return None
+            self._ensure_index()
+            if not self.index_path.exists():
+                return None
+            with open(self.index_path, "rb") as index, open(self.path, "rb") as f:
+                for _, line in _reverse_lines(index):
+                    ref = _decode(line)
+                    span = _span(ref)
+                    if ref is None or span is None or ref.get("task_id") != task_id:
+                        continue
+                    f.seek(span[0])
+                    record = _decode(f.read(span[1]))
+                    if record is not None and record.get("task_id") == task_id:
+                        return record
+        return None
+
+    def compact(self) -> int:
+        """최근 max_entries개 항목만 남기고 파일을 원자적으로 다시 씁니다.
+
+        Returns:
+            삭제한 줄 수 (손상된 줄/빈 줄 포함)
+        """
+        with self._lock:
+            if not self.path.exists():
+                self._lines = 0
+                self.index_path.unlink(missing_ok=True)
+                return 0
+            lines = self._read_lines()
+            keep: list[bytes] = []
+            for line in reversed(lines):
+                if len(keep) >= self.max_entries:
+                    break
+                if _decode(line) is not None:
+                    keep.append(line if line.endswith(b"\n") else line + b"\n")
+            keep.reverse()
+            removed = len(lines) - len(keep)
+            if keep != lines:
+                write_atomic(self.path, b"".join(keep))
+                logger.debug(f"히스토리 압축: {removed}줄 삭제, {len(keep)}개 보존")
+            self._write_index(keep)
+            if self.outputs is not None:
+                live = {
+                    str(record["output_ref"])
+                    for record in map(_decode, keep)
+                    if record is not None and record.get("output_ref")
+                }
+                self.outputs.prune(live | set(self._last_refs.values()))
+            self._lines = len(keep)
+            return removed
+
+    def wait(self) -> None:
+        """진행 중인 백그라운드 압축이 끝날 때까지 기다립니다."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def clear(self) -> None:
+        """히스토리 파일을 삭제합니다."""
+        self.wait()
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self.index_path.unlink(missing_ok=True)
+            self._lines = 0
+            self._last_refs.clear()
+            if self.outputs is not None:
+                self.outputs.clear()
+
+    def _store_output(self, record: HistoryRecord, outputs: OutputStore) -> HistoryRecord:
+        """출력을 블롭으로 저장하고 `output` 대신 `output_ref`를 가진 항목을 반환합니다."""
+        stored = dict(record)
+        text = str(stored.pop("output") or "")
+        ref: str | None = None
+        if text:
+            worker = stored.get("worker_id")
+            ref = outputs.put(text, self._last_refs.get(worker))
+            self._last_refs[worker] = ref
+        stored["output_ref"] = ref
+        return stored
+
+    def _schedule_compaction(self) -> None:
+        """압축을 실행합니다 (background면 이미 실행 중인 압축이 없을 때만 스레드 시작)."""
+        if not self.background:
+            self._run_compaction()
+            return
+        compactor = self._compactor
+        if compactor is not None and compactor.is_alive():
+            return
+        self._compactor = threading.Thread(
+            target=self._run_compaction, name="orchay-history-compact", daemon=True
+        )
+        self._compactor.start()
+
+    def _run_compaction(self) -> None:
+        try:
+            self.compact()
+        except OSError as e:
+            # 압축 실패는 저장 실패가 아님 - 다음 초과 시 다시 시도
+            logger.warning(f"히스토리 압축 실패: {e}")
+
+    def _count_lines(self) -> int:
+        """파일의 줄 수를 셉니다 (블록 단위, JSON 파싱 없음)."""
+        if not self.path.exists():
+            return 0
+        count = 0
+        with open(self.path, "rb") as f:
+            while block := f.read(_BLOCK_SIZE):
+                count += block.count(b"\n")
+        return count
+
+    def _ensure_index(self) -> None:
+        """색인이 히스토리 파일 끝까지 가리키지 않으면 다시 만듭니다 (잠금 안에서 호출)."""
+        size = self.path.stat().st_size if self.path.exists() else 0
+        end = 0
+        if self.index_path.exists():
+            with open(self.index_path, "rb") as index:
+                for _, line in _reverse_lines(index):
+                    span = _span(_decode(line))
+                    if span is not None:
+                        end = span[0] + span[1]
+                        break
+        if end != size:
+            logger.debug(f"히스토리 색인 재생성: {self.index_path}")
+            self._write_index(self._read_lines() if size else [])
+
+    def _write_index(self, lines: list[bytes]) -> None:
+        """히스토리 파일의 줄 목록으로 색인을 다시 씁니다 (손상된 줄도 위치만 기록)."""
+        out: list[bytes] = []
+        offset = 0
+        for line in lines:
+            out.append(_index_line(_decode(line), offset, len(line)))
+            offset += len(line)
+        write_atomic(self.index_path, b"".join(out))
+
+    def _read_lines(self) -> list[bytes]:
+        with open(self.path, "rb") as f:
+            return f.readlines()
+
+    def _read_all(self) -> list[HistoryRecord]:
+        if not self.path.exists():
+            return []
+        entries: list[HistoryRecord] = []
+        for line in self._read_lines():
+            record = _decode(line)
+            if record is not None:
+                entries.append(record)
+        return entries
+
+
+def _index_line(record: HistoryRecord | None, offset: int, length: int) -> bytes:
+    """색인 한 줄 (손상된 줄이면 task_id/timestamp는 null)."""
+    ref = {
+        "task_id": record.get("task_id") if record else None,
+        "timestamp": record.get("timestamp") if record else None,
+        "offset": offset,
+        "length": length,
+    }
+    return (json.dumps(ref, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _span(ref: HistoryRecord | None) -> tuple[int, int] | None:
+    """색인 항목의 (오프셋, 길이) (형식이 맞지 않으면 None)."""
+    if ref is None:
+        return None
+    offset, length = ref.get("offset"), ref.get("length")
+    if not isinstance(offset, int) or not isinstance(length, int):
+        return None
+    return offset, length
+
+
+def _reverse_lines(f: BinaryIO) -> Iterator[tuple[int, bytes]]:
+    """파일 끝에서부터 블록 단위로 거꾸로 읽어 (오프셋, 줄)을 반환합니다.
+
+    줄에는 끝의 줄바꿈이 포함되므로 `len(line)`이 파일에서 차지하는 바이트 수입니다.
+    """
+    pos = f.seek(0, os.SEEK_END)
+    buf = b""
+    end = 0
+    while True:
+        # buf[:end]의 마지막 줄 시작 위치 (끝의 줄바꿈은 그 줄에 포함)
+        newline = buf.rfind(b"\n", 0, end - 1) if end else -1
+        if newline >= 0:
+            yield pos + newline + 1, buf[newline + 1 : end]
+            end = newline + 1
+            continue
+        if pos == 0:
+            if end:
+                yield 0, buf[:end]
+            return
+        size = min(_BLOCK_SIZE, pos)
+        pos -= size
+        f.seek(pos)
+        buf = f.read(size) + buf[:end]
+        end = len(buf)
+
+
+def _decode(line: bytes) -> HistoryRecord | None:
+    """JSON 한 줄을 항목으로 변환합니다 (빈 줄/손상된 줄은 None)."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    return cast(HistoryRecord, record)
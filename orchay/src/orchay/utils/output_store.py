@@ -0,0 +1,228 @@
+"""pane 출력 압축 저장소.
+
+히스토리 항목의 pane 출력(최대 `capture_lines`줄)을 내용 주소(SHA-256) 기반 블롭으로
+저장합니다. 같은 Worker의 연속 캡처는 대부분 겹치므로, 직전 캡처를 기준으로 줄 단위
+델타(기준 블롭의 줄 범위 복사 + 새 줄 삽입)로 저장하고 zlib으로 압축합니다.
+
+- 같은 내용은 한 번만 저장 (참조 = 내용 해시)
+- 델타 체인 길이는 `max_chain`으로 제한 (넘으면 전체 내용 저장)
+- 읽기는 참조를 따라 필요할 때만 압축 해제 (최근 결과는 메모리 캐시)
+
+블롭 파일: `<root>/<참조 앞 2자>/<참조>.z` (zlib 압축 JSON)
+- 전체: `{"text": "..."}`
+- 델타: `{"base": "<참조>", "depth": n, "ops": [[시작, 끝], "삽입 텍스트", ...]}`
+
+Example:
+    ```python
+    store = OutputStore(Path(".orchay/logs/orchay-history-blobs"))
+    ref1 = store.put(capture1)
+    ref2 = store.put(capture2, base=ref1)  # ref1 기준 델타
+    store.get(ref2) == capture2
+    ```
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import logging
+import shutil
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, cast
+
+from orchay.utils.wbs_index import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# 참조 길이 (SHA-256 16진수 앞부분)
+_REF_LENGTH = 32
+
+# 메모리에 유지할 최근 복원 결과 수
+_CACHE_SIZE = 16
+
+# 델타가 전체 내용 대비 이 비율보다 크면 전체 내용을 저장
+_DELTA_RATIO = 0.8
+
+# 델타 연산: [기준 시작 줄, 기준 끝 줄] 복사 또는 삽입 텍스트
+_Op = list[int] | str
+
+
+class OutputStore:
+    """내용 주소 기반 pane 출력 블롭 저장소."""
+
+    def __init__(self, root: Path, max_chain: int = 16, level: int = 6) -> None:
+        """OutputStore를 초기화합니다.
+
+        Args:
+            root: 블롭 디렉토리
+            max_chain: 최대 델타 체인 길이 (복원 시 읽는 블롭 수 상한)
+            level: zlib 압축 레벨
+        """
+        self.root = root
+        self.max_chain = max_chain
+        self.level = level
+        # 참조 → (복원한 내용, 델타 깊이)
+        self._cache: OrderedDict[str, tuple[str, int]] = OrderedDict()
+
+    def put(self, text: str, base: str | None = None) -> str:
+        """출력을 저장하고 참조를 반환합니다.
+
+        Args:
+            text: pane 출력
+            base: 델타 기준으로 쓸 직전 캡처 참조 (없거나 읽을 수 없으면 전체 저장)
+
+        Returns:
+            내용 참조 (같은 내용이면 같은 참조)
+        """
+        ref = hashlib.sha256(text.encode("utf-8")).hexdigest()[:_REF_LENGTH]
+        path = self._blob_path(ref)
+        if path.exists():
+            return ref
+
+        blob: dict[str, Any] = {"text": text}
+        depth = 0
+        if base is not None and base != ref:
+            try:
+                base_text, base_depth = self._load(base)
+            except (OSError, ValueError, zlib.error) as e:
+                logger.debug(f"델타 기준 블롭을 읽을 수 없음 ({base}): {e}")
+            else:
+                if base_depth < self.max_chain:
+                    ops = _diff(base_text, text)
+                    inserted = sum(len(op) for op in ops if isinstance(op, str))
+                    if inserted < len(text) * _DELTA_RATIO:
+                        depth = base_depth + 1
+                        blob = {"base": base, "depth": depth, "ops": ops}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(blob, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        write_atomic(path, zlib.compress(data, self.level))
+        self._remember(ref, text, depth)
+        return ref
+
+    def get(self, ref: str) -> str:
+        """참조의 출력을 복원합니다.
+
+        Args:
+            ref: `put()`이 반환한 참조
+
+        Returns:
+            pane 출력
+
+        Raises:
+            OSError: 블롭 파일을 읽을 수 없음
+            ValueError: 블롭 형식이 잘못됨
+            zlib.error: 압축 해제 실패
+        """
+        return self._load(ref)[0]
+
+    def prune(self, live: Iterable[str]) -> int:
+        """살아 있는 참조와 그 델타 기준 체인을 제외한 블롭을 삭제합니다.
+
+        Args:
+            live: 유지할 참조
+
+        Returns:
+            삭제한 블롭 수
+        """
+        keep: set[str] = set()
+        for ref in live:
+            current: str | None = ref
+            while current is not None and current not in keep:
+                keep.add(current)
+                try:
+                    current = self._read_blob(current).get("base")
+                except (OSError, ValueError, zlib.error):
+                    current = None
+
+        removed = 0
+        if not self.root.exists():
+            return removed
+        for path in self.root.glob("*/*.z"):
+            if path.stem not in keep:
+                path.unlink(missing_ok=True)
+                self._cache.pop(path.stem, None)
+                removed += 1
+        if removed:
+            logger.debug(f"출력 블롭 정리: {removed}개 삭제, {len(keep)}개 유지")
+        return removed
+
+    def clear(self) -> None:
+        """모든 블롭을 삭제합니다."""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._cache.clear()
+
+    def _blob_path(self, ref: str) -> Path:
+        return self.root / ref[:2] / f"{ref}.z"
+
+    def _read_blob(self, ref: str) -> dict[str, Any]:
+        data = json.loads(zlib.decompress(self._blob_path(ref).read_bytes()))
+        if not isinstance(data, dict):
+            raise ValueError(f"잘못된 블롭 형식: {ref}")
+        return cast(dict[str, Any], data)
+
+    def _load(self, ref: str) -> tuple[str, int]:
+        """참조의 (내용, 델타 깊이)를 복원합니다 (캐시 또는 기준 체인을 따라 복원)."""
+        cached = self._cache.get(ref)
+        if cached is not None:
+            self._cache.move_to_end(ref)
+            return cached
+
+        # 캐시에 있거나 전체 내용이 저장된 블롭까지 기준 체인을 거슬러 올라감
+        chain: list[tuple[str, list[_Op]]] = []
+        current = ref
+        while True:
+            cached = self._cache.get(current)
+            if cached is not None:
+                text, depth = cached
+                break
+            blob = self._read_blob(current)
+            if "text" in blob:
+                text, depth = str(blob["text"]), 0
+                break
+            chain.append((current, cast(list[_Op], blob["ops"])))
+            current = str(blob["base"])
+            if len(chain) > self.max_chain:
+                raise ValueError(f"델타 체인이 너무 김: {ref}")
+
+        for blob_ref, ops in reversed(chain):
+            text = _apply(text, ops)
+            depth += 1
+            self._remember(blob_ref, text, depth)
+        return text, depth
+
+    def _remember(self, ref: str, text: str, depth: int) -> None:
+        self._cache[ref] = (text, depth)
+        self._cache.move_to_end(ref)
+        while len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+
+def _diff(base: str, text: str) -> list[_Op]:
+    """기준 내용에서 새 내용을 만드는 줄 단위 델타 연산."""
+    base_lines = base.splitlines(keepends=True)
+    lines = text.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, base_lines, lines, autojunk=False)
+    ops: list[_Op] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(lines[j1:j2]))
+    return ops
+
+
+def _apply(base: str, ops: list[_Op]) -> str:
+    """델타 연산을 기준 내용에 적용합니다."""
+    base_lines = base.splitlines(keepends=True)
+    parts: list[str] = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(base_lines[op[0] : op[1]])
+    return "".join(parts)
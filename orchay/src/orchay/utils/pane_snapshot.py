@@ -0,0 +1,158 @@
+"""Tick 단위 pane 스냅샷 모듈.
+
+한 번의 스케줄링 사이클(tick) 동안 여러 감지 로직이 같은 pane을 반복 조회하지 않도록
+`wezterm cli list` 1회 + pane별 `get-text` 1회(동시 실행) 결과를 공유합니다.
+신호 수신기로 받은 Worker 신호도 tick 동안 함께 전달합니다.
+
+Example:
+    ```python
+    snapshot = PaneSnapshot()
+    await snapshot.prefetch([w.pane_id for w in workers])
+
+    state, info = await detect_worker_state(pane_id, snapshot=snapshot)
+    task_id = await extract_running_task_from_pane(pane_id, snapshot=snapshot)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from orchay.domain.constants import WORKER_DETECTION
+from orchay.utils.signal_listener import WorkerSignal
+from orchay.utils.wezterm import wezterm_get_text, wezterm_list_panes
+
+logger = logging.getLogger(__name__)
+
+
+class PaneSnapshot:
+    """단일 tick 동안 공유되는 pane 목록/출력 캐시.
+
+    - pane 목록은 tick당 한 번만 조회합니다.
+    - pane 출력은 가장 큰 요청 라인 수(DONE_DETECTION_LINES)로 한 번 캡처하고,
+      더 적은 라인을 요청하는 소비자에게는 잘라서 반환합니다.
+    - 명령 전송 등으로 pane 내용이 바뀌면 `invalidate()`로 해당 pane만 폐기합니다.
+    """
+
+    def __init__(
+        self,
+        capture_lines: int = WORKER_DETECTION.DONE_DETECTION_LINES,
+        signals: dict[int, WorkerSignal] | None = None,
+    ) -> None:
+        """PaneSnapshot을 초기화합니다.
+
+        Args:
+            capture_lines: pane별 캡처 라인 수 (소비자 요청 최대값 이상이어야 함)
+            signals: 이번 tick에 받은 pane ID → Worker 신호
+        """
+        self._capture_lines = capture_lines
+        self._pane_ids: set[int] | None = None
+        self._texts: dict[int, str] = {}
+        self._signals = dict(signals) if signals else {}
+
+    @property
+    def capture_lines(self) -> int:
+        """pane별 캡처 라인 수."""
+        return self._capture_lines
+
+    async def prefetch(self, pane_ids: Iterable[int]) -> None:
+        """pane 목록과 지정한 pane들의 출력을 한 번에 캡처합니다.
+
+        목록 조회 실패(WezTerm 미설치 등) 시 스냅샷은 비어 있는 상태로 남고,
+        이후 조회는 개별 CLI 호출로 대체됩니다.
+
+        Args:
+            pane_ids: 출력을 캡처할 pane ID 목록
+        """
+        try:
+            panes = await wezterm_list_panes()
+        except Exception as e:
+            logger.debug(f"pane 스냅샷 생성 실패, 개별 조회로 대체: {e}")
+            return
+
+        self._pane_ids = {p.pane_id for p in panes}
+        targets = [pid for pid in dict.fromkeys(pane_ids) if pid in self._pane_ids]
+        if not targets:
+            return
+
+        texts = await asyncio.gather(
+            *(wezterm_get_text(pid, lines=self._capture_lines) for pid in targets),
+            return_exceptions=True,
+        )
+        for pid, text in zip(targets, texts, strict=True):
+            if isinstance(text, BaseException):
+                logger.debug(f"pane {pid} 캡처 실패: {text}")
+                continue
+            self._texts[pid] = text
+
+    async def pane_exists(self, pane_id: int) -> bool:
+        """pane 존재 여부를 반환합니다 (목록은 tick당 한 번만 조회).
+
+        Args:
+            pane_id: 확인할 pane ID
+
+        Returns:
+            pane 존재 여부
+        """
+        if self._pane_ids is None:
+            panes = await wezterm_list_panes()
+            self._pane_ids = {p.pane_id for p in panes}
+        return pane_id in self._pane_ids
+
+    async def get_text(self, pane_id: int, lines: int = 50) -> str:
+        """pane 출력의 마지막 N줄을 반환합니다.
+
+        캡처된 출력이 없거나 요청 라인 수가 캡처 범위를 넘으면 CLI로 직접 조회합니다.
+
+        Args:
+            pane_id: WezTerm pane ID
+            lines: 읽을 줄 수
+
+        Returns:
+            pane 출력 텍스트
+        """
+        if lines > self._capture_lines:
+            return await wezterm_get_text(pane_id, lines=lines)
+
+        text = self._texts.get(pane_id)
+        if text is None:
+            text = await wezterm_get_text(pane_id, lines=self._capture_lines)
+            self._texts[pane_id] = text
+
+        all_lines = text.split("\n")
+        if len(all_lines) > lines:
+            return "\n".join(all_lines[-lines:])
+        return text
+
+    def take_signal(self, pane_id: int) -> WorkerSignal | None:
+        """pane의 Worker 신호를 꺼냅니다 (한 번만 반환).
+
+        Args:
+            pane_id: WezTerm pane ID
+
+        Returns:
+            받은 신호 또는 None
+        """
+        return self._signals.pop(pane_id, None)
+
+    def untaken_signals(self) -> dict[int, WorkerSignal]:
+        """아직 꺼내지 않은 Worker 신호를 반환합니다.
+
+        명령 전송 중이거나 grace period라 상태 감지를 건너뛴 pane의 신호가 남습니다.
+
+        Returns:
+            pane ID → 신호
+        """
+        return dict(self._signals)
+
+    def invalidate(self, pane_id: int) -> None:
+        """pane 출력 캐시를 폐기합니다 (텍스트 전송 후 호출).
+
+        Args:
+            pane_id: 폐기할 pane ID
+        """
+        self._texts.pop(pane_id, None)
+        # 명령 전송 이전에 받은 신호는 더 이상 유효하지 않음
+        self._signals.pop(pane_id, None)
@@ -0,0 +1,329 @@
+"""Worker 신호 수신 모듈.
+
+pane 텍스트 폴링 없이 Worker가 완료/일시정지/에러를 직접 알릴 수 있도록
+로컬 Unix 소켓으로 신호를 받습니다. 폴링은 느린 fallback으로 유지됩니다.
+
+프로토콜 (한 줄에 JSON 객체 하나):
+    {"pane_id": 3, "signal": "ORCHAY_DONE:TSK-01-01:build:success"}
+
+signal 값:
+    - ORCHAY_DONE:{task-id}:{action}:{status}[:{message}]
+    - ORCHAY_PAUSED[:{message}] (예: "ORCHAY_PAUSED:rate limit resets 6pm")
+    - ORCHAY_ERROR[:{message}]
+    - 위 값을 담은 OSC 1337 SetUserVar 시퀀스 (값은 base64)
+      예: "\\x1b]1337;SetUserVar=orchay=T1JDSEFZX0VSUk9S\\x07"
+
+응답은 한 줄로 "ok" 또는 "error: {사유}"입니다.
+
+Example:
+    ```python
+    listener = SignalListener(Path(".orchay/logs/orchay.sock"))
+    if await listener.start():
+        await listener.wait(timeout=30)
+        signals = listener.drain()  # pane ID → 최신 신호
+    await listener.stop()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import contextlib
+import json
+import logging
+import re
+import socket
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, cast
+
+logger = logging.getLogger(__name__)
+
+SignalKind = Literal["done", "paused", "error"]
+
+# 신호 접두사 → 종류
+_SIGNAL_PATTERN = re.compile(r"^ORCHAY_(DONE|PAUSED|ERROR)(?::|$)")
+
+# OSC 1337 SetUserVar: ESC ] 1337 ; SetUserVar=<name>=<base64> (BEL | ESC \)
+_OSC_USER_VAR = re.compile(r"\x1b\]1337;SetUserVar=([^=]+)=([A-Za-z0-9+/=]*)(?:\x07|\x1b\\)")
+
+# 한 줄 최대 크기 (바이트)
+MAX_MESSAGE_BYTES = 4096
+
+
+@dataclass
+class WorkerSignal:
+    """Worker가 보낸 상태 신호."""
+
+    pane_id: int
+    kind: SignalKind
+    payload: str
+    received_at: float = field(default_factory=time.monotonic)
+
+
+def parse_signal_text(text: str) -> tuple[SignalKind, str] | None:
+    """신호 문자열을 종류와 본문으로 해석합니다.
+
+    Args:
+        text: 신호 문자열 (평문 또는 OSC 1337 SetUserVar)
+
+    Returns:
+        (종류, 본문) 또는 None (신호가 아닌 경우)
+    """
+    osc = _OSC_USER_VAR.search(text)
+    if osc:
+        try:
+            text = base64.b64decode(osc.group(2), validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            return None
+
+    text = text.strip()
+    match = _SIGNAL_PATTERN.match(text)
+    if not match:
+        return None
+    kind: SignalKind = match.group(1).lower()  # type: ignore[assignment]
+    return kind, text
+
+
+def parse_signal_message(line: str | bytes) -> WorkerSignal:
+    """소켓으로 받은 한 줄을 WorkerSignal로 변환합니다.
+
+    Args:
+        line: JSON 메시지 한 줄
+
+    Returns:
+        WorkerSignal
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    try:
+        data = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"JSON 형식 오류: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ValueError("JSON 객체가 아닙니다")
+    data = cast(dict[str, Any], data)
+
+    pane_id = data.get("pane_id")
+    if isinstance(pane_id, bool) or not isinstance(pane_id, int):
+        raise ValueError("pane_id가 없거나 정수가 아닙니다")
+
+    parsed = parse_signal_text(str(data.get("signal", "")))
+    if parsed is None:
+        raise ValueError("알 수 없는 신호입니다")
+
+    kind, payload = parsed
+    return WorkerSignal(pane_id=pane_id, kind=kind, payload=payload)
+
+
+class SignalListener:
+    """로컬 Unix 소켓 신호 수신기.
+
+    받은 신호는 pane별로 최신 값만 보관하며, 신호가 도착하면 wake 이벤트를
+    설정하여 다음 tick을 앞당길 수 있게 합니다.
+    """
+
+    def __init__(self, socket_path: Path) -> None:
+        """SignalListener를 초기화합니다.
+
+        Args:
+            socket_path: Unix 소켓 파일 경로
+        """
+        self.socket_path = socket_path
+        self._server: asyncio.AbstractServer | None = None
+        self._signals: dict[int, WorkerSignal] = {}
+        self._wake = asyncio.Event()
+        self._retry: asyncio.TimerHandle | None = None
+        self.received = 0
+
+    @property
+    def active(self) -> bool:
+        """신호 수신 중 여부."""
+        return self._server is not None
+
+    @property
+    def wake(self) -> asyncio.Event:
+        """신호 도착 이벤트."""
+        return self._wake
+
+    async def start(self) -> bool:
+        """소켓 수신을 시작합니다.
+
+        Unix 소켓을 지원하지 않는 플랫폼이거나 다른 프로세스가 이미 소켓을
+        사용 중이면 경고만 남기고 False를 반환합니다 (폴링만 사용).
+
+        Returns:
+            시작 성공 여부
+        """
+        if self._server is not None:
+            return True
+        if not hasattr(socket, "AF_UNIX"):
+            logger.warning("Unix 소켓을 지원하지 않는 플랫폼: 신호 수신 비활성화 (폴링만 사용)")
+            return False
+
+        if self.socket_path.exists():
+            if await _socket_alive(self.socket_path):
+                logger.warning(f"신호 소켓이 이미 사용 중입니다: {self.socket_path}")
+                return False
+            # 비정상 종료로 남은 소켓 파일 정리
+            self.socket_path.unlink(missing_ok=True)
+
+        try:
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            self._server = await asyncio.start_unix_server(
+                self._handle_client,
+                path=str(self.socket_path),
+                limit=MAX_MESSAGE_BYTES,
+            )
+        except OSError as e:
+            logger.warning(f"신호 소켓 생성 실패 ({self.socket_path}): {e}")
+            return False
+
+        logger.info(f"신호 수신 시작: {self.socket_path}")
+        return True
+
+    async def stop(self) -> None:
+        """소켓 수신을 중단하고 소켓 파일을 삭제합니다."""
+        self._cancel_retry()
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        self.socket_path.unlink(missing_ok=True)
+
+    def drain(self) -> dict[int, WorkerSignal]:
+        """보관 중인 신호를 꺼냅니다.
+
+        Returns:
+            pane ID → 최신 신호
+        """
+        signals, self._signals = self._signals, {}
+        self._wake.clear()
+        self._cancel_retry()
+        return signals
+
+    def restore(self, signals: dict[int, WorkerSignal], delay: float) -> None:
+        """tick에서 처리하지 못한 신호를 되돌려 놓고 delay초 뒤 wake 이벤트를 설정합니다.
+
+        같은 pane에 그 사이 새 신호가 도착했으면 새 신호를 유지합니다.
+
+        Args:
+            signals: pane ID → 처리하지 못한 신호
+            delay: 다시 처리를 시도하기까지 대기 시간 (초)
+        """
+        if not signals:
+            return
+        for pane_id, signal in signals.items():
+            self._signals.setdefault(pane_id, signal)
+        if self._retry is None:
+            self._retry = asyncio.get_running_loop().call_later(delay, self._wake.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """신호가 도착하거나 시간이 지날 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            신호 도착 여부
+        """
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def push(self, signal: WorkerSignal) -> None:
+        """신호를 보관하고 wake 이벤트를 설정합니다.
+
+        Args:
+            signal: 받은 신호
+        """
+        self._signals[signal.pane_id] = signal
+        self.received += 1
+        self._wake.set()
+        logger.info(f"신호 수신: pane {signal.pane_id} {signal.kind} ({signal.payload})")
+
+    def _cancel_retry(self) -> None:
+        if self._retry is not None:
+            self._retry.cancel()
+            self._retry = None
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """클라이언트 연결을 처리합니다 (한 줄에 메시지 하나)."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # limit 초과: 연결 종료
+                    writer.write(b"error: message too long\n")
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    self.push(parse_signal_message(line))
+                except ValueError as e:
+                    logger.debug(f"잘못된 신호 메시지 무시: {e}")
+                    writer.write(f"error: {e}\n".encode())
+                else:
+                    writer.write(b"ok\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+async def _socket_alive(path: Path) -> bool:
+    """소켓 파일에 수신 중인 프로세스가 있는지 확인합니다."""
+    try:
+        _, writer = await asyncio.open_unix_connection(str(path))
+    except OSError:
+        return False
+    writer.close()
+    with contextlib.suppress(ConnectionError):
+        await writer.wait_closed()
+    return True
+
+
+def send_signal(socket_path: Path, pane_id: int, signal: str, timeout: float = 2.0) -> str:
+    """신호를 전송하고 응답을 반환합니다 (동기 클라이언트).
+
+    Args:
+        socket_path: Unix 소켓 파일 경로
+        pane_id: 신호를 보내는 Worker pane ID
+        signal: 신호 문자열
+        timeout: 연결/응답 제한 시간 (초)
+
+    Returns:
+        응답 문자열 ("ok" 또는 "error: ...")
+
+    Raises:
+        OSError: 소켓 연결 실패 (스케줄러 미실행 등)
+    """
+    message = json.dumps({"pane_id": pane_id, "signal": signal}, ensure_ascii=False) + "\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(message.encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        response = b""
+        while not response.endswith(b"\n"):
+            chunk = sock.recv(1024)
+            if not chunk:
+                break
+            response += chunk
+    return response.decode("utf-8", errors="replace").strip()
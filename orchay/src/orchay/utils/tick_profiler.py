@@ -0,0 +1,283 @@
+"""tick 단계별 프로파일러.
+
+스케줄러 tick의 단계(재로드, Worker 감지, 단계 동기화, 분배, 상태 출력)와 외부 호출
+(WezTerm CLI 서브프로세스, WBS 파싱) 소요 시간을 최근 N개 구간의 백분위수로 유지합니다.
+
+- `TickProfiler.tick()` / `phase(name)`: Orchestrator가 tick과 각 단계를 측정
+- `profile(name)`: 활성 프로파일러에 외부 호출 지연과 tick당 호출 수를 기록
+  (프로파일러가 없으면 아무것도 하지 않음)
+- `status_line()`: TUI 상태 줄, `maybe_write()`: 주기적으로 메트릭 JSON 저장
+
+Example:
+    ```python
+    profiler = TickProfiler()
+    set_profiler(profiler)
+    with profiler.tick():
+        with profiler.phase("reload"):
+            ...
+        with profile("wezterm.get-text"):  # 어디서든 호출 가능
+            ...
+    profiler.maybe_write(Path(".orchay/logs/orchay-metrics.json"))
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from orchay.utils.wbs_index import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# 요약/상태 줄에 표시할 백분위수
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+# 상태 줄에 표시할 단계 (순서대로)
+STATUS_PHASES: tuple[str, ...] = ("reload", "detect", "sync", "dispatch", "ui")
+
+
+def _nearest_rank(ordered: list[float], p: float) -> float:
+    """정렬된 샘플의 p 백분위수 (nearest-rank)."""
+    return ordered[max(1, math.ceil(p / 100 * len(ordered))) - 1]
+
+
+class RollingStats:
+    """최근 `window`개 샘플의 백분위수를 계산하는 구간 통계 (단위: 초)."""
+
+    __slots__ = ("_samples", "count", "total")
+
+    def __init__(self, window: int = 200) -> None:
+        """RollingStats를 초기화합니다.
+
+        Args:
+            window: 백분위수 계산에 사용할 최근 샘플 수
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        # 누적 샘플 수와 합계 (구간과 무관)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: float) -> None:
+        """샘플을 추가합니다."""
+        self._samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def percentile(self, p: float) -> float:
+        """최근 샘플의 백분위수 (nearest-rank, 샘플이 없으면 0)."""
+        if not self._samples:
+            return 0.0
+        return _nearest_rank(sorted(self._samples), p)
+
+    def summary(self) -> dict[str, float]:
+        """누적 횟수와 최근 구간의 평균/백분위수/최댓값."""
+        samples = self._samples
+        result: dict[str, float] = {
+            "count": self.count,
+            "mean": sum(samples) / len(samples) if samples else 0.0,
+        }
+        if samples:
+            ordered = sorted(samples)
+            for p in PERCENTILES:
+                result[f"p{p}"] = _nearest_rank(ordered, p)
+            result["max"] = ordered[-1]
+        else:
+            result.update({f"p{p}": 0.0 for p in PERCENTILES})
+            result["max"] = 0.0
+        return result
+
+
+class TickProfiler:
+    """tick 단계와 외부 호출의 소요 시간을 수집합니다.
+
+    단계 이름은 자유 문자열이며, 외부 호출은 `<그룹>.<명령>` 형식(예: `wezterm.get-text`)으로
+    기록하면 tick마다 그룹별 호출 수(`<그룹>.calls`)도 함께 기록합니다.
+    """
+
+    def __init__(self, window: int = 200, write_interval: float = 30.0) -> None:
+        """TickProfiler를 초기화합니다.
+
+        Args:
+            window: 백분위수 계산에 사용할 최근 샘플 수
+            write_interval: `maybe_write()` 최소 저장 간격 (초)
+        """
+        self._window = window
+        self._write_interval = write_interval
+        self._stats: dict[str, RollingStats] = {}
+        # 현재 tick 중 그룹별 외부 호출 수
+        self._tick_calls: dict[str, int] = {}
+        self._ticks = 0
+        self._started = datetime.now()
+        # 마지막 저장 시각 (time.monotonic, None이면 다음 maybe_write()에서 저장)
+        self._last_write: float | None = None
+
+    @property
+    def ticks(self) -> int:
+        """완료한 tick 수."""
+        return self._ticks
+
+    def stats(self, name: str) -> RollingStats | None:
+        """이름에 해당하는 구간 통계 (기록이 없으면 None)."""
+        return self._stats.get(name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """소요 시간 샘플을 기록합니다.
+
+        Args:
+            name: 단계/호출 이름
+            seconds: 소요 시간 (초)
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = RollingStats(self._window)
+        stats.add(seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """블록 소요 시간을 `name` 단계로 기록합니다 (예외가 나도 기록)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    @contextmanager
+    def call(self, name: str) -> Generator[None]:
+        """외부 호출 지연을 기록하고 현재 tick의 그룹별 호출 수를 셉니다."""
+        group = name.partition(".")[0]
+        self._tick_calls[group] = self._tick_calls.get(group, 0) + 1
+        with self.phase(name):
+            yield
+
+    @contextmanager
+    def tick(self) -> Generator[None]:
+        """tick 전체 소요 시간과 tick당 외부 호출 수를 기록합니다."""
+        self._tick_calls = dict.fromkeys(self._tick_calls, 0)
+        try:
+            with self.phase("tick"):
+                yield
+        finally:
+            self._ticks += 1
+            for group, count in self._tick_calls.items():
+                self.record(f"{group}.calls", count)
+
+    def snapshot(self) -> dict[str, Any]:
+        """메트릭 JSON으로 저장할 요약 (시간 단위: 밀리초, 호출 수는 tick당 횟수)."""
+        phases: dict[str, dict[str, float]] = {}
+        for name in sorted(self._stats):
+            summary = self._stats[name].summary()
+            if name.endswith(".calls"):
+                phases[name] = summary
+            else:
+                phases[name] = {
+                    key: value if key == "count" else round(value * 1000, 3)
+                    for key, value in summary.items()
+                }
+        return {
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "started_at": self._started.isoformat(timespec="seconds"),
+            "ticks": self._ticks,
+            "window": self._window,
+            "phases": phases,
+        }
+
+    def status_line(self) -> str:
+        """TUI 상태 줄 (tick/단계별 p50/p95, tick당 WezTerm 호출 수)."""
+        tick = self._stats.get("tick")
+        if tick is None:
+            return "tick: -"
+        parts = [
+            f"tick p50 {_ms(tick.percentile(50))} p95 {_ms(tick.percentile(95))}",
+        ]
+        for name in STATUS_PHASES:
+            stats = self._stats.get(name)
+            if stats is not None:
+                parts.append(f"{name} {_ms(stats.percentile(95))}")
+        calls = self._stats.get("wezterm.calls")
+        if calls is not None:
+            parts.append(f"wezterm {calls.percentile(50):.0f}/tick")
+        return " | ".join(parts)
+
+    def write(self, path: Path) -> None:
+        """메트릭 요약을 JSON 파일로 저장합니다 (원자적 교체).
+
+        Args:
+            path: 저장 경로 (예: .orchay/logs/orchay-metrics.json)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+        write_atomic(path, data.encode("utf-8"))
+        self._last_write = time.monotonic()
+
+    def maybe_write(self, path: Path) -> bool:
+        """마지막 저장 후 `write_interval`이 지났으면 저장합니다.
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            True: 저장함
+            False: 아직 간격이 지나지 않았거나 저장 실패
+        """
+        last = self._last_write
+        if last is not None and time.monotonic() - last < self._write_interval:
+            return False
+        try:
+            self.write(path)
+        except OSError as e:
+            logger.warning(f"메트릭 저장 실패: {e}")
+            self._last_write = time.monotonic()
+            return False
+        return True
+
+
+def _ms(seconds: float) -> str:
+    """초를 상태 줄용 밀리초 문자열로 변환합니다."""
+    return f"{seconds * 1000:.0f}ms"
+
+
+# 활성 프로파일러 (None이면 profile()은 아무것도 하지 않음)
+_profiler: TickProfiler | None = None
+
+
+def set_profiler(profiler: TickProfiler | None) -> TickProfiler | None:
+    """활성 프로파일러를 교체합니다.
+
+    Args:
+        profiler: 사용할 프로파일러 (None이면 측정 중지)
+
+    Returns:
+        이전 프로파일러 (복원용)
+    """
+    global _profiler
+    previous, _profiler = _profiler, profiler
+    return previous
+
+
+def get_profiler() -> TickProfiler | None:
+    """활성 프로파일러를 반환합니다."""
+    return _profiler
+
+
+@contextmanager
+def profile(name: str) -> Generator[None]:
+    """활성 프로파일러에 외부 호출을 기록합니다 (`TickProfiler.call()`).
+
+    Args:
+        name: `<그룹>.<명령>` 형식 이름 (예: wezterm.get-text, wbs.parse)
+    """
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+    with profiler.call(name):
+        yield
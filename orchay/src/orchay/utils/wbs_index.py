@@ -0,0 +1,396 @@
+"""wbs.yaml 줄 위치 인덱스 모듈.
+
+Task ID → wbs.yaml 안의 줄/바이트 위치 인덱스를 만들어, 상태/blocked-by 변경을
+YAML 전체를 다시 로드/덤프하지 않고 해당 줄만 고쳐 쓰도록 합니다. 나머지 내용
+(주석, 따옴표, 들여쓰기, 키 순서)은 그대로 유지됩니다.
+
+인덱스는 `workPackages[].tasks[]` 구조의 한 줄 값만 다룹니다. 값이 여러 줄이거나
+flow mapping 형식 Task 등 해석할 수 없는 경우는 패치하지 않고(None 반환) 호출자가
+전체 로드/덤프로 처리합니다.
+
+인덱스는 파일 내용 해시별로 캐시되므로(`get_line_index`), `WbsParser.parse()`가
+만든 인덱스를 이후 상태 업데이트가 그대로 사용합니다.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import re
+import stat
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from orchay.utils.yaml_loader import FastLoadError, scan_scalar
+
+# Task 안에서 인덱싱하는 키 ("- id: ..." 항목 첫 줄 포함)
+_TASK_KEY = re.compile(rb"(id|status|blocked-by|blockedBy):(?: +|$)")
+
+# blocked-by 키 이름 (WbsParser와 같이 둘 다 허용)
+BLOCKED_BY_KEYS = ("blocked-by", "blockedBy")
+
+
+def content_digest(raw: bytes) -> str:
+    """wbs.yaml 내용 해시 (WbsParser 지문과 같은 값)."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class KeyLine(NamedTuple):
+    """Task 키 한 줄의 바이트 위치.
+
+    Attributes:
+        line_start: 줄 시작
+        line_end: 줄 끝 (줄바꿈 포함)
+        value_start: 값 시작
+        value_end: 값 끝 (뒤따르는 주석/공백 제외)
+        value: 해석된 값
+        first: `- key: value` 형식의 항목 첫 줄 여부 (삭제 불가)
+    """
+
+    line_start: int
+    line_end: int
+    value_start: int
+    value_end: int
+    value: Any
+    first: bool = False
+
+    def shifted(self, delta: int) -> KeyLine:
+        """위치를 delta만큼 이동한 KeyLine."""
+        return self._replace(
+            line_start=self.line_start + delta,
+            line_end=self.line_end + delta,
+            value_start=self.value_start + delta,
+            value_end=self.value_end + delta,
+        )
+
+
+@dataclass
+class TaskLines:
+    """Task 하나의 키 줄 위치."""
+
+    task_id: str
+    key_indent: int
+    keys: dict[str, KeyLine] = field(default_factory=dict[str, KeyLine])
+    # 해석할 수 없는 값이 있는 키 (패치하면 안 됨)
+    opaque: set[str] = field(default_factory=set[str])
+
+    @property
+    def status(self) -> str:
+        """현재 상태 코드 (키가 없으면 "[ ]")."""
+        line = self.keys.get("status")
+        return "[ ]" if line is None else str(line.value)
+
+
+@dataclass
+class WbsLineIndex:
+    """Task ID → 키 줄 위치 인덱스.
+
+    패치 메서드는 새 파일 내용을 반환하고 인덱스 위치를 새 내용에 맞게 갱신합니다.
+    """
+
+    tasks: dict[str, TaskLines]
+    newline: bytes = b"\n"
+
+    @classmethod
+    def build(cls, raw: bytes) -> WbsLineIndex:
+        """wbs.yaml 내용에서 인덱스를 만듭니다.
+
+        Args:
+            raw: 파일 내용 (UTF-8)
+
+        Returns:
+            WbsLineIndex (구조를 인식하지 못하면 빈 인덱스)
+        """
+        return _IndexBuilder(raw).build()
+
+    def set_status(self, raw: bytes, task_id: str, status_code: str) -> bytes | None:
+        """status 값을 바꾼 새 내용을 반환합니다.
+
+        Args:
+            raw: 인덱스를 만든 파일 내용
+            task_id: Task ID
+            status_code: 새 상태 코드 (예: "[im]")
+
+        Returns:
+            새 파일 내용 (패치할 수 없으면 None)
+        """
+        return self._set(raw, task_id, "status", status_code, after=("id",))
+
+    def set_blocked_by(self, raw: bytes, task_id: str, blocked_by: str | None) -> bytes | None:
+        """blocked-by 값을 설정하거나(None이면) 제거한 새 내용을 반환합니다.
+
+        Args:
+            raw: 인덱스를 만든 파일 내용
+            task_id: Task ID
+            blocked_by: blocked-by 값 (None이면 blocked-by/blockedBy 줄 제거)
+
+        Returns:
+            새 파일 내용 (패치할 수 없으면 None)
+        """
+        task = self.tasks.get(task_id)
+        if task is None or task.opaque.intersection(BLOCKED_BY_KEYS):
+            return None
+
+        if blocked_by:
+            key = next((k for k in BLOCKED_BY_KEYS if k in task.keys), "blocked-by")
+            return self._set(raw, task_id, key, blocked_by, after=("status", "id"))
+
+        # 제거: 뒤쪽 줄부터 지워야 앞쪽 위치가 유지됨
+        lines = sorted(
+            (task.keys[k] for k in BLOCKED_BY_KEYS if k in task.keys),
+            key=lambda line: line.line_start,
+            reverse=True,
+        )
+        if any(line.first for line in lines):
+            return None
+        for line in lines:
+            raw = raw[: line.line_start] + raw[line.line_end :]
+            self._shift(line.line_end, line.line_start - line.line_end)
+        for key in BLOCKED_BY_KEYS:
+            task.keys.pop(key, None)
+        return raw
+
+    def _set(
+        self, raw: bytes, task_id: str, key: str, value: str, after: tuple[str, ...]
+    ) -> bytes | None:
+        """키 값을 바꾸거나, 키가 없으면 after 키 줄 다음에 새 줄을 추가합니다."""
+        task = self.tasks.get(task_id)
+        if task is None or key in task.opaque:
+            return None
+
+        line = task.keys.get(key)
+        if line is not None:
+            text = _format_value(value, raw[line.value_start : line.value_end])
+            if text is None:
+                return None
+            new_raw = raw[: line.value_start] + text + raw[line.value_end :]
+            delta = len(text) - (line.value_end - line.value_start)
+            self._shift(line.value_end, delta)
+            task.keys[key] = line._replace(
+                line_end=line.line_end + delta,
+                value_end=line.value_start + len(text),
+                value=value,
+            )
+            return new_raw
+
+        anchor_key = next((k for k in after if k in task.keys), None)
+        text = _format_value(value, b"")
+        if anchor_key is None or text is None:
+            return None
+        anchor = task.keys[anchor_key]
+        pos = anchor.line_end
+        # 마지막 줄에 줄바꿈이 없으면 먼저 줄바꿈 추가
+        prefix = b"" if raw[pos - 1 : pos] == b"\n" else self.newline
+        head = prefix + b" " * task.key_indent + key.encode("utf-8") + b": "
+        inserted = head + text + self.newline
+        self._shift(pos, len(inserted))
+        task.keys[anchor_key] = anchor._replace(line_end=pos + len(prefix))
+        value_start = pos + len(head)
+        task.keys[key] = KeyLine(
+            pos + len(prefix), pos + len(inserted), value_start, value_start + len(text), value
+        )
+        return raw[:pos] + inserted + raw[pos:]
+
+    def _shift(self, pos: int, delta: int) -> None:
+        """pos 이후에 시작하는 모든 줄 위치를 delta만큼 이동합니다."""
+        if delta == 0:
+            return
+        for task in self.tasks.values():
+            for key, line in task.keys.items():
+                if line.line_start >= pos:
+                    task.keys[key] = line.shifted(delta)
+
+
+def _format_value(value: str, previous: bytes) -> bytes | None:
+    """새 값을 한 줄 YAML 값으로 만듭니다 (이전 값의 따옴표 형식 유지).
+
+    Returns:
+        YAML 값 바이트 (안전하게 표현할 수 없으면 None)
+    """
+    quote = previous[:1].decode("ascii", "replace")
+    candidates: list[str] = []
+    if quote == "'":
+        candidates.append("'" + value.replace("'", "''") + "'")
+    elif quote != '"':
+        candidates.append(value)
+    candidates.append('"' + value + '"')
+    for text in candidates:
+        with contextlib.suppress(FastLoadError):
+            parsed, end = scan_scalar(text)
+            if end == len(text) and parsed == value and isinstance(parsed, str):
+                return text.encode("utf-8")
+    return None
+
+
+class _IndexBuilder:
+    """줄 단위로 `workPackages[].tasks[]` 구조를 따라가며 인덱스를 만듭니다."""
+
+    def __init__(self, raw: bytes) -> None:
+        self._raw = raw
+        self._tasks: dict[str, TaskLines] = {}
+        self._current: TaskLines | None = None
+        self._in_work_packages = False
+        self._wp_indent: int | None = None
+        self._wp_key_indent = 0
+        self._in_tasks = False
+        self._tasks_indent: int | None = None
+
+    def build(self) -> WbsLineIndex:
+        raw = self._raw
+        newline = b"\r\n" if b"\r\n" in raw[:4096] else b"\n"
+        pos = 0
+        for line in raw.split(b"\n"):
+            start, pos = pos, pos + len(line) + 1
+            body = line.lstrip(b" ")
+            if not body or body[0] in b"#\r":
+                continue
+            if body[0] == 9:  # 탭 들여쓰기: 구조를 신뢰할 수 없음
+                return WbsLineIndex({}, newline)
+            self._line(start, min(pos, len(raw)), len(line) - len(body), body.rstrip(b"\r"))
+        self._end_task()
+        return WbsLineIndex(self._tasks, newline)
+
+    def _line(self, start: int, end: int, indent: int, body: bytes) -> None:
+        is_item = body[:2] == b"- " or body == b"-"
+        if indent == 0 and not is_item:
+            # 최상위 키
+            self._end_task()
+            self._in_work_packages = body.rstrip() == b"workPackages:"
+            self._wp_indent = None
+            self._in_tasks = False
+            return
+        if not self._in_work_packages:
+            return
+
+        if is_item:
+            rest = body[1:].lstrip(b" ")
+            content_indent = indent + len(body) - len(rest)
+            if self._wp_indent is None:
+                self._wp_indent = indent
+            if indent == self._wp_indent:
+                # 새 작업 패키지
+                self._end_task()
+                self._wp_key_indent = content_indent
+                self._in_tasks = False
+                self._wp_key(rest)
+                return
+            if self._in_tasks and indent >= self._wp_key_indent:
+                if self._tasks_indent is None:
+                    self._tasks_indent = indent
+                if indent == self._tasks_indent:
+                    self._end_task()
+                    task = TaskLines(task_id="", key_indent=content_indent)
+                    self._current = task
+                    self._key(
+                        task, rest, start, end, start + (len(body) - len(rest)) + indent, True
+                    )
+                    return
+
+        if indent <= self._wp_key_indent:
+            self._end_task()
+            self._in_tasks = False
+            if indent == self._wp_key_indent:
+                self._wp_key(body)
+            return
+
+        task = self._current
+        if task is not None and indent == task.key_indent:
+            self._key(task, body, start, end, start + indent, False)
+
+    def _wp_key(self, body: bytes) -> None:
+        """작업 패키지 키 줄 (tasks: 시작 감지)."""
+        if body.rstrip() == b"tasks:":
+            self._in_tasks = True
+            self._tasks_indent = None
+
+    def _key(
+        self, task: TaskLines, body: bytes, start: int, end: int, key_start: int, first: bool
+    ) -> None:
+        """Task 키 줄을 기록합니다."""
+        match = _TASK_KEY.match(body)
+        if match is None:
+            return
+        key = match.group(1).decode("ascii")
+        text = body[match.end() :].rstrip()
+        try:
+            value, length = scan_scalar(text.decode("utf-8"))
+        except (FastLoadError, UnicodeDecodeError):
+            task.opaque.add(key)
+            return
+        value_start = key_start + match.end()
+        value_end = value_start + len(text.decode("utf-8")[:length].encode("utf-8"))
+        task.keys[key] = KeyLine(start, end, value_start, value_end, value, first)
+        if key == "id" and isinstance(value, str):
+            task.task_id = value
+
+    def _end_task(self) -> None:
+        """현재 Task를 인덱스에 추가합니다 (같은 ID는 첫 번째만 유지)."""
+        task, self._current = self._current, None
+        if task is not None and task.task_id and task.task_id not in self._tasks:
+            self._tasks[task.task_id] = task
+
+
+# 파일별 인덱스 캐시: 경로 → (내용 해시, 인덱스)
+_INDEX_CACHE: dict[Path, tuple[str, WbsLineIndex]] = {}
+
+
+def get_line_index(path: Path, raw: bytes, digest: str | None = None) -> WbsLineIndex:
+    """파일 내용에 해당하는 인덱스를 반환합니다 (같은 내용이면 캐시 사용).
+
+    Args:
+        path: wbs.yaml 경로
+        raw: 파일 내용
+        digest: 내용 해시 (이미 계산했으면 전달)
+
+    Returns:
+        WbsLineIndex
+    """
+    key = path.resolve()
+    digest = digest or content_digest(raw)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+    index = WbsLineIndex.build(raw)
+    _INDEX_CACHE[key] = (digest, index)
+    return index
+
+
+def store_line_index(path: Path, raw: bytes, index: WbsLineIndex) -> str:
+    """패치 후 새 내용에 맞게 갱신된 인덱스를 캐시에 저장합니다.
+
+    Returns:
+        새 내용 해시
+    """
+    digest = content_digest(raw)
+    _INDEX_CACHE[path.resolve()] = (digest, index)
+    return digest
+
+
+def discard_line_index(path: Path) -> None:
+    """캐시된 인덱스를 버립니다 (패치 후 저장하지 못했거나 전체 덤프로 저장했을 때)."""
+    _INDEX_CACHE.pop(path.resolve(), None)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 rename으로 교체합니다 (읽는 쪽은 이전/새 내용만 봄).
+
+    Args:
+        path: 대상 파일
+        data: 파일 내용
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
@@ -0,0 +1,259 @@
+"""WBS 시작 스냅샷 모듈.
+
+파싱한 Task 목록과 메타데이터를 `.orchay/cache/`에 바이너리(marshal)로 저장하고,
+다음 시작 시 wbs.yaml 내용 해시가 같으면 YAML을 파싱하지 않고 스냅샷에서 Task를
+복원합니다. 해시가 다르거나 스냅샷을 읽을 수 없으면 None을 반환하여 호출자가
+전체 파싱하도록 합니다.
+
+스냅샷에는 WBS 파일에서 읽은 필드만 저장합니다 (assigned_worker 등 런타임 상태 제외).
+Task 객체가 메모리에서 바뀌어도 파일 내용과 같은 값을 저장하도록, 행(row)은 파싱에서
+새로 만들어지거나 바뀐 Task만 다시 인코딩하고 나머지는 이전 행을 재사용합니다.
+
+marshal 형식은 Python 버전마다 다를 수 있으므로 헤더의 Python 버전/필드 목록이
+현재와 다르면 스냅샷을 사용하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import hashlib
+import logging
+import marshal
+import sys
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from orchay.models import ExecutionInfo, Task, TaskCategory, TaskPriority, TaskStatus
+from orchay.utils.wbs_index import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 형식 버전 (행 구조가 바뀌면 올림)
+SNAPSHOT_VERSION = 1
+
+_MAGIC = "orchay-wbs-snapshot"
+
+# 파일 형식: 헤더 길이(4바이트) + 헤더(marshal) + 본문(marshal: 메타데이터, 행 목록)
+_HEADER_SIZE_BYTES = 4
+
+# 스냅샷 행의 필드 순서 (Task 필드 중 런타임 상태 제외)
+SNAPSHOT_FIELDS: tuple[str, ...] = (
+    "id",
+    "title",
+    "category",
+    "domain",
+    "status",
+    "priority",
+    "assignee",
+    "schedule",
+    "tags",
+    "depends",
+    "blocked_by",
+    "prd_ref",
+    "requirements",
+    "acceptance",
+    "tech_spec",
+    "api_spec",
+    "ui_spec",
+    "raw_content",
+    "execution",
+)
+
+# 스냅샷에 저장하지 않는 런타임 필드 (복원 시 기본값)
+RUNTIME_FIELDS: tuple[str, ...] = ("assigned_worker",)
+
+_CATEGORIES = {c.value: c for c in TaskCategory}
+_STATUSES = {s.value: s for s in TaskStatus}
+_PRIORITIES = {p.value: p for p in TaskPriority}
+
+Row = tuple[Any, ...]
+
+
+def snapshot_path_for(wbs_path: Path, cache_dir: Path) -> Path:
+    """WBS 파일의 스냅샷 경로 (경로별 하나, 예: `.orchay/cache/orchay-1a2b3c4d.snapshot`)."""
+    key = hashlib.blake2b(str(wbs_path.resolve()).encode("utf-8"), digest_size=4).hexdigest()
+    return cache_dir / f"{wbs_path.parent.name}-{key}.snapshot"
+
+
+def _header(digest: str) -> tuple[Any, ...]:
+    """스냅샷 헤더 (하나라도 다르면 사용하지 않음)."""
+    return (_MAGIC, SNAPSHOT_VERSION, sys.version_info[:2], SNAPSHOT_FIELDS, digest)
+
+
+def _encode(task: Task) -> Row:
+    """Task → 스냅샷 행."""
+    execution = task.execution
+    return (
+        task.id,
+        task.title,
+        task.category.value,
+        task.domain,
+        task.status.value,
+        task.priority.value,
+        task.assignee,
+        task.schedule,
+        task.tags,
+        task.depends,
+        task.blocked_by,
+        task.prd_ref,
+        task.requirements,
+        task.acceptance,
+        task.tech_spec,
+        task.api_spec,
+        task.ui_spec,
+        task.raw_content,
+        None
+        if execution is None
+        else (execution.command, execution.description, execution.startedAt, execution.worker),
+    )
+
+
+def _decode(row: Row) -> Task:
+    """스냅샷 행 → Task."""
+    execution = row[18]
+    return Task(
+        id=row[0],
+        title=row[1],
+        category=_CATEGORIES[row[2]],
+        domain=row[3],
+        status=_STATUSES[row[4]],
+        priority=_PRIORITIES[row[5]],
+        assignee=row[6],
+        schedule=row[7],
+        tags=row[8],
+        depends=row[9],
+        blocked_by=row[10],
+        prd_ref=row[11],
+        requirements=row[12],
+        acceptance=row[13],
+        tech_spec=row[14],
+        api_spec=row[15],
+        ui_spec=row[16],
+        raw_content=row[17],
+        execution=None
+        if execution is None
+        else ExecutionInfo(
+            command=execution[0],
+            description=execution[1],
+            startedAt=execution[2],
+            worker=execution[3],
+        ),
+    )
+
+
+@contextmanager
+def _gc_paused() -> Generator[None]:
+    """대량 객체 생성 중 순환 GC 일시 중지 (생성 시간 대부분이 GC 검사)."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class WbsSnapshot:
+    """wbs.yaml 하나의 시작 스냅샷.
+
+    `load()`는 내용 해시가 같을 때만 Task를 복원하고, `save()`는 파싱 결과를
+    원자적으로 저장합니다. 바뀌지 않은 Task의 행은 이전 저장/로드 결과를 재사용합니다.
+    """
+
+    def __init__(self, wbs_path: str | Path, cache_dir: str | Path) -> None:
+        """WbsSnapshot을 초기화합니다.
+
+        Args:
+            wbs_path: wbs.yaml 경로
+            cache_dir: 스냅샷 디렉토리 (예: .orchay/cache)
+        """
+        self._path = snapshot_path_for(Path(wbs_path), Path(cache_dir))
+        # Task ID → 마지막으로 저장/로드한 행
+        self._rows: dict[str, Row] = {}
+
+    @property
+    def path(self) -> Path:
+        """스냅샷 파일 경로."""
+        return self._path
+
+    def load(self, digest: str) -> tuple[list[Task], dict[str, Any]] | None:
+        """내용 해시가 같은 스냅샷에서 Task 목록과 메타데이터를 복원합니다.
+
+        Args:
+            digest: 현재 wbs.yaml 내용 해시
+
+        Returns:
+            (Task 리스트, 메타데이터) 또는 None (스냅샷 없음/해시 불일치/손상)
+        """
+        try:
+            with self._path.open("rb") as f:
+                header_size = int.from_bytes(f.read(_HEADER_SIZE_BYTES), "big")
+                if marshal.loads(f.read(header_size)) != _header(digest):
+                    logger.debug(f"WBS 스냅샷 불일치: {self._path}")
+                    return None
+                body = f.read()
+            with _gc_paused():
+                metadata, rows = marshal.loads(body)
+                tasks = [_decode(row) for row in rows]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"WBS 스냅샷 읽기 실패 (전체 파싱): {e}")
+            return None
+
+        self._rows = {row[0]: row for row in rows}
+        logger.info(f"WBS 스냅샷 사용: {len(tasks)}개 Task ({self._path})")
+        return tasks, metadata
+
+    async def save(
+        self,
+        digest: str,
+        tasks: list[Task],
+        metadata: dict[str, Any],
+        changed: Iterable[str] | None = None,
+    ) -> bool:
+        """파싱 결과를 스냅샷으로 저장합니다.
+
+        Args:
+            digest: 파싱한 wbs.yaml 내용 해시
+            tasks: 파싱 결과 Task 리스트
+            metadata: 메타데이터 (project, wbs)
+            changed: 이번 파싱에서 새로 만들어지거나 바뀐 Task ID (None이면 전체 인코딩)
+
+        Returns:
+            저장 성공 여부
+        """
+        refresh = None if changed is None else set(changed)
+        rows: list[Row] = []
+        cache: dict[str, Row] = {}
+        for task in tasks:
+            row = self._rows.get(task.id)
+            if row is None or refresh is None or task.id in refresh or task.id in cache:
+                row = _encode(task)
+            cache.setdefault(task.id, row)
+            rows.append(row)
+        self._rows = cache
+
+        try:
+            header = marshal.dumps(_header(digest))
+            body = marshal.dumps((metadata, rows))
+        except ValueError as e:
+            # 메타데이터에 marshal로 저장할 수 없는 값 (예: YAML 날짜)
+            logger.debug(f"WBS 스냅샷 저장 생략: {e}")
+            return False
+
+        try:
+            data = len(header).to_bytes(_HEADER_SIZE_BYTES, "big") + header + body
+            await asyncio.to_thread(self._write, data)
+        except OSError as e:
+            logger.warning(f"WBS 스냅샷 저장 실패: {e}")
+            return False
+        return True
+
+    def _write(self, data: bytes) -> None:
+        """스냅샷 파일을 원자적으로 씁니다."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self._path, data)
@@ -1,11 +1,21 @@
 """WezTerm CLI 래퍼.
 
 WezTerm 터미널의 pane을 관리하기 위한 비동기 CLI 래퍼입니다.
+`set_terminal_backend()`로 터미널 백엔드를 교체하면 (벤치마크/시뮬레이션)
+모든 호출이 WezTerm CLI 대신 해당 백엔드로 전달됩니다.
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from orchay.utils.tick_profiler import profile
+
+if TYPE_CHECKING:
+    from orchay.infrastructure.wezterm.adapter import ITerminalAdapter
 
 
 class WezTermNotFoundError(Exception):
@@ -22,6 +32,25 @@ class PaneInfo:
     workspace: str
     cwd: str
     title: str
+    rows: int = 0  # 화면(viewport) 줄 수, 0이면 알 수 없음
+
+
+# 터미널 백엔드 (None이면 WezTerm CLI 사용)
+_backend: ITerminalAdapter | None = None
+
+
+def set_terminal_backend(backend: ITerminalAdapter | None) -> ITerminalAdapter | None:
+    """터미널 백엔드를 교체합니다.
+
+    Args:
+        backend: 사용할 터미널 어댑터 (None이면 WezTerm CLI로 복원)
+
+    Returns:
+        이전 백엔드 (복원용)
+    """
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
 
 
 async def wezterm_list_panes() -> list[PaneInfo]:
@@ -33,17 +62,26 @@ async def wezterm_list_panes() -> list[PaneInfo]:
     Raises:
         WezTermNotFoundError: WezTerm CLI를 찾을 수 없을 때
     """
+    if _backend is not None:
+        return [
+            PaneInfo(
+                pane_id=p.pane_id, workspace=p.workspace, cwd=p.cwd, title=p.title, rows=p.rows
+            )
+            for p in await _backend.list_panes()
+        ]
+
     try:
-        process = await asyncio.create_subprocess_exec(
-            "wezterm",
-            "cli",
-            "list",
-            "--format",
-            "json",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await process.communicate()
+        with profile("wezterm.list"):
+            process = await asyncio.create_subprocess_exec(
+                "wezterm",
+                "cli",
+                "list",
+                "--format",
+                "json",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await process.communicate()
     except FileNotFoundError as e:
         raise WezTermNotFoundError(
             "WezTerm CLI를 찾을 수 없습니다. "
@@ -66,32 +104,49 @@ async def wezterm_list_panes() -> list[PaneInfo]:
                 workspace=item.get("workspace", ""),
                 cwd=item.get("cwd", ""),
                 title=item.get("title", ""),
+                rows=item.get("size", {}).get("rows", 0),
             )
         )
     return result
 
 
-async def wezterm_get_text(pane_id: int, lines: int = 50) -> str:
+async def wezterm_get_text(
+    pane_id: int,
+    lines: int = 50,
+    start_line: int | None = None,
+    end_line: int | None = None,
+) -> str:
     """특정 pane의 출력 텍스트를 조회합니다.
 
+    start_line/end_line을 지정하면 해당 범위만 조회합니다.
+    줄 번호는 화면 첫 줄이 0이고, 음수는 scrollback으로 거슬러 올라갑니다.
+
     Args:
         pane_id: WezTerm pane ID
         lines: 읽을 줄 수 (기본값: 50)
+        start_line: 조회 시작 줄 (None이면 화면 첫 줄)
+        end_line: 조회 끝 줄 (None이면 화면 마지막 줄)
 
     Returns:
         pane 출력 텍스트. pane이 없으면 빈 문자열.
     """
+    if _backend is not None:
+        return await _backend.get_text(pane_id, lines, start_line, end_line)
+
+    args = ["wezterm", "cli", "get-text", "--pane-id", str(pane_id)]
+    if start_line is not None:
+        args += ["--start-line", str(start_line)]
+    if end_line is not None:
+        args += ["--end-line", str(end_line)]
+
     try:
-        process = await asyncio.create_subprocess_exec(
-            "wezterm",
-            "cli",
-            "get-text",
-            "--pane-id",
-            str(pane_id),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await process.communicate()
+        with profile("wezterm.get-text"):
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await process.communicate()
     except FileNotFoundError:
         return ""
 
@@ -119,22 +174,27 @@ async def wezterm_send_text(pane_id: int, text: str) -> None:
         RuntimeError: 전송 실패 시
         WezTermNotFoundError: WezTerm CLI를 찾을 수 없을 때
     """
+    if _backend is not None:
+        await _backend.send_text(pane_id, text)
+        return
+
     try:
         # wezterm cli send-text는 -- 뒤에 텍스트를 받으므로
         # shlex.quote 없이도 안전하지만, 추가 보안을 위해 인자로 전달
-        process = await asyncio.create_subprocess_exec(
-            "wezterm",
-            "cli",
-            "send-text",
-            "--pane-id",
-            str(pane_id),
-            "--no-paste",
-            "--",
-            text,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        _, stderr = await process.communicate()
+        with profile("wezterm.send-text"):
+            process = await asyncio.create_subprocess_exec(
+                "wezterm",
+                "cli",
+                "send-text",
+                "--pane-id",
+                str(pane_id),
+                "--no-paste",
+                "--",
+                text,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
     except FileNotFoundError as e:
         raise WezTermNotFoundError("WezTerm CLI를 찾을 수 없습니다.") from e
 
@@ -164,17 +224,21 @@ async def get_active_pane_id() -> int | None:
     Returns:
         활성 pane ID 또는 None (찾을 수 없는 경우)
     """
+    if _backend is not None:
+        return await _backend.get_active_pane_id()
+
     try:
-        process = await asyncio.create_subprocess_exec(
-            "wezterm",
-            "cli",
-            "list",
-            "--format",
-            "json",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await process.communicate()
+        with profile("wezterm.list"):
+            process = await asyncio.create_subprocess_exec(
+                "wezterm",
+                "cli",
+                "list",
+                "--format",
+                "json",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await process.communicate()
     except FileNotFoundError:
         return None
 
@@ -0,0 +1,378 @@
+"""YAML 로딩 백엔드 모듈.
+
+wbs.yaml 로딩/저장에 사용할 YAML 백엔드를 선택합니다.
+
+백엔드:
+    - fast: WBS 파일 형식(블록 mapping/sequence, 한 줄 scalar)만 지원하는 전용 로더.
+      지원하지 않는 구문을 만나면 `FastLoadError`를 발생시킵니다.
+    - libyaml: PyYAML의 C 확장(`CSafeLoader`). 설치되어 있지 않으면 python으로 대체
+    - python: 순수 Python `SafeLoader` (`yaml.safe_load`와 동일)
+    - auto: fast → libyaml → python 순으로 자동 대체 (기본값)
+
+모든 백엔드는 `yaml.safe_load`와 같은 결과를 반환합니다. fast 로더의 scalar 해석은
+PyYAML의 resolver/constructor를 그대로 사용합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, Literal, cast
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+from yaml.scanner import Scanner
+
+logger = logging.getLogger(__name__)
+
+YamlBackend = Literal["auto", "fast", "libyaml", "python"]
+
+YAML_BACKENDS: tuple[YamlBackend, ...] = ("auto", "fast", "libyaml", "python")
+
+HAS_LIBYAML: bool = hasattr(yaml, "CSafeLoader")
+
+_LIBYAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DUMPER: Any = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# 한 줄 plain scalar로 쓸 수 없는 시작 문자 (flow, anchor/alias, tag, block scalar 등)
+_PLAIN_INDICATORS = frozenset("[]{},&*!|>'\"%@`#")
+
+# 한 줄 큰따옴표 문자열 ("..." 안의 escape 포함)과 escape 시퀀스
+_DOUBLE_QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_ESCAPE = re.compile(r"\\(?:([xuU])([0-9A-Fa-f]+)|(.))")
+
+# PyYAML 암시적 타입 해석 (null/bool/int/float/timestamp/str)
+_resolve_tag = cast(
+    Callable[[type[ScalarNode], str, tuple[bool, bool]], str],
+    Resolver().resolve,  # pyright: ignore[reportUnknownMemberType]
+)
+_CONSTRUCTOR = SafeConstructor()
+
+
+class FastLoadError(yaml.YAMLError):
+    """fast 로더가 지원하지 않는 YAML 구문."""
+
+    def __init__(self, message: str, line_number: int | None = None) -> None:
+        self.line_number = line_number
+        super().__init__(f"{message} (line {line_number})" if line_number else message)
+
+
+@lru_cache(maxsize=8192)
+def _resolve_plain(value: str) -> Any:  # noqa: ANN401
+    """plain scalar를 safe_load와 같은 규칙으로 변환 (null/bool/int/float/timestamp/str)."""
+    tag = _resolve_tag(ScalarNode, value, (True, False))
+    constructor = SafeConstructor.yaml_constructors.get(tag)
+    if constructor is None:
+        # merge key(<<), value(=) 등
+        raise FastLoadError(f"지원하지 않는 scalar: {value!r}")
+    return constructor(_CONSTRUCTOR, ScalarNode(tag, value))
+
+
+class _FastLoader:
+    """WBS 형식 전용 블록 YAML 로더.
+
+    줄 단위로 들여쓰기를 따라 mapping/sequence를 구성합니다. 지원 범위:
+    블록 mapping/sequence(부모 키와 같은 들여쓰기의 sequence 포함), `- key: value` 형식의
+    sequence 항목, 한 줄 plain/따옴표 scalar, `[]`, `{}`, 단순 flow sequence, 주석.
+    """
+
+    def __init__(self, content: str) -> None:
+        # (들여쓰기, 내용, 줄 번호)
+        self._lines: list[tuple[int, str, int]] = []
+        for number, raw in enumerate(content.lstrip("\ufeff").splitlines(), start=1):
+            text = raw.rstrip()
+            body = text.lstrip(" ")
+            if not body or body[0] == "#":
+                continue
+            if "\t" in text:
+                raise FastLoadError("탭 문자", number)
+            indent = len(text) - len(body)
+            if indent == 0 and body.startswith(("---", "...", "%")):
+                if body == "---" and not self._lines:
+                    continue
+                raise FastLoadError("문서 구분자/지시자", number)
+            self._lines.append((indent, body, number))
+
+    def load(self) -> Any:  # noqa: ANN401
+        """문서 전체를 변환합니다."""
+        if not self._lines:
+            return None
+        value, end = self._node(0, self._lines[0][0])
+        if end != len(self._lines):
+            raise FastLoadError("예상하지 못한 들여쓰기", self._lines[end][2])
+        return value
+
+    def _node(self, i: int, indent: int) -> tuple[Any, int]:
+        """i번째 줄에서 시작하는 블록 노드."""
+        body = self._lines[i][1]
+        if _is_sequence_entry(body):
+            return self._sequence(i, indent)
+        return self._mapping(i, indent)
+
+    def _nested(self, i: int, indent: int, allow_same_indent_sequence: bool) -> tuple[Any, int]:
+        """값이 비어 있는 항목의 하위 노드 (없으면 null)."""
+        if i < len(self._lines):
+            next_indent, next_body, _ = self._lines[i]
+            if next_indent > indent:
+                return self._node(i, next_indent)
+            if (
+                allow_same_indent_sequence
+                and next_indent == indent
+                and _is_sequence_entry(next_body)
+            ):
+                return self._sequence(i, indent)
+        return None, i
+
+    def _expect_no_continuation(self, i: int, indent: int) -> None:
+        """한 줄 값 다음 줄이 더 깊게 들여쓰기되어 있으면 (여러 줄 scalar 등) 실패."""
+        if i < len(self._lines) and self._lines[i][0] > indent:
+            raise FastLoadError("여러 줄 값", self._lines[i][2])
+
+    def _mapping(self, i: int, indent: int) -> tuple[dict[Any, Any], int]:
+        result: dict[Any, Any] = {}
+        lines = self._lines
+        while i < len(lines):
+            line_indent, body, number = lines[i]
+            if line_indent < indent:
+                break
+            if line_indent > indent:
+                raise FastLoadError("예상하지 못한 들여쓰기", number)
+            if _is_sequence_entry(body):
+                break
+
+            key, rest = _split_key(body, number)
+            i += 1
+            if rest:
+                result[key] = _scalar(rest, number)
+                self._expect_no_continuation(i, indent)
+            else:
+                result[key], i = self._nested(i, indent, allow_same_indent_sequence=True)
+        return result, i
+
+    def _sequence(self, i: int, indent: int) -> tuple[list[Any], int]:
+        result: list[Any] = []
+        lines = self._lines
+        while i < len(lines):
+            line_indent, body, number = lines[i]
+            if line_indent != indent or not _is_sequence_entry(body):
+                if line_indent > indent:
+                    raise FastLoadError("예상하지 못한 들여쓰기", number)
+                break
+
+            rest = body[1:].lstrip(" ")
+            if not rest or rest[0] == "#":
+                value, i = self._nested(i + 1, indent, allow_same_indent_sequence=False)
+            elif _is_sequence_entry(rest) or _is_mapping_entry(rest):
+                # "- key: value" / "- - item": 같은 줄 내용을 하위 들여쓰기 줄로 취급
+                lines[i] = (indent + len(body) - len(rest), rest, number)
+                value, i = self._node(i, lines[i][0])
+            else:
+                value = _scalar(rest, number)
+                i += 1
+                self._expect_no_continuation(i, indent)
+            result.append(value)
+        return result, i
+
+
+def _is_sequence_entry(body: str) -> bool:
+    return body[0] == "-" and (len(body) == 1 or body[1] == " ")
+
+
+def _is_mapping_entry(body: str) -> bool:
+    if body[0] in "\"'":
+        _, end = _quoted(body, 0)
+        return body[end:].startswith(":")
+    return ": " in body or body.endswith(":")
+
+
+def _split_key(body: str, number: int) -> tuple[Any, str]:
+    """'key: value' 줄을 (키, 값 문자열)로 나눕니다."""
+    if body[0] in "\"'":
+        key, end = _quoted(body, number)
+        rest = body[end:]
+        if not rest.startswith(":") or (len(rest) > 1 and rest[1] != " "):
+            raise FastLoadError("mapping 키가 아닙니다", number)
+        rest = rest[1:].strip()
+    else:
+        sep = body.find(": ")
+        if sep >= 0:
+            raw_key, rest = body[:sep].rstrip(), body[sep + 2 :].strip()
+        elif body.endswith(":"):
+            raw_key, rest = body[:-1].rstrip(), ""
+        else:
+            raise FastLoadError("mapping 키가 아닙니다", number)
+        if not raw_key or raw_key[0] in _PLAIN_INDICATORS or raw_key[0] in "?:" or " #" in raw_key:
+            raise FastLoadError(f"지원하지 않는 키: {raw_key!r}", number)
+        key = _resolve_plain(raw_key)
+    if rest.startswith("#"):
+        rest = ""
+    return key, rest
+
+
+def _quoted(text: str, number: int) -> tuple[str, int]:
+    """따옴표 scalar를 해석하고 (값, 닫는 따옴표 다음 위치)를 반환합니다."""
+    quote = text[0]
+    if quote == '"':
+        match = _DOUBLE_QUOTED.match(text)
+        if match is None:
+            raise FastLoadError("여러 줄 따옴표 문자열", number)
+        value = match.group(1)
+        if "\\" in value:
+            value = _ESCAPE.sub(lambda m: _unescape(m, number), value)
+        return value, match.end()
+
+    parts: list[str] = []
+    pos = 1
+    while True:
+        end = text.find("'", pos)
+        if end < 0:
+            raise FastLoadError("여러 줄 따옴표 문자열", number)
+        parts.append(text[pos:end])
+        if text.startswith("'", end + 1):
+            parts.append("'")
+            pos = end + 2
+            continue
+        return "".join(parts), end + 1
+
+
+def _unescape(match: re.Match[str], number: int) -> str:
+    """큰따옴표 문자열 escape 시퀀스 변환 (PyYAML scanner와 같은 규칙)."""
+    code, digits, char = match.groups()
+    if code is not None:
+        length = Scanner.ESCAPE_CODES[code]
+        if len(digits) < length:
+            raise FastLoadError("잘못된 escape 시퀀스", number)
+        return chr(int(digits[:length], 16)) + digits[length:]
+    replacement = Scanner.ESCAPE_REPLACEMENTS.get(char)
+    if replacement is None:
+        raise FastLoadError(f"잘못된 escape 시퀀스: \\{char}", number)
+    return replacement
+
+
+def _scalar(text: str, number: int) -> Any:  # noqa: ANN401
+    """한 줄 값 (따옴표/plain scalar, 빈 flow 컬렉션, 단순 flow sequence)."""
+    return _scalar_token(text, number)[0]
+
+
+def _scalar_token(text: str, number: int) -> tuple[Any, int]:
+    """한 줄 값을 해석하고 (값, 값 토큰 끝 위치)를 반환합니다 (뒤따르는 주석 제외)."""
+    first = text[0]
+    if first in "\"'":
+        value, end = _quoted(text, number)
+        rest = text[end:].lstrip()
+        if rest and rest[0] != "#":
+            raise FastLoadError("따옴표 문자열 뒤 내용", number)
+        return value, end
+
+    comment = text.find(" #")
+    if comment >= 0:
+        text = text[:comment].rstrip()
+    if first == "[" or first == "{":
+        return _flow(text, number), len(text)
+    if first in _PLAIN_INDICATORS or (first in "-?:" and (len(text) == 1 or text[1] == " ")):
+        raise FastLoadError(f"지원하지 않는 값: {text!r}", number)
+    if ": " in text or text.endswith(":"):
+        raise FastLoadError(f"mapping 값 안의 ':' : {text!r}", number)
+    return _resolve_plain(text), len(text)
+
+
+def _flow(text: str, number: int) -> Any:  # noqa: ANN401
+    """`[]`, `{}`, 따옴표/중첩 없는 `[a, b]`만 지원합니다 (주석 제외된 값)."""
+    if text == "[]":
+        return []
+    if text == "{}":
+        return {}
+    inner = text[1:-1]
+    if text[0] != "[" or text[-1] != "]" or any(c in inner for c in "[]{}\"'#&*!|>:?"):
+        raise FastLoadError(f"지원하지 않는 flow 컬렉션: {text!r}", number)
+    items = [item.strip() for item in inner.split(",")]
+    if items and not items[-1]:
+        items.pop()  # 끝 쉼표 허용 ([a, b,])
+    if any(not item or item[0] in _PLAIN_INDICATORS or item[0] == "-" for item in items):
+        raise FastLoadError(f"지원하지 않는 flow 항목: {text!r}", number)
+    return [_resolve_plain(item) for item in items]
+
+
+def fast_load(content: str) -> Any:  # noqa: ANN401
+    """WBS 형식 전용 로더로 YAML을 로드합니다.
+
+    Args:
+        content: YAML 문자열
+
+    Returns:
+        `yaml.safe_load(content)`와 같은 결과
+
+    Raises:
+        FastLoadError: 지원하지 않는 구문이 있을 때
+    """
+    return _FastLoader(content).load()
+
+
+def scan_scalar(text: str) -> tuple[Any, int]:
+    """한 줄 YAML 값을 fast 로더 규칙으로 해석합니다.
+
+    Args:
+        text: `key: ` 뒤의 값 문자열 (앞 공백 없음, 뒤따르는 주석 허용)
+
+    Returns:
+        (값, 값 토큰이 끝나는 위치). 위치 뒤에는 공백/주석만 남습니다.
+
+    Raises:
+        FastLoadError: 한 줄 값으로 해석할 수 없을 때 (빈 값, block scalar 등)
+    """
+    if not text:
+        raise FastLoadError("빈 값")
+    return _scalar_token(text, 0)
+
+
+def load_yaml(content: str, backend: YamlBackend = "auto") -> Any:  # noqa: ANN401
+    """선택한 백엔드로 YAML 문자열을 로드합니다.
+
+    Args:
+        content: YAML 문자열
+        backend: 로딩 백엔드 (기본: auto)
+
+    Returns:
+        로드된 데이터
+
+    Raises:
+        yaml.YAMLError: YAML 구문 오류 (fast 백엔드는 지원하지 않는 구문 포함)
+        ValueError: 알 수 없는 백엔드
+    """
+    if backend == "auto":
+        try:
+            return fast_load(content)
+        except FastLoadError as e:
+            logger.debug(f"fast YAML 로더 대체: {e}")
+            return yaml.load(content, Loader=_LIBYAML_LOADER)  # noqa: S506 (SafeLoader 계열)
+    if backend == "fast":
+        return fast_load(content)
+    if backend == "libyaml":
+        return yaml.load(content, Loader=_LIBYAML_LOADER)  # noqa: S506
+    if backend == "python":
+        return yaml.safe_load(content)
+    raise ValueError(f"알 수 없는 YAML 백엔드: {backend}")
+
+
+def dump_yaml(data: Any) -> str:  # noqa: ANN401
+    """wbs.yaml 저장 형식으로 YAML 문자열을 생성합니다 (libyaml이 있으면 CSafeDumper).
+
+    Args:
+        data: 저장할 데이터 (safe 타입만)
+
+    Returns:
+        YAML 문자열
+    """
+    return yaml.dump(
+        data,
+        Dumper=_DUMPER,
+        allow_unicode=True,
+        default_flow_style=False,
+        sort_keys=False,
+        indent=2,
+        width=120,
+    )
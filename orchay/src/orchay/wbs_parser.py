@@ -9,22 +9,86 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from collections.abc import Awaitable, Callable
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
-import yaml
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
 from orchay.models import ExecutionInfo, Task, TaskCategory, TaskPriority, TaskStatus
+from orchay.utils.tick_profiler import profile
+from orchay.utils.wbs_index import content_digest, get_line_index
+from orchay.utils.wbs_snapshot import WbsSnapshot
+from orchay.utils.yaml_loader import YamlBackend, load_yaml
+from orchay.wbs_writer import get_wbs_writer
 
 if TYPE_CHECKING:
     from watchdog.observers.api import BaseObserver
 
 logger = logging.getLogger(__name__)
 
+# mtime 해상도 여유 (나노초): 이 시간 안에 다시 수정된 파일은 stat만으로 변경을 판별할 수 없음
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+class WbsFingerprint(NamedTuple):
+    """WBS 파일 지문 (변경 판별용)."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+# WBS 파일에서 읽는 Task 필드 (assigned_worker 등 런타임 상태 제외)
+WBS_TASK_FIELDS: tuple[str, ...] = (
+    "title",
+    "category",
+    "domain",
+    "status",
+    "priority",
+    "assignee",
+    "schedule",
+    "tags",
+    "depends",
+    "blocked_by",
+    "prd_ref",
+    "requirements",
+    "acceptance",
+    "tech_spec",
+    "api_spec",
+    "ui_spec",
+    "raw_content",
+    "execution",
+)
+
+
+@dataclass(frozen=True)
+class WbsDelta:
+    """이전 parse() 대비 Task 변경 내역.
+
+    Attributes:
+        added: 새로 생긴 Task ID (파일 순서)
+        removed: 사라진 Task ID
+        changed: Task ID → 값이 바뀐 WBS 필드 이름
+    """
+
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    changed: dict[str, frozenset[str]] = field(default_factory=dict[str, frozenset[str]])
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """변경된 Task들의 필드 이름 합집합."""
+        return frozenset[str]().union(*self.changed.values())
+
 
 class WbsParseError(Exception):
     """WBS 파싱 오류."""
@@ -73,18 +137,72 @@ def _parse_priority(priority_str: str) -> TaskPriority:
     return priority_map.get(priority_str.lower(), TaskPriority.MEDIUM)
 
 
+@dataclass
+class _ParseResult:
+    """_parse_content() 결과."""
+
+    tasks: list[Task] = field(default_factory=list[Task])
+    delta: WbsDelta = field(default_factory=WbsDelta)
+    added: list[str] = field(default_factory=list[str])
+    changed: dict[str, frozenset[str]] = field(default_factory=dict[str, frozenset[str]])
+    # (기존 Task, 새로 파싱한 Task): 기존 객체에 반영할 변경
+    updates: list[tuple[Task, Task]] = field(default_factory=list[tuple[Task, Task]])
+    wp_sources: dict[str, tuple[dict[str, Any], list[str]]] = field(
+        default_factory=dict[str, tuple[dict[str, Any], list[str]]]
+    )
+    task_sources: dict[str, dict[str, Any]] = field(default_factory=dict[str, dict[str, Any]])
+
+
 class WbsParser:
     """WBS 파일 파서.
 
     wbs.yaml 파일을 파싱하여 Task 리스트를 반환합니다.
     파싱 실패 시 이전 캐시를 반환합니다.
+
+    파일 지문(mtime_ns, size, 내용 해시)이 이전 파싱과 같으면 다시 읽거나 파싱하지 않고
+    캐시를 반환합니다. mtime이 확인 시점과 가까우면(같은 mtime 안에서 다시 수정될 수 있음)
+    stat만 믿지 않고 내용 해시로 확인합니다.
+
+    YAML 로딩 백엔드는 기본적으로 WBS 전용 fast 로더를 사용하고, 지원하지 않는 구문이면
+    libyaml(CSafeLoader) → 순수 Python 순으로 자동 대체합니다 (`orchay.utils.yaml_loader`).
+
+    다시 파싱할 때는 작업 패키지와 Task의 YAML 매핑을 이전 파싱과 비교하여 바뀐 항목만
+    Task로 다시 만들고, 바뀐 필드만 기존 객체에 반영합니다. 변경 내역은 `delta`로 제공합니다.
+
+    `snapshot_dir`를 지정하면 파싱 결과를 바이너리 스냅샷으로 저장하고, 첫 parse()에서
+    파일 내용 해시가 같은 스냅샷이 있으면 YAML을 파싱하지 않고 복원합니다
+    (`orchay.utils.wbs_snapshot`).
     """
 
-    def __init__(self, path: str | Path) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        yaml_backend: YamlBackend = "auto",
+        snapshot_dir: str | Path | None = None,
+    ) -> None:
+        """WbsParser를 초기화합니다.
+
+        Args:
+            path: wbs.yaml 파일 경로
+            yaml_backend: YAML 로딩 백엔드 (기본: auto)
+            snapshot_dir: 시작 스냅샷 디렉토리 (None이면 스냅샷 미사용)
+        """
         self._path = Path(path)
+        self._yaml_backend: YamlBackend = yaml_backend
+        self._snapshot = None if snapshot_dir is None else WbsSnapshot(self._path, snapshot_dir)
+        self._from_snapshot = False
         self._cache: list[Task] = []
         self._metadata: dict[str, Any] = {}
         self._last_parsed: datetime | None = None
+        self._fingerprint: WbsFingerprint | None = None
+        # 지문을 마지막으로 확인한 시각 (time.time_ns)
+        self._checked_ns = 0
+        self._changed = True
+        self._delta = WbsDelta()
+        # 작업 패키지 키 → (YAML 매핑, Task ID 목록)
+        self._wp_sources: dict[str, tuple[dict[str, Any], list[str]]] = {}
+        # Task ID → YAML 매핑
+        self._task_sources: dict[str, dict[str, Any]] = {}
 
     @property
     def project_root(self) -> str | None:
@@ -101,6 +219,50 @@ class WbsParser:
         """전체 메타데이터 반환."""
         return self._metadata.copy()
 
+    @property
+    def fingerprint(self) -> WbsFingerprint | None:
+        """마지막으로 읽은 파일의 지문."""
+        return self._fingerprint
+
+    @property
+    def changed(self) -> bool:
+        """마지막 parse() 호출에서 파일 내용이 바뀌어 다시 파싱했는지 여부.
+
+        False이면 이전 호출과 같은 Task 목록(같은 객체)을 반환한 것이므로
+        필터링/UI 갱신 등 후속 작업을 건너뛸 수 있습니다.
+        """
+        return self._changed
+
+    @property
+    def delta(self) -> WbsDelta:
+        """마지막 parse() 호출의 Task 변경 내역 (다시 파싱하지 않았으면 빈 내역)."""
+        return self._delta
+
+    @property
+    def from_snapshot(self) -> bool:
+        """마지막 parse() 호출에서 YAML 대신 스냅샷으로 Task를 복원했는지 여부."""
+        return self._from_snapshot
+
+    def invalidate(self) -> None:
+        """지문을 폐기하여 다음 parse()에서 파일을 다시 파싱하도록 합니다."""
+        self._fingerprint = None
+
+    def _is_unchanged(self, stat: os.stat_result) -> bool | None:
+        """stat만으로 파일이 바뀌지 않았는지 판별합니다.
+
+        Returns:
+            True: 변경 없음, False: 변경됨, None: 판별 불가 (내용 해시 비교 필요)
+        """
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) != (fingerprint.mtime_ns, fingerprint.size):
+            return False
+        # racy mtime: 확인 직후 같은 mtime 안에서 다시 수정되었을 수 있음
+        if stat.st_mtime_ns + RACY_MTIME_WINDOW_NS >= self._checked_ns:
+            return None
+        return True
+
     async def parse(self) -> list[Task]:
         """wbs.yaml 파일을 파싱하여 Task 리스트 반환.
 
@@ -110,17 +272,42 @@ class WbsParser:
         Note:
             파싱 실패 시 이전 캐시된 결과를 반환합니다.
             기존 Task 객체가 있으면 WBS 필드만 업데이트하고 런타임 상태는 유지합니다.
+            파일이 바뀌지 않았으면 다시 파싱하지 않고 캐시를 반환합니다 (`changed` = False).
+            바뀐 Task는 `delta`로 확인할 수 있습니다.
+            처음 파싱할 때 내용 해시가 같은 스냅샷이 있으면 스냅샷에서 복원합니다.
         """
+        self._changed = False
+        self._from_snapshot = False
+        self._delta = WbsDelta()
         try:
             if not self._path.exists():
                 logger.warning(f"WBS 파일이 존재하지 않습니다: {self._path}")
                 return [] if not self._cache else self._cache
 
-            content = self._path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
+            stat = self._path.stat()
+            unchanged = self._is_unchanged(stat)
+            if unchanged:
+                return self._cache
+
+            checked_ns = time.time_ns()
+            raw = self._path.read_bytes()
+            fingerprint = WbsFingerprint(stat.st_mtime_ns, stat.st_size, content_digest(raw))
+            previous, self._fingerprint = self._fingerprint, fingerprint
+            self._checked_ns = checked_ns
+            if previous is not None and previous.digest == fingerprint.digest:
+                # touch 등 내용 변경 없음
+                return self._cache
+
+            self._changed = True
+            if previous is None and not self._cache and self._load_snapshot(fingerprint.digest):
+                return self._cache
+
+            with profile("wbs.parse"):
+                data = load_yaml(raw.decode("utf-8"), self._yaml_backend)
 
             if not data:
                 logger.warning("YAML 파일이 비어있습니다")
+                self._changed = False
                 return self._cache if self._cache else []
 
             # 메타데이터 저장
@@ -129,96 +316,181 @@ class WbsParser:
                 "wbs": data.get("wbs", {}),
             }
 
-            new_tasks = self._parse_content(data)
+            result = self._parse_content(data)
+            tasks = result.tasks
 
             # 파싱 결과가 비어있고 이전 캐시가 있으면 캐시 반환 (BR-01)
-            if not new_tasks and self._cache:
+            if not tasks and self._cache:
                 logger.warning("파싱 결과 없음. 이전 캐시 반환")
+                self._changed = False
                 return self._cache
 
-            # 기존 캐시가 있으면 기존 객체 업데이트 (런타임 상태 유지)
-            if self._cache:
-                existing_map = {t.id: t for t in self._cache}
-                result: list[Task] = []
-                for new_task in new_tasks:
-                    if new_task.id in existing_map:
-                        # 기존 객체의 WBS 필드만 업데이트, 런타임 상태 유지
-                        existing = existing_map[new_task.id]
-                        self._update_task_fields(existing, new_task)
-                        result.append(existing)
-                    else:
-                        # 새 Task 추가
-                        result.append(new_task)
-                tasks = result
-            else:
-                tasks = new_tasks
+            # 기존 Task 객체에는 바뀐 WBS 필드만 반영 (런타임 상태 유지)
+            for existing, new_task in result.updates:
+                self._update_task_fields(existing, new_task, result.delta.changed[existing.id])
 
             # 캐시 업데이트
             self._cache = tasks
+            self._delta = result.delta
+            self._wp_sources = result.wp_sources
+            self._task_sources = result.task_sources
             self._last_parsed = datetime.now()
 
+            # 상태 업데이트용 줄 위치 인덱스 (같은 내용이면 캐시 재사용)
+            get_line_index(self._path, raw, fingerprint.digest)
+
+            if self._snapshot is not None and tasks:
+                await self._snapshot.save(
+                    fingerprint.digest,
+                    tasks,
+                    self._metadata,
+                    changed=[*result.added, *result.changed],
+                )
+
             return tasks
 
         except Exception as e:
             logger.error(f"WBS 파싱 오류: {e}")
-            # 캐시 반환
+            # 캐시 반환 (같은 내용이면 다음 호출에서 다시 파싱하지 않음)
+            self._changed = False
             return self._cache
 
-    def _update_task_fields(self, existing: Task, new: Task) -> None:
+    def _load_snapshot(self, digest: str) -> bool:
+        """내용 해시가 같은 스냅샷으로 캐시를 채웁니다.
+
+        줄 위치 인덱스는 만들지 않습니다 (첫 상태 업데이트 시 writer가 만듦).
+        파일과 Task의 비교 기준(YAML 매핑)이 없으므로 다음 파싱은 모든 Task를 필드 단위로
+        비교합니다.
+
+        Returns:
+            스냅샷 사용 여부
+        """
+        if self._snapshot is None:
+            return False
+        loaded = self._snapshot.load(digest)
+        if loaded is None or not loaded[0]:
+            return False
+        tasks, metadata = loaded
+        self._cache = tasks
+        self._metadata = metadata
+        self._delta = WbsDelta(added=tuple(dict.fromkeys(t.id for t in tasks)))
+        self._last_parsed = datetime.now()
+        self._from_snapshot = True
+        return True
+
+    def _update_task_fields(
+        self, existing: Task, new: Task, fields: Iterable[str] = WBS_TASK_FIELDS
+    ) -> None:
         """기존 Task 객체의 WBS 필드만 업데이트.
 
         런타임 상태(assigned_worker)는 유지합니다.
         """
-        # WBS에서 파싱되는 필드만 업데이트
-        existing.title = new.title
-        existing.category = new.category
-        existing.domain = new.domain
-        existing.status = new.status
-        existing.priority = new.priority
-        existing.assignee = new.assignee
-        existing.schedule = new.schedule
-        existing.tags = new.tags
-        existing.depends = new.depends
-        existing.blocked_by = new.blocked_by
-        existing.prd_ref = new.prd_ref
-        existing.requirements = new.requirements
-        existing.acceptance = new.acceptance
-        existing.tech_spec = new.tech_spec
-        existing.api_spec = new.api_spec
-        existing.ui_spec = new.ui_spec
-        existing.raw_content = new.raw_content
-        existing.execution = new.execution
-        # assigned_worker는 업데이트하지 않음 (런타임 상태)
-
-    def _parse_content(self, data: dict[str, Any]) -> list[Task]:
-        """YAML 데이터를 파싱하여 Task 리스트 반환."""
-        tasks: list[Task] = []
+        for name in fields:
+            setattr(existing, name, getattr(new, name))
+
+    def _parse_content(self, data: dict[str, Any]) -> _ParseResult:
+        """YAML 데이터를 파싱하여 Task 리스트와 이전 파싱 대비 변경 내역 반환.
+
+        YAML 매핑이 이전과 같은 작업 패키지/Task는 기존 Task 객체를 그대로 사용하고,
+        바뀐 Task만 새로 만들어 기존 객체와 필드 단위로 비교합니다. 기존 객체 갱신은
+        호출자가 `updates`로 수행합니다.
+        """
+        previous = {t.id: t for t in self._cache}
+        result = _ParseResult()
+        seen: set[str] = set()
 
         work_packages = data.get("workPackages", [])
         if not isinstance(work_packages, list):
-            return tasks
+            work_packages = []
 
         work_packages_list = cast(list[Any], work_packages)
-        for wp in work_packages_list:
+        for position, wp in enumerate(work_packages_list):
             if not isinstance(wp, dict):
                 continue
 
             wp_dict = cast(dict[str, Any], wp)
-            wp_tasks = wp_dict.get("tasks", [])
-            if not isinstance(wp_tasks, list):
+            wp_key = str(wp_dict.get("id") or f"#{position}")
+            if wp_key in result.wp_sources:
+                wp_key = f"{wp_key}#{position}"
+
+            # 작업 패키지 전체가 그대로면 Task 비교 생략
+            cached = self._wp_sources.get(wp_key)
+            if (
+                cached is not None
+                and cached[0] == wp_dict
+                and all(i in previous and i not in seen for i in cached[1])
+            ):
+                for task_id in cached[1]:
+                    result.tasks.append(previous[task_id])
+                    result.task_sources[task_id] = self._task_sources[task_id]
+                seen.update(cached[1])
+                result.wp_sources[wp_key] = cached
                 continue
 
-            wp_tasks_list = cast(list[Any], wp_tasks)
-            for task_data in wp_tasks_list:
-                if not isinstance(task_data, dict):
-                    continue
+            wp_task_ids: list[str] = []
+            wp_tasks = wp_dict.get("tasks", [])
+            if isinstance(wp_tasks, list):
+                for task_data in cast(list[Any], wp_tasks):
+                    if not isinstance(task_data, dict):
+                        continue
+                    task_dict = cast(dict[str, Any], task_data)
+                    task = self._diff_task(task_dict, previous, seen, result)
+                    if task is not None:
+                        wp_task_ids.append(task.id)
+            result.wp_sources[wp_key] = (wp_dict, wp_task_ids)
+
+        result.delta = WbsDelta(
+            added=tuple(result.added),
+            removed=tuple(i for i in previous if i not in seen),
+            changed=result.changed,
+        )
+        return result
+
+    def _diff_task(
+        self,
+        data: dict[str, Any],
+        previous: dict[str, Task],
+        seen: set[str],
+        result: _ParseResult,
+    ) -> Task | None:
+        """Task 매핑을 이전 파싱과 비교하여 결과에 추가합니다.
+
+        Returns:
+            변경 추적 대상 Task (생성 실패 또는 중복 ID면 None)
+        """
+        task_id = str(data.get("id", ""))
+        existing = previous.get(task_id)
+        if task_id in seen:
+            # 중복 ID: 변경 추적 없이 새 객체로 추가
+            task = self._create_task(data)
+            if task is not None:
+                result.tasks.append(task)
+            return None
 
-                task_dict = cast(dict[str, Any], task_data)
-                task = self._create_task(task_dict)
-                if task:
-                    tasks.append(task)
+        if existing is not None and self._task_sources.get(task_id) == data:
+            task = existing
+        else:
+            new_task = self._create_task(data)
+            if new_task is None:
+                return None
+            if existing is None:
+                task = new_task
+                result.added.append(task_id)
+            else:
+                task = existing
+                fields = frozenset(
+                    name
+                    for name in WBS_TASK_FIELDS
+                    if getattr(existing, name) != getattr(new_task, name)
+                )
+                if fields:
+                    result.changed[task_id] = fields
+                    result.updates.append((existing, new_task))
 
-        return tasks
+        seen.add(task_id)
+        result.tasks.append(task)
+        result.task_sources[task_id] = data
+        return task
 
     def _create_task(self, data: dict[str, Any]) -> Task | None:
         """딕셔너리에서 Task 객체 생성."""
@@ -370,47 +642,24 @@ STATUS_CODE_TO_NAME: dict[str, str] = {
 }
 
 
-def _find_task_in_yaml(
-    data: dict[str, Any], task_id: str
-) -> tuple[dict[str, Any] | None, int, int]:
-    """YAML 데이터에서 Task를 찾아 반환.
-
-    Returns:
-        (task_dict, wp_index, task_index) 또는 (None, -1, -1)
-    """
-    work_packages = data.get("workPackages", [])
-    if not isinstance(work_packages, list):
-        return None, -1, -1
-
-    work_packages_list = cast(list[Any], work_packages)
-    for wp_idx, wp in enumerate(work_packages_list):
-        if not isinstance(wp, dict):
-            continue
-        wp_dict = cast(dict[str, Any], wp)
-        tasks = wp_dict.get("tasks", [])
-        if not isinstance(tasks, list):
-            continue
-        tasks_list = cast(list[Any], tasks)
-        for task_idx, task in enumerate(tasks_list):
-            if isinstance(task, dict):
-                task_dict = cast(dict[str, Any], task)
-                if task_dict.get("id") == task_id:
-                    return task_dict, wp_idx, task_idx
-
-    return None, -1, -1
-
-
 async def update_task_status(
     wbs_path: Path,
     task_id: str,
     new_status_code: str,
+    expected_status: str | None = None,
 ) -> bool:
     """WBS 파일의 Task 상태 코드를 업데이트.
 
+    공용 `WbsWriter`(`orchay.wbs_writer`)를 통해 저장합니다. 동시에 들어온 변경은
+    한 번의 쓰기로 묶이고, 쓰기 동안 wbs.yaml 잠금 파일을 잡습니다. status 값만
+    고쳐 쓰므로 주석과 포맷이 유지됩니다.
+
     Args:
         wbs_path: wbs.yaml 파일 경로
         task_id: 업데이트할 Task ID (예: TSK-01-01)
         new_status_code: 새 상태 코드 (예: "[ap]", "[im]")
+        expected_status: 현재 상태로 기대하는 코드. 파일의 상태가 다르면(외부에서
+            먼저 변경됨) 덮어쓰지 않고 False 반환 (None이면 확인하지 않음)
 
     Returns:
         성공 여부
@@ -422,40 +671,14 @@ async def update_task_status(
             "[ap]"
         )
     """
-    try:
-        if not wbs_path.exists():
-            logger.error(f"WBS 파일이 존재하지 않습니다: {wbs_path}")
-            return False
-
-        content = wbs_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
-
-        if not data:
-            logger.error("YAML 파일이 비어있습니다")
-            return False
-
-        task, _wp_idx, _task_idx = _find_task_in_yaml(data, task_id)
-        if task is None:
-            logger.warning(f"[{task_id}] Task를 찾을 수 없습니다")
-            return False
-
-        current_code = task.get("status", "[ ]")
-        if current_code == new_status_code:
-            logger.info(f"[{task_id}] 상태가 이미 {new_status_code}입니다")
-            return True
-
-        # 상태 업데이트
-        task["status"] = new_status_code
-        logger.info(f"[{task_id}] 상태 변경: {current_code} → {new_status_code}")
-
-        # YAML 저장 (원본 포맷 유지를 위해 커스텀 덤프 사용)
-        _save_yaml(wbs_path, data)
-        return True
-
-    except Exception as e:
-        logger.error(f"WBS 상태 업데이트 오류: {e}")
+    if not wbs_path.exists():
+        logger.error(f"WBS 파일이 존재하지 않습니다: {wbs_path}")
         return False
 
+    writer = get_wbs_writer(wbs_path)
+    outcome = await writer.set_status(task_id, new_status_code, expected_status)
+    return outcome in ("applied", "unchanged")
+
 
 async def update_task_blocked_by(
     wbs_path: Path,
@@ -464,6 +687,8 @@ async def update_task_blocked_by(
 ) -> bool:
     """WBS 파일의 Task blocked-by 속성을 업데이트.
 
+    `update_task_status`와 같이 공용 `WbsWriter`로 blocked-by 줄만 변경/추가/제거합니다.
+
     Args:
         wbs_path: wbs.yaml 파일 경로
         task_id: 업데이트할 Task ID (예: TSK-01-01)
@@ -478,63 +703,26 @@ async def update_task_blocked_by(
         # 복구
         await update_task_blocked_by(path, "TSK-01-01", None)
     """
-    try:
-        if not wbs_path.exists():
-            logger.error(f"WBS 파일이 존재하지 않습니다: {wbs_path}")
-            return False
-
-        content = wbs_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
-
-        if not data:
-            logger.error("YAML 파일이 비어있습니다")
-            return False
-
-        task, _wp_idx, _task_idx = _find_task_in_yaml(data, task_id)
-        if task is None:
-            logger.warning(f"[{task_id}] Task를 찾을 수 없습니다")
-            return False
-
-        if blocked_by:
-            task["blocked-by"] = blocked_by
-            logger.info(f"[{task_id}] blocked-by 설정: {blocked_by}")
-        else:
-            # blocked-by 필드 제거
-            if "blocked-by" in task:
-                del task["blocked-by"]
-            if "blockedBy" in task:
-                del task["blockedBy"]
-            logger.info(f"[{task_id}] blocked-by 제거")
-
-        _save_yaml(wbs_path, data)
-        return True
-
-    except Exception as e:
-        logger.error(f"WBS blocked-by 업데이트 오류: {e}")
+    if not wbs_path.exists():
+        logger.error(f"WBS 파일이 존재하지 않습니다: {wbs_path}")
         return False
 
-
-def _save_yaml(path: Path, data: dict[str, Any]) -> None:
-    """YAML 파일을 저장 (한글 및 포맷 유지)."""
-    # 커스텀 Dumper 설정 (한글 출력 지원)
-    yaml_content = yaml.dump(
-        data,
-        allow_unicode=True,
-        default_flow_style=False,
-        sort_keys=False,
-        indent=2,
-        width=120,
-    )
-    path.write_text(yaml_content, encoding="utf-8")
+    writer = get_wbs_writer(wbs_path)
+    outcome = await writer.set_blocked_by(task_id, blocked_by)
+    return outcome in ("applied", "unchanged")
 
 
 class WbsFileHandler(FileSystemEventHandler):
-    """WBS 파일 변경 이벤트 핸들러."""
+    """WBS 파일 변경 이벤트 핸들러.
+
+    수정뿐 아니라 생성/이동(임시 파일 + rename으로 교체하는 원자적 쓰기) 이벤트도
+    감지하며, 마지막 이벤트 후 debounce 초가 지나면 이벤트 루프에서 콜백을 실행합니다.
+    """
 
     def __init__(
         self,
         wbs_path: Path,
-        callback: Callable[[list[Task]], Awaitable[None]],
+        callback: Callable[[], Awaitable[None]],
         debounce: float,
         loop: asyncio.AbstractEventLoop,
     ) -> None:
@@ -543,75 +731,104 @@ class WbsFileHandler(FileSystemEventHandler):
         self._debounce = debounce
         self._loop = loop
         self._pending_task: asyncio.Task[None] | None = None
-        self._parser = WbsParser(wbs_path)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """파일 수정 이벤트 처리."""
-        if event.is_directory:
-            return
+        self._handle(event, event.src_path)
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """파일 생성 이벤트 처리."""
+        self._handle(event, event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """파일 이동 이벤트 처리 (rename으로 wbs.yaml 교체)."""
+        self._handle(event, event.dest_path)
 
-        src_path = event.src_path
-        if isinstance(src_path, bytes):
-            src_path = src_path.decode("utf-8")
+    def _handle(self, event: FileSystemEvent, path: str | bytes) -> None:
+        """wbs.yaml 이벤트면 디바운스 콜백을 (다시) 예약합니다 (watchdog 스레드)."""
+        if event.is_directory or not path:
+            return
 
-        event_path = Path(src_path)
-        if event_path.name != self._wbs_path.name:
+        if isinstance(path, bytes):
+            path = path.decode("utf-8")
+        if Path(path).name != self._wbs_path.name:
             return
 
-        # 디바운싱: 이전 대기 중인 태스크 취소
+        with contextlib.suppress(RuntimeError):  # 이벤트 루프 종료됨
+            self._loop.call_soon_threadsafe(self._reschedule)
+
+    def _reschedule(self) -> None:
+        """디바운싱: 이전 대기 중인 콜백을 취소하고 새로 예약합니다 (이벤트 루프)."""
         if self._pending_task and not self._pending_task.done():
             self._pending_task.cancel()
+        self._pending_task = self._loop.create_task(self._debounced_callback())
 
-        # 새 태스크 예약
-        future = asyncio.run_coroutine_threadsafe(self._debounced_callback(), self._loop)
-        with contextlib.suppress(Exception):
-            self._pending_task = future.result(timeout=1.0)
-
-    async def _debounced_callback(self) -> asyncio.Task[None]:
+    async def _debounced_callback(self) -> None:
         """디바운스된 콜백 실행."""
-
-        async def delayed_callback() -> None:
-            await asyncio.sleep(self._debounce)
-            tasks = await self._parser.parse()
-            await self._callback(tasks)
-
-        return asyncio.create_task(delayed_callback())
+        await asyncio.sleep(self._debounce)
+        try:
+            await self._callback()
+        except Exception as e:
+            logger.error(f"WBS 변경 콜백 오류: {e}")
 
 
 class WbsWatcher:
     """WBS 파일 감시자.
 
     wbs.yaml 파일 변경을 감지하고 콜백을 실행합니다.
+
+    `callback`은 파일을 파싱한 Task 목록을 받고, `on_change`는 파싱 없이 변경
+    알림만 받습니다 (직접 파싱 시점을 정하는 Orchestrator 등에서 사용).
     """
 
     def __init__(
         self,
         path: str | Path,
-        callback: Callable[[list[Task]], Awaitable[None]],
+        callback: Callable[[list[Task]], Awaitable[None]] | None = None,
         debounce: float = 0.5,
+        on_change: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
+        if callback is None and on_change is None:
+            raise ValueError("callback 또는 on_change가 필요합니다")
         self._path = Path(path)
         self._callback = callback
+        self._on_change = on_change
         self._debounce = debounce
         self._observer: BaseObserver | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._parser: WbsParser | None = None
+
+    @property
+    def active(self) -> bool:
+        """감시 중 여부."""
+        return self._observer is not None
 
     def start(self) -> None:
         """파일 감시 시작."""
         self._loop = asyncio.get_event_loop()
         handler = WbsFileHandler(
             self._path,
-            self._callback,
+            self._notify,
             self._debounce,
             self._loop,
         )
 
-        self._observer = Observer()
-        self._observer.schedule(handler, str(self._path.parent), recursive=False)  # type: ignore[arg-type]
-        self._observer.start()
+        observer = Observer()
+        observer.schedule(handler, str(self._path.parent), recursive=False)  # type: ignore[arg-type]
+        observer.start()
+        self._observer = observer
 
         logger.info(f"WBS 파일 감시 시작: {self._path}")
 
+    async def _notify(self) -> None:
+        """변경 알림 (on_change) 또는 파싱 결과 콜백 실행."""
+        if self._on_change is not None:
+            await self._on_change()
+        if self._callback is not None:
+            if self._parser is None:
+                self._parser = WbsParser(self._path)
+            await self._callback(await self._parser.parse())
+
     async def stop(self) -> None:
         """파일 감시 중지."""
         if self._observer:
@@ -0,0 +1,453 @@
+"""WBS 쓰기 모듈.
+
+wbs.yaml의 Task 상태/blocked-by 변경을 한 곳(`WbsWriter`)에서 처리합니다.
+
+- 같은 이벤트 루프 반복(또는 `window` 초) 안에 들어온 변경을 모아 한 번에 씁니다.
+  같은 Task/필드 변경이 여러 번이면 마지막 값만 씁니다.
+- 쓰기 동안 `wbs.yaml.lock` 파일에 advisory lock(POSIX: flock, Windows: msvcrt)을
+  잡습니다. 외부 writer(Worker pane의 /wf 스킬 등)도 같은 잠금 파일을 사용하면
+  (예: `flock wbs.yaml.lock <명령>`) 서로의 변경을 덮어쓰지 않습니다.
+- 잠금 안에서 파일을 다시 읽고 변경을 적용하므로 다른 Task에 대한 외부 변경은
+  유지됩니다. 상태 변경에 기대 상태(`expected`)를 주면, 파일의 현재 상태가
+  기대 상태와 다를 때(외부에서 먼저 바뀜) 덮어쓰지 않고 `conflict`로 보고합니다.
+- 잠금을 사용하지 않는 writer가 읽기와 쓰기 사이에 파일을 바꾸면(stat 변화)
+  다시 읽어 적용합니다.
+
+Example:
+    ```python
+    writer = get_wbs_writer(wbs_path)
+    results = await asyncio.gather(
+        writer.set_status("TSK-01-01", "[ap]", expected="[dd]"),
+        writer.set_status("TSK-01-02", "[ap]", expected="[dd]"),
+    )  # 파일 쓰기 1회
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import sys
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Literal, cast
+
+from orchay.utils.wbs_index import (
+    BLOCKED_BY_KEYS,
+    WbsLineIndex,
+    discard_line_index,
+    get_line_index,
+    store_line_index,
+    write_atomic,
+)
+from orchay.utils.yaml_loader import dump_yaml, load_yaml
+
+logger = logging.getLogger(__name__)
+
+WbsField = Literal["status", "blocked_by"]
+
+# applied: 변경됨, unchanged: 이미 같은 값, conflict: 기대 상태와 다름,
+# not_found: Task 없음, failed: 파일 없음/잠금 시간 초과/쓰기 오류
+WriteOutcome = Literal["applied", "unchanged", "conflict", "not_found", "failed"]
+
+# 잠금 획득 재시도 간격 (초)
+_LOCK_POLL_INTERVAL = 0.02
+
+# 잠금 없는 외부 편집으로 재시도하는 최대 횟수
+_MAX_ATTEMPTS = 3
+
+
+class WbsLockTimeout(TimeoutError):
+    """wbs.yaml 잠금을 제한 시간 안에 얻지 못함."""
+
+
+def lock_path_for(path: Path) -> Path:
+    """wbs.yaml 잠금 파일 경로 (같은 디렉토리의 `{이름}.lock`)."""
+    return path.with_name(f"{path.name}.lock")
+
+
+def _try_lock(fd: int) -> bool:
+    """잠금 파일에 배타적 잠금을 시도합니다 (대기하지 않음)."""
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    """잠금을 해제합니다."""
+    if sys.platform == "win32":
+        import msvcrt
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextlib.asynccontextmanager
+async def wbs_lock(path: Path, timeout: float = 10.0) -> AsyncGenerator[None]:
+    """wbs.yaml advisory lock을 잡습니다 (대기 중에는 이벤트 루프를 막지 않음).
+
+    Args:
+        path: wbs.yaml 경로
+        timeout: 최대 대기 시간 (초)
+
+    Raises:
+        WbsLockTimeout: 제한 시간 안에 잠금을 얻지 못했을 때
+    """
+    fd = os.open(lock_path_for(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(fd):
+            if time.monotonic() >= deadline:
+                raise WbsLockTimeout(f"WBS 잠금 대기 시간 초과: {lock_path_for(path)}")
+            await asyncio.sleep(_LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass(frozen=True)
+class WbsMutation:
+    """Task 하나의 필드 변경.
+
+    Attributes:
+        task_id: Task ID
+        field: 변경할 필드 (status, blocked_by)
+        value: 새 값 (blocked_by는 None이면 제거)
+        expected: 적용 전 기대 상태 (status만, None이면 확인하지 않음)
+    """
+
+    task_id: str
+    field: WbsField
+    value: str | None
+    expected: str | None = None
+
+
+@dataclass
+class _Pending:
+    """쓰기 대기 중인 변경과 결과를 기다리는 호출자."""
+
+    mutation: WbsMutation
+    futures: list[asyncio.Future[WriteOutcome]] = field(
+        default_factory=list[asyncio.Future[WriteOutcome]]
+    )
+
+
+class WbsWriter:
+    """wbs.yaml 단일 writer (변경 묶음 쓰기 + 파일 잠금 + 충돌 감지)."""
+
+    def __init__(self, path: str | Path, window: float = 0.0, lock_timeout: float = 10.0) -> None:
+        """WbsWriter를 초기화합니다.
+
+        Args:
+            path: wbs.yaml 경로
+            window: 첫 변경 후 쓰기 전까지 추가 변경을 모으는 시간 (초, 0이면 같은
+                이벤트 루프 반복에 들어온 변경만)
+            lock_timeout: 잠금 최대 대기 시간 (초)
+        """
+        self._path = Path(path)
+        self._window = window
+        self._lock_timeout = lock_timeout
+        self._pending: dict[tuple[str, WbsField], _Pending] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        # 파일 쓰기 횟수 / 충돌 수 (측정용)
+        self.writes = 0
+        self.conflicts = 0
+
+    @property
+    def path(self) -> Path:
+        """wbs.yaml 경로."""
+        return self._path
+
+    @property
+    def window(self) -> float:
+        """첫 변경 후 쓰기 전까지 추가 변경을 모으는 시간 (초)."""
+        return self._window
+
+    @window.setter
+    def window(self, value: float) -> None:
+        self._window = value
+
+    @property
+    def pending(self) -> int:
+        """쓰기 대기 중인 변경 수."""
+        return len(self._pending)
+
+    async def set_status(
+        self, task_id: str, status_code: str, expected: str | None = None
+    ) -> WriteOutcome:
+        """Task 상태 코드를 변경합니다.
+
+        Args:
+            task_id: Task ID
+            status_code: 새 상태 코드 (예: "[ap]")
+            expected: 현재 상태로 기대하는 코드 (다르면 conflict)
+
+        Returns:
+            처리 결과
+        """
+        return await self.submit(WbsMutation(task_id, "status", status_code, expected))
+
+    async def set_blocked_by(self, task_id: str, blocked_by: str | None) -> WriteOutcome:
+        """Task blocked-by를 설정하거나 제거합니다.
+
+        Args:
+            task_id: Task ID
+            blocked_by: blocked-by 값 (None이면 제거)
+
+        Returns:
+            처리 결과
+        """
+        return await self.submit(WbsMutation(task_id, "blocked_by", blocked_by))
+
+    async def submit(self, mutation: WbsMutation) -> WriteOutcome:
+        """변경을 대기열에 넣고 파일에 반영될 때까지 기다립니다.
+
+        Args:
+            mutation: 변경 내용
+
+        Returns:
+            처리 결과
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[WriteOutcome] = loop.create_future()
+        key = (mutation.task_id, mutation.field)
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = _Pending(mutation, [future])
+        else:
+            # 같은 Task/필드: 마지막 값으로 합치고 처음 기대 상태 유지
+            pending.mutation = replace(mutation, expected=pending.mutation.expected)
+            pending.futures.append(future)
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+        return await future
+
+    async def flush(self) -> None:
+        """대기 중인 변경을 즉시 파일에 씁니다."""
+        while self._pending:
+            batch, self._pending = self._pending, {}
+            mutations = [p.mutation for p in batch.values()]
+            try:
+                async with wbs_lock(self._path, self._lock_timeout):
+                    outcomes = self._apply(mutations)
+            except Exception as e:
+                logger.error(f"WBS 쓰기 오류: {e}")
+                outcomes: list[WriteOutcome] = ["failed"] * len(mutations)
+
+            for pending, outcome in zip(batch.values(), outcomes, strict=True):
+                for future in pending.futures:
+                    if not future.done():
+                        future.set_result(outcome)
+
+    async def _flush_later(self) -> None:
+        """window 뒤(0이면 다음 루프 반복에) 대기열을 씁니다."""
+        await asyncio.sleep(self._window)
+        await self.flush()
+
+    def _apply(self, mutations: list[WbsMutation]) -> list[WriteOutcome]:
+        """잠금 안에서 파일을 읽고 변경을 적용해 한 번에 씁니다."""
+        if not self._path.exists():
+            logger.error(f"WBS 파일이 존재하지 않습니다: {self._path}")
+            return ["failed"] * len(mutations)
+
+        for _ in range(_MAX_ATTEMPTS):
+            before = _file_id(self._path.stat())
+            raw = self._path.read_bytes()
+            index = get_line_index(self._path, raw)
+            try:
+                outcomes, new_raw, patched_only = self._patch(raw, index, mutations)
+                if new_raw == raw:
+                    return outcomes
+                if _file_id(self._path.stat()) != before:
+                    # 잠금을 사용하지 않는 writer가 그 사이 파일을 바꿈 → 다시 읽어 적용
+                    logger.warning("WBS 파일이 쓰기 도중 외부에서 변경됨. 다시 적용합니다")
+                    discard_line_index(self._path)
+                    continue
+                write_atomic(self._path, new_raw)
+            except BaseException:
+                discard_line_index(self._path)
+                raise
+
+            self.writes += 1
+            if patched_only:
+                store_line_index(self._path, new_raw, index)
+            else:
+                discard_line_index(self._path)
+            changed = outcomes.count("applied")
+            logger.debug(f"WBS 저장: 변경 {changed}건 (요청 {len(mutations)}건)")
+            return outcomes
+
+        logger.error("WBS 파일이 계속 외부에서 변경되어 저장하지 못했습니다")
+        return ["failed"] * len(mutations)
+
+    def _patch(
+        self, raw: bytes, index: WbsLineIndex, mutations: list[WbsMutation]
+    ) -> tuple[list[WriteOutcome], bytes, bool]:
+        """변경을 줄 단위 패치로 적용하고, 불가능한 변경은 전체 로드/덤프로 적용합니다.
+
+        Returns:
+            (변경별 결과, 새 파일 내용, 줄 단위 패치만 사용했는지)
+        """
+        outcomes: list[WriteOutcome] = []
+        fallback: list[int] = []
+        for i, mutation in enumerate(mutations):
+            lines = index.tasks.get(mutation.task_id)
+            if lines is None:
+                fallback.append(i)
+                outcomes.append("not_found")
+                continue
+            if mutation.field == "status":
+                current: str | None = lines.status
+            else:
+                current = next(
+                    (str(lines.keys[k].value) for k in BLOCKED_BY_KEYS if k in lines.keys),
+                    None,
+                )
+            outcome = self._check(mutation, current)
+            outcomes.append(outcome)
+            if outcome != "applied":
+                continue
+            if mutation.field == "status":
+                patched = index.set_status(raw, mutation.task_id, str(mutation.value))
+            else:
+                patched = index.set_blocked_by(raw, mutation.task_id, mutation.value)
+            if patched is None:
+                fallback.append(i)
+            else:
+                raw = patched
+                _log_applied(mutation, current)
+
+        if not fallback:
+            return outcomes, raw, True
+
+        # 줄 단위로 처리할 수 없는 형식: 전체 로드/덤프
+        data = load_yaml(raw.decode("utf-8"))
+        changed = False
+        for i in fallback:
+            mutation = mutations[i]
+            task = (
+                _find_task_in_yaml(cast(dict[str, Any], data), mutation.task_id)
+                if isinstance(data, dict)
+                else None
+            )
+            if task is None:
+                logger.warning(f"[{mutation.task_id}] Task를 찾을 수 없습니다")
+                outcomes[i] = "not_found"
+                continue
+            if mutation.field == "status":
+                current = str(task.get("status", "[ ]"))
+            else:
+                value = next((task[k] for k in BLOCKED_BY_KEYS if k in task), None)
+                current = None if value is None else str(value)
+            outcomes[i] = self._check(mutation, current)
+            if outcomes[i] != "applied":
+                continue
+            if mutation.field == "status":
+                task["status"] = mutation.value
+            else:
+                for key in BLOCKED_BY_KEYS:
+                    task.pop(key, None)
+                if mutation.value:
+                    task["blocked-by"] = mutation.value
+            changed = True
+            _log_applied(mutation, current)
+
+        if changed:
+            raw = dump_yaml(cast(dict[str, Any], data)).encode("utf-8")
+        return outcomes, raw, False
+
+    def _check(self, mutation: WbsMutation, current: str | None) -> WriteOutcome:
+        """현재 값과 비교하여 적용 여부를 결정합니다 (applied/unchanged/conflict)."""
+        if current == mutation.value:
+            if mutation.field == "status":
+                logger.info(f"[{mutation.task_id}] 상태가 이미 {mutation.value}입니다")
+            return "unchanged"
+        if (
+            mutation.field == "status"
+            and mutation.expected is not None
+            and current != mutation.expected
+        ):
+            self.conflicts += 1
+            logger.warning(
+                f"[{mutation.task_id}] 상태 충돌: {mutation.expected} → {mutation.value} "
+                f"요청, 현재 {current}. 변경하지 않습니다"
+            )
+            return "conflict"
+        return "applied"
+
+
+def _log_applied(mutation: WbsMutation, current: str | None) -> None:
+    """적용된 변경을 기록합니다."""
+    task_id = mutation.task_id
+    if mutation.field == "status":
+        logger.info(f"[{task_id}] 상태 변경: {current} → {mutation.value}")
+    elif mutation.value:
+        logger.info(f"[{task_id}] blocked-by 설정: {mutation.value}")
+    else:
+        logger.info(f"[{task_id}] blocked-by 제거")
+
+
+def _file_id(stat: os.stat_result) -> tuple[int, int, int]:
+    """파일 변경 판별용 (inode, mtime_ns, size)."""
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _find_task_in_yaml(data: dict[str, Any], task_id: str) -> dict[str, Any] | None:
+    """YAML 데이터의 workPackages[].tasks[]에서 Task를 찾습니다."""
+    work_packages = data.get("workPackages", [])
+    if not isinstance(work_packages, list):
+        return None
+    for wp in cast(list[Any], work_packages):
+        if not isinstance(wp, dict):
+            continue
+        tasks = cast(dict[str, Any], wp).get("tasks", [])
+        if not isinstance(tasks, list):
+            continue
+        for task in cast(list[Any], tasks):
+            if isinstance(task, dict) and cast(dict[str, Any], task).get("id") == task_id:
+                return cast(dict[str, Any], task)
+    return None
+
+
+# 파일별 writer: 경로 → WbsWriter
+_WRITERS: dict[Path, WbsWriter] = {}
+
+
+def get_wbs_writer(path: str | Path, window: float | None = None) -> WbsWriter:
+    """wbs.yaml 경로의 공용 WbsWriter를 반환합니다 (경로당 하나).
+
+    Args:
+        path: wbs.yaml 경로
+        window: 변경을 모으는 시간 (초, None이면 기존 값 유지 - 처음 만들 때는 0)
+
+    Returns:
+        WbsWriter
+    """
+    key = Path(path).resolve()
+    writer = _WRITERS.get(key)
+    if writer is None:
+        writer = _WRITERS[key] = WbsWriter(key)
+    if window is not None:
+        writer.window = window
+    return writer
@@ -3,18 +3,24 @@
 Worker pane의 출력을 분석하여 상태를 감지합니다.
 """
 
+from __future__ import annotations
+
 import logging
 import re
 import time
 import zoneinfo
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from orchay.domain.constants import WORKER_DETECTION
 from orchay.models.worker import PausedInfo
 from orchay.utils.wezterm import pane_exists, wezterm_get_text
 
+if TYPE_CHECKING:
+    from orchay.utils.pane_snapshot import PaneSnapshot
+    from orchay.utils.signal_listener import WorkerSignal
+
 logger = logging.getLogger(__name__)
 
 # 모듈 시작 시간 (idle 감지 지연용)
@@ -218,12 +224,64 @@ def parse_done_signal(text: str) -> DoneInfo | None:
     return None
 
 
+def build_paused_info(text: str) -> PausedInfo:
+    """일시 중단 텍스트에서 재개 시간을 파싱하여 PausedInfo를 만듭니다.
+
+    Args:
+        text: rate limit 메시지가 포함된 텍스트
+
+    Returns:
+        PausedInfo (시간 파싱 실패 시 30분 뒤 재개)
+    """
+    detected_at = datetime.now(zoneinfo.ZoneInfo("Asia/Seoul"))
+    try:
+        resume_at = parse_resume_time(text, detected_at)
+    except ValueError:
+        # 시간 파싱 실패 시 fallback: 30분 뒤
+        resume_at = get_fallback_resume_time(detected_at)
+        logger.info(f"Token limit detected (no time), using fallback: {resume_at}")
+        return PausedInfo(
+            reason="rate limit",
+            resume_at=resume_at,
+            detected_at=detected_at,
+            message="fallback: 30 minutes",
+        )
+
+    logger.info(f"Token limit detected, resuming at {resume_at}")
+    return PausedInfo(
+        reason="rate limit",
+        resume_at=resume_at,
+        detected_at=detected_at,
+        message=text[:200],  # 처음 200자만 저장
+    )
+
+
 WorkerState = Literal["dead", "done", "paused", "error", "blocked", "idle", "busy"]
 
 
+def state_from_signal(
+    signal: WorkerSignal,
+) -> tuple[WorkerState, DoneInfo | PausedInfo | None] | None:
+    """Worker가 직접 보낸 신호를 상태로 변환합니다.
+
+    Args:
+        signal: 신호 수신기로 받은 신호
+
+    Returns:
+        (상태, DoneInfo/PausedInfo 또는 None) 튜플. 해석할 수 없으면 None.
+    """
+    if signal.kind == "done":
+        done_info = parse_done_signal(signal.payload)
+        return ("done", done_info) if done_info else None
+    if signal.kind == "paused":
+        return "paused", build_paused_info(signal.payload)
+    return "error", None
+
+
 async def detect_worker_state(
     pane_id: int,
     has_active_task: bool = False,
+    snapshot: PaneSnapshot | None = None,
 ) -> tuple[WorkerState, DoneInfo | PausedInfo | None]:
     """Worker 상태를 감지합니다.
 
@@ -234,6 +292,7 @@ async def detect_worker_state(
         has_active_task: Worker가 현재 Task를 실행 중인지 여부.
             True면 프롬프트로 idle 감지하지 않음 (ORCHAY_DONE만으로 완료 판정).
             False면 프롬프트로 idle 감지 허용 (시작 시, Task 완료 후).
+        snapshot: tick 단위 pane 스냅샷 (있으면 CLI 재호출 없이 캐시 사용)
 
     Returns:
         (상태, DoneInfo/PausedInfo 또는 None) 튜플
@@ -242,14 +301,23 @@ async def detect_worker_state(
         - 그 외: None
     """
     # 0. pane 존재 확인
-    if not await pane_exists(pane_id):
+    exists = await snapshot.pane_exists(pane_id) if snapshot else await pane_exists(pane_id)
+    if not exists:
         return "dead", None
 
+    # push 신호가 있으면 pane 텍스트 분석 없이 바로 반영 (폴링은 fallback)
+    signal = snapshot.take_signal(pane_id) if snapshot else None
+    if signal:
+        pushed = state_from_signal(signal)
+        if pushed:
+            return pushed
+
     # 1. pane 텍스트 조회 (100줄 - DONE 신호 + 기본 상태 모두 처리)
     # 성능 최적화: 한 번의 wezterm_get_text 호출로 두 용도 모두 처리
-    output = await wezterm_get_text(
-        pane_id, lines=WORKER_DETECTION.DONE_DETECTION_LINES
-    )
+    if snapshot:
+        output = await snapshot.get_text(pane_id, lines=WORKER_DETECTION.DONE_DETECTION_LINES)
+    else:
+        output = await wezterm_get_text(pane_id, lines=WORKER_DETECTION.DONE_DETECTION_LINES)
 
     # 빈 출력이면 busy로 간주
     if not output.strip():
@@ -265,29 +333,7 @@ async def detect_worker_state(
     # 3. 일시 중단 패턴 (rate limit 등은 실제 제약이므로 우선)
     for pattern in PAUSE_PATTERNS:
         if pattern.search(output):
-            # 시간 파싱 시도
-            detected_at = datetime.now(zoneinfo.ZoneInfo("Asia/Seoul"))
-            try:
-                resume_at = parse_resume_time(output, detected_at)
-                paused_info = PausedInfo(
-                    reason="rate limit",
-                    resume_at=resume_at,
-                    detected_at=detected_at,
-                    message=output[:200],  # 처음 200자만 저장
-                )
-                logger.info(f"Token limit detected, resuming at {resume_at}")
-                return "paused", paused_info
-            except ValueError:
-                # 시간 파싱 실패 시 fallback: 30분 뒤
-                resume_at = get_fallback_resume_time(detected_at)
-                paused_info = PausedInfo(
-                    reason="rate limit",
-                    resume_at=resume_at,
-                    detected_at=detected_at,
-                    message="fallback: 30 minutes",
-                )
-                logger.info(f"Token limit detected (no time), using fallback: {resume_at}")
-                return "paused", paused_info
+            return "paused", build_paused_info(output)
 
     # 4. 작업 중 패턴 체크 (명시적 busy 상태)
     # Claude Code가 작업 중일 때 나타나는 패턴이 있으면 busy
@@ -327,7 +373,10 @@ async def detect_worker_state(
 WF_COMMAND_PATTERN = re.compile(r"/wf:\w+\s+((?:[\w-]+/)?(TSK-[\w-]+))")
 
 
-async def extract_running_task_from_pane(pane_id: int) -> str | None:
+async def extract_running_task_from_pane(
+    pane_id: int,
+    snapshot: PaneSnapshot | None = None,
+) -> str | None:
     """pane 텍스트에서 현재 실행 중인 Task ID를 추출합니다.
 
     가장 최근의 /wf:xxx 명령어에서 Task ID를 찾습니다.
@@ -335,11 +384,15 @@ async def extract_running_task_from_pane(pane_id: int) -> str | None:
 
     Args:
         pane_id: WezTerm pane ID
+        snapshot: tick 단위 pane 스냅샷 (있으면 CLI 재호출 없이 캐시 사용)
 
     Returns:
         Task ID (예: "TSK-01-01") 또는 None
     """
-    output = await wezterm_get_text(pane_id, lines=WORKER_DETECTION.OUTPUT_LINES)
+    if snapshot:
+        output = await snapshot.get_text(pane_id, lines=WORKER_DETECTION.OUTPUT_LINES)
+    else:
+        output = await wezterm_get_text(pane_id, lines=WORKER_DETECTION.OUTPUT_LINES)
 
     if not output.strip():
         return None
@@ -5,6 +5,8 @@ DispatchService의 비즈니스 로직 테스트를 제공합니다.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from orchay.application.dispatch_service import DispatchResult, DispatchService
+from orchay.domain.constants import DispatchTimings
 from orchay.domain.workflow import ExecutionMode
 from orchay.models import Task, TaskCategory, TaskPriority, TaskStatus, Worker, WorkerState
 
@@ -417,3 +420,312 @@ class TestSendCommand:
 
             assert result.success is False
             assert task.assigned_worker is None
+
+
+class TestBackgroundDispatch:
+    """백그라운드 명령 전송 테스트."""
+
+    @pytest.fixture
+    def service(self) -> DispatchService:
+        """background=True DispatchService."""
+        return DispatchService(
+            config=create_config(),
+            project_name="test",
+            wbs_path=Path("/test/wbs.yaml"),
+            mode=ExecutionMode.QUICK,
+            background=True,
+        )
+
+    @pytest.fixture(autouse=True)
+    def fast_timings(self) -> Iterator[None]:
+        """전송 대기 시간 단축."""
+        with patch(
+            "orchay.application.dispatch_service.DISPATCH_TIMINGS",
+            DispatchTimings(
+                CLEAR_WAIT_SECONDS=0.1, COMMAND_WAIT_SECONDS=0.05, ENTER_WAIT_SECONDS=0.05
+            ),
+        ):
+            yield
+
+    async def test_returns_immediately_and_marks_dispatching(
+        self, service: DispatchService
+    ) -> None:
+        """분배는 즉시 반환되고 전송 완료 후 BUSY가 됩니다."""
+        worker = create_worker()
+        task = create_task()
+
+        with (
+            patch(
+                "orchay.application.dispatch_service.get_next_workflow_command",
+                return_value="start",
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                new_callable=AsyncMock,
+            ) as mock_send,
+        ):
+            result = await service.dispatch_next_step(worker, task)
+
+            assert result.success is True
+            assert worker.state == WorkerState.DISPATCHING
+            assert service.pending_workers == {worker.id}
+            assert mock_send.call_count < 4
+
+            await service.wait_pending()
+
+        assert worker.state == WorkerState.BUSY
+        assert worker.current_task == task.id
+        assert service.pending_workers == set()
+        assert mock_send.call_count == 4
+
+    async def test_workers_receive_commands_in_parallel(
+        self, service: DispatchService
+    ) -> None:
+        """여러 Worker 전송이 병렬로 진행됩니다."""
+        workers = [create_worker(id=i, pane_id=100 + i) for i in (1, 2, 3, 4)]
+        tasks = [create_task(id=f"TSK-01-0{i}") for i in (1, 2, 3, 4)]
+
+        with (
+            patch(
+                "orchay.application.dispatch_service.get_next_workflow_command",
+                return_value="start",
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                new_callable=AsyncMock,
+            ),
+        ):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for worker, task in zip(workers, tasks, strict=True):
+                await service.dispatch_next_step(worker, task)
+            assert loop.time() - start < 0.1
+
+            await service.wait_pending()
+            elapsed = loop.time() - start
+
+        # 순차 실행이면 4 x 0.25s = 1s
+        assert elapsed < 0.6
+        assert all(w.state == WorkerState.BUSY for w in workers)
+
+    async def test_send_failure_resets_assignment(self, service: DispatchService) -> None:
+        """백그라운드 전송 실패 시 할당을 해제합니다."""
+        worker = create_worker()
+        task = create_task()
+
+        with (
+            patch(
+                "orchay.application.dispatch_service.get_next_workflow_command",
+                return_value="start",
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                new_callable=AsyncMock,
+                side_effect=Exception("Send error"),
+            ),
+        ):
+            await service.dispatch_next_step(worker, task)
+            await service.wait_pending()
+
+        assert worker.state == WorkerState.IDLE
+        assert worker.current_task is None
+        assert task.assigned_worker is None
+
+    async def test_wait_pending_timeout_cancels(self, service: DispatchService) -> None:
+        """제한 시간 초과 시 전송을 취소하고 할당을 해제합니다."""
+        worker = create_worker()
+        task = create_task()
+
+        async def hang(*args: object) -> None:
+            await asyncio.sleep(10)
+
+        with (
+            patch(
+                "orchay.application.dispatch_service.get_next_workflow_command",
+                return_value="start",
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                new_callable=AsyncMock,
+                side_effect=hang,
+            ),
+        ):
+            await service.dispatch_next_step(worker, task)
+            await service.wait_pending(timeout=0.05)
+
+        assert worker.state == WorkerState.IDLE
+        assert task.assigned_worker is None
+        assert service.pending_workers == set()
+
+
+class FakePane:
+    """입력을 화면에 에코하는 테스트용 pane."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = ["old output", ">"]
+        self.sent: list[str] = []
+
+    async def send_text(self, pane_id: int, text: str) -> None:
+        self.sent.append(text)
+        if text == "\r":
+            typed = self.lines[-1].removeprefix("> ")
+            if typed == "/clear":
+                self.lines = [">"]
+            else:
+                self.lines[-1] = f"> {typed}"
+                self.lines += ["* 작업 중...", ">"]
+        else:
+            self.lines[-1] = f"> {text}"
+
+    async def get_text(self, pane_id: int, lines: int = 50) -> str:
+        return "\n".join(self.lines[-lines:])
+
+
+class TestAdaptiveDelivery:
+    """adaptive 명령 전송 테스트."""
+
+    @pytest.fixture
+    def service(self) -> DispatchService:
+        """delivery="adaptive" DispatchService."""
+        config = create_config()
+        config.dispatch.delivery = "adaptive"
+        return DispatchService(
+            config=config,
+            project_name="test",
+            wbs_path=Path("/test/wbs.yaml"),
+            mode=ExecutionMode.QUICK,
+        )
+
+    async def test_proceeds_as_soon_as_pane_is_ready(self, service: DispatchService) -> None:
+        """에코/화면 정리가 확인되면 고정 대기 없이 진행합니다."""
+        pane = FakePane()
+
+        with (
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                side_effect=pane.send_text,
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_get_text",
+                side_effect=pane.get_text,
+            ),
+        ):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await service.deliver(100, "/wf:start test/TSK-01-01")
+            elapsed = loop.time() - start
+
+        assert pane.sent == ["/clear", "\r", "/wf:start test/TSK-01-01", "\r"]
+        assert elapsed < 1.0
+
+    async def test_clear_waits_for_empty_screen(self, service: DispatchService) -> None:
+        """상태 줄 프롬프트만으로는 /clear 완료로 보지 않고 화면이 빌 때까지 기다립니다."""
+        pane = FakePane()
+        pane.lines = [f"old output {i}" for i in range(12)] + ["⏵⏵ bypass permissions", ">"]
+
+        def wipe() -> None:
+            pane.lines = ["⏵⏵ bypass permissions", ">"]
+
+        async def send_text(pane_id: int, text: str) -> None:
+            pane.sent.append(text)
+            if text == "\r":
+                # Enter 직후에는 입력창만 비고, 이전 출력은 잠시 뒤에 지워짐
+                pane.lines[-1] = ">"
+                asyncio.get_running_loop().call_later(0.3, wipe)
+            else:
+                pane.lines[-1] = f"> {text}"
+
+        with (
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                side_effect=send_text,
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_get_text",
+                side_effect=pane.get_text,
+            ),
+        ):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await service._send_clear(100, adaptive=True)  # pyright: ignore[reportPrivateUsage]
+            elapsed = loop.time() - start
+
+        assert pane.lines == ["⏵⏵ bypass permissions", ">"]
+        assert 0.3 <= elapsed < 1.0
+
+    async def test_falls_back_to_fixed_timings(self, service: DispatchService) -> None:
+        """pane 확인이 안 되면 고정 대기 시간 후 진행합니다."""
+        timings = DispatchTimings(
+            CLEAR_WAIT_SECONDS=0.2, COMMAND_WAIT_SECONDS=0.1, ENTER_WAIT_SECONDS=0.1
+        )
+
+        with (
+            patch("orchay.application.dispatch_service.DISPATCH_TIMINGS", timings),
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                new_callable=AsyncMock,
+            ) as mock_send,
+            patch(
+                "orchay.application.dispatch_service.wezterm_get_text",
+                new_callable=AsyncMock,
+                side_effect=Exception("get-text error"),
+            ),
+        ):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await service.deliver(100, "/wf:start test/TSK-01-01")
+            elapsed = loop.time() - start
+
+        assert mock_send.call_count == 4
+        assert elapsed >= 0.5
+
+    async def test_enter_waits_when_echo_not_seen(self, service: DispatchService) -> None:
+        """입력 에코를 확인하지 못하면 Enter 후에도 고정 대기 시간을 지킵니다."""
+        service._config.dispatch.clear_before_dispatch = False  # pyright: ignore[reportPrivateUsage]
+        timings = DispatchTimings(COMMAND_WAIT_SECONDS=0.1, ENTER_WAIT_SECONDS=0.3)
+
+        with (
+            patch("orchay.application.dispatch_service.DISPATCH_TIMINGS", timings),
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_get_text",
+                new_callable=AsyncMock,
+                return_value="unrelated output\n>",
+            ),
+        ):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await service.deliver(100, "/wf:start test/TSK-01-01")
+            elapsed = loop.time() - start
+
+        assert elapsed >= 0.4
+
+    async def test_fixed_mode_does_not_probe(self) -> None:
+        """delivery="fixed"이면 pane을 확인하지 않습니다."""
+        config = create_config(clear_before_dispatch=False)
+        config.dispatch.delivery = "fixed"
+        service = DispatchService(
+            config=config,
+            project_name="test",
+            wbs_path=Path("/test/wbs.yaml"),
+            mode=ExecutionMode.QUICK,
+        )
+        timings = DispatchTimings(COMMAND_WAIT_SECONDS=0.01, ENTER_WAIT_SECONDS=0.01)
+
+        with (
+            patch("orchay.application.dispatch_service.DISPATCH_TIMINGS", timings),
+            patch(
+                "orchay.application.dispatch_service.wezterm_send_text",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "orchay.application.dispatch_service.wezterm_get_text",
+                new_callable=AsyncMock,
+            ) as mock_get_text,
+        ):
+            await service.deliver(100, "/wf:start test/TSK-01-01")
+
+        mock_get_text.assert_not_called()
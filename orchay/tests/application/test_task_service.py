@@ -8,13 +8,14 @@ from __future__ import annotations
 import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from orchay.application.task_service import STOP_STATE_MAP, TaskService
 from orchay.domain.workflow import ExecutionMode, WorkflowConfig, WorkflowEngine
 from orchay.models import Task, TaskCategory, TaskPriority, TaskStatus
+from orchay.wbs_parser import WbsDelta
 
 
 # 테스트용 workflows.json 데이터
@@ -200,6 +201,180 @@ class TestGetExecutableTasks:
         assert result[0].id == "T1"
 
 
+class TestChangeTracking:
+    """WBS 변경 여부에 따른 병합/필터링 생략 테스트."""
+
+    async def test_unchanged_wbs_skips_merge(
+        self, task_service: TaskService, mock_parser: MagicMock
+    ) -> None:
+        """parser.changed가 False이면 첫 reload 이후 병합하지 않습니다."""
+        mock_parser.changed = False
+        mock_parser.parse.return_value = [create_task(id="T1")]
+        await task_service.reload_tasks()
+        assert task_service.tasks_changed
+        assert [t.id for t in task_service.tasks] == ["T1"]
+
+        mock_parser.parse.return_value = [create_task(id="T2")]
+        await task_service.reload_tasks()
+
+        assert not task_service.tasks_changed
+        assert [t.id for t in task_service.tasks] == ["T1"]
+
+    async def test_change_seen_by_refresh_is_merged(
+        self, task_service: TaskService, mock_parser: MagicMock
+    ) -> None:
+        """refresh_task_status()가 먼저 읽은 변경도 다음 reload에서 병합합니다."""
+        task = create_task(id="T1")
+        mock_parser.changed = False
+        mock_parser.parse.return_value = [task]
+        await task_service.reload_tasks()
+        await task_service.reload_tasks()
+
+        mock_parser.changed = True
+        mock_parser.parse.return_value = [create_task(id="T1"), create_task(id="T2")]
+        await task_service.refresh_task_status(task)
+        assert task_service.tasks_changed
+
+        mock_parser.changed = False
+        await task_service.reload_tasks()
+
+        assert task_service.tasks_changed
+        assert [t.id for t in task_service.tasks] == ["T1", "T2"]
+
+    async def test_executable_cache_rechecks_runtime_state(
+        self, task_service: TaskService, mock_parser: MagicMock
+    ) -> None:
+        """WBS가 그대로면 필터 결과를 재사용하되 할당 상태는 매번 반영합니다."""
+        mock_parser.changed = False
+        mock_parser.parse.return_value = [create_task(id="T1"), create_task(id="T2")]
+        await task_service.reload_tasks()
+
+        policy = task_service._filter_policy
+        with patch.object(
+            policy, "filter_executable", wraps=policy.filter_executable
+        ) as mock_filter:
+            assert [t.id for t in task_service.get_executable_tasks(ExecutionMode.QUICK)] == [
+                "T1",
+                "T2",
+            ]
+            task_service.tasks[0].assigned_worker = 1
+            assert [t.id for t in task_service.get_executable_tasks(ExecutionMode.QUICK)] == [
+                "T2"
+            ]
+            task_service.tasks[0].assigned_worker = None
+            assert len(task_service.get_executable_tasks(ExecutionMode.QUICK)) == 2
+            assert mock_filter.call_count == 1
+
+            # 모드가 바뀌면 다시 필터링
+            task_service.get_executable_tasks(ExecutionMode.FORCE)
+            assert mock_filter.call_count == 2
+
+    async def test_delta_merges_changed_tasks_only(
+        self, task_service: TaskService, mock_parser: MagicMock
+    ) -> None:
+        """parser.delta가 있으면 변경 내역의 Task/필드만 병합합니다."""
+        mock_parser.changed = True
+        mock_parser.parse.return_value = [create_task(id="T1"), create_task(id="T2")]
+        await task_service.reload_tasks()
+        assert task_service.last_delta is None  # 첫 로드는 전체 병합
+
+        t1, t2 = task_service.tasks
+        new_t2 = create_task(id="T2", status=TaskStatus.BASIC_DESIGN, priority=TaskPriority.HIGH)
+        mock_parser.parse.return_value = [create_task(id="T1"), new_t2, create_task(id="T3")]
+        mock_parser.delta = WbsDelta(added=("T3",), changed={"T2": frozenset({"status"})})
+        await task_service.reload_tasks()
+
+        assert task_service.tasks_changed
+        assert [t.id for t in task_service.tasks] == ["T1", "T2", "T3"]
+        assert task_service.tasks[0] is t1
+        assert task_service.tasks[1] is t2
+        assert t2.status == TaskStatus.BASIC_DESIGN
+        assert t2.priority == TaskPriority.MEDIUM  # 변경 내역에 없는 필드는 그대로
+
+        mock_parser.delta = WbsDelta(removed=("T1",))
+        await task_service.reload_tasks()
+        assert [t.id for t in task_service.tasks] == ["T2", "T3"]
+
+    async def test_delta_keeps_filter_cache(
+        self, task_service: TaskService, mock_parser: MagicMock
+    ) -> None:
+        """WBS 변경 내역은 전체 필터링 없이 바뀐 Task만 다시 평가합니다."""
+        mock_parser.changed = True
+        mock_parser.parse.return_value = [create_task(id="T1"), create_task(id="T2")]
+        mock_parser.delta = WbsDelta(added=("T1", "T2"))
+        await task_service.reload_tasks()
+
+        policy = task_service._filter_policy
+        with patch.object(
+            policy, "filter_executable", wraps=policy.filter_executable
+        ) as mock_filter:
+            task_service.get_executable_tasks(ExecutionMode.QUICK)
+
+            mock_parser.delta = WbsDelta(changed={"T1": frozenset({"title"})})
+            await task_service.reload_tasks()
+            task_service.get_executable_tasks(ExecutionMode.QUICK)
+            assert mock_filter.call_count == 1
+
+            mock_parser.parse.return_value = [
+                create_task(id="T1", status=TaskStatus.DONE),
+                create_task(id="T2"),
+            ]
+            mock_parser.delta = WbsDelta(changed={"T1": frozenset({"status"})})
+            await task_service.reload_tasks()
+            assert [t.id for t in task_service.get_executable_tasks(ExecutionMode.QUICK)] == [
+                "T2"
+            ]
+            assert mock_filter.call_count == 1
+
+            # 형식만 바뀐 경우 (빈 변경 내역): Task 목록 변경 없음
+            mock_parser.delta = WbsDelta()
+            await task_service.reload_tasks()
+            assert not task_service.tasks_changed
+
+
+class TestWatchMode:
+    """파일 감시 모드 테스트."""
+
+    async def test_skips_parse_until_dirty(
+        self, task_service: TaskService, mock_parser: MagicMock
+    ) -> None:
+        """감시 모드에서는 변경 알림이 있을 때만 WBS를 파싱합니다."""
+        mock_parser.changed = False
+        mock_parser.parse.return_value = [create_task(id="T1")]
+        task_service.set_watching(True, fallback_interval=60)
+        await task_service.reload_tasks()
+        assert mock_parser.parse.call_count == 1
+
+        await task_service.reload_tasks()
+        assert mock_parser.parse.call_count == 1
+        assert not task_service.tasks_changed
+
+        task_service.mark_dirty()
+        await task_service.reload_tasks()
+        assert mock_parser.parse.call_count == 2
+
+    async def test_fallback_interval(
+        self, task_service: TaskService, mock_parser: MagicMock
+    ) -> None:
+        """변경 알림이 없어도 fallback 간격이 지나면 파싱합니다."""
+        mock_parser.changed = False
+        task_service.set_watching(True, fallback_interval=5)
+        with patch("orchay.application.task_service.time.monotonic", return_value=100.0):
+            await task_service.reload_tasks()
+            await task_service.reload_tasks()
+        assert mock_parser.parse.call_count == 1
+
+        with patch("orchay.application.task_service.time.monotonic", return_value=105.0):
+            await task_service.reload_tasks()
+        assert mock_parser.parse.call_count == 2
+
+        # 감시 해제 시 매번 파싱
+        task_service.set_watching(False)
+        await task_service.reload_tasks()
+        await task_service.reload_tasks()
+        assert mock_parser.parse.call_count == 4
+
+
 class TestCleanupCompleted:
     """cleanup_completed 메서드 테스트."""
 
@@ -338,6 +513,16 @@ class TestGetAssignedTasks:
         assert result[0].id == "T1"
         assert result[1].id == "T3"
 
+    def test_reflects_direct_assignment(self, task_service: TaskService) -> None:
+        """Task 속성을 직접 바꿔도 조회 결과에 반영됩니다."""
+        task_service.tasks = [create_task(id="T1"), create_task(id="T2")]
+
+        task_service.tasks[1].assigned_worker = 3
+        task_service.tasks[1].status = TaskStatus.IMPLEMENT
+
+        assert [t.id for t in task_service.get_assigned_tasks()] == ["T2"]
+        assert [t.id for t in task_service.get_tasks_by_status(TaskStatus.TODO)] == ["T1"]
+
 
 class TestStopStateMap:
     """STOP_STATE_MAP 상수 테스트."""
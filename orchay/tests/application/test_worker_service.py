@@ -209,6 +209,17 @@ class TestGetBusyWorkers:
         assert result[0].id == 2
         assert result[1].id == 3
 
+    def test_includes_dispatching_workers(self) -> None:
+        """명령 전송 중(dispatching)인 Worker도 작업 중으로 반환합니다."""
+        config = create_config()
+        service = WorkerService(config)
+        service.workers = [
+            create_worker(id=1, state=WorkerState.IDLE),
+            create_worker(id=2, state=WorkerState.DISPATCHING),
+        ]
+
+        assert [w.id for w in service.get_busy_workers()] == [2]
+
 
 class TestGetWorkerById:
     """get_worker_by_id 메서드 테스트."""
@@ -425,6 +436,31 @@ class TestUpdateWorkerStateWithContinuation:
             mock_detect.assert_not_called()
             assert worker.state == WorkerState.BUSY
 
+    async def test_skips_while_dispatching(self) -> None:
+        """명령 전송 중(DISPATCHING)인 Worker는 상태 감지를 건너뜁니다."""
+        service = WorkerService(create_config())
+        worker = create_worker(
+            id=1,
+            state=WorkerState.DISPATCHING,
+            dispatch_time=datetime.now() - timedelta(seconds=30),
+        )
+        service.workers = [worker]
+
+        with patch(
+            "orchay.application.worker_service.detect_worker_state", new_callable=AsyncMock
+        ) as mock_detect:
+            await service.update_worker_state_with_continuation(
+                worker=worker,
+                tasks=[],
+                dispatch_service=AsyncMock(),
+                task_service=MagicMock(),
+                mode="quick",
+                paused=False,
+            )
+
+            mock_detect.assert_not_called()
+            assert worker.state == WorkerState.DISPATCHING
+
     async def test_updates_to_idle_after_grace_period(self) -> None:
         """TC-WS-20: Grace period 이후 IDLE로 전환합니다."""
         config = create_config(grace_period=20.0)
@@ -8,9 +8,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from orchay.domain.policies import ReadySet, TaskOrdering
 from orchay.domain.policies.task_filter import (
     IMPLEMENTED_STATUSES,
     PRIORITY_ORDER,
@@ -18,7 +20,7 @@ from orchay.domain.policies.task_filter import (
     sort_tasks_by_id,
 )
 from orchay.domain.workflow import ExecutionMode, WorkflowConfig, WorkflowEngine
-from orchay.models import Task, TaskCategory, TaskPriority, TaskStatus
+from orchay.models import Task, TaskCategory, TaskPriority, TaskStatus, TaskStore
 
 
 # 테스트용 workflows.json 데이터
@@ -461,3 +463,107 @@ class TestSortTasksByIdFunction:
         assert result is not tasks
         assert tasks[0].id == "T2"  # 원본 순서 유지
         assert result[0].id == "T1"  # 정렬된 결과
+
+
+class TestReadySet:
+    """ReadySet 증분 갱신 테스트."""
+
+    def _store(self) -> TaskStore:
+        """T2는 T1에 의존 (T1 구현 전에는 T2 build 불가)."""
+        return TaskStore(
+            [
+                create_task(id="T1", status=TaskStatus.APPROVED),
+                create_task(id="T2", status=TaskStatus.APPROVED, depends=["T1"]),
+                create_task(id="T3"),
+            ]
+        )
+
+    def test_matches_filter_executable(self, filter_policy: TaskFilterPolicy) -> None:
+        """첫 조회 결과는 filter_executable과 같습니다."""
+        store = self._store()
+        ready = ReadySet(store, filter_policy)
+
+        assert ready.tasks(ExecutionMode.QUICK) == filter_policy.filter_executable(
+            store, ExecutionMode.QUICK
+        )
+        assert [t.id for t in ready.tasks(ExecutionMode.QUICK)] == ["T1", "T3"]
+
+    def test_dependency_change_reevaluates_dependents(
+        self, filter_policy: TaskFilterPolicy
+    ) -> None:
+        """의존 Task 상태가 바뀌면 전체 필터링 없이 의존하는 Task를 다시 평가합니다."""
+        store = self._store()
+        ready = ReadySet(store, filter_policy)
+        ready.tasks(ExecutionMode.QUICK)
+
+        with patch.object(
+            filter_policy, "filter_executable", wraps=filter_policy.filter_executable
+        ) as mock_filter:
+            store[0].status = TaskStatus.IMPLEMENT
+
+            assert [t.id for t in ready.tasks(ExecutionMode.QUICK)] == ["T2", "T3"]
+            mock_filter.assert_not_called()
+
+    def test_runtime_changes(self, filter_policy: TaskFilterPolicy) -> None:
+        """할당/blocked-by 변경과 Task 추가/삭제를 반영합니다."""
+        store = self._store()
+        ready = ReadySet(store, filter_policy)
+        ready.tasks(ExecutionMode.QUICK)
+
+        store[0].assigned_worker = 1
+        store[2].blocked_by = "skipped"
+        assert ready.tasks(ExecutionMode.QUICK) == []
+
+        store[0].assigned_worker = None
+        store.append(create_task(id="T0"))
+        assert [t.id for t in ready.tasks(ExecutionMode.QUICK)] == ["T0", "T1"]
+
+        store.discard_ids({"T0"})
+        assert [t.id for t in ready.tasks(ExecutionMode.QUICK)] == ["T1"]
+
+    def test_first_skips_excluded(self, filter_policy: TaskFilterPolicy) -> None:
+        """first()는 제외 ID를 건너뛴 가장 작은 ID의 Task를 반환합니다."""
+        ready = ReadySet(self._store(), filter_policy)
+
+        first = ready.first(ExecutionMode.QUICK)
+        assert first is not None and first.id == "T1"
+        second = ready.first(ExecutionMode.QUICK, exclude={"T1"})
+        assert second is not None and second.id == "T3"
+        assert ready.first(ExecutionMode.QUICK, exclude={"T1", "T3"}) is None
+
+    def test_invalidate(self, filter_policy: TaskFilterPolicy) -> None:
+        """알림 없는 필드 변경은 invalidate()로 반영합니다."""
+        store = self._store()
+        ready = ReadySet(store, filter_policy)
+        ready.tasks(ExecutionMode.QUICK)
+
+        store[2].category = TaskCategory.INFRASTRUCTURE
+        ready.invalidate(store[2])
+
+        assert ready.tasks(ExecutionMode.QUICK) == filter_policy.filter_executable(
+            store, ExecutionMode.QUICK
+        )
+
+    def test_critical_path_order(self, filter_policy: TaskFilterPolicy) -> None:
+        """critical-path 순서는 의존성이 바뀔 때 그래프를 다시 계산합니다."""
+        store = TaskStore(
+            [
+                create_task(id="T1"),
+                create_task(id="T2"),
+                create_task(id="T9", status=TaskStatus.APPROVED, depends=["T2"]),
+            ]
+        )
+        ordering = TaskOrdering("critical-path")
+        ready = ReadySet(store, filter_policy, ordering)
+
+        with patch.object(ordering, "refresh", wraps=ordering.refresh) as mock_refresh:
+            assert [t.id for t in ready.tasks(ExecutionMode.QUICK)] == ["T2", "T1"]
+            store[0].assigned_worker = 1
+            assert [t.id for t in ready.tasks(ExecutionMode.QUICK)] == ["T2"]
+            assert mock_refresh.call_count == 1
+
+            store[0].assigned_worker = None
+
+            store[2].depends = ("T1",)
+            assert [t.id for t in ready.tasks(ExecutionMode.QUICK)] == ["T1", "T2"]
+            assert mock_refresh.call_count == 2
@@ -0,0 +1,124 @@
+"""Task 분배 순서 정책 테스트."""
+
+from __future__ import annotations
+
+from orchay.domain.policies import DependencyGraph, TaskOrdering
+from orchay.domain.policies.task_order import expected_days
+from orchay.models import Task, TaskPriority, TaskStatus
+
+
+def _task(
+    task_id: str,
+    depends: list[str] | None = None,
+    schedule: str = "",
+    status: TaskStatus = TaskStatus.TODO,
+    priority: TaskPriority = TaskPriority.MEDIUM,
+) -> Task:
+    """테스트용 Task 생성."""
+    return Task(
+        id=task_id,
+        title=task_id,
+        category="development",  # type: ignore[arg-type]
+        status=status,
+        priority=priority,
+        depends=depends or [],
+        schedule=schedule,
+    )
+
+
+class TestExpectedDays:
+    """expected_days 테스트."""
+
+    def test_schedule_range(self) -> None:
+        """schedule 양 끝을 포함한 일수를 반환합니다."""
+        task = _task("T1", schedule="2026-01-05 ~ 2026-01-07")
+
+        assert expected_days(task) == 3.0
+
+    def test_missing_or_invalid(self) -> None:
+        """schedule이 없거나 읽을 수 없으면 기본값을 반환합니다."""
+        assert expected_days(_task("T1"), 2.0) == 2.0
+        assert expected_days(_task("T1", schedule="미정 ~ 미정"), 2.0) == 2.0
+        assert expected_days(_task("T1", schedule="2026-01-07 ~ 2026-01-05"), 2.0) == 2.0
+
+
+class TestDependencyGraph:
+    """DependencyGraph 테스트."""
+
+    def test_levels_and_paths(self) -> None:
+        """위상 레벨과 예상 기간 가중 임계 경로를 계산합니다."""
+        graph = DependencyGraph(
+            [
+                _task("A", schedule="2026-01-01 ~ 2026-01-03"),
+                _task("B", depends=["A"]),
+                _task("C", depends=["B"], schedule="2026-01-01 ~ 2026-01-05"),
+                _task("D"),
+                _task("E", depends=["A", "D", "UNKNOWN"]),
+            ]
+        )
+
+        assert graph.levels == {"A": 0, "B": 1, "C": 2, "D": 0, "E": 1}
+        assert graph.paths["C"] == 5.0
+        assert graph.paths["B"] == 6.0
+        assert graph.paths["A"] == 9.0
+        assert graph.paths["D"] == 2.0
+
+    def test_done_tasks_have_no_weight(self) -> None:
+        """완료 Task는 경로 길이에 더하지 않습니다."""
+        graph = DependencyGraph([_task("A", status=TaskStatus.DONE), _task("B", depends=["A"])])
+
+        assert graph.paths == {"A": 1.0, "B": 1.0}
+
+    def test_cycle(self) -> None:
+        """순환 의존성 Task는 마지막 레벨에 둡니다."""
+        graph = DependencyGraph(
+            [_task("A"), _task("B", depends=["A", "C"]), _task("C", depends=["B"])]
+        )
+
+        assert graph.levels == {"A": 0, "B": 1, "C": 1}
+        assert graph.paths["A"] == 2.0
+
+
+class TestTaskOrdering:
+    """TaskOrdering 정렬 키 테스트."""
+
+    def _tasks(self) -> list[Task]:
+        return [
+            _task("T1", priority=TaskPriority.LOW),
+            _task("T2", priority=TaskPriority.HIGH),
+            _task("T3", depends=["T1"], schedule="2026-01-01 ~ 2026-01-10"),
+        ]
+
+    def _sorted(self, ordering: TaskOrdering, tasks: list[Task]) -> list[str]:
+        return [t.id for t in sorted(tasks, key=lambda t: (*ordering.key(t), t.id))]
+
+    def test_id_and_priority(self) -> None:
+        """id는 Task ID 순, priority는 우선순위 순입니다."""
+        tasks = self._tasks()
+
+        assert self._sorted(TaskOrdering(), tasks) == ["T1", "T2", "T3"]
+        assert self._sorted(TaskOrdering("priority"), tasks) == ["T2", "T3", "T1"]
+
+    def test_topological(self) -> None:
+        """topological은 레벨, 우선순위 순입니다."""
+        ordering = TaskOrdering("topological")
+        tasks = self._tasks()
+        ordering.refresh(tasks)
+
+        assert self._sorted(ordering, tasks) == ["T2", "T1", "T3"]
+
+    def test_critical_path(self) -> None:
+        """critical-path는 후속 작업 경로가 긴 Task가 먼저입니다."""
+        ordering = TaskOrdering("critical-path")
+        tasks = self._tasks()
+        ordering.refresh(tasks)
+
+        assert self._sorted(ordering, tasks) == ["T1", "T3", "T2"]
+
+    def test_graph_only_for_graph_orders(self) -> None:
+        """의존성 그래프는 topological/critical-path에서만 계산합니다."""
+        ordering = TaskOrdering("priority")
+        ordering.refresh(self._tasks())
+
+        assert not ordering.uses_graph
+        assert ordering.graph is None
@@ -11,7 +11,12 @@ from typing import Any
 
 import pytest
 
-from orchay.domain.workflow import ExecutionMode, WorkflowConfig, WorkflowEngine
+from orchay.domain.workflow import (
+    CompiledWorkflows,
+    ExecutionMode,
+    WorkflowConfig,
+    WorkflowEngine,
+)
 from orchay.models import Task, TaskCategory, TaskPriority, TaskStatus
 
 
@@ -427,3 +432,47 @@ class TestWorkflowEngineCategories:
         sample_task.status = TaskStatus.APPROVED
         cmd = workflow_engine.get_next_command(sample_task, ExecutionMode.DEVELOP)
         assert cmd == "build"
+
+
+class TestCompiledWorkflows:
+    """컴파일된 조회 테이블 테스트."""
+
+    def test_compile_tables(self) -> None:
+        """TC-WE-37: transitions/actions/모드를 조회 테이블로 컴파일합니다."""
+        compiled = CompiledWorkflows.compile(SAMPLE_WORKFLOWS)
+
+        assert compiled.transitions[("development", "[bd]")] == "start"
+        assert compiled.first_actions[("development", "[dd]")] == "review"
+        assert compiled.next_actions[("development", "[dd]", "review")] == "apply"
+        assert compiled.next_actions[("development", "[dd]", "apply")] is None
+        assert compiled.mode(ExecutionMode.QUICK).manual_commands == {"approve", "done"}
+        assert compiled.mode(None).scope == "transitions-only"
+
+    def test_next_action(self) -> None:
+        """TC-WE-38: 마지막 action에 따라 다음 action을 결정합니다."""
+        compiled = CompiledWorkflows.compile(SAMPLE_WORKFLOWS)
+
+        assert compiled.next_action("development", "[dd]", None) == "review"
+        assert compiled.next_action("development", "[dd]", "start") == "review"
+        assert compiled.next_action("development", "[dd]", "unknown") == "review"
+        assert compiled.next_action("development", "[dd]", "review") == "apply"
+        assert compiled.next_action("development", "[dd]", "apply") is None
+        assert compiled.next_action("development", "[ap]", None) is None
+
+    def test_recompiled_only_on_reload(
+        self, sample_workflows_path: Path, workflow_config: WorkflowConfig
+    ) -> None:
+        """TC-WE-39: 파일 변경이 감지되어 리로드할 때만 다시 컴파일합니다."""
+        compiled = workflow_config.compiled
+
+        assert not workflow_config.reload_if_stale()
+        assert workflow_config.compiled is compiled
+
+        new_data = {
+            "workflows": {"development": {"transitions": [{"from": "[ ]", "command": "go"}]}}
+        }
+        sample_workflows_path.write_text(json.dumps(new_data), encoding="utf-8")
+        assert workflow_config.reload_if_stale()
+
+        assert workflow_config.compiled is not compiled
+        assert workflow_config.compiled.transitions == {("development", "[ ]"): "go"}
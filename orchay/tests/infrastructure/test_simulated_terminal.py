@@ -0,0 +1,165 @@
+"""SimulatedTerminal 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from orchay.infrastructure.wezterm.simulated import SimulatedTerminal, SimulationProfile
+from orchay.utils.wezterm import (
+    get_active_pane_id,
+    pane_exists,
+    set_terminal_backend,
+    wezterm_get_text,
+    wezterm_list_panes,
+    wezterm_send_text,
+)
+from orchay.worker import detect_worker_state
+
+FAST = SimulationProfile(duration=(0.01, 0.01), output_lines=3, rows=10, seed=1)
+
+
+async def wait_idle(terminal: SimulatedTerminal, pane_id: int) -> None:
+    """pane 명령이 끝날 때까지 대기합니다."""
+    for _ in range(200):
+        if not terminal.panes[pane_id].busy:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("시뮬레이션 명령이 끝나지 않았습니다")
+
+
+class TestSimulatedPane:
+    """pane 출력 재현 테스트."""
+
+    async def test_echo_and_clear(self) -> None:
+        """입력은 프롬프트에 에코되고 /clear는 출력을 지웁니다."""
+        terminal = SimulatedTerminal(workers=1, profile=FAST)
+
+        await terminal.send_text(1, "hello")
+        assert (await terminal.get_text(1, lines=1)) == "> hello"
+
+        await terminal.send_text(1, "\r")
+        assert "> hello" in await terminal.get_text(1)
+        assert (await terminal.get_text(1, lines=1)) == ">"
+
+        await terminal.send_text(1, "/clear\r")
+        assert (await terminal.get_text(1)).strip() == ">"
+
+    async def test_workflow_command_completes(self) -> None:
+        """/wf 명령은 작업 중 표시 후 완료 신호를 출력하고 콜백을 호출합니다."""
+        completed: list[tuple[str, str, bool]] = []
+
+        async def on_complete(task_id: str, action: str, success: bool) -> None:
+            completed.append((task_id, action, success))
+
+        terminal = SimulatedTerminal(workers=1, profile=FAST, on_complete=on_complete)
+        await terminal.send_text(1, "/wf:build proj/TSK-01-01\r")
+        assert "(esc to interrupt)" in await terminal.get_text(1)
+
+        await wait_idle(terminal, 1)
+        text = await terminal.get_text(1)
+        assert "ORCHAY_DONE:proj/TSK-01-01:build:success" in text
+        assert completed == [("TSK-01-01", "build", True)]
+        stats = terminal.panes[1].stats
+        assert stats.commands == 1
+        assert len(stats.dispatch_latencies) == 1
+
+    async def test_failure_and_rate_limit(self) -> None:
+        """실패 확률 1이면 error 신호, rate limit 중에는 일시 중단 안내를 표시합니다."""
+        profile = SimulationProfile(
+            duration=(0.01, 0.01),
+            output_lines=2,
+            rows=10,
+            failure_rate=1.0,
+            rate_limit_rate=1.0,
+            rate_limit_seconds=0.05,
+        )
+        terminal = SimulatedTerminal(workers=1, profile=profile)
+        await terminal.send_text(1, "/wf:start p/TSK-01-01\r")
+
+        for _ in range(100):
+            if "rate limit" in await terminal.get_text(1, lines=1):
+                break
+            await asyncio.sleep(0.005)
+        else:
+            raise AssertionError("rate limit 안내가 표시되지 않았습니다")
+
+        await wait_idle(terminal, 1)
+        text = await terminal.get_text(1)
+        assert "ORCHAY_DONE:p/TSK-01-01:start:error" in text
+        assert "rate limit" not in text
+        assert terminal.panes[1].stats.failures == 1
+        assert terminal.panes[1].stats.rate_limits == 1
+
+    async def test_input_ignored_while_busy(self) -> None:
+        """실행 중 입력은 무시합니다."""
+        terminal = SimulatedTerminal(workers=1, profile=FAST)
+        await terminal.send_text(1, "/wf:build p/TSK-01-01\r")
+        await terminal.send_text(1, "/wf:verify p/TSK-01-01\r")
+        await wait_idle(terminal, 1)
+        assert terminal.panes[1].stats.commands == 1
+
+    async def test_close_cancels_jobs(self) -> None:
+        """close()는 실행 중인 명령을 취소합니다."""
+        terminal = SimulatedTerminal(workers=2, profile=SimulationProfile(duration=(5, 5)))
+        await terminal.send_text(1, "/wf:build p/TSK-01-01\r")
+        await terminal.close()
+        assert not terminal.panes[1].busy
+
+
+class TestSimulatedTerminal:
+    """ITerminalAdapter 동작 테스트."""
+
+    async def test_panes_and_calls(self) -> None:
+        """pane 0은 스케줄러 pane이고 호출 수를 명령별로 집계합니다."""
+        terminal = SimulatedTerminal(workers=3, profile=FAST)
+
+        panes = await terminal.list_panes()
+        assert [p.pane_id for p in panes] == [0, 1, 2, 3]
+        assert await terminal.get_active_pane_id() == 0
+        assert await terminal.pane_exists(3)
+        assert not await terminal.pane_exists(4)
+        with pytest.raises(RuntimeError):
+            await terminal.send_text(9, "x")
+
+        assert terminal.calls["list"] == 4
+        assert terminal.calls["send-text"] == 1
+
+    async def test_line_range(self) -> None:
+        """줄 번호 규칙은 wezterm get-text와 같습니다 (화면 첫 줄 0, 음수는 scrollback)."""
+        profile = SimulationProfile(rows=4, seed=1)
+        terminal = SimulatedTerminal(workers=1, profile=profile)
+        for i in range(6):
+            await terminal.send_text(1, f"line{i}\r")
+
+        # 전체: "> line0" ... "> line5", "", ">" → 화면은 마지막 4줄
+        screen = (await terminal.get_text(1)).split("\n")
+        assert screen == ["> line4", "> line5", "", ">"]
+        above = await terminal.get_text(1, start_line=-2, end_line=-1)
+        assert above.split("\n") == ["> line2", "> line3"]
+        assert await terminal.get_text(99) == ""
+
+
+class TestBackendRouting:
+    """utils.wezterm 백엔드 교체 테스트."""
+
+    async def test_module_functions_use_backend(self) -> None:
+        """set_terminal_backend 후 모듈 함수는 서브프로세스 대신 백엔드를 사용합니다."""
+        terminal = SimulatedTerminal(workers=2, profile=FAST)
+        previous = set_terminal_backend(terminal)
+        try:
+            panes = await wezterm_list_panes()
+            assert [p.pane_id for p in panes] == [0, 1, 2]
+            assert panes[1].rows == FAST.rows
+            assert await pane_exists(2)
+            assert await get_active_pane_id() == 0
+
+            await wezterm_send_text(1, "ping")
+            assert await wezterm_get_text(1, lines=1) == "> ping"
+            await wezterm_send_text(1, "\r")
+
+            state, _ = await detect_worker_state(1)
+            assert state == "idle"
+        finally:
+            assert set_terminal_backend(previous) is terminal
@@ -0,0 +1,180 @@
+"""SqliteStateStore 테스트."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from orchay.infrastructure.persistence import (
+    HistoryEntry,
+    SqliteStateStore,
+    StateStore,
+)
+
+
+def _entry(
+    task_id: str, worker_id: int = 1, result: str = "success", minute: int = 0
+) -> HistoryEntry:
+    return HistoryEntry(
+        task_id=task_id,
+        command=f"/wf:run {task_id}",
+        result=result,
+        worker_id=worker_id,
+        timestamp=f"2026-01-05T10:{minute:02d}:00",
+        output="OK",
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Generator[SqliteStateStore]:
+    """임시 경로를 사용하는 SqliteStateStore."""
+    store = SqliteStateStore(base_path=tmp_path, max_history_entries=5)
+    yield store
+    store.close()
+
+
+class TestSqliteActiveState:
+    """활성 상태 관리 테스트."""
+
+    def test_defaults(self, store: SqliteStateStore) -> None:
+        """저장된 상태가 없으면 기본값을 반환합니다."""
+        assert store.load_active_state() == {"pausedWorkers": [], "schedulerState": "running"}
+
+    def test_wal_mode(self, store: SqliteStateStore) -> None:
+        """DB를 WAL 모드로 엽니다."""
+        conn = sqlite3.connect(store.db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_pause_resume_and_state(self, store: SqliteStateStore) -> None:
+        """Worker 일시정지와 스케줄러 상태를 다른 연결에서도 읽을 수 있습니다."""
+        store.pause_worker(2)
+        store.pause_worker(1)
+        store.pause_worker(2)
+        store.resume_worker(3)
+        store.set_scheduler_state("paused")
+
+        other = SqliteStateStore(base_path=store.db_path.parent)
+        try:
+            assert other.get_paused_workers() == [1, 2]
+            assert other.is_worker_paused(2)
+            assert other.get_scheduler_state() == "paused"
+        finally:
+            other.close()
+
+        store.resume_worker(2)
+        assert not store.is_worker_paused(2)
+
+    def test_save_active_state_replaces(self, store: SqliteStateStore) -> None:
+        """save_active_state는 전체 상태를 교체합니다."""
+        store.pause_worker(1)
+        store.save_active_state({"pausedWorkers": [3], "schedulerState": "stopped"})
+
+        assert store.load_active_state() == {"pausedWorkers": [3], "schedulerState": "stopped"}
+
+
+class TestSqliteHistory:
+    """히스토리 관리 테스트."""
+
+    def test_list_and_get(self, store: SqliteStateStore) -> None:
+        """최신순 조회와 Task별 최근 항목 조회."""
+        store.append_history(_entry("A", result="error", minute=0))
+        store.append_history(_entry("B", minute=1))
+        store.append_history(_entry("A", minute=2))
+
+        assert [e["task_id"] for e in store.list_history(limit=2)] == ["A", "B"]
+        latest = store.get_task_history("A")
+        assert latest is not None
+        assert latest["result"] == "success"
+        assert store.get_task_history("C") is None
+
+    def test_max_history_entries(self, store: SqliteStateStore) -> None:
+        """보존 한도를 넘은 오래된 항목은 삭제합니다."""
+        for i in range(7):
+            store.append_history(_entry(f"T{i}", minute=i))
+
+        assert [e["task_id"] for e in store.list_history(limit=10)] == [
+            "T6",
+            "T5",
+            "T4",
+            "T3",
+            "T2",
+        ]
+
+    def test_query_history(self, store: SqliteStateStore) -> None:
+        """worker/result/시간 범위 조건을 함께 적용합니다."""
+        store.append_history(_entry("A", worker_id=1, result="error", minute=0))
+        store.append_history(_entry("B", worker_id=2, result="error", minute=1))
+        store.append_history(_entry("C", worker_id=2, result="success", minute=2))
+        store.append_history(_entry("D", worker_id=2, result="error", minute=3))
+
+        rows = store.query_history(worker_id=2, result="error")
+        assert [r["task_id"] for r in rows] == ["D", "B"]
+        rows = store.query_history(since="2026-01-05T10:01:00", until="2026-01-05T10:03:00")
+        assert [r["task_id"] for r in rows] == ["C", "B"]
+
+    def test_clear_history(self, store: SqliteStateStore) -> None:
+        """히스토리 삭제."""
+        store.append_history(_entry("A"))
+        store.clear_history()
+
+        assert store.list_history() == []
+
+
+class TestSqliteImport:
+    """JSON/JSONL 파일 가져오기 테스트."""
+
+    def test_imports_json_once(self, tmp_path: Path) -> None:
+        """기존 JSON 상태와 히스토리를 처음 열 때 한 번만 가져옵니다."""
+        legacy = StateStore(base_path=tmp_path, max_history_entries=5)
+        legacy.save_active_state({"pausedWorkers": [2], "schedulerState": "paused"})
+        legacy.append_history(_entry("A", minute=0))
+        legacy.append_history(_entry("B", minute=1))
+        with open(legacy.history_path, "a", encoding="utf-8") as f:
+            f.write("invalid\n")
+            f.write(json.dumps({"task_id": "C"}) + "\n")
+
+        store = SqliteStateStore(base_path=tmp_path, max_history_entries=5)
+        try:
+            assert store.get_paused_workers() == [2]
+            assert store.get_scheduler_state() == "paused"
+            assert [e["task_id"] for e in store.list_history()] == ["C", "B", "A"]
+            assert store.import_json() is False
+        finally:
+            store.close()
+
+        reopened = SqliteStateStore(base_path=tmp_path, max_history_entries=5)
+        try:
+            assert len(reopened.list_history()) == 3
+        finally:
+            reopened.close()
+
+    def test_concurrent_import_runs_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """다른 프로세스가 확인 직후 먼저 가져와도 중복으로 넣지 않습니다."""
+        StateStore(base_path=tmp_path).append_history(_entry("A"))
+        first = SqliteStateStore(base_path=tmp_path, import_legacy=False)
+        second = SqliteStateStore(base_path=tmp_path, import_legacy=False)
+
+        def racing_store(base_path: Path, max_history_entries: int) -> StateStore:
+            # 두 번째 프로세스가 파일을 읽는 사이에 첫 번째 프로세스가 가져오기를 끝냄
+            monkeypatch.undo()
+            assert first.import_json() is True
+            return StateStore(base_path, max_history_entries)
+
+        monkeypatch.setattr(
+            "orchay.infrastructure.persistence.sqlite_store.StateStore", racing_store
+        )
+        try:
+            assert second.import_json() is False
+            assert [e["task_id"] for e in second.list_history()] == ["A"]
+        finally:
+            first.close()
+            second.close()
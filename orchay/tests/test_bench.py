@@ -0,0 +1,126 @@
+"""orchay bench 테스트."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from orchay.bench import BenchConfig, run_bench
+from orchay.bench.runner import Percentiles, write_bench_project
+from orchay.scheduler import _get_workflow_engine
+from orchay.utils.wezterm import set_terminal_backend
+from orchay.wbs_parser import parse_wbs
+
+
+class TestPercentiles:
+    """분포 요약 테스트."""
+
+    def test_nearest_rank(self) -> None:
+        """nearest-rank 백분위수를 계산합니다."""
+        result = Percentiles.from_samples([float(i) for i in range(1, 101)])
+        assert (result.count, result.p50, result.p95, result.max) == (100, 50.0, 95.0, 100.0)
+
+    def test_empty(self) -> None:
+        """측정값이 없으면 0."""
+        assert Percentiles.from_samples([]) == Percentiles()
+
+
+class TestBenchProject:
+    """합성 프로젝트 생성 테스트."""
+
+    async def test_synthetic_wbs(self, tmp_path: Path) -> None:
+        """작업 패키지별로 나뉜 Task를 생성합니다."""
+        wbs_path = write_bench_project(tmp_path, 120)
+
+        tasks = await parse_wbs(wbs_path)
+        assert len(tasks) == 120
+        assert len({t.id for t in tasks}) == 120
+        assert all(t.status.value == "[ ]" for t in tasks)
+        assert (tmp_path / ".orchay" / "settings" / "workflows.json").exists()
+
+
+class TestRunBench:
+    """벤치마크 실행 테스트."""
+
+    async def test_all_tasks_complete(self) -> None:
+        """모든 Task가 [xx]까지 진행되고 측정값이 채워집니다."""
+        engine = _get_workflow_engine()
+
+        report = await run_bench(
+            BenchConfig(
+                workers=3,
+                tasks=5,
+                duration=(0.01, 0.02),
+                failure_rate=0.2,
+                tick_interval=0.05,
+                timeout=30,
+                seed=7,
+            )
+        )
+
+        assert not report.timed_out
+        assert report.completed == 5
+        # force 모드: start/build/verify/done 명령 (approve는 스케줄러가 직접 처리)
+        assert report.steps == 20
+        assert report.ticks > 0
+        assert report.dispatch_latency.count == report.steps + report.failures
+        assert report.terminal_calls["send-text"] > 0
+        assert report.file_writes > 0
+        assert report.tasks_per_hour > 0
+
+        # 전역 교체 복원
+        assert set_terminal_backend(None) is None
+        assert _get_workflow_engine() is engine
+
+
+class TestYamlBench:
+    """YAML 백엔드 벤치마크 테스트."""
+
+    def test_synthetic_wbs_uses_fast_loader(self) -> None:
+        """합성 WBS는 fast 로더로 읽을 수 있고 safe_load와 결과가 같습니다."""
+        import yaml
+
+        from orchay.bench.yaml_bench import generate_wbs
+        from orchay.utils.yaml_loader import fast_load
+
+        content = generate_wbs(150)
+        data = fast_load(content)
+        assert data == yaml.safe_load(content)
+        assert sum(len(wp["tasks"]) for wp in data["workPackages"]) == 150
+
+    def test_run_yaml_bench(self) -> None:
+        """크기/백엔드별 결과를 반환합니다."""
+        from orchay.bench.yaml_bench import run_yaml_bench
+
+        results = run_yaml_bench(sizes=(10, 30), backends=("fast", "python"), repeat=1)
+
+        assert [(r.size, r.backend) for r in results] == [
+            (10, "fast"),
+            (10, "python"),
+            (30, "fast"),
+            (30, "python"),
+        ]
+        assert all(r.matches_reference for r in results)
+        assert all(r.load_seconds > 0 and r.parse_seconds > 0 for r in results)
+        assert all(r.peak_bytes > 0 for r in results)
+
+
+class TestModelBench:
+    """Task/Worker 모델 벤치마크 테스트."""
+
+    def test_run_model_bench(self) -> None:
+        """pydantic 모델과 런타임 표현의 객체당 결과를 반환합니다."""
+        from orchay.bench.model_bench import run_model_bench
+
+        results = run_model_bench(count=50, repeat=1, min_time=0.0)
+
+        assert [(r.model, r.impl) for r in results] == [
+            ("Task", "pydantic"),
+            ("Task", "slots"),
+            ("Worker", "pydantic"),
+            ("Worker", "slots"),
+        ]
+        assert all(r.count == 50 for r in results)
+        assert all(r.construct_seconds > 0 and r.assign_seconds > 0 for r in results)
+        # 런타임 표현이 객체당 메모리를 덜 사용
+        assert results[1].bytes_per_object < results[0].bytes_per_object
+        assert results[3].bytes_per_object < results[2].bytes_per_object
@@ -282,4 +282,143 @@ class TestHandleHistory:
 
         assert result == 0
 
+    def test_handle_history_show(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--show일 때만 압축 저장된 출력을 복원하여 표시합니다."""
+        from argparse import Namespace
+
+        from orchay.cli import handle_history
+        from orchay.utils.history import HistoryEntry, HistoryManager
+
+        history_file = tmp_path / ".orchay" / "logs" / "orchay-history.jsonl"
+        manager = HistoryManager(str(history_file))
+        manager.save(
+            HistoryEntry(
+                task_id="TSK-01-01",
+                command="build",
+                result="success",
+                worker_id=1,
+                timestamp="2025-12-28 12:00:00",
+                output="Build output here",
+            )
+        )
+        assert "Build output here" not in history_file.read_text(encoding="utf-8")
+
+        monkeypatch.chdir(tmp_path)
+
+        assert handle_history(Namespace(task_id="TSK-01-01", limit=10, clear=False)) == 0
+        assert "Build output here" not in capsys.readouterr().out
+
+        assert handle_history(Namespace(task_id=None, limit=10, clear=False, show=True)) == 0
+        assert "Build output here" in capsys.readouterr().out
+
+
+class TestHandleSignal:
+    """handle_signal 함수 테스트."""
+
+    def test_rejects_unknown_signal(self) -> None:
+        """알 수 없는 신호는 전송하지 않습니다."""
+        from argparse import Namespace
+
+        from orchay.cli import handle_signal
+
+        assert handle_signal(Namespace(signal="hello", pane=1)) == 1
+
+    def test_requires_pane(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """pane ID를 알 수 없으면 실패합니다."""
+        from argparse import Namespace
+
+        from orchay.cli import handle_signal
+
+        monkeypatch.delenv("WEZTERM_PANE", raising=False)
+        assert handle_signal(Namespace(signal="ORCHAY_ERROR", pane=None)) == 1
+
+    def test_sends_to_configured_socket(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """프로젝트 루트 기준 소켓 경로로 WEZTERM_PANE의 신호를 전송합니다."""
+        from argparse import Namespace
+        from unittest.mock import patch
+
+        from orchay.cli import handle_signal
+
+        (tmp_path / ".orchay").mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("WEZTERM_PANE", "4")
+
+        with patch(
+            "orchay.utils.signal_listener.send_signal", return_value="ok"
+        ) as mock_send:
+            result = handle_signal(Namespace(signal="ORCHAY_ERROR", pane=None))
+
+        assert result == 0
+        mock_send.assert_called_once_with(
+            tmp_path.resolve() / ".orchay/logs/orchay.sock", 4, "ORCHAY_ERROR"
+        )
+
+
+class TestHandleBench:
+    """handle_bench 함수 테스트."""
+
+    def test_parse_bench_options(self) -> None:
+        """bench 옵션 파싱."""
+        from orchay.cli import create_parser
+
+        args = create_parser().parse_args(
+            ["bench", "-w", "20", "-t", "50", "--duration", "0.5", "1.5", "--failure-rate", "0.1"]
+        )
+
+        assert args.command == "bench"
+        assert args.workers == 20
+        assert args.tasks == 50
+        assert args.duration == [0.5, 1.5]
+        assert args.failure_rate == 0.1
+
+    def test_rejects_invalid_counts(self) -> None:
+        """Worker/Task 수가 0이면 실행하지 않습니다."""
+        from orchay.cli import create_parser, handle_bench
+
+        args = create_parser().parse_args(["bench", "-w", "0"])
+        assert handle_bench(args) == 1
+
+    def test_runs_small_bench(self) -> None:
+        """작은 벤치마크를 끝까지 실행합니다."""
+        from orchay.cli import create_parser, handle_bench
+
+        args = create_parser().parse_args(
+            ["bench", "-w", "2", "-t", "3", "--duration", "0.01", "0.02",
+             "--tick-interval", "0.05", "--timeout", "30", "-v"]
+        )
+        assert handle_bench(args) == 0
+
+    def test_parse_bench_yaml_options(self) -> None:
+        """bench yaml 옵션 파싱."""
+        from orchay.cli import create_parser
+
+        args = create_parser().parse_args(
+            ["bench", "yaml", "--sizes", "100", "1000", "--backends", "fast", "libyaml"]
+        )
+
+        assert args.command == "bench"
+        assert args.bench_command == "yaml"
+        assert args.sizes == [100, 1000]
+        assert args.backends == ["fast", "libyaml"]
+
+    def test_runs_small_yaml_bench(self) -> None:
+        """작은 YAML 벤치마크를 실행합니다."""
+        from orchay.cli import create_parser, handle_bench
+
+        args = create_parser().parse_args(
+            ["bench", "yaml", "--sizes", "20", "--backends", "auto", "python", "--repeat", "1"]
+        )
+        assert handle_bench(args) == 0
+
+    def test_runs_small_model_bench(self) -> None:
+        """작은 모델 벤치마크를 실행합니다."""
+        from orchay.cli import create_parser, handle_bench
+
+        args = create_parser().parse_args(["bench", "models", "--count", "20", "--repeat", "1"])
 
+        assert args.bench_command == "models"
+        assert handle_bench(args) == 0
@@ -1,6 +1,7 @@
 """main.py 테스트."""
 
 import asyncio
+import json
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -245,6 +246,17 @@ class TestOrchestratorInit:
         assert orch._worker_service is not None
         assert orch._dispatch_service is not None
 
+    def test_init_snapshot_dir(self, tmp_wbs: Path, tmp_path: Path) -> None:
+        """WBS 스냅샷은 프로젝트 루트 기준 캐시 디렉토리를 사용합니다."""
+        orch = Orchestrator(Config(), tmp_wbs, tmp_path, "test")
+        assert orch.parser._snapshot is not None
+        assert orch.parser._snapshot.path.parent == tmp_path / ".orchay" / "cache"
+
+        config = Config()
+        config.cache.enabled = False
+        orch = Orchestrator(config, tmp_wbs, tmp_path, "test")
+        assert orch.parser._snapshot is None
+
 
 class TestOrchestratorInitialize:
     """Orchestrator.initialize 메서드 테스트."""
@@ -430,6 +442,24 @@ class TestOrchestratorTick:
         # 일시정지 상태에서는 get_executable_tasks 호출 안 함
         orchestrator._task_service.get_executable_tasks.assert_not_called()
 
+    async def test_records_tick_profile(self, orchestrator: Orchestrator, tmp_path: Path) -> None:
+        """tick 단계별 소요 시간을 기록하고 메트릭 파일을 저장합니다."""
+        orchestrator._task_service.reload_tasks = AsyncMock(return_value=[])
+        orchestrator._task_service.get_executable_tasks.return_value = []
+        orchestrator._worker_service.update_worker_state_with_continuation = AsyncMock()
+        orchestrator._worker_service.running_task_ids.return_value = set()
+
+        await orchestrator._tick()
+
+        profiler = orchestrator.profiler
+        assert profiler.ticks == 1
+        for phase in ("tick", "reload", "detect", "detect.worker.1", "sync", "dispatch", "status"):
+            stats = profiler.stats(phase)
+            assert stats is not None and stats.count == 1
+        metrics = json.loads((tmp_path / ".orchay/logs/orchay-metrics.json").read_text())
+        assert metrics["ticks"] == 1
+        assert "dispatch" in metrics["phases"]
+
 
 class TestOrchestratorDispatchIdleWorkers:
     """Orchestrator._dispatch_idle_workers 메서드 테스트."""
@@ -539,6 +569,103 @@ class TestOrchestratorDispatchIdleWorkers:
         orchestrator._dispatch_service.dispatch_task.assert_not_called()
 
 
+class TestOrchestratorConcurrentPolling:
+    """Orchestrator._update_worker_states 동시 폴링 테스트."""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path: Path) -> Orchestrator:
+        """Worker 3개를 가진 테스트용 Orchestrator."""
+        wbs_file = tmp_path / "wbs.yaml"
+        wbs_file.write_text("# WBS\n")
+
+        config = Config()
+        config.detection.poll_timeout = 0.2
+        orch = Orchestrator(config, wbs_file, tmp_path, "test")
+        orch.workers = [Worker(id=i, pane_id=i) for i in (1, 2, 3)]
+        orch._worker_service = MagicMock()
+        return orch
+
+    async def test_polls_workers_concurrently(self, orchestrator: Orchestrator) -> None:
+        """tick 시간이 pane 합계가 아니라 가장 느린 pane으로 제한됩니다."""
+
+        async def slow_update(worker: Worker, **kwargs: object) -> None:
+            await asyncio.sleep(0.1)
+
+        orchestrator._worker_service.update_worker_state_with_continuation = AsyncMock(
+            side_effect=slow_update
+        )
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await orchestrator._update_worker_states()
+        elapsed = loop.time() - start
+
+        assert orchestrator._worker_service.update_worker_state_with_continuation.call_count == 3
+        assert elapsed < 0.25
+
+    async def test_hung_pane_is_isolated(self, orchestrator: Orchestrator) -> None:
+        """응답 없는 pane은 시간 초과로 격리되고 나머지 Worker는 갱신됩니다."""
+        updated: list[int] = []
+
+        async def update(worker: Worker, **kwargs: object) -> None:
+            if worker.id == 2:
+                await asyncio.sleep(10)
+            updated.append(worker.id)
+
+        orchestrator._worker_service.update_worker_state_with_continuation = AsyncMock(
+            side_effect=update
+        )
+
+        await orchestrator._update_worker_states()
+        await orchestrator._update_worker_states()
+
+        assert sorted(updated) == [1, 1, 3, 3]
+        assert orchestrator.slow_workers == {2: 2}
+
+    async def test_error_is_isolated(self, orchestrator: Orchestrator) -> None:
+        """한 Worker의 예외가 다른 Worker 폴링을 중단시키지 않습니다."""
+        updated: list[int] = []
+
+        async def update(worker: Worker, **kwargs: object) -> None:
+            if worker.id == 1:
+                raise RuntimeError("boom")
+            updated.append(worker.id)
+
+        orchestrator._worker_service.update_worker_state_with_continuation = AsyncMock(
+            side_effect=update
+        )
+
+        await orchestrator._update_worker_states()
+
+        assert sorted(updated) == [2, 3]
+
+    async def test_recovery_clears_timeout_count(self, orchestrator: Orchestrator) -> None:
+        """응답이 회복되면 시간 초과 기록을 지웁니다."""
+        orchestrator._poll_timeouts = {1: 3}
+        orchestrator._worker_service.update_worker_state_with_continuation = AsyncMock()
+
+        await orchestrator._update_worker_states()
+
+        assert orchestrator.slow_workers == {}
+
+    async def test_sequential_mode(self, orchestrator: Orchestrator) -> None:
+        """concurrent_polling=False면 Worker 순서대로 폴링합니다."""
+        orchestrator.config.detection.concurrent_polling = False
+        order: list[int] = []
+
+        async def update(worker: Worker, **kwargs: object) -> None:
+            await asyncio.sleep(0.01 * (4 - worker.id))
+            order.append(worker.id)
+
+        orchestrator._worker_service.update_worker_state_with_continuation = AsyncMock(
+            side_effect=update
+        )
+
+        await orchestrator._update_worker_states()
+
+        assert order == [1, 2, 3]
+
+
 class TestOrchestratorRun:
     """Orchestrator.run 메서드 테스트."""
 
@@ -585,6 +712,136 @@ class TestOrchestratorRun:
         assert call_count >= 2
 
 
+class TestOrchestratorSignals:
+    """Worker 신호 수신 테스트."""
+
+    async def test_signal_wakes_run_loop(self, tmp_path: Path) -> None:
+        """신호가 도착하면 폴링 간격을 기다리지 않고 다음 tick을 실행합니다."""
+        import tempfile
+
+        from orchay.utils.signal_listener import send_signal
+
+        wbs_file = tmp_path / "wbs.yaml"
+        wbs_file.write_text("# WBS\n")
+        config = Config()
+        config.signal.enabled = True
+        config.signal.fallback_interval = 60
+
+        with tempfile.TemporaryDirectory(prefix="orchay") as sock_dir:
+            config.signal.socket_path = f"{sock_dir}/s.sock"
+            orch = Orchestrator(config, wbs_file, tmp_path, "test")
+            drained: list[dict[int, Any]] = []
+
+            async def tick() -> None:
+                assert orch._signal_listener is not None
+                drained.append(orch._signal_listener.drain())
+                if len(drained) == 2:
+                    orch.stop()
+
+            orch._tick = tick  # type: ignore[method-assign]
+            run_task = asyncio.create_task(orch.run())
+            while not orch.signals_active:
+                await asyncio.sleep(0.01)
+
+            assert orch.poll_interval == 60
+            response = await asyncio.to_thread(
+                send_signal, Path(config.signal.socket_path), 3, "ORCHAY_ERROR"
+            )
+            await asyncio.wait_for(run_task, timeout=5)
+
+        assert response == "ok"
+        assert list(drained[1]) == [3]
+        assert not orch.signals_active
+
+    async def test_signal_kept_during_grace_period(self, tmp_path: Path) -> None:
+        """grace period라 처리하지 못한 Worker 신호는 다음 tick으로 넘깁니다."""
+        from datetime import datetime
+
+        from orchay.utils.signal_listener import WorkerSignal
+        from orchay.utils.wezterm import PaneInfo
+
+        wbs_file = tmp_path / "wbs.yaml"
+        wbs_file.write_text("# WBS\n")
+        config = Config()
+        config.signal.enabled = True
+        orch = Orchestrator(config, wbs_file, tmp_path, "test")
+        listener = orch._signal_listener  # pyright: ignore[reportPrivateUsage]
+        assert listener is not None
+        orch.workers = [
+            Worker(id=1, pane_id=1, state=WorkerState.BUSY, dispatch_time=datetime.now())
+        ]
+        listener.push(WorkerSignal(1, "done", "ORCHAY_DONE:TSK-01-01:build:success"))
+        listener.push(WorkerSignal(9, "error", "ORCHAY_ERROR"))
+        panes = [PaneInfo(pane_id=1, workspace="default", cwd="/", title="", rows=50)]
+
+        with (
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_list_panes",
+                new_callable=AsyncMock,
+                return_value=panes,
+            ),
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_get_text",
+                new_callable=AsyncMock,
+                return_value="> \n",
+            ),
+        ):
+            await orch.run_tick()
+
+        assert not listener.wake.is_set()
+        assert list(listener.drain()) == [1]
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """기본 설정에서는 신호 수신 없이 기존 간격으로 폴링합니다."""
+        orch = Orchestrator(Config(), tmp_path / "wbs.yaml", tmp_path, "test")
+
+        assert orch._signal_listener is None
+        assert orch.poll_interval == orch.config.interval
+
+
+class TestOrchestratorWbsWatch:
+    """WBS 파일 감시 테스트."""
+
+    async def test_wbs_change_wakes_and_reparses(self, tmp_path: Path) -> None:
+        """WBS가 바뀌면 대기를 깨우고, 바뀌지 않은 tick은 파싱하지 않습니다."""
+        wbs_file = tmp_path / "wbs.yaml"
+        wbs_file.write_text(
+            "workPackages:\n  - id: WP-01\n    tasks:\n"
+            '      - id: TSK-01-01\n        title: Task\n        status: "[ ]"\n'
+        )
+        config = Config()
+        config.watch.debounce = 0.05
+        orch = Orchestrator(config, wbs_file, tmp_path, "test")
+
+        assert await orch.start_wbs_watcher()
+        try:
+            assert orch.wbs_watch_active
+            with patch.object(orch.parser, "parse", wraps=orch.parser.parse) as mock_parse:
+                await orch._task_service.reload_tasks()
+                await orch._task_service.reload_tasks()
+                assert mock_parse.call_count == 1
+
+                await asyncio.sleep(0.2)
+                wbs_file.write_text(wbs_file.read_text().replace("[ ]", "[dd]"))
+                assert await orch.wait_for_signal(5)
+
+                tasks = await orch._task_service.reload_tasks()
+                assert mock_parse.call_count == 2
+            assert tasks[0].status == TaskStatus.DETAIL_DESIGN
+        finally:
+            await orch.stop_wbs_watcher()
+        assert not orch.wbs_watch_active
+
+    async def test_disabled(self, tmp_path: Path) -> None:
+        """watch.enabled가 False면 감시하지 않습니다."""
+        config = Config()
+        config.watch.enabled = False
+        orch = Orchestrator(config, tmp_path / "wbs.yaml", tmp_path, "test")
+
+        assert not await orch.start_wbs_watcher()
+        assert not orch.wbs_watch_active
+
+
 class TestOrchestratorPrintStatus:
     """Orchestrator.print_status 메서드 테스트."""
 
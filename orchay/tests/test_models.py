@@ -0,0 +1,86 @@
+"""Task 모델 테스트."""
+
+import pytest
+from pydantic import ValidationError
+
+from orchay.models import ExecutionInfo, Task, TaskCategory, TaskModel, TaskPriority, TaskStatus
+from orchay.models.task import TASK_FIELDS
+
+
+class TestTaskRuntime:
+    """런타임 Task 표현 테스트."""
+
+    def test_defaults_match_model(self) -> None:
+        """기본값이 pydantic 모델과 같습니다 (목록 필드는 튜플)."""
+        task = Task(id="TSK-01-01", title="Task", category=TaskCategory.DEVELOPMENT)
+        model = TaskModel(id="TSK-01-01", title="Task", category=TaskCategory.DEVELOPMENT)
+
+        assert tuple(TaskModel.model_fields) == TASK_FIELDS
+        for name in TASK_FIELDS:
+            value = getattr(task, name)
+            expected = getattr(model, name)
+            assert value == (tuple(expected) if isinstance(expected, list) else expected), name
+
+    def test_slots_and_tuples(self) -> None:
+        """__dict__ 없이 목록 필드를 튜플로 저장하고 빈 목록은 공유합니다."""
+        first = Task(id="TSK-01-01", title="A", category="development", depends=["TSK-00-01"])
+        second = Task(id="TSK-01-02", title="B", category="development")
+
+        assert not hasattr(first, "__dict__")
+        assert first.depends == ("TSK-00-01",)
+        assert first.requirements is second.requirements == ()
+
+    def test_enum_strings_coerced(self) -> None:
+        """enum 필드 문자열 값은 enum으로 변환합니다."""
+        task = Task(id="TSK-01-01", title="A", category="defect", status="[im]", priority="high")
+
+        assert task.category is TaskCategory.DEFECT
+        assert task.status is TaskStatus.IMPLEMENT
+        assert task.priority is TaskPriority.HIGH
+
+        with pytest.raises(ValueError):
+            Task(id="TSK-01-01", title="A", category="unknown")
+
+    def test_equality(self) -> None:
+        """모든 필드가 같으면 같은 Task입니다 (해시 불가)."""
+        first = Task(id="TSK-01-01", title="A", category="development")
+        second = Task(id="TSK-01-01", title="A", category="development")
+
+        assert first == second
+        second.assigned_worker = 1
+        assert first != second
+        with pytest.raises(TypeError):
+            hash(first)
+
+
+class TestTaskModelConversion:
+    """pydantic 모델 변환 테스트."""
+
+    def test_round_trip(self) -> None:
+        """pydantic 모델과 양방향 변환합니다."""
+        task = Task(
+            id="TSK-01-01",
+            title="Task",
+            category=TaskCategory.INFRASTRUCTURE,
+            status=TaskStatus.APPROVED,
+            tags=["infra"],
+            requirements=["요구사항 1"],
+            assigned_worker=2,
+            execution=ExecutionInfo(command="build", startedAt="2026-01-01T00:00:00"),
+        )
+
+        model = task.to_model()
+
+        assert model.tags == ["infra"]
+        assert model.execution == task.execution
+        assert Task.from_model(model) == task
+
+    def test_boundary_validation(self) -> None:
+        """외부 입력은 TaskModel에서 검증합니다."""
+        with pytest.raises(ValidationError):
+            TaskModel.model_validate({"id": "TSK-01-01", "title": "A", "category": "unknown"})
+
+        model = TaskModel.model_validate(
+            {"id": "TSK-01-01", "title": "A", "category": "defect", "depends": ["TSK-00-01"]}
+        )
+        assert Task.from_model(model).depends == ("TSK-00-01",)
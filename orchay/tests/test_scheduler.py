@@ -655,7 +655,9 @@ class TestHandleApprove:
 
             assert result is True
             assert task.status == TaskStatus.APPROVED
-            mock_update.assert_called_once_with(wbs_path, "TSK-01-01", "[ap]")
+            mock_update.assert_called_once_with(
+                wbs_path, "TSK-01-01", "[ap]", expected_status="[dd]"
+            )
 
     @pytest.mark.asyncio
     async def test_force_mode_update_fails(self) -> None:
@@ -0,0 +1,157 @@
+"""TaskStore 색인 테스트."""
+
+from __future__ import annotations
+
+from orchay.models import Task, TaskStatus, TaskStore
+from orchay.models.task_store import find_task, tasks_by_id
+
+
+def _task(task_id: str, **kwargs: object) -> Task:
+    """테스트용 Task 생성."""
+    return Task(id=task_id, title=task_id, category="development", **kwargs)  # type: ignore[arg-type]
+
+
+def _store() -> TaskStore:
+    """테스트용 TaskStore (T2, T3은 T1에 의존)."""
+    return TaskStore(
+        [
+            _task("T1", status=TaskStatus.DONE),
+            _task("T2", depends=["T1"], assigned_worker=1),
+            _task("T3", depends=["T1", "T2"]),
+        ]
+    )
+
+
+class TestTaskStoreQueries:
+    """색인 조회 테스트."""
+
+    def test_is_list(self) -> None:
+        """리스트와 같이 비교/인덱싱할 수 있습니다."""
+        store = _store()
+
+        assert isinstance(store, list)
+        assert [t.id for t in store] == ["T1", "T2", "T3"]
+        assert TaskStore() == []
+
+    def test_get(self) -> None:
+        """ID로 Task를 조회합니다."""
+        store = _store()
+
+        assert store.get("T2") is store[1]
+        assert store.get("T9") is None
+
+    def test_status_queries(self) -> None:
+        """상태별 Task를 리스트 순서로 조회합니다."""
+        store = _store()
+
+        assert [t.id for t in store.with_status(TaskStatus.TODO)] == ["T2", "T3"]
+        assert [t.id for t in store.without_status(TaskStatus.DONE)] == ["T2", "T3"]
+        assert [t.id for t in store.with_status(TaskStatus.DONE, TaskStatus.TODO)] == [
+            "T1",
+            "T2",
+            "T3",
+        ]
+
+    def test_assigned(self) -> None:
+        """할당된 Task를 Worker별로 조회합니다."""
+        store = _store()
+
+        assert [t.id for t in store.assigned()] == ["T2"]
+        assert [t.id for t in store.assigned(1)] == ["T2"]
+        assert store.assigned(2) == []
+
+    def test_dependents(self) -> None:
+        """역방향 의존성을 조회합니다."""
+        store = _store()
+
+        assert [t.id for t in store.dependents("T1")] == ["T2", "T3"]
+        assert [t.id for t in store.dependents("T2")] == ["T3"]
+        assert store.dependents("T3") == []
+
+    def test_duplicate_id_points_to_first(self) -> None:
+        """같은 ID가 여러 개면 먼저 나오는 Task를 반환합니다."""
+        first, second = _task("T1"), _task("T1", status=TaskStatus.DONE)
+        store = TaskStore([first, second])
+
+        assert store.get("T1") is first
+        store.remove(first)
+        assert store.get("T1") is second
+
+
+class TestTaskStoreUpdates:
+    """색인 갱신 테스트."""
+
+    def test_field_assignment_updates_indexes(self) -> None:
+        """Task 속성을 직접 바꿔도 색인이 갱신됩니다."""
+        store = _store()
+        t2, t3 = store[1], store[2]
+
+        t3.status = TaskStatus.IMPLEMENT
+        t2.assigned_worker = None
+        t3.assigned_worker = 2
+        t3.depends = ("T2",)
+
+        assert store.with_status(TaskStatus.IMPLEMENT) == [t3]
+        assert store.with_status(TaskStatus.TODO) == [t2]
+        assert store.assigned() == [t3]
+        assert store.assigned(1) == []
+        assert store.dependents("T1") == [t2]
+
+    def test_append_and_remove(self) -> None:
+        """추가/삭제한 Task가 색인에 반영됩니다."""
+        store = _store()
+        t4 = _task("T4", depends=["T1"])
+
+        store.append(t4)
+        assert store.get("T4") is t4
+        assert store.dependents("T1")[-1] is t4
+
+        removed = store.pop(0)
+        assert store.get("T1") is None
+        assert store.with_status(TaskStatus.DONE) == []
+        assert removed.store is None
+
+        # 저장소에서 빠진 Task 변경은 색인에 영향 없음
+        removed.status = TaskStatus.TODO
+        assert removed not in store.with_status(TaskStatus.TODO)
+
+    def test_discard_ids(self) -> None:
+        """ID로 여러 Task를 제거합니다."""
+        store = _store()
+
+        store.discard_ids({"T1", "T3"})
+
+        assert [t.id for t in store] == ["T2"]
+        assert store.get("T3") is None
+        assert store.dependents("T1") == [store[0]]
+
+    def test_reorder_keeps_list_order(self) -> None:
+        """순서를 바꾸면 조회 결과도 새 리스트 순서를 따릅니다."""
+        store = _store()
+
+        store.reverse()
+        store.insert(0, _task("T0"))
+
+        assert [t.id for t in store.with_status(TaskStatus.TODO)] == ["T0", "T3", "T2"]
+        store[1:] = []
+        assert [t.id for t in store.with_status(TaskStatus.TODO)] == ["T0"]
+        assert store.dependents("T1") == []
+
+
+class TestTaskLookupHelpers:
+    """tasks_by_id / find_task 테스트."""
+
+    def test_store_uses_index(self) -> None:
+        """TaskStore면 유지 중인 색인을 사용합니다."""
+        store = _store()
+
+        assert tasks_by_id(store) is store.by_id
+        assert find_task(store, "T3") is store[2]
+
+    def test_plain_list(self) -> None:
+        """일반 리스트도 지원합니다."""
+        tasks = [_task("T1"), _task("T2")]
+
+        assert tasks_by_id(tasks) == {"T1": tasks[0], "T2": tasks[1]}
+        assert find_task(tasks, "T2") is tasks[1]
+        assert find_task(tasks, "T9") is None
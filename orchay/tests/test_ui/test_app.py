@@ -16,6 +16,8 @@
 - TC-E2E-01: 전체 플로우
 """
 
+import asyncio
+
 import pytest
 from textual.widgets import DataTable, Footer, Header
 
@@ -534,3 +536,56 @@ async def test_action_show_help() -> None:
     async with app.run_test() as pilot:
         await pilot.press("f1")
         # 오류 없이 실행되면 성공
+
+
+class _SignalOrchestrator:
+    """신호 수신 루프 테스트용 Orchestrator (tick에서 신호를 drain)."""
+
+    def __init__(self) -> None:
+        self.poll_interval = 60.0
+        self.tasks: list[Task] = []
+        self.workers: list[Worker] = []
+        self.wake = asyncio.Event()
+        self.ticks = 0
+
+    async def start_signal_listener(self) -> bool:
+        return True
+
+    async def start_wbs_watcher(self) -> bool:
+        return False
+
+    async def stop_signal_listener(self) -> None:
+        pass
+
+    async def stop_wbs_watcher(self) -> None:
+        pass
+
+    async def wait_for_signal(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self.wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _tick(self) -> None:
+        await asyncio.sleep(0.05)
+        self.wake.clear()
+        self.ticks += 1
+
+    def stop(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_signal_runs_single_tick() -> None:
+    """신호 하나에 tick을 한 번만 실행합니다."""
+    config = Config()
+    config.signal.enabled = True
+    orchestrator = _SignalOrchestrator()
+    app = OrchayApp(config=config, interval=60, orchestrator=orchestrator)
+    async with app.run_test() as pilot:
+        await pilot.pause(0.1)
+        orchestrator.wake.set()
+        await pilot.pause(0.6)
+
+    assert orchestrator.ticks == 1
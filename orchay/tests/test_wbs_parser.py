@@ -1,13 +1,17 @@
 """WBS 파서 테스트."""
 
 import asyncio
+import os
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from orchay.models import TaskStatus
 from orchay.wbs_parser import (
     WbsParser,
+    WbsWatcher,
     parse_wbs,
     update_task_blocked_by,
     update_task_status,
@@ -210,6 +214,33 @@ workPackages:
         finally:
             await watcher.stop()
 
+    @pytest.mark.asyncio
+    async def test_watch_atomic_replace(self, tmp_path: Path) -> None:
+        """임시 파일 + rename으로 교체되는 쓰기도 감지합니다 (on_change: 파싱 없이 알림)."""
+        wbs_file = tmp_path / "wbs.yaml"
+        wbs_file.write_text(WBS_TEMPLATE.format(status="[ ]"), encoding="utf-8")
+        changed = asyncio.Event()
+
+        async def on_change() -> None:
+            changed.set()
+
+        watcher = WbsWatcher(wbs_file, debounce=0.05, on_change=on_change)
+        watcher.start()
+        try:
+            assert watcher.active
+            await asyncio.sleep(0.2)
+            assert await update_task_status(wbs_file, "TSK-01-01", "[dd]")
+
+            await asyncio.wait_for(changed.wait(), timeout=5.0)
+        finally:
+            await watcher.stop()
+        assert not watcher.active
+
+    def test_watcher_requires_callback(self, tmp_path: Path) -> None:
+        """callback과 on_change가 모두 없으면 ValueError."""
+        with pytest.raises(ValueError):
+            WbsWatcher(tmp_path / "wbs.yaml")
+
 
 class TestUpdateTaskStatus:
     """update_task_status() 함수 테스트."""
@@ -309,6 +340,46 @@ workPackages:
         assert tasks[0].status.value == "[ ]"  # TSK-01-01은 변경 없음
         assert tasks[1].status.value == "[im]"  # TSK-01-02만 변경
 
+    @pytest.mark.asyncio
+    async def test_update_status_in_place(self, tmp_path: Path) -> None:
+        """status 값만 고쳐 쓰고 주석/포맷은 유지합니다 (전체 덤프 없음)."""
+        wbs_file = tmp_path / "wbs.yaml"
+        original = """# 프로젝트 주석
+project:
+  id: test
+workPackages:
+  - id: WP-01
+    tasks:
+      - id: TSK-01-01
+        title: Test Task   # 제목
+        status: "[ ]"
+        depends: []
+"""
+        wbs_file.write_text(original, encoding="utf-8")
+
+        with patch("orchay.wbs_writer.dump_yaml") as mock_dump:
+            assert await update_task_status(wbs_file, "TSK-01-01", "[dd]")
+        mock_dump.assert_not_called()
+
+        assert wbs_file.read_text(encoding="utf-8") == original.replace('"[ ]"', '"[dd]"')
+        # 임시 파일 없음 (잠금 파일만 추가)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["wbs.yaml", "wbs.yaml.lock"]
+
+    @pytest.mark.asyncio
+    async def test_update_status_falls_back_to_dump(self, tmp_path: Path) -> None:
+        """줄 단위로 처리할 수 없는 형식(flow mapping Task)은 전체 덤프로 저장합니다."""
+        wbs_file = tmp_path / "wbs.yaml"
+        wbs_file.write_text("""workPackages:
+  - id: WP-01
+    tasks:
+      - {id: TSK-01-01, title: Flow Task, status: "[ ]"}
+""")
+
+        assert await update_task_status(wbs_file, "TSK-01-01", "[im]")
+
+        tasks = await parse_wbs(wbs_file)
+        assert tasks[0].status == TaskStatus.IMPLEMENT
+
 
 class TestUpdateTaskBlockedBy:
     """update_task_blocked_by() 함수 테스트."""
@@ -436,3 +507,263 @@ workPackages:
         tasks = await parse_wbs(wbs_file)
         assert len(tasks) == 1
         assert tasks[0].execution is None
+
+
+WBS_TEMPLATE = """project:
+  id: test
+workPackages:
+  - id: WP-01
+    title: WP
+    tasks:
+      - id: TSK-01-01
+        title: Task 1
+        status: "{status}"
+"""
+
+
+def _write_wbs(path: Path, status: str, mtime_ns: int | None = None) -> None:
+    """상태만 다른(크기가 같은) WBS 파일 작성 (mtime 지정 가능)."""
+    path.write_text(WBS_TEMPLATE.format(status=status), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestWbsFingerprint:
+    """파일 지문 기반 재파싱 생략 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_returns_cache(self, tmp_path: Path) -> None:
+        """내용이 같으면 다시 파싱하지 않고 같은 목록을 반환합니다 (touch 포함)."""
+        wbs = tmp_path / "wbs.yaml"
+        _write_wbs(wbs, "[ ]")
+        parser = WbsParser(wbs)
+
+        tasks1 = await parser.parse()
+        assert parser.changed
+        assert parser.fingerprint is not None
+
+        with patch("orchay.wbs_parser.load_yaml") as mock_load:
+            tasks2 = await parser.parse()
+            assert not parser.changed
+
+            # mtime만 바뀐 경우 (touch): 해시가 같으므로 파싱 생략
+            wbs.touch()
+            tasks3 = await parser.parse()
+            assert not parser.changed
+            mock_load.assert_not_called()
+
+        assert tasks2 is tasks1
+        assert tasks3 is tasks1
+
+    @pytest.mark.asyncio
+    async def test_racy_same_size_change_detected(self, tmp_path: Path) -> None:
+        """mtime과 크기가 같아도 mtime이 확인 시점과 가까우면 내용 해시로 변경을 감지합니다."""
+        wbs = tmp_path / "wbs.yaml"
+        mtime_ns = time.time_ns()
+        _write_wbs(wbs, "[dd]", mtime_ns)
+        parser = WbsParser(wbs)
+        tasks = await parser.parse()
+        assert tasks[0].status == TaskStatus.DETAIL_DESIGN
+
+        # 같은 mtime 안에서 같은 크기로 다시 수정됨
+        _write_wbs(wbs, "[ap]", mtime_ns)
+        tasks = await parser.parse()
+
+        assert parser.changed
+        assert tasks[0].status == TaskStatus.APPROVED
+
+    @pytest.mark.asyncio
+    async def test_old_mtime_trusts_stat(self, tmp_path: Path) -> None:
+        """mtime이 충분히 오래되었으면 stat만 비교하고 파일을 읽지 않습니다."""
+        wbs = tmp_path / "wbs.yaml"
+        old_ns = time.time_ns() - 60 * 1_000_000_000
+        _write_wbs(wbs, "[dd]", old_ns)
+        parser = WbsParser(wbs)
+        await parser.parse()
+
+        # mtime/크기를 그대로 둔 채 내용 변경 → stat 일치로 읽지 않음
+        _write_wbs(wbs, "[ap]", old_ns)
+        tasks = await parser.parse()
+        assert not parser.changed
+        assert tasks[0].status == TaskStatus.DETAIL_DESIGN
+
+        # invalidate() 후에는 다시 읽음
+        parser.invalidate()
+        tasks = await parser.parse()
+        assert parser.changed
+        assert tasks[0].status == TaskStatus.APPROVED
+
+    @pytest.mark.asyncio
+    async def test_update_task_status_detected(self, tmp_path: Path) -> None:
+        """update_task_status()로 바뀐 상태는 다음 parse()에 반영됩니다."""
+        wbs = tmp_path / "wbs.yaml"
+        _write_wbs(wbs, "[ ]")
+        parser = WbsParser(wbs)
+        await parser.parse()
+
+        assert await update_task_status(wbs, "TSK-01-01", "[dd]")
+        tasks = await parser.parse()
+
+        assert parser.changed
+        assert tasks[0].status == TaskStatus.DETAIL_DESIGN
+
+
+DELTA_WBS = """workPackages:
+  - id: WP-01
+    tasks:
+      - id: TSK-01-01
+        title: Task 1
+        status: "[ ]"
+      - id: TSK-01-02
+        title: Task 2
+        status: "[dd]"
+  - id: WP-02
+    tasks:
+      - id: TSK-02-01
+        title: Task 3
+        status: "[ ]"
+"""
+
+
+class TestWbsDelta:
+    """증분 파싱과 변경 내역 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_first_parse_adds_all(self, tmp_path: Path) -> None:
+        """첫 파싱은 모든 Task를 추가로 보고합니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+        parser = WbsParser(wbs)
+
+        await parser.parse()
+
+        assert parser.delta.added == ("TSK-01-01", "TSK-01-02", "TSK-02-01")
+        assert not parser.delta.removed
+        assert not parser.delta.changed
+
+    @pytest.mark.asyncio
+    async def test_changed_fields_only(self, tmp_path: Path) -> None:
+        """바뀐 Task의 바뀐 필드만 보고하고 기존 객체와 런타임 상태를 유지합니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+        parser = WbsParser(wbs)
+        before = await parser.parse()
+        before[1].assigned_worker = 2
+
+        wbs.write_text(
+            DELTA_WBS.replace('"[dd]"', '"[ap]"').replace("Task 2", "Task 2 수정"),
+            encoding="utf-8",
+        )
+        # 매핑이 바뀐 Task만 다시 만듦
+        with patch.object(parser, "_create_task", wraps=parser._create_task) as mock_create:
+            after = await parser.parse()
+
+        assert mock_create.call_count == 1
+        assert parser.delta.changed == {"TSK-01-02": frozenset({"status", "title"})}
+        assert parser.delta.changed_fields == {"status", "title"}
+        assert all(a is b for a, b in zip(after, before, strict=True))
+        assert after[1].status == TaskStatus.APPROVED
+        assert after[1].title == "Task 2 수정"
+        assert after[1].assigned_worker == 2
+
+    @pytest.mark.asyncio
+    async def test_added_and_removed(self, tmp_path: Path) -> None:
+        """추가/삭제된 Task를 보고하고 파일 순서를 유지합니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+        parser = WbsParser(wbs)
+        await parser.parse()
+
+        wbs.write_text(
+            DELTA_WBS.replace("TSK-01-01", "TSK-01-00")
+            + "      - id: TSK-02-02\n        title: Task 4\n",
+            encoding="utf-8",
+        )
+        tasks = await parser.parse()
+
+        assert [t.id for t in tasks] == ["TSK-01-00", "TSK-01-02", "TSK-02-01", "TSK-02-02"]
+        assert parser.delta.added == ("TSK-01-00", "TSK-02-02")
+        assert parser.delta.removed == ("TSK-01-01",)
+        assert not parser.delta.changed
+
+    @pytest.mark.asyncio
+    async def test_format_only_change_is_empty(self, tmp_path: Path) -> None:
+        """주석 등 Task 값이 그대로인 변경은 빈 변경 내역입니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+        parser = WbsParser(wbs)
+        await parser.parse()
+
+        wbs.write_text("# 주석\n" + DELTA_WBS, encoding="utf-8")
+        await parser.parse()
+
+        assert parser.changed
+        assert not parser.delta
+
+
+class TestWbsSnapshot:
+    """시작 스냅샷 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_cold_start_uses_snapshot(self, tmp_path: Path) -> None:
+        """내용이 같으면 새 파서가 YAML을 파싱하지 않고 스냅샷에서 복원합니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+        cache = tmp_path / "cache"
+        expected = await WbsParser(wbs, snapshot_dir=cache).parse()
+
+        parser = WbsParser(wbs, snapshot_dir=cache)
+        with patch("orchay.wbs_parser.load_yaml") as mock_load:
+            tasks = await parser.parse()
+
+        mock_load.assert_not_called()
+        assert parser.from_snapshot
+        assert parser.changed
+        assert tasks == expected
+        assert parser.delta.added == ("TSK-01-01", "TSK-01-02", "TSK-02-01")
+
+    @pytest.mark.asyncio
+    async def test_changed_content_full_parse(self, tmp_path: Path) -> None:
+        """내용이 바뀌었으면 전체 파싱하고 스냅샷을 갱신합니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+        cache = tmp_path / "cache"
+        await WbsParser(wbs, snapshot_dir=cache).parse()
+
+        wbs.write_text(DELTA_WBS.replace('"[dd]"', '"[ap]"'), encoding="utf-8")
+        parser = WbsParser(wbs, snapshot_dir=cache)
+        tasks = await parser.parse()
+
+        assert not parser.from_snapshot
+        assert tasks[1].status == TaskStatus.APPROVED
+
+        restarted = WbsParser(wbs, snapshot_dir=cache)
+        assert await restarted.parse() == tasks
+        assert restarted.from_snapshot
+
+    @pytest.mark.asyncio
+    async def test_reparse_after_snapshot(self, tmp_path: Path) -> None:
+        """스냅샷으로 시작한 뒤 파일이 바뀌면 같은 객체에 변경만 반영합니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+        cache = tmp_path / "cache"
+        await WbsParser(wbs, snapshot_dir=cache).parse()
+        parser = WbsParser(wbs, snapshot_dir=cache)
+        before = await parser.parse()
+
+        wbs.write_text(DELTA_WBS.replace("Task 3", "Task 3 수정"), encoding="utf-8")
+        after = await parser.parse()
+
+        assert not parser.from_snapshot
+        assert parser.delta.changed == {"TSK-02-01": frozenset({"title"})}
+        assert all(a is b for a, b in zip(after, before, strict=True))
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """snapshot_dir가 없으면 스냅샷을 쓰지 않습니다."""
+        wbs = tmp_path / "wbs.yaml"
+        wbs.write_text(DELTA_WBS, encoding="utf-8")
+
+        await WbsParser(wbs).parse()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["wbs.yaml"]
@@ -0,0 +1,209 @@
+"""WBS writer 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from orchay.utils.wbs_index import WbsLineIndex, get_line_index
+from orchay.wbs_writer import WbsWriter, get_wbs_writer, lock_path_for
+
+WBS = """# 주석
+workPackages:
+  - id: WP-01
+    tasks:
+      - id: TSK-01-01
+        status: "[dd]"
+      - id: TSK-01-02
+        status: "[dd]"
+      - id: TSK-01-03
+        status: "[ ]"
+        blocked-by: manual
+"""
+
+
+def _statuses(path: Path) -> dict[str, str]:
+    """파일의 Task ID → 상태."""
+    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    return {t["id"]: t.get("status", "[ ]") for t in data["workPackages"][0]["tasks"]}
+
+
+@pytest.fixture
+def wbs_file(tmp_path: Path) -> Path:
+    """테스트용 wbs.yaml."""
+    path = tmp_path / "wbs.yaml"
+    path.write_text(WBS, encoding="utf-8")
+    return path
+
+
+class TestBatching:
+    """변경 묶음 쓰기 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_single_write(self, wbs_file: Path) -> None:
+        """동시에 들어온 변경은 한 번의 쓰기로 저장합니다."""
+        writer = WbsWriter(wbs_file)
+
+        results = await asyncio.gather(
+            writer.set_status("TSK-01-01", "[ap]", expected="[dd]"),
+            writer.set_status("TSK-01-02", "[ap]", expected="[dd]"),
+            writer.set_blocked_by("TSK-01-03", None),
+            writer.set_status("TSK-99-99", "[ap]"),
+        )
+
+        assert results == ["applied", "applied", "applied", "not_found"]
+        assert writer.writes == 1
+        assert _statuses(wbs_file) == {"TSK-01-01": "[ap]", "TSK-01-02": "[ap]", "TSK-01-03": "[ ]"}
+        content = wbs_file.read_text(encoding="utf-8")
+        assert content.startswith("# 주석")
+        assert "blocked-by" not in content
+
+    @pytest.mark.asyncio
+    async def test_same_key_keeps_last_value(self, wbs_file: Path) -> None:
+        """같은 Task/필드 변경은 마지막 값만 씁니다."""
+        writer = WbsWriter(wbs_file)
+
+        results = await asyncio.gather(
+            writer.set_status("TSK-01-01", "[ap]"),
+            writer.set_status("TSK-01-01", "[im]"),
+        )
+
+        assert results == ["applied", "applied"]
+        assert writer.writes == 1
+        assert _statuses(wbs_file)["TSK-01-01"] == "[im]"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_skips_write(self, wbs_file: Path) -> None:
+        """값이 같으면 파일을 쓰지 않습니다."""
+        writer = WbsWriter(wbs_file)
+
+        assert await writer.set_status("TSK-01-01", "[dd]") == "unchanged"
+        assert await writer.set_blocked_by("TSK-01-03", "manual") == "unchanged"
+        assert writer.writes == 0
+
+    @pytest.mark.asyncio
+    async def test_fallback_in_same_batch(self, tmp_path: Path) -> None:
+        """줄 단위로 처리할 수 없는 Task가 섞여도 한 번에 저장합니다."""
+        path = tmp_path / "wbs.yaml"
+        path.write_text(
+            "workPackages:\n"
+            "  - id: WP-01\n"
+            "    tasks:\n"
+            '      - {id: TSK-01-01, status: "[ ]"}\n'
+            "      - id: TSK-01-02\n"
+            '        status: "[ ]"\n',
+            encoding="utf-8",
+        )
+        writer = WbsWriter(path)
+
+        results = await asyncio.gather(
+            writer.set_status("TSK-01-01", "[im]"),
+            writer.set_status("TSK-01-02", "[dd]"),
+        )
+
+        assert results == ["applied", "applied"]
+        assert writer.writes == 1
+        assert _statuses(path) == {"TSK-01-01": "[im]", "TSK-01-02": "[dd]"}
+
+    def test_registry_per_path(self, wbs_file: Path) -> None:
+        """경로당 하나의 writer를 사용합니다."""
+        assert get_wbs_writer(wbs_file) is get_wbs_writer(str(wbs_file))
+
+    @pytest.mark.asyncio
+    async def test_window_merges_staggered_updates(self, wbs_file: Path) -> None:
+        """window 안에 이어서 들어온 변경도 한 번의 쓰기로 저장합니다."""
+        writer = get_wbs_writer(wbs_file, window=0.2)
+        assert get_wbs_writer(wbs_file).window == 0.2
+
+        first = asyncio.create_task(writer.set_status("TSK-01-01", "[ap]"))
+        await asyncio.sleep(0.05)
+        second = await writer.set_status("TSK-01-02", "[ap]")
+
+        assert [await first, second] == ["applied", "applied"]
+        assert writer.writes == 1
+
+
+class TestConflicts:
+    """충돌 감지 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_expected_status_mismatch(self, wbs_file: Path) -> None:
+        """파일 상태가 기대 상태와 다르면 덮어쓰지 않습니다."""
+        writer = WbsWriter(wbs_file)
+        wbs_file.write_text(WBS.replace('"[dd]"', '"[im]"', 1), encoding="utf-8")
+
+        assert await writer.set_status("TSK-01-01", "[ap]", expected="[dd]") == "conflict"
+        assert writer.conflicts == 1
+        assert writer.writes == 0
+        assert _statuses(wbs_file)["TSK-01-01"] == "[im]"
+
+    @pytest.mark.asyncio
+    async def test_external_edit_preserved(self, wbs_file: Path) -> None:
+        """다른 writer가 바꾼 Task는 유지합니다 (쓰기 직전에 다시 읽음)."""
+        writer = WbsWriter(wbs_file)
+        await writer.set_status("TSK-01-01", "[ap]")
+
+        wbs_file.write_text(
+            wbs_file.read_text(encoding="utf-8").replace('status: "[dd]"', 'status: "[im]"'),
+            encoding="utf-8",
+        )
+        await writer.set_status("TSK-01-03", "[dd]")
+
+        assert _statuses(wbs_file) == {
+            "TSK-01-01": "[ap]",
+            "TSK-01-02": "[im]",
+            "TSK-01-03": "[dd]",
+        }
+
+    @pytest.mark.asyncio
+    async def test_unlocked_edit_during_write_retries(self, wbs_file: Path) -> None:
+        """읽기와 쓰기 사이에 잠금 없이 파일이 바뀌면 다시 읽어 적용합니다."""
+        writer = WbsWriter(wbs_file)
+        calls = 0
+
+        def edit_once(path: Path, raw: bytes) -> WbsLineIndex:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                # 다른 프로세스의 쓰기 (크기가 달라지도록 상태 변경)
+                wbs_file.write_text(WBS.replace('"[ ]"', '"[xx]"'), encoding="utf-8")
+            return get_line_index(path, raw)
+
+        with patch("orchay.wbs_writer.get_line_index", side_effect=edit_once):
+            assert await writer.set_status("TSK-01-01", "[ap]") == "applied"
+
+        assert calls == 2
+        assert writer.writes == 1
+        assert _statuses(wbs_file) == {
+            "TSK-01-01": "[ap]",
+            "TSK-01-02": "[dd]",
+            "TSK-01-03": "[xx]",
+        }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX flock")
+class TestLock:
+    """advisory lock 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_external_lock(self, wbs_file: Path) -> None:
+        """외부 프로세스가 잠금을 잡고 있으면 제한 시간 후 실패합니다."""
+        import fcntl
+
+        writer = WbsWriter(wbs_file, lock_timeout=0.1)
+        fd = os.open(lock_path_for(wbs_file), os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            assert await writer.set_status("TSK-01-01", "[ap]") == "failed"
+            assert _statuses(wbs_file)["TSK-01-01"] == "[dd]"
+
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            assert await writer.set_status("TSK-01-01", "[ap]") == "applied"
+        finally:
+            os.close(fd)
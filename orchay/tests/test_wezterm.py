@@ -179,6 +179,20 @@ class TestWeztermGetText:
         # 전체 텍스트 반환
         assert result == "line 1\nline 2\nline 3"
 
+    @pytest.mark.asyncio
+    async def test_get_text_line_range(self) -> None:
+        """start_line/end_line 지정 시 범위 옵션 전달."""
+        mock_process = AsyncMock()
+        mock_process.communicate = AsyncMock(return_value=(b"test", b""))
+        mock_process.returncode = 0
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            await wezterm_get_text(pane_id=1, lines=60, start_line=-20, end_line=39)
+
+        args = mock_exec.call_args.args
+        assert args[args.index("--start-line") + 1] == "-20"
+        assert args[args.index("--end-line") + 1] == "39"
+
 
 class TestPaneExists:
     """pane_exists 테스트."""
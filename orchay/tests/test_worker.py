@@ -8,7 +8,7 @@ from unittest.mock import patch
 import pytest
 
 import orchay.worker
-from orchay.models.worker import PausedInfo, Worker, WorkerState
+from orchay.models.worker import PausedInfo, Worker, WorkerModel, WorkerState
 from orchay.worker import (
     detect_worker_state,
     get_fallback_resume_time,
@@ -91,6 +91,45 @@ def reset_startup_time() -> None:
     orchay.worker._startup_time = time.time() - 100  # 100초 전으로 설정
 
 
+class TestWorkerRuntime:
+    """런타임 Worker 표현과 pydantic 모델 변환 테스트."""
+
+    def test_slots_without_dict(self) -> None:
+        """런타임 Worker는 __slots__ 객체입니다."""
+        worker = Worker(id=1, pane_id=2)
+
+        assert not hasattr(worker, "__dict__")
+        with pytest.raises(AttributeError):
+            worker.unknown = 1  # type: ignore[attr-defined]
+
+    def test_state_string_coerced(self) -> None:
+        """state 문자열 값은 enum으로 변환합니다."""
+        assert Worker(id=1, pane_id=1, state="busy").state is WorkerState.BUSY
+
+    def test_model_round_trip(self) -> None:
+        """pydantic 모델과 양방향 변환합니다."""
+        worker = Worker(
+            id=1,
+            pane_id=3,
+            state=WorkerState.PAUSED,
+            current_task="TSK-01-01",
+            dispatch_time=datetime(2026, 1, 1, 9, 0),
+            paused_info=PausedInfo(
+                reason="rate limit",
+                resume_at=datetime(2026, 1, 1, 10, 0),
+                detected_at=datetime(2026, 1, 1, 9, 30),
+            ),
+        )
+
+        model = worker.to_model()
+
+        assert isinstance(model, WorkerModel)
+        assert model.paused_info == worker.paused_info
+        assert model.state is WorkerState.PAUSED
+        assert Worker.from_model(model) == worker
+        assert Worker.from_model(model) != Worker(id=1, pane_id=3)
+
+
 class TestParseDoneSignal:
     """parse_done_signal 테스트."""
 
@@ -8,6 +8,8 @@ from pathlib import Path
 import pytest
 
 from orchay.utils.active_tasks import (
+    ActiveStateFile,
+    ActiveTasksData,
     _get_default_data,
     get_active_tasks_path,
     get_paused_workers,
@@ -217,3 +219,86 @@ class TestGetSchedulerState:
     def test_returns_running_by_default(self, active_tasks_file: Path) -> None:
         """TC-AT-19: 기본값으로 running을 반환합니다."""
         assert get_scheduler_state() == "running"
+
+
+class TestActiveStateFile:
+    """ActiveStateFile 캐시/원자적 저장 테스트."""
+
+    def test_reads_only_when_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """파일이 바뀌지 않으면 조회 시 다시 읽지 않습니다."""
+        path = tmp_path / "orchay-active.json"
+        path.write_text(json.dumps({"pausedWorkers": [1]}), encoding="utf-8")
+        state = ActiveStateFile(path)
+        reads: list[Path] = []
+        original = ActiveStateFile._read
+
+        def counting_read(self: ActiveStateFile) -> ActiveTasksData:
+            reads.append(self.path)
+            return original(self)
+
+        monkeypatch.setattr(ActiveStateFile, "_read", counting_read)
+
+        for _ in range(3):
+            assert state.is_worker_paused(1)
+        assert len(reads) == 1
+
+        # 외부 수정 (크기 변경)
+        path.write_text(
+            json.dumps({"pausedWorkers": [1, 2], "schedulerState": "paused"}), encoding="utf-8"
+        )
+
+        assert state.get_paused_workers() == [1, 2]
+        assert state.get_scheduler_state() == "paused"
+        assert len(reads) == 2
+
+    def test_own_writes_are_atomic_and_not_reread(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """저장은 새 파일로 교체하며, 자신이 쓴 파일은 다시 읽지 않습니다."""
+        path = tmp_path / "logs" / "orchay-active.json"
+        state = ActiveStateFile(path)
+        state.pause_worker(1)
+        inode = path.stat().st_ino
+
+        def fail_read(self: ActiveStateFile) -> ActiveTasksData:
+            pytest.fail("자신이 쓴 파일을 다시 읽음")
+
+        monkeypatch.setattr(ActiveStateFile, "_read", fail_read)
+
+        state.set_scheduler_state("paused")
+
+        assert path.stat().st_ino != inode
+        assert [p.name for p in path.parent.iterdir()] == ["orchay-active.json"]
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "pausedWorkers": [1],
+            "schedulerState": "paused",
+        }
+        assert state.load() == {"pausedWorkers": [1], "schedulerState": "paused"}
+
+    def test_load_returns_copy(self, tmp_path: Path) -> None:
+        """load() 결과를 바꿔도 캐시는 바뀌지 않습니다."""
+        state = ActiveStateFile(tmp_path / "orchay-active.json")
+
+        state.load()["pausedWorkers"].append(3)
+
+        assert not state.is_worker_paused(3)
+
+    def test_coalesces_writes(self, tmp_path: Path) -> None:
+        """병합 간격 안의 연속 저장은 flush()나 간격이 지난 뒤 한 번 기록합니다."""
+        path = tmp_path / "orchay-active.json"
+        state = ActiveStateFile(path, coalesce=60.0)
+        state.pause_worker(1)  # 첫 저장은 즉시 기록
+        state.pause_worker(2)
+        state.set_scheduler_state("paused")
+
+        assert json.loads(path.read_text(encoding="utf-8"))["pausedWorkers"] == [1]
+        assert state.get_paused_workers() == [1, 2]
+
+        state.flush()
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "pausedWorkers": [1, 2],
+            "schedulerState": "paused",
+        }
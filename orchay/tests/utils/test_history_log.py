@@ -0,0 +1,215 @@
+"""HistoryLog 테스트."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from orchay.utils import history_log
+from orchay.utils.history_log import HistoryLog
+from orchay.utils.output_store import OutputStore
+
+
+def _record(i: int) -> dict[str, object]:
+    return {"task_id": f"TSK-{i:02d}", "output": "line\n" * 3}
+
+
+def _line_count(path: Path) -> int:
+    return len(path.read_bytes().splitlines())
+
+
+class TestHistoryLogAppend:
+    """추가 전용 저장 테스트."""
+
+    def test_append_does_not_rewrite(self, tmp_path: Path) -> None:
+        """저장은 기존 내용을 다시 쓰지 않고 파일 끝에 한 줄을 추가합니다."""
+        path = tmp_path / "logs" / "history.jsonl"
+        log = HistoryLog(path, max_entries=10)
+        log.append(_record(0))
+        inode = path.stat().st_ino
+        first = path.read_bytes()
+
+        log.append(_record(1))
+
+        assert path.stat().st_ino == inode
+        assert path.read_bytes().startswith(first)
+        assert [r["task_id"] for r in log.read()] == ["TSK-00", "TSK-01"]
+
+    def test_read_caps_to_max_entries_before_compaction(self, tmp_path: Path) -> None:
+        """압축 전이라도 조회는 최근 max_entries개만 반환합니다."""
+        path = tmp_path / "history.jsonl"
+        log = HistoryLog(path, max_entries=3, slack=10)
+        for i in range(6):
+            log.append(_record(i))
+
+        assert _line_count(path) == 6
+        assert [r["task_id"] for r in log.read()] == ["TSK-03", "TSK-04", "TSK-05"]
+
+
+class TestHistoryLogCompaction:
+    """보존 한도 압축 테스트."""
+
+    def test_compacts_after_slack(self, tmp_path: Path) -> None:
+        """줄 수가 max_entries + slack을 넘으면 최근 max_entries개로 압축합니다."""
+        path = tmp_path / "history.jsonl"
+        log = HistoryLog(path, max_entries=3, slack=2)
+        for i in range(5):
+            log.append(_record(i))
+        assert _line_count(path) == 5
+
+        log.append(_record(5))
+
+        assert _line_count(path) == 3
+        assert [r["task_id"] for r in log.read()] == ["TSK-03", "TSK-04", "TSK-05"]
+
+    def test_compact_drops_corrupted_lines(self, tmp_path: Path) -> None:
+        """압축은 손상된 줄을 버리고 유효한 항목만 남깁니다."""
+        path = tmp_path / "history.jsonl"
+        path.write_text(
+            "invalid\n" + "".join(json.dumps(_record(i)) + "\n" for i in range(4)),
+            encoding="utf-8",
+        )
+        log = HistoryLog(path, max_entries=2)
+
+        assert log.compact() == 3
+        assert [r["task_id"] for r in log.read()] == ["TSK-02", "TSK-03"]
+
+    def test_counts_existing_lines(self, tmp_path: Path) -> None:
+        """기존 파일의 줄 수를 이어받아 압축 시점을 정합니다."""
+        path = tmp_path / "history.jsonl"
+        path.write_text("".join(json.dumps(_record(i)) + "\n" for i in range(4)), encoding="utf-8")
+        log = HistoryLog(path, max_entries=2, slack=2)
+
+        log.append(_record(4))
+
+        assert _line_count(path) == 2
+
+    def test_background_compaction(self, tmp_path: Path) -> None:
+        """background=True면 별도 스레드에서 압축합니다."""
+        path = tmp_path / "history.jsonl"
+        log = HistoryLog(path, max_entries=2, slack=1, background=True)
+        for i in range(4):
+            log.append(_record(i))
+        log.wait()
+
+        assert _line_count(path) <= 3
+        assert [r["task_id"] for r in log.read()] == ["TSK-02", "TSK-03"]
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear는 파일을 삭제하고 줄 수를 초기화합니다."""
+        path = tmp_path / "history.jsonl"
+        log = HistoryLog(path, max_entries=2, slack=1)
+        for i in range(3):
+            log.append(_record(i))
+
+        log.clear()
+        log.append(_record(9))
+
+        assert not log.compact()
+        assert [r["task_id"] for r in log.read()] == ["TSK-09"]
+
+
+class TestHistoryLogQuery:
+    """역방향 읽기와 사이드카 색인 조회 테스트."""
+
+    def test_tail_reads_across_blocks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """블록 경계에 걸친 줄도 최신순으로 읽습니다."""
+        monkeypatch.setattr(history_log, "_BLOCK_SIZE", 7)
+        path = tmp_path / "history.jsonl"
+        log = HistoryLog(path, max_entries=10)
+        for i in range(5):
+            log.append(_record(i))
+        with open(path, "ab") as f:
+            f.write(b"invalid\n")
+
+        assert [r["task_id"] for r in log.tail(3)] == ["TSK-04", "TSK-03", "TSK-02"]
+        assert len(log.tail(100)) == 5
+
+    def test_tail_caps_to_max_entries(self, tmp_path: Path) -> None:
+        """압축 전 초과분은 tail에 포함하지 않습니다."""
+        log = HistoryLog(tmp_path / "history.jsonl", max_entries=2, slack=10)
+        for i in range(5):
+            log.append(_record(i))
+
+        assert [r["task_id"] for r in log.tail(10)] == ["TSK-04", "TSK-03"]
+
+    def test_latest_uses_index(self, tmp_path: Path) -> None:
+        """색인의 오프셋으로 Task의 가장 최근 항목을 읽습니다."""
+        path = tmp_path / "history.jsonl"
+        log = HistoryLog(path, max_entries=10)
+        log.append({"task_id": "A", "timestamp": "t1", "result": "error"})
+        log.append({"task_id": "B", "timestamp": "t2", "result": "success"})
+        log.append({"task_id": "A", "timestamp": "t3", "result": "success"})
+
+        refs = [json.loads(line) for line in log.index_path.read_text().splitlines()]
+        assert [(r["task_id"], r["timestamp"]) for r in refs] == [
+            ("A", "t1"),
+            ("B", "t2"),
+            ("A", "t3"),
+        ]
+        assert refs[-1]["offset"] + refs[-1]["length"] == path.stat().st_size
+        assert log.latest("A") == {"task_id": "A", "timestamp": "t3", "result": "success"}
+        assert log.latest("C") is None
+
+    def test_latest_rebuilds_stale_index(self, tmp_path: Path) -> None:
+        """색인이 없거나 파일 끝과 맞지 않으면 다시 만듭니다."""
+        path = tmp_path / "history.jsonl"
+        path.write_text(json.dumps(_record(0)) + "\n", encoding="utf-8")
+        log = HistoryLog(path, max_entries=10)
+
+        assert log.latest("TSK-00") is not None
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(_record(1)) + "\n")
+
+        assert log.latest("TSK-01") is not None
+
+    def test_latest_after_compaction(self, tmp_path: Path) -> None:
+        """압축 후 색인 오프셋을 새 파일 기준으로 다시 만듭니다."""
+        log = HistoryLog(tmp_path / "history.jsonl", max_entries=2, slack=1)
+        for i in range(4):
+            log.append(_record(i))
+
+        record = log.latest("TSK-03")
+        assert record is not None
+        assert record["task_id"] == "TSK-03"
+        assert log.latest("TSK-00") is None
+
+
+class TestHistoryLogOutputs:
+    """pane 출력 블롭 저장 테스트."""
+
+    def _log(self, tmp_path: Path, max_entries: int = 10, slack: int = 10) -> HistoryLog:
+        return HistoryLog(
+            tmp_path / "history.jsonl",
+            max_entries=max_entries,
+            slack=slack,
+            outputs=OutputStore(tmp_path / "blobs"),
+        )
+
+    def test_output_stored_as_reference(self, tmp_path: Path) -> None:
+        """출력은 블롭으로 저장하고 항목에는 참조만 남깁니다."""
+        log = self._log(tmp_path)
+        log.append({"task_id": "A", "worker_id": 1, "output": "captured text\n"})
+        log.append({"task_id": "B", "worker_id": 1, "output": ""})
+
+        assert b"captured text" not in log.path.read_bytes()
+        newest, oldest = log.tail(2)
+        assert newest["output_ref"] is None
+        assert "output" not in oldest
+        assert log.output(oldest) == "captured text\n"
+        assert log.output(newest) == ""
+        assert log.output({"task_id": "C", "output": "inline"}) == "inline"
+
+    def test_compaction_prunes_blobs(self, tmp_path: Path) -> None:
+        """압축 후 보존 항목이 참조하지 않는 블롭은 삭제합니다."""
+        log = self._log(tmp_path, max_entries=2, slack=1)
+        for i in range(4):
+            log.append({"task_id": f"T{i}", "worker_id": 1, "output": f"out {i}\n"})
+
+        assert len(list((tmp_path / "blobs").glob("*/*.z"))) == 2
+        assert [log.output(r) for r in log.tail(2)] == ["out 3\n", "out 2\n"]
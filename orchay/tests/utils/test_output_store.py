@@ -0,0 +1,81 @@
+"""OutputStore 테스트."""
+
+from __future__ import annotations
+
+import zlib
+from pathlib import Path
+
+from orchay.utils.output_store import OutputStore
+
+
+def _capture(start: int, count: int = 200) -> str:
+    """스크롤된 pane 캡처 흉내 (start번째 줄부터 count줄)."""
+    return "".join(f"[{i:04d}] building module {i} ... ok\n" for i in range(start, start + count))
+
+
+def _blob_size(store: OutputStore, ref: str) -> int:
+    return (store.root / ref[:2] / f"{ref}.z").stat().st_size
+
+
+class TestOutputStore:
+    """압축/델타 저장 테스트."""
+
+    def test_round_trip_and_dedupe(self, tmp_path: Path) -> None:
+        """저장한 출력을 그대로 복원하고, 같은 내용은 같은 참조를 씁니다."""
+        store = OutputStore(tmp_path / "blobs")
+        text = _capture(0)
+
+        ref = store.put(text)
+
+        assert store.put(text) == ref
+        assert OutputStore(tmp_path / "blobs").get(ref) == text
+        assert len(list((tmp_path / "blobs").glob("*/*.z"))) == 1
+
+    def test_delta_against_previous_capture(self, tmp_path: Path) -> None:
+        """직전 캡처와 겹치는 출력은 델타로 작게 저장합니다."""
+        store = OutputStore(tmp_path / "blobs")
+        first = store.put(_capture(0))
+        second = store.put(_capture(10), base=first)
+
+        assert _blob_size(store, second) < _blob_size(store, first) / 2
+        # 캐시 없이 기준 체인을 따라 복원
+        assert OutputStore(tmp_path / "blobs").get(second) == _capture(10)
+
+    def test_chain_length_is_bounded(self, tmp_path: Path) -> None:
+        """델타 체인이 max_chain에 이르면 전체 내용을 저장합니다."""
+        store = OutputStore(tmp_path / "blobs", max_chain=2)
+        refs = [store.put(_capture(0))]
+        for i in range(1, 4):
+            refs.append(store.put(_capture(i), base=refs[-1]))
+
+        fresh = OutputStore(tmp_path / "blobs", max_chain=2)
+        assert [fresh.get(ref) for ref in refs] == [_capture(i) for i in range(4)]
+        assert _blob_size(store, refs[3]) > _blob_size(store, refs[2])
+
+    def test_missing_base_stores_full(self, tmp_path: Path) -> None:
+        """델타 기준을 읽을 수 없으면 전체 내용을 저장합니다."""
+        store = OutputStore(tmp_path / "blobs")
+
+        ref = store.put("hello\n", base="0" * 32)
+
+        assert OutputStore(tmp_path / "blobs").get(ref) == "hello\n"
+
+    def test_prune_keeps_delta_bases(self, tmp_path: Path) -> None:
+        """살아 있는 참조의 기준 블롭은 남기고 나머지를 삭제합니다."""
+        store = OutputStore(tmp_path / "blobs")
+        orphan = store.put("unrelated\n")
+        base = store.put(_capture(0))
+        live = store.put(_capture(5), base=base)
+
+        assert store.prune([live]) == 1
+        assert not (store.root / orphan[:2] / f"{orphan}.z").exists()
+        assert OutputStore(tmp_path / "blobs").get(live) == _capture(5)
+
+    def test_blob_is_zlib_compressed(self, tmp_path: Path) -> None:
+        """블롭 파일은 zlib 압축 데이터입니다."""
+        store = OutputStore(tmp_path / "blobs")
+        ref = store.put(_capture(0))
+
+        data = zlib.decompress((store.root / ref[:2] / f"{ref}.z").read_bytes())
+
+        assert data.startswith(b'{"text":')
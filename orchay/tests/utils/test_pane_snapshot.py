@@ -0,0 +1,150 @@
+"""PaneSnapshot 테스트."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from orchay.utils.pane_snapshot import PaneSnapshot
+from orchay.utils.wezterm import PaneInfo, WezTermNotFoundError
+from orchay.worker import detect_worker_state, extract_running_task_from_pane
+
+
+def make_panes(*pane_ids: int) -> list[PaneInfo]:
+    """테스트용 PaneInfo 목록 생성."""
+    return [PaneInfo(pane_id=pid, workspace="default", cwd="/", title="") for pid in pane_ids]
+
+
+class TestPrefetch:
+    """prefetch 테스트."""
+
+    async def test_single_list_and_one_capture_per_pane(self) -> None:
+        """목록 1회, pane별 get-text 1회만 호출합니다."""
+        snapshot = PaneSnapshot()
+        with (
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_list_panes",
+                new_callable=AsyncMock,
+                return_value=make_panes(1, 2),
+            ) as mock_list,
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_get_text",
+                new_callable=AsyncMock,
+                side_effect=lambda pid, lines: f"pane {pid}\n>",
+            ) as mock_get_text,
+        ):
+            await snapshot.prefetch([1, 2, 1, 3])
+
+            assert await snapshot.pane_exists(1)
+            assert not await snapshot.pane_exists(3)
+            assert await snapshot.get_text(1, lines=50) == "pane 1\n>"
+            assert await snapshot.get_text(2, lines=5) == "pane 2\n>"
+
+        mock_list.assert_called_once()
+        assert mock_get_text.call_count == 2
+        mock_get_text.assert_any_call(1, lines=snapshot.capture_lines)
+
+    async def test_wezterm_missing_falls_back(self) -> None:
+        """목록 조회 실패 시 예외 없이 개별 조회로 대체합니다."""
+        snapshot = PaneSnapshot()
+        with patch(
+            "orchay.utils.pane_snapshot.wezterm_list_panes",
+            new_callable=AsyncMock,
+            side_effect=WezTermNotFoundError("missing"),
+        ):
+            await snapshot.prefetch([1])
+
+        with patch(
+            "orchay.utils.pane_snapshot.wezterm_list_panes",
+            new_callable=AsyncMock,
+            return_value=make_panes(1),
+        ) as mock_list:
+            assert await snapshot.pane_exists(1)
+            assert await snapshot.pane_exists(1)
+        mock_list.assert_called_once()
+
+
+class TestGetText:
+    """get_text 테스트."""
+
+    async def test_slices_tail(self) -> None:
+        """요청 라인 수만큼 마지막 줄을 잘라 반환합니다."""
+        snapshot = PaneSnapshot(capture_lines=10)
+        text = "\n".join(f"line {i}" for i in range(10))
+        with patch(
+            "orchay.utils.pane_snapshot.wezterm_get_text",
+            new_callable=AsyncMock,
+            return_value=text,
+        ) as mock_get_text:
+            assert await snapshot.get_text(1, lines=2) == "line 8\nline 9"
+            assert await snapshot.get_text(1, lines=10) == text
+
+        mock_get_text.assert_called_once_with(1, lines=10)
+
+    async def test_larger_request_bypasses_cache(self) -> None:
+        """캡처 범위보다 큰 요청은 CLI로 직접 조회합니다."""
+        snapshot = PaneSnapshot(capture_lines=10)
+        with patch(
+            "orchay.utils.pane_snapshot.wezterm_get_text",
+            new_callable=AsyncMock,
+            return_value="big",
+        ) as mock_get_text:
+            assert await snapshot.get_text(1, lines=20) == "big"
+
+        mock_get_text.assert_called_once_with(1, lines=20)
+
+    async def test_invalidate_recaptures(self) -> None:
+        """invalidate 후에는 다시 캡처합니다."""
+        snapshot = PaneSnapshot()
+        with patch(
+            "orchay.utils.pane_snapshot.wezterm_get_text",
+            new_callable=AsyncMock,
+            side_effect=["before", "after"],
+        ):
+            assert await snapshot.get_text(1) == "before"
+            snapshot.invalidate(1)
+            assert await snapshot.get_text(1) == "after"
+
+
+class TestDetectorsShareSnapshot:
+    """감지 함수 스냅샷 공유 테스트."""
+
+    async def test_detect_and_extract_use_single_capture(self) -> None:
+        """상태 감지와 Task 추출이 같은 캡처를 재사용합니다."""
+        output = "/wf:build orchay/TSK-01-01\nworking...\nesc to interrupt"
+        snapshot = PaneSnapshot()
+        with (
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_list_panes",
+                new_callable=AsyncMock,
+                return_value=make_panes(1),
+            ),
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_get_text",
+                new_callable=AsyncMock,
+                return_value=output,
+            ) as mock_get_text,
+            patch("orchay.worker.wezterm_get_text", new_callable=AsyncMock) as mock_live,
+            patch("orchay.worker.pane_exists", new_callable=AsyncMock) as mock_exists,
+        ):
+            await snapshot.prefetch([1])
+            state, _ = await detect_worker_state(1, has_active_task=True, snapshot=snapshot)
+            task_id = await extract_running_task_from_pane(1, snapshot=snapshot)
+
+        assert state == "busy"
+        assert task_id == "TSK-01-01"
+        mock_get_text.assert_called_once()
+        mock_live.assert_not_called()
+        mock_exists.assert_not_called()
+
+    async def test_missing_pane_is_dead(self) -> None:
+        """스냅샷 목록에 없는 pane은 dead로 감지합니다."""
+        snapshot = PaneSnapshot()
+        with patch(
+            "orchay.utils.pane_snapshot.wezterm_list_panes",
+            new_callable=AsyncMock,
+            return_value=make_panes(2),
+        ):
+            await snapshot.prefetch([])
+            state, _ = await detect_worker_state(1, snapshot=snapshot)
+
+        assert state == "dead"
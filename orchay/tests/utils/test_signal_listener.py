@@ -0,0 +1,230 @@
+"""SignalListener 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from orchay.models import PausedInfo
+from orchay.utils.pane_snapshot import PaneSnapshot
+from orchay.utils.signal_listener import (
+    SignalListener,
+    WorkerSignal,
+    parse_signal_message,
+    parse_signal_text,
+    send_signal,
+)
+from orchay.utils.wezterm import PaneInfo
+from orchay.worker import DoneInfo, detect_worker_state
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """짧은 소켓 경로 (Unix 소켓 경로 길이 제한 대비)."""
+    with tempfile.TemporaryDirectory(prefix="orchay") as tmp:
+        yield Path(tmp) / "s.sock"
+
+
+async def send_lines(path: Path, *lines: str) -> list[str]:
+    """스크립트 클라이언트: 줄 단위로 보내고 응답을 받습니다."""
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    responses: list[str] = []
+    for line in lines:
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+        responses.append((await reader.readline()).decode().strip())
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def message(pane_id: int, signal: str) -> str:
+    """프로토콜 메시지 생성."""
+    return json.dumps({"pane_id": pane_id, "signal": signal})
+
+
+class TestParseSignal:
+    """신호 파싱 테스트."""
+
+    def test_plain_signals(self) -> None:
+        """평문 신호의 종류를 구분합니다."""
+        assert parse_signal_text("ORCHAY_DONE:TSK-01-01:build:success") == (
+            "done",
+            "ORCHAY_DONE:TSK-01-01:build:success",
+        )
+        assert parse_signal_text("ORCHAY_PAUSED:resets 6pm") == (
+            "paused",
+            "ORCHAY_PAUSED:resets 6pm",
+        )
+        assert parse_signal_text("ORCHAY_ERROR") == ("error", "ORCHAY_ERROR")
+        assert parse_signal_text("hello") is None
+        assert parse_signal_text("ORCHAY_DONEX") is None
+
+    def test_osc_user_var(self) -> None:
+        """OSC 1337 SetUserVar 값(base64)을 해석합니다."""
+        value = base64.b64encode(b"ORCHAY_ERROR:build failed").decode()
+        assert parse_signal_text(f"\x1b]1337;SetUserVar=orchay={value}\x07") == (
+            "error",
+            "ORCHAY_ERROR:build failed",
+        )
+        assert parse_signal_text("\x1b]1337;SetUserVar=orchay=!!!\x07") is None
+
+    def test_invalid_messages(self) -> None:
+        """형식이 잘못된 메시지는 ValueError."""
+        with pytest.raises(ValueError):
+            parse_signal_message("not json")
+        with pytest.raises(ValueError):
+            parse_signal_message(json.dumps({"signal": "ORCHAY_ERROR"}))
+        with pytest.raises(ValueError):
+            parse_signal_message(json.dumps({"pane_id": True, "signal": "ORCHAY_ERROR"}))
+        with pytest.raises(ValueError):
+            parse_signal_message(message(1, "unknown"))
+
+
+class TestSignalListener:
+    """소켓 수신 테스트."""
+
+    async def test_receives_and_wakes(self, socket_path: Path) -> None:
+        """신호를 받으면 wake 이벤트가 설정되고 pane별 최신 신호만 보관합니다."""
+        listener = SignalListener(socket_path)
+        assert await listener.start()
+        try:
+            responses = await send_lines(
+                socket_path,
+                message(1, "ORCHAY_ERROR"),
+                message(1, "ORCHAY_DONE:TSK-01-01:build:success"),
+                "garbage",
+            )
+            assert await listener.wait(timeout=1.0)
+        finally:
+            await listener.stop()
+
+        assert responses[:2] == ["ok", "ok"]
+        assert responses[2].startswith("error:")
+        signals = listener.drain()
+        assert list(signals) == [1]
+        assert signals[1].kind == "done"
+        assert not listener.wake.is_set()
+        assert not socket_path.exists()
+
+    async def test_restore_wakes_after_delay(self, socket_path: Path) -> None:
+        """되돌린 신호는 delay초 뒤에 다시 wake하고, 그 사이 받은 새 신호가 우선합니다."""
+        listener = SignalListener(socket_path)
+        old = WorkerSignal(1, "done", "ORCHAY_DONE:TSK-01-01:build:success")
+        listener.push(WorkerSignal(2, "error", "ORCHAY_ERROR"))
+        listener.drain()
+        listener.push(WorkerSignal(1, "error", "ORCHAY_ERROR"))
+        listener.wake.clear()
+
+        listener.restore({1: old, 2: WorkerSignal(2, "error", "ORCHAY_ERROR")}, delay=0.05)
+
+        assert not listener.wake.is_set()
+        assert await listener.wait(timeout=1.0)
+        signals = listener.drain()
+        assert signals[1].kind == "error"
+        assert list(signals) == [1, 2]
+
+    async def test_drain_cancels_restore_wake(self, socket_path: Path) -> None:
+        """되돌린 신호를 먼저 꺼내면 예약한 wake는 취소됩니다."""
+        listener = SignalListener(socket_path)
+        listener.restore({1: WorkerSignal(1, "error", "ORCHAY_ERROR")}, delay=0.01)
+        listener.drain()
+
+        assert not await listener.wait(timeout=0.05)
+
+    async def test_wait_times_out(self, socket_path: Path) -> None:
+        """신호가 없으면 시간 초과 후 False."""
+        listener = SignalListener(socket_path)
+        assert await listener.start()
+        try:
+            assert not await listener.wait(timeout=0.01)
+        finally:
+            await listener.stop()
+
+    async def test_stale_socket_replaced(self, socket_path: Path) -> None:
+        """비정상 종료로 남은 소켓 파일은 정리하고 다시 수신합니다."""
+        socket_path.write_text("")
+        listener = SignalListener(socket_path)
+        assert await listener.start()
+        await listener.stop()
+
+    async def test_socket_in_use(self, socket_path: Path) -> None:
+        """다른 수신기가 사용 중인 소켓은 가로채지 않습니다."""
+        first = SignalListener(socket_path)
+        assert await first.start()
+        try:
+            second = SignalListener(socket_path)
+            assert not await second.start()
+            assert not second.active
+            assert socket_path.exists()
+        finally:
+            await first.stop()
+
+    async def test_sync_client(self, socket_path: Path) -> None:
+        """send_signal 동기 클라이언트로 신호를 전송합니다."""
+        listener = SignalListener(socket_path)
+        assert await listener.start()
+        try:
+            response = await asyncio.to_thread(
+                send_signal, socket_path, 7, "ORCHAY_PAUSED:resets 6pm"
+            )
+        finally:
+            await listener.stop()
+
+        assert response == "ok"
+        assert listener.drain()[7].kind == "paused"
+
+    def test_send_without_listener(self, socket_path: Path) -> None:
+        """수신기가 없으면 OSError."""
+        with pytest.raises(OSError):
+            send_signal(socket_path, 1, "ORCHAY_ERROR")
+
+
+class TestDetectWithSignals:
+    """detect_worker_state 신호 반영 테스트."""
+
+    async def test_signal_skips_pane_text(self) -> None:
+        """신호가 있으면 pane 텍스트 없이 상태를 판정하고 한 번만 사용합니다."""
+        snapshot = PaneSnapshot(
+            signals={
+                1: WorkerSignal(1, "done", "ORCHAY_DONE:TSK-01-01:build:success"),
+                2: WorkerSignal(2, "paused", "ORCHAY_PAUSED:rate limit resets 6pm"),
+            }
+        )
+        with (
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_list_panes",
+                new_callable=AsyncMock,
+                return_value=[PaneInfo(pid, "default", "/", "") for pid in (1, 2)],
+            ),
+            patch(
+                "orchay.utils.pane_snapshot.wezterm_get_text",
+                new_callable=AsyncMock,
+                return_value="working...\nesc to interrupt",
+            ) as mock_get_text,
+        ):
+            done_state, done_info = await detect_worker_state(1, snapshot=snapshot)
+            paused_state, paused_info = await detect_worker_state(2, snapshot=snapshot)
+            mock_get_text.assert_not_called()
+
+            again, _ = await detect_worker_state(1, snapshot=snapshot)
+
+        assert done_state == "done"
+        assert isinstance(done_info, DoneInfo)
+        assert done_info.task_id == "TSK-01-01"
+        assert paused_state == "paused"
+        assert isinstance(paused_info, PausedInfo)
+        assert again == "busy"
+
+    async def test_invalidate_drops_signal(self) -> None:
+        """명령 전송으로 pane이 무효화되면 이전 신호도 폐기합니다."""
+        snapshot = PaneSnapshot(signals={1: WorkerSignal(1, "error", "ORCHAY_ERROR")})
+        snapshot.invalidate(1)
+        assert snapshot.take_signal(1) is None
@@ -0,0 +1,103 @@
+"""TickProfiler 테스트."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from orchay.utils.tick_profiler import (
+    RollingStats,
+    TickProfiler,
+    get_profiler,
+    profile,
+    set_profiler,
+)
+
+
+@pytest.fixture
+def profiler() -> Generator[TickProfiler]:
+    """활성 프로파일러로 등록된 TickProfiler (테스트 후 복원)."""
+    profiler = TickProfiler(window=10, write_interval=60)
+    previous = set_profiler(profiler)
+    yield profiler
+    set_profiler(previous)
+
+
+class TestRollingStats:
+    """RollingStats 테스트."""
+
+    def test_percentiles(self) -> None:
+        """최근 구간의 nearest-rank 백분위수를 계산합니다."""
+        stats = RollingStats(window=100)
+        for value in range(1, 101):
+            stats.add(value / 1000)
+
+        assert stats.percentile(50) == 0.05
+        assert stats.percentile(95) == 0.095
+        assert stats.summary()["max"] == 0.1
+
+    def test_window(self) -> None:
+        """구간 밖 샘플은 백분위수에서 제외하고 누적 횟수만 유지합니다."""
+        stats = RollingStats(window=2)
+        for value in (10.0, 1.0, 2.0):
+            stats.add(value)
+
+        assert stats.percentile(100) == 2.0
+        assert stats.count == 3
+        assert RollingStats().percentile(50) == 0.0
+
+
+class TestTickProfiler:
+    """TickProfiler 테스트."""
+
+    def test_phases_and_calls(self, profiler: TickProfiler) -> None:
+        """tick/단계 소요 시간과 tick당 외부 호출 수를 기록합니다."""
+        for calls in (2, 0):
+            with profiler.tick():
+                with profiler.phase("reload"):
+                    pass
+                for _ in range(calls):
+                    with profile("wezterm.get-text"):
+                        pass
+
+        assert profiler.ticks == 2
+        assert profiler.stats("reload") is not None
+        latency = profiler.stats("wezterm.get-text")
+        assert latency is not None and latency.count == 2
+        per_tick = profiler.stats("wezterm.calls")
+        assert per_tick is not None and per_tick.percentile(100) == 2
+        assert per_tick.percentile(50) == 0
+        assert "wezterm" in profiler.status_line()
+
+    def test_phase_records_on_error(self, profiler: TickProfiler) -> None:
+        """예외가 나도 단계 소요 시간을 기록합니다."""
+        with pytest.raises(RuntimeError), profiler.phase("dispatch"):
+            raise RuntimeError("boom")
+
+        stats = profiler.stats("dispatch")
+        assert stats is not None and stats.count == 1
+
+    def test_write_interval(self, profiler: TickProfiler, tmp_path: Path) -> None:
+        """write_interval 간격으로만 메트릭 파일을 저장합니다."""
+        path = tmp_path / "logs" / "orchay-metrics.json"
+        with profiler.tick():
+            pass
+
+        assert profiler.maybe_write(path)
+        assert not profiler.maybe_write(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["ticks"] == 1
+        assert set(data["phases"]["tick"]) == {"count", "mean", "p50", "p95", "p99", "max"}
+
+    def test_profile_without_profiler(self) -> None:
+        """활성 프로파일러가 없으면 아무것도 기록하지 않습니다."""
+        previous = set_profiler(None)
+        try:
+            with profile("wezterm.list"):
+                pass
+            assert get_profiler() is None
+        finally:
+            set_profiler(previous)
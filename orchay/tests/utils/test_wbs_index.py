@@ -0,0 +1,158 @@
+"""wbs.yaml 줄 위치 인덱스 테스트."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import yaml
+
+from orchay.utils.wbs_index import (
+    WbsLineIndex,
+    get_line_index,
+    store_line_index,
+    write_atomic,
+)
+
+WBS = """# 주석은 유지됩니다
+project:
+  id: test
+workPackages:
+  - id: WP-01
+    title: WP
+    tasks:
+      - id: TSK-01-01
+        title: Task 1
+        status: "[ ]"   # 상태
+        tags:
+          - a
+      - id: TSK-01-02
+        title: Task 2
+        status: '[dd]'
+        blocked-by: manual
+  - id: WP-02
+    tasks:
+      - id: TSK-02-01
+        title: Task 3
+""".encode()
+
+# yaml.dump 형식 (sequence가 부모 키와 같은 들여쓰기)
+DUMPED = b"""workPackages:
+- id: WP-01
+  tasks:
+  - id: TSK-01-01
+    title: Task 1
+    status: '[ ]'
+    tags:
+    - a
+  note: after tasks
+"""
+
+
+class TestBuild:
+    """인덱스 생성 테스트."""
+
+    def test_indexes_tasks(self) -> None:
+        """workPackages[].tasks[]의 Task만 인덱싱합니다 (WP ID 제외)."""
+        index = WbsLineIndex.build(WBS)
+
+        assert list(index.tasks) == ["TSK-01-01", "TSK-01-02", "TSK-02-01"]
+        assert index.tasks["TSK-01-01"].status == "[ ]"
+        assert index.tasks["TSK-01-02"].status == "[dd]"
+        assert index.tasks["TSK-02-01"].status == "[ ]"  # status 키 없음
+        assert index.tasks["TSK-01-02"].keys["blocked-by"].value == "manual"
+
+    def test_dump_style(self) -> None:
+        """부모 키와 같은 들여쓰기의 sequence도 인식합니다."""
+        index = WbsLineIndex.build(DUMPED)
+
+        assert list(index.tasks) == ["TSK-01-01"]
+        line = index.tasks["TSK-01-01"].keys["status"]
+        assert DUMPED[line.value_start : line.value_end] == b"'[ ]'"
+
+    def test_multiline_value_is_opaque(self) -> None:
+        """한 줄로 해석할 수 없는 값은 패치하지 않습니다."""
+        raw = b"workPackages:\n- id: WP\n  tasks:\n  - id: T1\n    status: |\n      [ ]\n"
+        index = WbsLineIndex.build(raw)
+
+        assert index.set_status(raw, "T1", "[dd]") is None
+        assert index.set_status(raw, "UNKNOWN", "[dd]") is None
+
+
+class TestPatch:
+    """줄 단위 패치 테스트."""
+
+    def test_set_status_keeps_format(self) -> None:
+        """값만 바꾸고 주석/따옴표/다른 줄은 그대로 둡니다."""
+        index = WbsLineIndex.build(WBS)
+        patched = index.set_status(WBS, "TSK-01-01", "[im]")
+        assert patched is not None
+        patched = index.set_status(patched, "TSK-01-02", "[xx]")
+        assert patched is not None
+
+        assert 'status: "[im]"   # 상태\n'.encode() in patched
+        assert b"status: '[xx]'\n" in patched
+        assert patched.startswith(b"# ")
+        assert len(patched.splitlines()) == len(WBS.splitlines())
+
+    def test_insert_and_remove(self) -> None:
+        """없는 키는 추가하고, blocked-by 제거 시 줄을 지웁니다."""
+        index = WbsLineIndex.build(WBS)
+        raw = index.set_status(WBS, "TSK-02-01", "[dd]")
+        assert raw is not None
+        raw = index.set_blocked_by(raw, "TSK-02-01", "skipped")
+        assert raw is not None
+        raw = index.set_blocked_by(raw, "TSK-01-02", None)
+        assert raw is not None
+
+        data = yaml.safe_load(raw)
+        task3 = data["workPackages"][1]["tasks"][0]
+        assert task3 == {
+            "id": "TSK-02-01",
+            "title": "Task 3",
+            "status": "[dd]",
+            "blocked-by": "skipped",
+        }
+        assert "blocked-by" not in data["workPackages"][0]["tasks"][1]
+
+        # 패치 후 갱신된 인덱스 == 새 내용으로 다시 만든 인덱스
+        fresh = WbsLineIndex.build(raw)
+        assert {k: t.keys for k, t in index.tasks.items()} == {
+            k: t.keys for k, t in fresh.tasks.items()
+        }
+
+    def test_insert_without_trailing_newline(self) -> None:
+        """마지막 줄에 줄바꿈이 없어도 새 줄을 추가합니다."""
+        raw = b"workPackages:\n- id: WP\n  tasks:\n  - id: T1\n    title: x"
+        index = WbsLineIndex.build(raw)
+        patched = index.set_status(raw, "T1", "[dd]")
+
+        assert patched is not None
+        assert yaml.safe_load(patched)["workPackages"][0]["tasks"][0]["status"] == "[dd]"
+
+
+class TestCacheAndWrite:
+    """인덱스 캐시와 원자적 쓰기 테스트."""
+
+    def test_cache_by_content(self, tmp_path: Path) -> None:
+        """같은 내용이면 같은 인덱스를, 패치 후에는 저장된 인덱스를 반환합니다."""
+        path = tmp_path / "wbs.yaml"
+        index = get_line_index(path, WBS)
+        assert get_line_index(path, WBS) is index
+
+        patched = index.set_status(WBS, "TSK-01-01", "[dd]")
+        assert patched is not None
+        store_line_index(path, patched, index)
+        assert get_line_index(path, patched) is index
+        assert get_line_index(path, WBS) is not index
+
+    def test_write_atomic(self, tmp_path: Path) -> None:
+        """기존 파일 권한을 유지하고 임시 파일을 남기지 않습니다."""
+        path = tmp_path / "wbs.yaml"
+        path.write_bytes(b"old")
+        path.chmod(0o640)
+
+        write_atomic(path, b"new")
+
+        assert path.read_bytes() == b"new"
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["wbs.yaml"]
@@ -0,0 +1,133 @@
+"""WBS 시작 스냅샷 테스트."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from orchay.models import ExecutionInfo, Task, TaskStatus
+from orchay.models.task import TASK_FIELDS
+from orchay.utils.wbs_snapshot import (
+    RUNTIME_FIELDS,
+    SNAPSHOT_FIELDS,
+    WbsSnapshot,
+    snapshot_path_for,
+)
+from orchay.wbs_parser import WbsParser
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+METADATA = {"project": {"id": "test"}, "wbs": {"projectRoot": "test"}}
+
+
+def _tasks() -> list[Task]:
+    """테스트용 Task 목록."""
+    return [
+        Task(id="TSK-01-01", title="Task 1", category="development", tags=["a"]),
+        Task(
+            id="TSK-01-02",
+            title="Task 2",
+            category="defect",
+            status=TaskStatus.DETAIL_DESIGN,
+            depends=["TSK-01-01"],
+            blocked_by="manual",
+            execution=ExecutionInfo(command="build", startedAt="2026-01-01T00:00:00", worker=1),
+        ),
+    ]
+
+
+class TestSnapshotRoundTrip:
+    """저장/복원 테스트."""
+
+    def test_fields_cover_task_model(self) -> None:
+        """스냅샷 필드와 런타임 필드가 Task 모델 필드를 모두 포함합니다."""
+        assert set(SNAPSHOT_FIELDS) | set(RUNTIME_FIELDS) == set(TASK_FIELDS)
+        assert not set(SNAPSHOT_FIELDS) & set(RUNTIME_FIELDS)
+
+    async def test_round_trip(self, tmp_path: Path) -> None:
+        """저장한 Task와 메타데이터를 그대로 복원합니다 (런타임 상태 제외)."""
+        tasks = _tasks()
+        tasks[0].assigned_worker = 3
+        snapshot = WbsSnapshot(tmp_path / "wbs.yaml", tmp_path / "cache")
+
+        assert await snapshot.save("d1", tasks, METADATA)
+        loaded = WbsSnapshot(tmp_path / "wbs.yaml", tmp_path / "cache").load("d1")
+
+        assert loaded is not None
+        restored, metadata = loaded
+        assert metadata == METADATA
+        assert restored[1] == tasks[1]
+        assert restored[0].assigned_worker is None
+        assert restored[0].tags == ("a",)
+        assert restored[0].to_dict() == {**tasks[0].to_dict(), "assigned_worker": None}
+
+    async def test_parsed_fixture_round_trip(self, tmp_path: Path) -> None:
+        """파서 결과를 그대로 복원합니다."""
+        parser = WbsParser(FIXTURES_DIR / "full_attributes_wbs.yaml")
+        tasks = await parser.parse()
+        snapshot = WbsSnapshot(tmp_path / "wbs.yaml", tmp_path)
+
+        await snapshot.save("d1", tasks, parser.metadata)
+        loaded = snapshot.load("d1")
+
+        assert loaded is not None
+        assert loaded[0] == tasks
+        assert loaded[1] == parser.metadata
+
+
+class TestSnapshotMiss:
+    """스냅샷을 사용할 수 없는 경우 테스트."""
+
+    async def test_digest_mismatch(self, tmp_path: Path) -> None:
+        """내용 해시가 다르면 None을 반환합니다."""
+        snapshot = WbsSnapshot(tmp_path / "wbs.yaml", tmp_path)
+        await snapshot.save("d1", _tasks(), METADATA)
+
+        assert snapshot.load("d2") is None
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """스냅샷이 없으면 None을 반환합니다."""
+        assert WbsSnapshot(tmp_path / "wbs.yaml", tmp_path).load("d1") is None
+
+    async def test_corrupted_file(self, tmp_path: Path) -> None:
+        """손상된 스냅샷은 사용하지 않습니다."""
+        snapshot = WbsSnapshot(tmp_path / "wbs.yaml", tmp_path)
+        await snapshot.save("d1", _tasks(), METADATA)
+        snapshot.path.write_bytes(snapshot.path.read_bytes()[:-20])
+
+        assert snapshot.load("d1") is None
+
+    async def test_unmarshallable_metadata_skips_save(self, tmp_path: Path) -> None:
+        """marshal로 저장할 수 없는 메타데이터면 저장을 건너뜁니다."""
+        snapshot = WbsSnapshot(tmp_path / "wbs.yaml", tmp_path)
+
+        assert not await snapshot.save("d1", _tasks(), {"wbs": {"date": object()}})
+        assert not snapshot.path.exists()
+
+    def test_path_per_wbs_file(self, tmp_path: Path) -> None:
+        """WBS 파일 경로마다 다른 스냅샷 파일을 사용합니다."""
+        first = snapshot_path_for(tmp_path / "a" / "wbs.yaml", tmp_path / "cache")
+        second = snapshot_path_for(tmp_path / "b" / "wbs.yaml", tmp_path / "cache")
+
+        assert first.parent == tmp_path / "cache"
+        assert first.name.startswith("a-")
+        assert first != second
+
+
+class TestIncrementalSave:
+    """바뀐 Task만 다시 인코딩하는 저장 테스트."""
+
+    async def test_unchanged_rows_reused(self, tmp_path: Path) -> None:
+        """바뀌지 않은 Task는 메모리에서 바뀌어도 마지막 파일 내용으로 저장합니다."""
+        tasks = _tasks()
+        snapshot = WbsSnapshot(tmp_path / "wbs.yaml", tmp_path)
+        await snapshot.save("d1", tasks, METADATA)
+
+        # 메모리 동기화 (파일에는 아직 반영되지 않음)
+        tasks[0].status = TaskStatus.APPROVED
+        tasks[1].title = "Task 2 수정"
+        await snapshot.save("d2", tasks, METADATA, changed=["TSK-01-02"])
+        loaded = snapshot.load("d2")
+
+        assert loaded is not None
+        assert loaded[0][0].status == TaskStatus.TODO
+        assert loaded[0][1].title == "Task 2 수정"
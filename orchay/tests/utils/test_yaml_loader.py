@@ -0,0 +1,116 @@
+"""YAML 로딩 백엔드 테스트."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from orchay.utils.yaml_loader import FastLoadError, dump_yaml, fast_load, load_yaml
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+class TestFastLoad:
+    """fast 로더 결과가 safe_load와 같은지 확인합니다."""
+
+    @pytest.mark.parametrize("name", ["valid_wbs.yaml", "full_attributes_wbs.yaml"])
+    def test_fixtures_match_safe_load(self, name: str) -> None:
+        """WBS fixture 파일."""
+        content = (FIXTURES / name).read_text(encoding="utf-8")
+        assert fast_load(content) == yaml.safe_load(content)
+
+    def test_dump_round_trip(self) -> None:
+        """_save_yaml 형식(부모 키와 같은 들여쓰기의 sequence)도 그대로 읽습니다."""
+        content = (FIXTURES / "valid_wbs.yaml").read_text(encoding="utf-8")
+        data = yaml.safe_load(content)
+        assert fast_load(dump_yaml(data)) == data
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            'status: "[ ]"\nassignee: "-"',
+            "a: yes\nb: ~\nc: 1.5\nd: 2025-12-28\ne: 0x1f\nf: -1",
+            "schedule: 2025-12-28 ~ 2025-12-29\nurl: http://x:1",
+            "note: text # comment\nempty:\nflow: []\nmap: {}\ndeps: [TSK-01-01, 2]",
+            "a: 'it''s'\nb: \"\\\"quoted\\\" \\u00e9\\t\"",
+            "items:\n  - a: 1\n    b:\n    - x\n  - - n\n    - m\n  -\n    c: 2",
+            '---\n# comment\n1: one\n"key": value',
+            "",
+        ],
+    )
+    def test_scalars_and_structure(self, content: str) -> None:
+        """scalar 타입 해석과 블록 구조가 safe_load와 같습니다."""
+        assert fast_load(content) == yaml.safe_load(content)
+
+    def test_timestamp_type(self) -> None:
+        """날짜는 safe_load와 같이 date로 변환합니다."""
+        assert fast_load("createdAt: 2025-12-28") == {"createdAt": date(2025, 12, 28)}
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "a: |\n  block",
+            "a: &anchor 1\nb: *anchor",
+            "a: !!str 1",
+            "a: first\n  continued",
+            'a: ["quoted"]',
+            "? complex\n: key",
+            "<<: {}",
+            "a:\n\t- tab",
+            "a: b: c",
+            "a: 1\n---\nb: 2",
+        ],
+    )
+    def test_unsupported_raises(self, content: str) -> None:
+        """지원하지 않는 구문은 FastLoadError를 발생시킵니다."""
+        with pytest.raises(FastLoadError):
+            fast_load(content)
+
+
+class TestLoadYaml:
+    """백엔드 선택 테스트."""
+
+    def test_auto_falls_back(self) -> None:
+        """auto는 fast 로더가 실패하면 libyaml/python 로더로 대체합니다."""
+        content = "a: |\n  line1\n  line2\nb: &x 1\nc: *x\n"
+        assert load_yaml(content) == yaml.safe_load(content)
+
+    def test_auto_uses_fast_loader(self) -> None:
+        """auto는 지원하는 구문이면 PyYAML 로더를 사용하지 않습니다."""
+        with patch("orchay.utils.yaml_loader.yaml.load") as mock_load:
+            assert load_yaml("a: 1") == {"a": 1}
+        mock_load.assert_not_called()
+
+    @pytest.mark.parametrize("backend", ["auto", "fast", "libyaml", "python"])
+    def test_backends_agree(self, backend: str) -> None:
+        """모든 백엔드가 같은 결과를 반환합니다."""
+        content = (FIXTURES / "valid_wbs.yaml").read_text(encoding="utf-8")
+        assert load_yaml(content, backend) == yaml.safe_load(content)  # type: ignore[arg-type]
+
+    def test_syntax_error(self) -> None:
+        """구문 오류는 yaml.YAMLError로 전달합니다."""
+        content = (FIXTURES / "corrupted_wbs.yaml").read_text(encoding="utf-8")
+        with pytest.raises(yaml.YAMLError):
+            load_yaml(content)
+
+    def test_unknown_backend(self) -> None:
+        """알 수 없는 백엔드는 ValueError."""
+        with pytest.raises(ValueError):
+            load_yaml("a: 1", "unknown")  # type: ignore[arg-type]
+
+    def test_dump_matches_yaml_dump(self) -> None:
+        """dump_yaml 출력은 기존 yaml.dump 저장 형식과 같습니다."""
+        data = yaml.safe_load((FIXTURES / "valid_wbs.yaml").read_text(encoding="utf-8"))
+        expected = yaml.dump(
+            data,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
+            indent=2,
+            width=120,
+        )
+        assert dump_yaml(data) == expected